@@ -13,6 +13,7 @@ The memory system is designed as a personal journal,
 not a rigid database, supporting agent self-discovery.
 """
 
+import os
 import sys
 from pathlib import Path
 from typing import Any, Optional
@@ -25,15 +26,25 @@ from fastmcp import FastMCP
 from src.core.agent_memory import (
     AgentMemory,
     MemoryType,
+    enable_write_behind,
     get_memory,
     remember,
     recall,
     get_context,
+    use_shared_store,
 )
 
 # Initialize FastMCP server
 mcp = FastMCP("Agent Memory")
 
+# Memories arrive in bursts; batch journal writes (flushed on exit too)
+enable_write_behind()
+
+# Opt-in shared SQLite store: safe for concurrent agents, searchable across agents
+shared_store = (
+    use_shared_store() if os.environ.get("AGENT_MEMORY_BACKEND", "").lower() == "sqlite" else None
+)
+
 
 @mcp.tool()
 def store_memory(
@@ -353,6 +364,60 @@ def recall_memories(
     }
 
 
+@mcp.tool()
+def search_team_memories(
+    query: Optional[str] = None,
+    agent_name: Optional[str] = None,
+    memory_type: Optional[str] = None,
+    tags: Optional[list[str]] = None,
+    related_to: Optional[str] = None,
+    limit: int = 20,
+) -> dict[str, Any]:
+    """
+    Search memories across every agent (requires AGENT_MEMORY_BACKEND=sqlite).
+
+    Args:
+        query: Full-text search over memory content
+        agent_name: Restrict to one agent
+        memory_type: Restrict to one memory type
+        tags: Match memories with any of these tags
+        related_to: Filter by relation (substring)
+        limit: Maximum results
+
+    Returns:
+        Matching memories (each with its agent_name), newest first
+
+    Example:
+        >>> search_team_memories(memory_type="insight", tags=["testing"])
+    """
+    if shared_store is None:
+        return {
+            "success": False,
+            "error": "Team search requires the shared store (AGENT_MEMORY_BACKEND=sqlite)",
+        }
+    try:
+        mem_type = MemoryType(memory_type) if memory_type else None
+    except ValueError as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "valid_types": [t.value for t in MemoryType],
+        }
+    results = shared_store.search(
+        text=query,
+        agent_name=agent_name,
+        memory_type=mem_type,
+        tags=tags,
+        related_to=related_to,
+        limit=limit,
+    )
+    return {
+        "success": True,
+        "count": len(results),
+        "memories": results,
+    }
+
+
 @mcp.tool()
 def get_memory_context(agent_name: str) -> dict[str, Any]:
     """
@@ -429,6 +494,28 @@ def get_journal_summary(agent_name: str) -> dict[str, Any]:
     }
 
 
+@mcp.tool()
+def flush_memories(agent_name: str) -> dict[str, Any]:
+    """
+    Write any pending memories for an agent to disk immediately.
+
+    Memories are batched and saved shortly after being stored; call this
+    before handing off work when they must be durable right away.
+
+    Args:
+        agent_name: Name of the agent
+
+    Returns:
+        Confirmation of the flush
+    """
+    memory = get_memory(agent_name)
+    memory.flush()
+    return {
+        "success": True,
+        "agent_name": agent_name,
+    }
+
+
 @mcp.resource("memory://types")
 def get_memory_types() -> str:
     """Get available memory types and their descriptions."""
@@ -221,10 +221,11 @@ investigate_dirty_worktree() {
 
     # Multi-agent awareness: Skip investigation if other agents are running
     # In parallel execution, dirty files may belong to other agents
-    local claims_file="config/.work_claims.json"
-    if [[ -f "$claims_file" ]]; then
+    local orchestrator_root="${ORCHESTRATOR_ROOT:-.}"
+    local claims_db="$orchestrator_root/config/.work_claims.db"
+    if [[ -f "$claims_db" ]]; then
         local active_claims
-        active_claims=$(jq 'keys | length' "$claims_file" 2>/dev/null || echo "0")
+        active_claims=$(PYTHONPATH="$orchestrator_root" "$orchestrator_root/.venv/bin/python" -c "from src.orchestrator.claims_store import ClaimsStore; print(ClaimsStore().count_active())" 2>/dev/null || echo "0")
         if [[ "$active_claims" -gt 1 ]]; then
             log_warning "Other agents running ($active_claims active claims). Skipping dirty worktree investigation."
             log_warning "Files may belong to other agents working in parallel."
@@ -21,11 +21,15 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from src.core.task_parser import TaskParser
 from src.core.tool_registry import get_tool_registry
 
 # Initialize FastMCP server
 mcp = FastMCP("Orchestrator Agent")
 
+# Shared parser so repeated descriptions are served from its cache
+task_parser = TaskParser()
+
 
 @mcp.tool()
 def analyze_task(task_description: str) -> dict[str, Any]:
@@ -43,14 +47,16 @@ def analyze_task(task_description: str) -> dict[str, Any]:
         - task_type: Classification (software, research, analysis, creative, hybrid)
         - ambiguities: List of unclear aspects requiring clarification
     """
-    # TODO: Implement AI-based task analysis
+    parsed = task_parser.parse(task_description)
     return {
-        "goal": f"Analyze: {task_description}",
-        "constraints": [],
-        "context": {},
-        "task_type": "unknown",
-        "ambiguities": [],
-        "status": "analysis_pending"
+        "goal": parsed.goal,
+        "constraints": parsed.constraints,
+        "context": parsed.context,
+        "task_type": parsed.task_type.value,
+        "success_criteria": parsed.success_criteria,
+        "ambiguities": parsed.ambiguities,
+        "clarifications": parsed.generate_clarification_requests(),
+        "status": "analyzed"
     }
 
 
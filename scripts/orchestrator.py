@@ -272,6 +272,12 @@ def cmd_batch(args) -> int:
         if failed:
             print(f"  {colored(f'✗ Failed: {failed}', Colors.RED)}")
 
+        stats = orchestrator.last_batch_stats
+        if stats:
+            print(f"  Slot utilization: {stats.slot_utilization:.0%} "
+                  f"({stats.slots} slots, {stats.wall_seconds:.0f}s)")
+            print(f"  Idle gap: max {stats.max_idle_gap:.1f}s, mean {stats.mean_idle_gap:.1f}s")
+
         return 0 if failed == 0 else 1
 
     except KeyboardInterrupt:
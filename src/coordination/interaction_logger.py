@@ -3,10 +3,25 @@ Interaction Logger for tracking all agent communications.
 
 This module provides comprehensive logging of all agent-to-agent interactions
 via the NATS message bus, enabling full transparency and debugging capabilities.
+
+Storage:
+- Timestamps are parsed once, when an interaction is logged, into epoch
+  seconds. Naive timestamps (AgentMessage uses utcnow()) are read as UTC.
+- Interactions are indexed by time, by agent (sender or recipient) and by
+  agent pair; each index is kept sorted by (epoch, log order), so time
+  ranges are found with bisect and timelines need no sorting.
+- An optional retention policy (max_rows and/or max_age) drops the oldest
+  interactions, spilling them to a JSONL or SQLite archive if configured.
 """
 
+import json
+import sqlite3
+import time
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterator
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any
 
 from src.coordination.nats_bus import AgentMessage, MessageType
@@ -47,6 +62,29 @@ class LoggedInteraction:
             correlation_id=message.correlation_id,
         )
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dict."""
+        return {
+            "from_agent": self.from_agent,
+            "to_agent": self.to_agent,
+            "message_type": self.message_type.value,
+            "content": self.content,
+            "timestamp": self.timestamp,
+            "correlation_id": self.correlation_id,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LoggedInteraction":
+        """Create from a dict produced by to_dict()."""
+        return cls(
+            from_agent=data["from_agent"],
+            to_agent=data.get("to_agent"),
+            message_type=MessageType(data["message_type"]),
+            content=data.get("content", {}),
+            timestamp=data["timestamp"],
+            correlation_id=data.get("correlation_id"),
+        )
+
 
 @dataclass
 class InteractionQuery:
@@ -63,6 +101,122 @@ class InteractionQuery:
     broadcast_only: bool = False  # Only return broadcast messages (to_agent=None)
 
 
+def _to_epoch(timestamp: str) -> float:
+    """Parse an ISO timestamp into epoch seconds (now, if unparseable)."""
+    try:
+        return _epoch(datetime.fromisoformat(timestamp))
+    except (TypeError, ValueError):
+        return time.time()
+
+
+def _epoch(moment: datetime) -> float:
+    """Epoch seconds of a datetime, reading naive ones as UTC."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    return moment.timestamp()
+
+
+def _pair_key(agent1: str, agent2: str) -> tuple[str, str]:
+    """Order-independent key for a pair of agents."""
+    return (agent1, agent2) if agent1 <= agent2 else (agent2, agent1)
+
+
+# -----------------------------------------------------------------------------
+# Archives
+# -----------------------------------------------------------------------------
+
+_ARCHIVE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS interactions (
+    epoch REAL NOT NULL,
+    from_agent TEXT NOT NULL,
+    to_agent TEXT,
+    message_type TEXT NOT NULL,
+    content TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    correlation_id TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_interactions_epoch ON interactions(epoch);
+"""
+
+
+def _is_sqlite_archive(path: Path) -> bool:
+    """Archives ending in .db/.sqlite/.sqlite3 are SQLite; anything else is JSONL."""
+    return path.suffix in (".db", ".sqlite", ".sqlite3")
+
+
+def _write_archive(path: Path, rows: list[tuple[float, LoggedInteraction]]) -> None:
+    """Append evicted interactions to an archive."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if _is_sqlite_archive(path):
+        conn = sqlite3.connect(str(path))
+        try:
+            conn.executescript(_ARCHIVE_SCHEMA)
+            with conn:
+                conn.executemany(
+                    "INSERT INTO interactions VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            epoch,
+                            i.from_agent,
+                            i.to_agent,
+                            i.message_type.value,
+                            json.dumps(i.content),
+                            i.timestamp,
+                            i.correlation_id,
+                        )
+                        for epoch, i in rows
+                    ],
+                )
+        finally:
+            conn.close()
+    else:
+        with open(path, "a") as f:
+            for _, interaction in rows:
+                f.write(json.dumps(interaction.to_dict()) + "\n")
+
+
+def read_archive(path: Path) -> Iterator[LoggedInteraction]:
+    """
+    Read interactions spilled to an archive, in the order they were evicted.
+
+    Args:
+        path: JSONL or SQLite archive written by InteractionLogger
+
+    Yields:
+        Archived interactions
+    """
+    if not path.exists():
+        return
+    if _is_sqlite_archive(path):
+        conn = sqlite3.connect(str(path))
+        try:
+            rows = conn.execute(
+                "SELECT from_agent, to_agent, message_type, content, timestamp, "
+                "correlation_id FROM interactions ORDER BY rowid"
+            ).fetchall()
+        finally:
+            conn.close()
+        for from_agent, to_agent, message_type, content, timestamp, correlation_id in rows:
+            yield LoggedInteraction(
+                from_agent=from_agent,
+                to_agent=to_agent,
+                message_type=MessageType(message_type),
+                content=json.loads(content),
+                timestamp=timestamp,
+                correlation_id=correlation_id,
+            )
+    else:
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    yield LoggedInteraction.from_dict(json.loads(line))
+
+
+# -----------------------------------------------------------------------------
+# Logger
+# -----------------------------------------------------------------------------
+
+
 class InteractionLogger:
     """
     Logs and queries agent interactions for transparency and debugging.
@@ -76,11 +230,42 @@ class InteractionLogger:
     - Conversation reconstruction between agents
     - Agent timeline views
     - Broadcast message tracking
+    - Optional retention (max rows / max age) with archive spill
     """
 
-    def __init__(self) -> None:
-        """Initialize the interaction logger."""
-        self._interactions: list[LoggedInteraction] = []
+    # When max_rows is exceeded, trim this fraction extra so eviction
+    # happens in batches rather than on every log
+    EVICTION_SLACK = 0.05
+
+    def __init__(
+        self,
+        max_rows: int | None = None,
+        max_age_seconds: float | None = None,
+        archive_path: Path | None = None,
+    ) -> None:
+        """
+        Initialize the interaction logger.
+
+        Args:
+            max_rows: Keep at most this many interactions (default: unbounded)
+            max_age_seconds: Drop interactions whose timestamp is older than
+                             this (default: never)
+            archive_path: Append dropped interactions to this file; a .db,
+                          .sqlite or .sqlite3 suffix selects SQLite, anything
+                          else JSONL (default: discard them)
+        """
+        self.max_rows = max_rows
+        self.max_age_seconds = max_age_seconds
+        self.archive_path = Path(archive_path) if archive_path is not None else None
+
+        self._next_seq = 0
+        # seq -> interaction, in log order
+        self._interactions: dict[int, LoggedInteraction] = {}
+        # (epoch, seq) sorted lists: all, per agent, per agent pair
+        self._by_time: list[tuple[float, int]] = []
+        self._by_agent: dict[str, list[tuple[float, int]]] = {}
+        self._by_pair: dict[tuple[str, str], list[tuple[float, int]]] = {}
+        self.archived_count = 0
 
     def log_interaction(self, message: AgentMessage) -> None:
         """
@@ -90,7 +275,19 @@ class InteractionLogger:
             message: The AgentMessage to log
         """
         interaction = LoggedInteraction.from_agent_message(message)
-        self._interactions.append(interaction)
+        key = (_to_epoch(interaction.timestamp), self._next_seq)
+        self._next_seq += 1
+
+        self._interactions[key[1]] = interaction
+        _insert(self._by_time, key)
+        _insert(self._by_agent.setdefault(interaction.from_agent, []), key)
+        if interaction.to_agent is not None:
+            if interaction.to_agent != interaction.from_agent:
+                _insert(self._by_agent.setdefault(interaction.to_agent, []), key)
+            pair = _pair_key(interaction.from_agent, interaction.to_agent)
+            _insert(self._by_pair.setdefault(pair, []), key)
+
+        self._apply_retention()
 
     def get_all_interactions(self) -> list[LoggedInteraction]:
         """
@@ -99,7 +296,7 @@ class InteractionLogger:
         Returns:
             List of all LoggedInteraction objects
         """
-        return self._interactions.copy()
+        return list(self._interactions.values())
 
     def query_interactions(self, query: InteractionQuery) -> list[LoggedInteraction]:
         """
@@ -109,45 +306,26 @@ class InteractionLogger:
             query: InteractionQuery with filter parameters
 
         Returns:
-            List of LoggedInteraction objects matching the query
+            List of LoggedInteraction objects matching the query, in log order
         """
-        results = self._interactions
-
-        # Filter by agent ID (either from or to)
+        # Narrowest index first: the agent's, else everything
         if query.agent_id is not None:
-            results = [
-                i for i in results
-                if i.from_agent == query.agent_id or i.to_agent == query.agent_id
-            ]
-
-        # Filter by message type
-        if query.message_type is not None:
-            results = [
-                i for i in results
-                if i.message_type == query.message_type
-            ]
-
-        # Filter by time range
-        if query.start_time is not None:
-            results = [
-                i for i in results
-                if datetime.fromisoformat(i.timestamp) >= query.start_time
-            ]
-
-        if query.end_time is not None:
-            results = [
-                i for i in results
-                if datetime.fromisoformat(i.timestamp) <= query.end_time
-            ]
-
-        # Filter for broadcast messages only
-        if query.broadcast_only:
-            results = [
-                i for i in results
-                if i.to_agent is None
-            ]
-
-        return results
+            keys = self._by_agent.get(query.agent_id, [])
+        else:
+            keys = self._by_time
+        keys = _time_slice(keys, query.start_time, query.end_time)
+
+        seqs = []
+        for _, seq in keys:
+            interaction = self._interactions[seq]
+            if query.message_type is not None and interaction.message_type != query.message_type:
+                continue
+            if query.broadcast_only and interaction.to_agent is not None:
+                continue
+            seqs.append(seq)
+
+        seqs.sort()
+        return [self._interactions[seq] for seq in seqs]
 
     def get_conversation(self, agent1: str, agent2: str) -> list[LoggedInteraction]:
         """
@@ -160,17 +338,8 @@ class InteractionLogger:
         Returns:
             List of interactions between the two agents, in chronological order
         """
-        # Get interactions where both agents are involved
-        conversation = [
-            i for i in self._interactions
-            if (i.from_agent == agent1 and i.to_agent == agent2)
-            or (i.from_agent == agent2 and i.to_agent == agent1)
-        ]
-
-        # Sort by timestamp
-        conversation.sort(key=lambda i: datetime.fromisoformat(i.timestamp))
-
-        return conversation
+        keys = self._by_pair.get(_pair_key(agent1, agent2), [])
+        return [self._interactions[seq] for _, seq in keys]
 
     def get_agent_timeline(self, agent_id: str) -> list[LoggedInteraction]:
         """
@@ -182,17 +351,87 @@ class InteractionLogger:
         Returns:
             List of interactions involving the agent, sorted by timestamp (oldest first)
         """
-        # Get all interactions involving this agent
-        timeline = [
-            i for i in self._interactions
-            if i.from_agent == agent_id or i.to_agent == agent_id
-        ]
-
-        # Sort by timestamp (oldest first)
-        timeline.sort(key=lambda i: datetime.fromisoformat(i.timestamp))
-
-        return timeline
+        keys = self._by_agent.get(agent_id, [])
+        return [self._interactions[seq] for _, seq in keys]
 
     def clear_logs(self) -> None:
-        """Clear all logged interactions."""
+        """Clear all logged interactions (archives are kept)."""
         self._interactions.clear()
+        self._by_time.clear()
+        self._by_agent.clear()
+        self._by_pair.clear()
+
+    # -------------------------------------------------------------------------
+    # Retention
+    # -------------------------------------------------------------------------
+
+    def _apply_retention(self) -> None:
+        """Evict the oldest interactions beyond max_rows or max_age_seconds."""
+        evict = 0
+        if self.max_age_seconds is not None and self._by_time:
+            cutoff = time.time() - self.max_age_seconds
+            if self._by_time[0][0] < cutoff:
+                evict = bisect_left(self._by_time, (cutoff, -1))
+
+        if self.max_rows is not None and len(self._by_time) - evict > self.max_rows:
+            slack = int(self.max_rows * self.EVICTION_SLACK)
+            evict = len(self._by_time) - self.max_rows + slack
+
+        if evict:
+            self._evict(evict)
+
+    def _evict(self, count: int) -> None:
+        """Drop the count oldest interactions, archiving them if configured."""
+        evicted = self._by_time[:count]
+        del self._by_time[:count]
+
+        # The oldest entries overall are also the oldest in every index
+        # they appear in, so each index loses a prefix
+        agent_counts: dict[str, int] = {}
+        pair_counts: dict[tuple[str, str], int] = {}
+        rows = []
+        for epoch, seq in evicted:
+            interaction = self._interactions.pop(seq)
+            rows.append((epoch, interaction))
+            agents = {interaction.from_agent}
+            if interaction.to_agent is not None:
+                agents.add(interaction.to_agent)
+                pair = _pair_key(interaction.from_agent, interaction.to_agent)
+                pair_counts[pair] = pair_counts.get(pair, 0) + 1
+            for agent in agents:
+                agent_counts[agent] = agent_counts.get(agent, 0) + 1
+
+        _drop_prefixes(self._by_agent, agent_counts)
+        _drop_prefixes(self._by_pair, pair_counts)
+
+        if self.archive_path is not None:
+            _write_archive(self.archive_path, rows)
+            self.archived_count += len(rows)
+
+
+def _insert(keys: list[tuple[float, int]], key: tuple[float, int]) -> None:
+    """Add a key to a sorted index (appending when it is the newest)."""
+    if not keys or keys[-1] <= key:
+        keys.append(key)
+    else:
+        insort(keys, key)
+
+
+def _time_slice(
+    keys: list[tuple[float, int]],
+    start: datetime | None,
+    end: datetime | None,
+) -> list[tuple[float, int]]:
+    """Keys whose epoch lies within [start, end]."""
+    lo = bisect_left(keys, (_epoch(start), -1)) if start is not None else 0
+    hi = bisect_right(keys, (_epoch(end), float("inf"))) if end is not None else len(keys)
+    return keys[lo:hi]
+
+
+def _drop_prefixes(index: dict, counts: dict) -> None:
+    """Remove the given number of leading keys from each index entry."""
+    for name, count in counts.items():
+        keys = index[name]
+        del keys[:count]
+        if not keys:
+            del index[name]
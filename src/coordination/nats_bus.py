@@ -3,10 +3,33 @@ NATS-based message bus for inter-agent communication.
 
 This module provides a high-level interface for agent communication using NATS,
 supporting pub/sub, request/reply, and queue groups for workload distribution.
+
+Wire format:
+- Payloads are encoded with a MessageCodec named in the Agent-Codec header.
+  Messages without the header are JSON, so older publishers keep working.
+- The binary codec is a length-prefixed struct layout; msgpack is used when
+  the optional msgpack package is installed.
+- An opt-in MessageBatcher packs high-frequency messages (status updates,
+  heartbeats) published within a short window into one NATS message; the
+  Agent-Batch header carries the count and subscribers unpack transparently.
+
+Transports:
+- By default the bus connects to a NATS server. A "loopback://" URL (or an
+  explicit MessageTransport) keeps delivery in-process for single-node runs
+  and tests; see src/coordination/transport.py.
+
+Durable work queues:
+- publish_to_queue(durable=True) persists items in a DurableWorkQueue; they
+  are pulled with fetch() and settled with ack()/nak(), or consumed by
+  create_work_queue(durable=True) workers. A notification on
+  orchestrator.queue.{queue_name}.available wakes idle workers.
 """
 
+import asyncio
 import json
-from collections.abc import Callable
+import os
+import struct
+from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -16,9 +39,27 @@ import nats
 from nats.aio.client import Client as NATSClient
 from nats.aio.msg import Msg
 
+from src.coordination.transport import (
+    LOOPBACK_SCHEME,
+    LoopbackTransport,
+    MessageTransport,
+    get_loopback_transport,
+)
+from src.coordination.work_queue import DurableWorkQueue, QueueItem
+
+try:
+    import msgpack  # type: ignore[import-not-found, import-untyped]
+except ImportError:  # Optional: the binary codec needs no dependencies
+    msgpack = None
+
 
 class MessageType(str, Enum):
-    """Types of messages agents can exchange."""
+    """
+    Types of messages agents can exchange.
+
+    The binary codec sends a member's position as its wire code, so new
+    types must be appended at the end.
+    """
     STATUS_UPDATE = "status_update"
     TASK_ASSIGNMENT = "task_assignment"
     TASK_ASSIGNED = "task_assigned"  # Work stream claimed
@@ -51,21 +92,20 @@ class AgentMessage:
     timestamp: str
     correlation_id: str | None = None  # For request/reply tracking
 
-    def to_json(self) -> str:
-        """Serialize message to JSON."""
-        return json.dumps({
+    def to_dict(self) -> dict[str, Any]:
+        """Convert message to a plain dictionary."""
+        return {
             "from_agent": self.from_agent,
             "to_agent": self.to_agent,
             "message_type": self.message_type.value,
             "content": self.content,
             "timestamp": self.timestamp,
             "correlation_id": self.correlation_id,
-        })
+        }
 
     @classmethod
-    def from_json(cls, data: str) -> "AgentMessage":
-        """Deserialize message from JSON."""
-        obj = json.loads(data)
+    def from_dict(cls, obj: dict[str, Any]) -> "AgentMessage":
+        """Create message from a plain dictionary."""
         return cls(
             from_agent=obj["from_agent"],
             to_agent=obj.get("to_agent"),
@@ -75,6 +115,288 @@ class AgentMessage:
             correlation_id=obj.get("correlation_id"),
         )
 
+    def to_json(self) -> str:
+        """Serialize message to compact JSON."""
+        return json.dumps(self.to_dict(), separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, data: str) -> "AgentMessage":
+        """Deserialize message from JSON."""
+        return cls.from_dict(json.loads(data))
+
+
+@dataclass
+class QueuedMessage:
+    """A message pulled from a durable work queue; settle with ack() or nak()."""
+
+    message: AgentMessage
+    item: QueueItem
+
+
+# -----------------------------------------------------------------------------
+# Codecs
+# -----------------------------------------------------------------------------
+
+# Header naming the payload codec (absent means JSON)
+CODEC_HEADER = "Agent-Codec"
+# Header carrying the number of messages packed into a batch payload
+BATCH_HEADER = "Agent-Batch"
+
+
+class MessageCodec(str, Enum):
+    """Payload encodings understood by every bus."""
+    JSON = "json"
+    BINARY = "binary"  # Length-prefixed struct fields, no dependencies
+    MSGPACK = "msgpack"  # Requires the optional msgpack package
+
+
+_BINARY_VERSION = 1
+_BINARY_HEADER = struct.Struct("!BB")  # version, message type code
+_LENGTH = struct.Struct("!I")
+_NONE_LENGTH = 0xFFFFFFFF
+_MESSAGE_TYPES = list(MessageType)
+_MESSAGE_TYPE_CODES = {message_type: i for i, message_type in enumerate(_MESSAGE_TYPES)}
+
+
+def _encode_binary(message: AgentMessage) -> bytes:
+    """Pack a message as a type code followed by length-prefixed fields."""
+    parts = [_BINARY_HEADER.pack(_BINARY_VERSION, _MESSAGE_TYPE_CODES[message.message_type])]
+    content = json.dumps(message.content, separators=(",", ":"))
+    for value in (
+        message.from_agent,
+        message.to_agent,
+        message.timestamp,
+        message.correlation_id,
+        content,
+    ):
+        if value is None:
+            parts.append(_LENGTH.pack(_NONE_LENGTH))
+        else:
+            raw = value.encode("utf-8")
+            parts.append(_LENGTH.pack(len(raw)))
+            parts.append(raw)
+    return b"".join(parts)
+
+
+def _decode_binary(data: bytes) -> AgentMessage:
+    """Unpack a message written by _encode_binary."""
+    version, type_code = _BINARY_HEADER.unpack_from(data, 0)
+    if version != _BINARY_VERSION:
+        raise ValueError(f"Unsupported binary message version: {version}")
+    if type_code >= len(_MESSAGE_TYPES):
+        raise ValueError(f"Unknown message type code: {type_code}")
+
+    offset = _BINARY_HEADER.size
+    fields: list[str | None] = []
+    for _ in range(5):
+        (length,) = _LENGTH.unpack_from(data, offset)
+        offset += _LENGTH.size
+        if length == _NONE_LENGTH:
+            fields.append(None)
+            continue
+        end = offset + length
+        if end > len(data):
+            raise ValueError("Truncated binary message")
+        fields.append(data[offset:end].decode("utf-8"))
+        offset = end
+
+    from_agent, to_agent, timestamp, correlation_id, content = fields
+    return AgentMessage(
+        from_agent=from_agent or "",
+        to_agent=to_agent,
+        message_type=_MESSAGE_TYPES[type_code],
+        content=json.loads(content) if content is not None else {},
+        timestamp=timestamp or "",
+        correlation_id=correlation_id,
+    )
+
+
+def encode_message(message: AgentMessage, codec: MessageCodec = MessageCodec.JSON) -> bytes:
+    """
+    Encode a message for the wire.
+
+    Args:
+        message: Message to encode
+        codec: Encoding to use
+
+    Returns:
+        Encoded payload
+    """
+    if codec == MessageCodec.BINARY:
+        return _encode_binary(message)
+    if codec == MessageCodec.MSGPACK:
+        if msgpack is None:
+            raise ValueError("The msgpack codec requires the msgpack package")
+        packed: bytes = msgpack.packb(message.to_dict(), use_bin_type=True)
+        return packed
+    return message.to_json().encode("utf-8")
+
+
+def decode_message(data: bytes, codec: MessageCodec = MessageCodec.JSON) -> AgentMessage:
+    """
+    Decode a single message payload.
+
+    Args:
+        data: Encoded payload
+        codec: Encoding the payload was written with
+
+    Returns:
+        Decoded message
+    """
+    if codec == MessageCodec.BINARY:
+        return _decode_binary(data)
+    if codec == MessageCodec.MSGPACK:
+        if msgpack is None:
+            raise ValueError("The msgpack codec requires the msgpack package")
+        return AgentMessage.from_dict(msgpack.unpackb(data, raw=False))
+    return AgentMessage.from_json(data.decode("utf-8"))
+
+
+def pack_batch(payloads: list[bytes]) -> bytes:
+    """Concatenate encoded messages, each prefixed with its length."""
+    parts = []
+    for payload in payloads:
+        parts.append(_LENGTH.pack(len(payload)))
+        parts.append(payload)
+    return b"".join(parts)
+
+
+def unpack_batch(data: bytes) -> list[bytes]:
+    """Split a payload written by pack_batch."""
+    payloads = []
+    offset = 0
+    while offset < len(data):
+        (length,) = _LENGTH.unpack_from(data, offset)
+        offset += _LENGTH.size
+        payloads.append(data[offset:offset + length])
+        offset += length
+    return payloads
+
+
+def codec_from_headers(headers: dict[str, str] | None) -> MessageCodec:
+    """Get the codec named in message headers (JSON when absent)."""
+    if not headers or CODEC_HEADER not in headers:
+        return MessageCodec.JSON
+    return MessageCodec(headers[CODEC_HEADER])
+
+
+def decode_payload(data: bytes, headers: dict[str, str] | None = None) -> list[AgentMessage]:
+    """
+    Decode a NATS payload into messages, unpacking batches.
+
+    Args:
+        data: Raw payload
+        headers: NATS message headers, if any
+
+    Returns:
+        Messages in publish order
+    """
+    codec = codec_from_headers(headers)
+    if headers and BATCH_HEADER in headers:
+        return [decode_message(payload, codec) for payload in unpack_batch(data)]
+    return [decode_message(data, codec)]
+
+
+# -----------------------------------------------------------------------------
+# Batching
+# -----------------------------------------------------------------------------
+
+
+class MessageBatcher:
+    """
+    Coalesces high-frequency messages into batched publishes.
+
+    Messages of the batched types are buffered per subject and sent together
+    when the flush window elapses or a subject's buffer fills, whichever
+    comes first.
+    """
+
+    DEFAULT_TYPES = frozenset({MessageType.STATUS_UPDATE, MessageType.HEARTBEAT})
+
+    def __init__(
+        self,
+        send: Callable[[str, list[bytes]], Awaitable[None]],
+        flush_interval: float = 0.05,
+        max_batch: int = 100,
+        message_types: Iterable[MessageType] | None = None,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            send: Coroutine publishing a subject's encoded messages at once
+            flush_interval: Seconds to hold messages before sending
+            max_batch: Messages per subject that trigger an immediate send
+            message_types: Types to batch (default: DEFAULT_TYPES)
+        """
+        self._send = send
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.message_types = frozenset(
+            self.DEFAULT_TYPES if message_types is None else message_types
+        )
+        self._buffers: dict[str, list[bytes]] = {}
+        self._timer: asyncio.Task | None = None
+        self.batches_sent = 0
+        self.messages_batched = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered messages."""
+        return sum(len(buffer) for buffer in self._buffers.values())
+
+    def accepts(self, message: AgentMessage) -> bool:
+        """Whether a message should be batched (requests never are)."""
+        return message.message_type in self.message_types and message.correlation_id is None
+
+    async def add(self, subject: str, payload: bytes) -> None:
+        """
+        Buffer an encoded message.
+
+        Args:
+            subject: Subject the message is published to
+            payload: Encoded message
+        """
+        buffer = self._buffers.setdefault(subject, [])
+        buffer.append(payload)
+        if len(buffer) >= self.max_batch:
+            await self._send_subject(subject)
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+
+    async def flush(self) -> int:
+        """
+        Send every buffered message now.
+
+        Returns:
+            Number of messages sent
+        """
+        if self._timer is not None and self._timer is not asyncio.current_task():
+            self._timer.cancel()
+        self._timer = None
+
+        sent = 0
+        for subject in list(self._buffers):
+            sent += await self._send_subject(subject)
+        return sent
+
+    async def _send_subject(self, subject: str) -> int:
+        """Send one subject's buffer."""
+        payloads = self._buffers.pop(subject, [])
+        if payloads:
+            await self._send(subject, payloads)
+            self.batches_sent += 1
+            self.messages_batched += len(payloads)
+        return len(payloads)
+
+    async def _flush_later(self) -> None:
+        """Flush once the window elapses."""
+        await asyncio.sleep(self.flush_interval)
+        try:
+            await self.flush()
+        except Exception as e:
+            print(f"Error flushing message batch: {e}")
+
 
 class NATSMessageBus:
     """
@@ -91,32 +413,145 @@ class NATSMessageBus:
     - orchestrator.agent.{agent_id}.{message_type} - Direct to specific agent
     - orchestrator.team.{team_id}.{message_type} - Team-specific
     - orchestrator.queue.{queue_name} - Work queue for load balancing
+    - orchestrator.queue.{queue_name}.available - Durable queue has new work
+
+    Codecs other than JSON and batching need message headers; against a
+    server without header support the bus falls back to plain JSON.
+
+    A bus given a transport (or a "loopback://" URL) shares it with other
+    buses: disconnecting removes this bus's subscriptions but leaves the
+    transport open.
     """
 
-    def __init__(self, nats_url: str = "nats://localhost:4222"):
+    # Seconds an idle durable-queue worker waits before re-checking for
+    # redeliveries (new work wakes it immediately)
+    QUEUE_POLL_INTERVAL = 1.0
+
+    def __init__(
+        self,
+        nats_url: str = "nats://localhost:4222",
+        codec: MessageCodec = MessageCodec.JSON,
+        batching: bool = False,
+        flush_interval: float = 0.05,
+        max_batch: int = 100,
+        batch_types: Iterable[MessageType] | None = None,
+        transport: MessageTransport | None = None,
+        work_queue: DurableWorkQueue | None = None,
+    ):
         """
         Initialize NATS message bus.
 
         Args:
             nats_url: NATS server URL
+            codec: Preferred payload encoding for published messages
+            batching: Coalesce high-frequency message types into batches
+            flush_interval: Seconds batched messages may wait before sending
+            max_batch: Buffered messages per subject that force a send
+            batch_types: Message types to batch (default: status updates
+                         and heartbeats)
+            transport: Deliver through this transport instead of connecting
+                       to nats_url
+            work_queue: Store for durable queues (default: created on first
+                        use at config/.work_queue.db)
         """
+        if codec == MessageCodec.MSGPACK and msgpack is None:
+            raise ValueError("The msgpack codec requires the msgpack package")
+
         self.nats_url = nats_url
-        self.nc: NATSClient | None = None
+        self.nc: NATSClient | MessageTransport | None = None
         self.subscriptions: dict[str, int] = {}
+        self._transport = transport
+        self._subscription_handles: list[Any] = []
+        self._work_queue = work_queue
+        self._queue_workers: list[asyncio.Task] = []
+        self.requested_codec = MessageCodec(codec)
+        self.codec = MessageCodec.JSON
+        self._batching_requested = batching
+        self._batcher: MessageBatcher | None = None
+        self._flush_interval = flush_interval
+        self._max_batch = max_batch
+        self._batch_types = batch_types
+        self.messages_published = 0
+        self.bytes_published = 0
 
     async def connect(self) -> None:
         """Connect to NATS server."""
         if self.nc:
             return
 
+        if self._transport is None and self.nats_url.startswith(f"{LOOPBACK_SCHEME}://"):
+            self._transport = get_loopback_transport()
+
+        if self._transport is not None:
+            self.nc = self._transport
+            self._negotiate()
+            print(f"Connected to {type(self._transport).__name__}")
+            return
+
         self.nc = await nats.connect(self.nats_url)
+        self._negotiate()
         print(f"Connected to NATS at {self.nats_url}")
 
+    def _negotiate(self) -> None:
+        """Pick the codec and batching mode the connected server supports."""
+        if isinstance(self.nc, MessageTransport):
+            headers_supported = self.nc.supports_headers
+        else:
+            # nats-py exposes the server's INFO only through this attribute
+            server_info = getattr(self.nc, "_server_info", None) or {}
+            headers_supported = bool(server_info.get("headers", False))
+
+        self.codec = self.requested_codec if headers_supported else MessageCodec.JSON
+        if self._batching_requested and headers_supported:
+            self._batcher = MessageBatcher(
+                self._send_batch,
+                flush_interval=self._flush_interval,
+                max_batch=self._max_batch,
+                message_types=self._batch_types,
+            )
+        else:
+            self._batcher = None
+
+    def _headers(self, batch_size: int = 1) -> dict[str, str] | None:
+        """Headers describing a payload in the negotiated codec."""
+        headers = {}
+        if self.codec != MessageCodec.JSON:
+            headers[CODEC_HEADER] = self.codec.value
+        if batch_size > 1:
+            headers[BATCH_HEADER] = str(batch_size)
+        return headers or None
+
+    async def _send_batch(self, subject: str, payloads: list[bytes]) -> None:
+        """Publish encoded messages as one NATS message."""
+        if not self.nc:
+            raise RuntimeError("Not connected to NATS")
+        data = payloads[0] if len(payloads) == 1 else pack_batch(payloads)
+        await self.nc.publish(subject, data, headers=self._headers(len(payloads)))
+        self.messages_published += 1
+        self.bytes_published += len(data)
+
+    async def flush(self) -> None:
+        """Send any batched messages immediately."""
+        if self._batcher:
+            await self._batcher.flush()
+
     async def disconnect(self) -> None:
         """Disconnect from NATS server."""
+        for worker in self._queue_workers:
+            worker.cancel()
+        self._queue_workers.clear()
+
         if self.nc:
-            await self.nc.drain()
-            await self.nc.close()
+            await self.flush()
+            if self._transport is not None:
+                # Shared transport: only remove what this bus added
+                for sub in self._subscription_handles:
+                    await sub.unsubscribe()
+            else:
+                await self.nc.drain()
+                await self.nc.close()
+            self._subscription_handles.clear()
+            self.subscriptions.clear()
             self.nc = None
             print("Disconnected from NATS")
 
@@ -135,7 +570,15 @@ class NATSMessageBus:
         if not self.nc:
             raise RuntimeError("Not connected to NATS")
 
-        await self.nc.publish(subject, message.to_json().encode())
+        payload = encode_message(message, self.codec)
+        if self._batcher:
+            if self._batcher.accepts(message):
+                await self._batcher.add(subject, payload)
+                return
+            # Keep earlier batched messages ahead of this one
+            await self._batcher.flush()
+
+        await self._send_batch(subject, [payload])
 
     async def broadcast(
         self,
@@ -226,13 +669,17 @@ class NATSMessageBus:
             correlation_id=correlation_id,
         )
 
+        if self._batcher:
+            await self._batcher.flush()
+
         try:
             response = await self.nc.request(
                 subject,
-                message.to_json().encode(),
-                timeout=timeout
+                encode_message(message, self.codec),
+                timeout=timeout,
+                headers=self._headers(),
             )
-            return AgentMessage.from_json(response.data.decode())
+            return decode_payload(response.data, response.headers)[0]
         except TimeoutError:
             raise TimeoutError(
                 f"No reply from {to_agent} within {timeout}s"
@@ -241,7 +688,7 @@ class NATSMessageBus:
     async def subscribe(
         self,
         subject: str,
-        callback: Callable[[AgentMessage], None],
+        callback: Callable[[AgentMessage], Awaitable[Any]],
         queue: str | None = None
     ) -> int:
         """
@@ -261,27 +708,36 @@ class NATSMessageBus:
         async def message_handler(msg: Msg) -> None:
             """Internal handler that deserializes and calls callback."""
             try:
-                agent_msg = AgentMessage.from_json(msg.data.decode())
+                messages = decode_payload(msg.data, msg.headers)
 
                 # If this is a request, callback should return response
                 if msg.reply:
-                    response = await callback(agent_msg)
+                    response = await callback(messages[0])
                     if response:
-                        await self.nc.publish(msg.reply, response.to_json().encode())
+                        # Reply in the requester's codec so older clients can read it
+                        codec = codec_from_headers(msg.headers)
+                        headers = None
+                        if codec != MessageCodec.JSON:
+                            headers = {CODEC_HEADER: codec.value}
+                        await self.nc.publish(
+                            msg.reply, encode_message(response, codec), headers=headers
+                        )
                 else:
-                    await callback(agent_msg)
+                    for agent_msg in messages:
+                        await callback(agent_msg)
             except Exception as e:
                 print(f"Error handling message: {e}")
 
-        sub = await self.nc.subscribe(subject, queue=queue, cb=message_handler)
+        sub = await self.nc.subscribe(subject, queue=queue or "", cb=message_handler)
         self.subscriptions[subject] = sub._id
+        self._subscription_handles.append(sub)
 
         return sub._id
 
     async def subscribe_to_agent_messages(
         self,
         agent_id: str,
-        callback: Callable[[AgentMessage], AgentMessage | None]
+        callback: Callable[[AgentMessage], Awaitable[AgentMessage | None]]
     ) -> list[int]:
         """
         Subscribe to all messages for a specific agent.
@@ -310,20 +766,35 @@ class NATSMessageBus:
     async def create_work_queue(
         self,
         queue_name: str,
-        callback: Callable[[AgentMessage], None],
-        num_workers: int = 1
+        callback: Callable[[AgentMessage], Awaitable[Any]],
+        num_workers: int = 1,
+        durable: bool = False,
+        max_in_flight: int = 10,
     ) -> list[int]:
         """
         Create a work queue with multiple workers for load balancing.
 
+        Durable workers pull from the work queue store: an item is acked
+        when the callback returns and nak'd (redelivered after a backoff)
+        when it raises. Items published before the workers started are
+        processed too.
+
         Args:
             queue_name: Name of the work queue
             callback: Function to process work items
             num_workers: Number of workers in queue group
+            durable: Consume from the durable work queue store
+            max_in_flight: Items each durable worker fetches per batch
 
         Returns:
             List of subscription IDs
         """
+        if durable:
+            sub_id = await self._start_queue_workers(
+                queue_name, callback, num_workers, max_in_flight
+            )
+            return [sub_id]
+
         subject = f"orchestrator.queue.{queue_name}"
         sub_ids = []
 
@@ -342,8 +813,9 @@ class NATSMessageBus:
         queue_name: str,
         from_agent: str,
         message_type: MessageType,
-        content: dict[str, Any]
-    ) -> None:
+        content: dict[str, Any],
+        durable: bool = False,
+    ) -> int | None:
         """
         Publish work to a queue.
 
@@ -352,6 +824,11 @@ class NATSMessageBus:
             from_agent: ID of agent publishing work
             message_type: Type of work
             content: Work payload
+            durable: Persist the item until a worker acks it (works while
+                     disconnected; connected workers are notified)
+
+        Returns:
+            Sequence number of a durable item, else None
         """
         subject = f"orchestrator.queue.{queue_name}"
         message = AgentMessage(
@@ -361,7 +838,161 @@ class NATSMessageBus:
             content=content,
             timestamp=datetime.utcnow().isoformat(),
         )
-        await self.publish(subject, message)
+        if not durable:
+            await self.publish(subject, message)
+            return None
+
+        store = await self._open_work_queue()
+        seq = await asyncio.to_thread(store.publish, queue_name, message.to_json().encode())
+        if self.nc:
+            await self.nc.publish(f"{subject}.available", b"")
+        return seq
+
+    # -------------------------------------------------------------------------
+    # Durable work queues
+    # -------------------------------------------------------------------------
+
+    @property
+    def work_queue(self) -> DurableWorkQueue:
+        """Store backing durable queues (opened on first use)."""
+        if self._work_queue is None:
+            self._work_queue = DurableWorkQueue()
+        return self._work_queue
+
+    async def _open_work_queue(self) -> DurableWorkQueue:
+        """Store backing durable queues, opened in a worker thread on first use."""
+        if self._work_queue is None:
+            store = await asyncio.to_thread(DurableWorkQueue)
+            if self._work_queue is None:
+                self._work_queue = store
+            else:
+                store.close()
+        return self._work_queue
+
+    async def fetch(
+        self,
+        queue_name: str,
+        consumer: str,
+        batch: int = 10,
+        max_in_flight: int | None = None,
+    ) -> list[QueuedMessage]:
+        """
+        Pull up to a batch of items from a durable queue.
+
+        Each item must be settled with ack() or nak(); unsettled items are
+        redelivered once the store's ack_wait passes. Store calls run in a
+        worker thread, since SQLite may block on another process's lock.
+
+        Args:
+            queue_name: Name of work queue
+            consumer: Consumer ID (unique per worker)
+            batch: Maximum number of items
+            max_in_flight: Cap on this consumer's unsettled items
+
+        Returns:
+            Pulled messages, oldest first
+        """
+        store = await self._open_work_queue()
+        items = await asyncio.to_thread(store.fetch, queue_name, consumer, batch, max_in_flight)
+        return [
+            QueuedMessage(AgentMessage.from_json(item.payload.decode()), item)
+            for item in items
+        ]
+
+    async def ack(self, queued: QueuedMessage) -> bool:
+        """
+        Mark a pulled item as done.
+
+        Returns:
+            False if the item's lease had expired and it was redelivered
+        """
+        store = await self._open_work_queue()
+        return await asyncio.to_thread(store.ack, queued.item)
+
+    async def nak(self, queued: QueuedMessage, delay: float | None = None) -> bool:
+        """
+        Return a pulled item for redelivery.
+
+        Args:
+            queued: Item returned by fetch()
+            delay: Seconds before redelivery (default: backoff by attempt)
+
+        Returns:
+            False if the item's lease had expired and it was redelivered
+        """
+        store = await self._open_work_queue()
+        return await asyncio.to_thread(store.nak, queued.item, delay)
+
+    async def in_progress(self, queued: QueuedMessage) -> bool:
+        """
+        Extend a pulled item's lease by the store's ack_wait.
+
+        Returns:
+            False if the item's lease had expired and it was redelivered
+        """
+        store = await self._open_work_queue()
+        return await asyncio.to_thread(store.in_progress, queued.item)
+
+    async def _start_queue_workers(
+        self,
+        queue_name: str,
+        callback: Callable[[AgentMessage], Awaitable[Any]],
+        num_workers: int,
+        max_in_flight: int,
+    ) -> int:
+        """Start pull workers for a durable queue; returns the wake-up subscription ID."""
+        wakes = [asyncio.Event() for _ in range(num_workers)]
+
+        async def on_available(msg: Msg) -> None:
+            for wake in wakes:
+                wake.set()
+
+        sub_id = -1
+        if self.nc:
+            sub = await self.nc.subscribe(
+                f"orchestrator.queue.{queue_name}.available", cb=on_available
+            )
+            self._subscription_handles.append(sub)
+            sub_id = sub._id
+
+        for i, wake in enumerate(wakes):
+            consumer = f"{queue_name}-{os.getpid()}-{id(self):x}-{i}"
+            self._queue_workers.append(asyncio.create_task(
+                self._run_queue_worker(queue_name, consumer, callback, max_in_flight, wake)
+            ))
+        return sub_id
+
+    async def _run_queue_worker(
+        self,
+        queue_name: str,
+        consumer: str,
+        callback: Callable[[AgentMessage], Awaitable[Any]],
+        max_in_flight: int,
+        wake: asyncio.Event,
+    ) -> None:
+        """Pull, process and settle items until cancelled."""
+        while True:
+            wake.clear()
+            batch = await self.fetch(queue_name, consumer, max_in_flight, max_in_flight)
+            if not batch:
+                try:
+                    await asyncio.wait_for(wake.wait(), self.QUEUE_POLL_INTERVAL)
+                except TimeoutError:
+                    pass
+                continue
+
+            for i, queued in enumerate(batch):
+                # Later items waited while earlier ones ran; renew their
+                # leases so they are not redelivered to another worker
+                if i and not await self.in_progress(queued):
+                    continue
+                try:
+                    await callback(queued.message)
+                except Exception as e:
+                    print(f"Error processing {queue_name} item {queued.item.seq}: {e}")
+                    await self.nak(queued)
+                else:
+                    await self.ack(queued)
 
     async def get_stats(self) -> dict[str, Any]:
         """
@@ -373,24 +1004,37 @@ class NATSMessageBus:
         if not self.nc:
             return {"connected": False}
 
+        # Transports other than the nats-py client and loopback may keep no counters
+        stats = self.nc.stats if isinstance(self.nc, NATSClient | LoopbackTransport) else {}
         return {
             "connected": self.nc.is_connected,
-            "server_info": self.nc.connected_server_info,
-            "stats": self.nc.stats,
+            "server_info": getattr(self.nc, "_server_info", None) or {},
+            "stats": stats,
             "subscriptions": len(self.subscriptions),
+            "codec": self.codec.value,
+            "messages_published": self.messages_published,
+            "bytes_published": self.bytes_published,
+            "batches_sent": self._batcher.batches_sent if self._batcher else 0,
+            "messages_batched": self._batcher.messages_batched if self._batcher else 0,
         }
 
 
+def default_nats_url() -> str:
+    """NATS URL from the NATS_URL environment variable, else the local server."""
+    return os.environ.get("NATS_URL", "nats://localhost:4222")
+
+
 # Singleton instance for convenience
 _bus_instance: NATSMessageBus | None = None
 
 
-async def get_message_bus(nats_url: str = "nats://localhost:4222") -> NATSMessageBus:
+async def get_message_bus(nats_url: str | None = None) -> NATSMessageBus:
     """
     Get or create the global message bus instance.
 
     Args:
-        nats_url: NATS server URL
+        nats_url: NATS server URL (default: the NATS_URL environment
+                  variable, else nats://localhost:4222)
 
     Returns:
         Message bus instance
@@ -398,7 +1042,7 @@ async def get_message_bus(nats_url: str = "nats://localhost:4222") -> NATSMessag
     global _bus_instance
 
     if _bus_instance is None:
-        _bus_instance = NATSMessageBus(nats_url)
+        _bus_instance = NATSMessageBus(nats_url or default_nats_url())
         await _bus_instance.connect()
 
     return _bus_instance
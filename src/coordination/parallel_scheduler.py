@@ -3,6 +3,7 @@
 Implements:
 - Parallel task dispatching with concurrency limits
 - Dependency-aware scheduling (respects task prerequisites)
+- Critical-path list scheduling (longest remaining chain first)
 - Task handoff synchronization between agents
 - Idle time optimization for resource utilization
 """
@@ -12,8 +13,11 @@ import uuid
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from enum import Enum
 from typing import Any
 
+from src.core.readiness import ReadinessTracker, find_cycle
+from src.core.task_decomposer import COMPLEXITY_WEIGHTS
 from src.models.agent import Agent
 from src.models.enums import TaskStatus
 from src.models.task import Subtask
@@ -63,31 +67,28 @@ class DependencyResolver:
                         f"non-existent task {dep_id}"
                     )
 
-        # Check for circular dependencies using DFS
-        visited = set()
-        rec_stack = set()
+        # Check for circular dependencies (iterative, safe for long chains)
+        cycle = find_cycle(self._dependencies())
+        if cycle:
+            raise ValueError(f"Circular dependency detected involving task {cycle[0]}")
 
-        def has_cycle(task_id: str) -> bool:
-            visited.add(task_id)
-            rec_stack.add(task_id)
+    def create_tracker(
+        self, priority: dict[str, Any] | None = None
+    ) -> ReadinessTracker:
+        """Create a readiness tracker for one run over these tasks.
 
-            task = self._task_map[task_id]
-            for dep_id in task.dependencies:
-                if dep_id not in visited:
-                    if has_cycle(dep_id):
-                        return True
-                elif dep_id in rec_stack:
-                    return True
+        Args:
+            priority: Optional task ID -> sort key (lower runs first);
+                ties and the default follow task list order
 
-            rec_stack.remove(task_id)
-            return False
+        Returns:
+            Tracker with every dependency-free task ready
+        """
+        return ReadinessTracker(self._dependencies(), priority=priority)
 
-        for task in self.tasks:
-            if task.id not in visited:
-                if has_cycle(task.id):
-                    raise ValueError(
-                        f"Circular dependency detected involving task {task.id}"
-                    )
+    def _dependencies(self) -> dict[str, list[str]]:
+        """Task ID -> dependency IDs, in task list order."""
+        return {t.id: t.dependencies for t in self.tasks}
 
     def get_ready_tasks(self, completed_task_ids: set[str]) -> list[Subtask]:
         """Get tasks that are ready to execute.
@@ -96,6 +97,9 @@ class DependencyResolver:
         - It's not already completed
         - All its dependencies are completed
 
+        This rescans every task; schedulers that track completions as they
+        happen should use create_tracker() instead.
+
         Args:
             completed_task_ids: Set of task IDs that have completed
 
@@ -118,12 +122,74 @@ class DependencyResolver:
         return ready
 
 
+class SchedulingStrategy(str, Enum):
+    """Order in which ready tasks are dispatched."""
+
+    FIFO = "fifo"  # Task list order, every task on the first agent
+    CRITICAL_PATH = "critical_path"  # Highest upward rank first, least-loaded idle agent
+
+
+def get_task_weight(task: Subtask) -> int:
+    """Get a task's relative duration from its estimated complexity.
+
+    Args:
+        task: Task with an optional "estimated_complexity" metadata entry
+
+    Returns:
+        Weight from COMPLEXITY_WEIGHTS (medium if unknown)
+    """
+    complexity = task.metadata.get("estimated_complexity", "medium")
+    return COMPLEXITY_WEIGHTS.get(complexity, COMPLEXITY_WEIGHTS["medium"])
+
+
+def compute_upward_ranks(tasks: list[Subtask]) -> dict[str, int]:
+    """Compute the upward rank of every task.
+
+    A task's upward rank is its own weight plus the largest upward rank among
+    the tasks that depend on it: the length of the longest chain of work that
+    cannot start until it finishes. Dispatching the highest rank first starts
+    long dependency chains early.
+
+    Args:
+        tasks: Tasks with acyclic dependencies
+
+    Returns:
+        Dictionary mapping task IDs to upward ranks
+    """
+    task_map = {t.id: t for t in tasks}
+    dependents: dict[str, list[str]] = {t.id: [] for t in tasks}
+    remaining: dict[str, int] = {t.id: 0 for t in tasks}
+    for task in tasks:
+        for dep_id in set(task.dependencies):
+            if dep_id in dependents:
+                dependents[dep_id].append(task.id)
+                remaining[dep_id] += 1
+
+    # Process sinks first; a task is ranked once all its dependents are
+    ranks: dict[str, int] = {}
+    stack = [tid for tid, count in remaining.items() if count == 0]
+    while stack:
+        task_id = stack.pop()
+        task = task_map[task_id]
+        ranks[task_id] = get_task_weight(task) + max(
+            (ranks[d] for d in dependents[task_id]), default=0
+        )
+        for dep_id in set(task.dependencies):
+            if dep_id in remaining:
+                remaining[dep_id] -= 1
+                if remaining[dep_id] == 0:
+                    stack.append(dep_id)
+
+    return ranks
+
+
 class ParallelTaskDispatcher:
     """Dispatches tasks for parallel execution with concurrency limits.
 
     Features:
     - Concurrent task execution with configurable limits
     - Dependency-aware scheduling
+    - Optional critical-path list scheduling across idle agents
     - Async execution with proper error handling
     """
 
@@ -132,6 +198,7 @@ class ParallelTaskDispatcher:
         agents: list[Agent],
         tasks: list[Subtask],
         max_concurrent: int = 5,
+        strategy: SchedulingStrategy = SchedulingStrategy.FIFO,
     ):
         """Initialize parallel task dispatcher.
 
@@ -139,15 +206,31 @@ class ParallelTaskDispatcher:
             agents: Available agents for task execution
             tasks: Tasks to execute
             max_concurrent: Maximum number of concurrent tasks
+            strategy: FIFO dispatches in list order on the first agent;
+                CRITICAL_PATH dispatches by upward rank, one task per agent
         """
         self.agents = agents
         self.tasks = tasks
         self.max_concurrent = max_concurrent
+        self.strategy = SchedulingStrategy(strategy)
         self.dependency_resolver = DependencyResolver(tasks)
 
         # Validate dependencies on creation
         self.dependency_resolver.validate_dependencies()
 
+        # List-scheduling state
+        self._ranks: dict[str, int] = {}
+        self._task_map = {t.id: t for t in tasks}
+        self._busy_agents: set[str] = set()
+        self._agent_load: dict[str, int] = {a.id: 0 for a in agents}
+        if self.strategy == SchedulingStrategy.CRITICAL_PATH:
+            self._ranks = compute_upward_ranks(tasks)
+
+    @property
+    def agent_load(self) -> dict[str, int]:
+        """Total task weight dispatched to each agent so far."""
+        return dict(self._agent_load)
+
     async def dispatch_all(
         self,
         execute_fn: Callable[[Subtask, Agent], Awaitable[TaskExecutionState]],
@@ -160,53 +243,44 @@ class ParallelTaskDispatcher:
         Returns:
             List of execution states for all tasks
         """
-        completed_task_ids: set[str] = set()
-        results: list[TaskExecutionState] = []
-        running_tasks: dict[str, asyncio.Task] = {}  # task_id -> async Task
-
-        while len(completed_task_ids) < len(self.tasks):
-            # Get tasks ready to execute
-            ready_tasks = self.dependency_resolver.get_ready_tasks(completed_task_ids)
-
-            # Filter out tasks already running
-            ready_tasks = [t for t in ready_tasks if t.id not in running_tasks]
+        priority = None
+        if self.strategy == SchedulingStrategy.CRITICAL_PATH:
+            priority = {task_id: -rank for task_id, rank in self._ranks.items()}
+        tracker = self.dependency_resolver.create_tracker(priority)
 
-            # Dispatch new tasks up to concurrency limit
-            available_slots = self.max_concurrent - len(running_tasks)
+        results: list[TaskExecutionState] = []
+        running: dict[asyncio.Task, tuple[str, str]] = {}  # -> (task_id, agent_id)
 
-            for task in ready_tasks[:available_slots]:
-                # Find an available agent (simple round-robin for now)
+        while not tracker.is_finished:
+            # Dispatch ready tasks up to the concurrency limit
+            while tracker.has_ready and len(running) < self.max_concurrent:
                 agent = self._get_available_agent()
                 if not agent:
-                    continue  # Skip if no agent available
+                    break  # No agent free (CRITICAL_PATH) or no agents at all
 
-                # Create async task
+                task = self._task_map[tracker.pop_ready()]
+                self._busy_agents.add(agent.id)
+                self._agent_load[agent.id] = (
+                    self._agent_load.get(agent.id, 0) + get_task_weight(task)
+                )
                 async_task = asyncio.create_task(
                     self._execute_with_error_handling(task, agent, execute_fn)
                 )
-                running_tasks[task.id] = async_task
-
-            # Wait for at least one task to complete
-            if running_tasks:
-                done, pending = await asyncio.wait(
-                    running_tasks.values(),
-                    return_when=asyncio.FIRST_COMPLETED,
-                )
+                running[async_task] = (task.id, agent.id)
 
-                # Process completed tasks
-                for async_task in done:
-                    result = await async_task
-                    results.append(result)
-                    completed_task_ids.add(result.task_id)
+            # If nothing is running after dispatch, no task can make progress
+            if not running:
+                break
 
-                    # Remove from running tasks
-                    running_tasks = {
-                        tid: t for tid, t in running_tasks.items() if t not in done
-                    }
+            # Wait for at least one task to complete
+            done, _ = await asyncio.wait(running.keys(), return_when=asyncio.FIRST_COMPLETED)
 
-            # If no tasks running and no tasks ready, we have a problem
-            if not running_tasks and not ready_tasks:
-                break
+            # Failed tasks still release their dependents
+            for async_task in done:
+                task_id, agent_id = running.pop(async_task)
+                self._busy_agents.discard(agent_id)
+                results.append(await async_task)
+                tracker.mark_completed(task_id)
 
         return results
 
@@ -241,14 +315,21 @@ class ParallelTaskDispatcher:
             )
 
     def _get_available_agent(self) -> Agent | None:
-        """Get an available agent (simple round-robin).
+        """Get an available agent.
+
+        FIFO always returns the first agent. CRITICAL_PATH returns the idle
+        agent with the least work dispatched so far (ties go to list order).
 
         Returns:
             An available agent or None if no agents available
         """
-        # Simple implementation - just return first agent
-        # In a real system, this would check agent status, workload, etc.
-        return self.agents[0] if self.agents else None
+        if self.strategy == SchedulingStrategy.FIFO:
+            return self.agents[0] if self.agents else None
+
+        idle = [a for a in self.agents if a.id not in self._busy_agents]
+        if not idle:
+            return None
+        return min(idle, key=lambda a: self._agent_load[a.id])
 
 
 @dataclass
@@ -0,0 +1,421 @@
+"""
+Message Transports - Pluggable delivery layer under NATSMessageBus.
+
+NATSMessageBus talks to its connection through a small client surface:
+publish, subscribe, request, drain and close. The nats-py client provides it
+for multi-host deployments; LoopbackTransport provides it in memory for
+single-node runs and tests, with no broker and no sockets.
+
+LoopbackTransport follows NATS semantics:
+- Subjects are dot-separated tokens; subscriptions may use ``*`` (one token)
+  and ``>`` (one or more trailing tokens)
+- Subscribers sharing a queue group name receive each message once between
+  them (round-robin)
+- Each subscription handles its messages in order on its own task, so a
+  publisher never waits for subscriber callbacks
+- Requests publish with a private reply subject and wait for the first reply
+"""
+
+import asyncio
+import itertools
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+# Scheme selecting the shared in-process transport (e.g. "loopback://")
+LOOPBACK_SCHEME = "loopback"
+
+
+def subject_matches(pattern: str, subject: str) -> bool:
+    """
+    Check whether a subject matches a subscription pattern.
+
+    Args:
+        pattern: Subscription subject, possibly with * and > wildcards
+        subject: Concrete subject a message was published to
+
+    Returns:
+        True if the pattern matches the subject
+    """
+    pattern_tokens = pattern.split(".")
+    subject_tokens = subject.split(".")
+    for i, token in enumerate(pattern_tokens):
+        if token == ">":
+            return len(subject_tokens) > i
+        if i >= len(subject_tokens):
+            return False
+        if token != "*" and token != subject_tokens[i]:
+            return False
+    return len(pattern_tokens) == len(subject_tokens)
+
+
+class MessageTransport(ABC):
+    """
+    Client surface NATSMessageBus needs from its connection.
+
+    The nats-py Client satisfies this interface as-is; other transports
+    subclass it. A subscription handle must provide ``unsubscribe()``.
+    """
+
+    # Whether message headers (codec negotiation, batching) are supported
+    supports_headers: bool = True
+
+    @property
+    @abstractmethod
+    def is_connected(self) -> bool:
+        """Whether the transport can deliver messages."""
+
+    @abstractmethod
+    async def publish(
+        self,
+        subject: str,
+        payload: bytes = b"",
+        reply: str = "",
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        """Publish a payload to a subject."""
+
+    @abstractmethod
+    async def subscribe(
+        self,
+        subject: str,
+        queue: str = "",
+        cb: Callable[[Any], Awaitable[None]] | None = None,
+    ) -> Any:
+        """Subscribe a callback; returns a subscription with an ``_id``."""
+
+    @abstractmethod
+    async def request(
+        self,
+        subject: str,
+        payload: bytes = b"",
+        timeout: float = 0.5,
+        headers: dict[str, str] | None = None,
+    ) -> Any:
+        """Publish a request and wait for the first reply message."""
+
+    @abstractmethod
+    async def drain(self) -> None:
+        """Deliver in-flight messages, then stop accepting new ones."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Close the transport."""
+
+
+# -----------------------------------------------------------------------------
+# In-process loopback
+# -----------------------------------------------------------------------------
+
+
+@dataclass
+class LoopbackMsg:
+    """A delivered message (same attributes as nats.aio.msg.Msg)."""
+
+    subject: str
+    data: bytes
+    reply: str = ""
+    headers: dict[str, str] | None = None
+
+
+@dataclass
+class LoopbackSubscription:
+    """A subscription on a LoopbackTransport."""
+
+    _id: int
+    subject: str
+    queue: str
+    cb: Callable[[LoopbackMsg], Awaitable[None]] | None
+    loop: asyncio.AbstractEventLoop
+    _transport: "LoopbackTransport"
+    _inbox: asyncio.Queue = field(default_factory=asyncio.Queue)
+    _worker: asyncio.Task | None = None
+    delivered: int = 0
+
+    async def unsubscribe(self) -> None:
+        """Stop receiving messages."""
+        self._transport._remove(self)
+
+    def _deliver(self, msg: LoopbackMsg) -> bool:
+        """Queue a message from any loop; False if this subscription is dead."""
+        if self.loop.is_closed():
+            return False
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self.loop:
+            self._inbox.put_nowait(msg)
+        else:
+            self.loop.call_soon_threadsafe(self._inbox.put_nowait, msg)
+        return True
+
+    async def _run(self) -> None:
+        """Handle queued messages in order."""
+        while True:
+            msg = await self._inbox.get()
+            self.delivered += 1
+            if self.cb is not None:
+                try:
+                    await self.cb(msg)
+                except Exception as e:
+                    print(f"Error in loopback subscriber for {self.subject}: {e}")
+            self._inbox.task_done()
+
+
+class LoopbackTransport(MessageTransport):
+    """
+    In-memory transport for agents that share one process.
+
+    Usage:
+        bus = NATSMessageBus(transport=LoopbackTransport())
+        await bus.connect()
+
+    Subscriptions may live on different event loops (e.g. code that calls
+    asyncio.run per operation); messages are handed to each subscriber's
+    own loop, and subscriptions whose loop has closed are dropped.
+    """
+
+    _INBOX_PREFIX = "_INBOX"
+    MATCH_CACHE_SIZE = 1024  # Subjects whose matching subscriptions are remembered
+
+    def __init__(self) -> None:
+        """Initialize an empty transport."""
+        self._subs: dict[int, LoopbackSubscription] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        # subject -> subscriptions matching it (LRU), cleared when subscriptions change
+        self._match_cache: OrderedDict[str, list[LoopbackSubscription]] = OrderedDict()
+        self._queue_cursors: dict[str, int] = {}
+        self._pending_replies: dict[str, asyncio.Future] = {}
+        self._closed = False
+        self.stats = {"in_msgs": 0, "out_msgs": 0, "in_bytes": 0, "out_bytes": 0}
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether the transport is open."""
+        return not self._closed
+
+    @property
+    def subscription_count(self) -> int:
+        """Number of live subscriptions."""
+        return len(self._subs)
+
+    async def publish(
+        self,
+        subject: str,
+        payload: bytes = b"",
+        reply: str = "",
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        """
+        Publish a payload to every matching subscription.
+
+        Args:
+            subject: Subject to publish to (no wildcards)
+            payload: Message bytes
+            reply: Subject replies should be sent to
+            headers: Optional message headers
+        """
+        if self._closed:
+            raise RuntimeError("Loopback transport is closed")
+
+        self.stats["out_msgs"] += 1
+        self.stats["out_bytes"] += len(payload)
+        msg = LoopbackMsg(subject=subject, data=payload, reply=reply, headers=headers)
+
+        if subject.startswith(self._INBOX_PREFIX):
+            future = self._pending_replies.pop(subject, None)
+            if future is not None:
+                _resolve(future, msg)
+                return
+
+        for sub in self._targets(subject):
+            if sub._deliver(msg):
+                self.stats["in_msgs"] += 1
+                self.stats["in_bytes"] += len(payload)
+            else:
+                self._remove(sub)
+
+    async def subscribe(
+        self,
+        subject: str,
+        queue: str = "",
+        cb: Callable[[LoopbackMsg], Awaitable[None]] | None = None,
+    ) -> LoopbackSubscription:
+        """
+        Subscribe a callback to a subject pattern.
+
+        Args:
+            subject: Subject pattern (may use * and >)
+            queue: Queue group name; members share each message
+            cb: Coroutine called with each LoopbackMsg
+
+        Returns:
+            The subscription
+        """
+        if self._closed:
+            raise RuntimeError("Loopback transport is closed")
+
+        sub = LoopbackSubscription(
+            _id=next(self._ids),
+            subject=subject,
+            queue=queue or "",
+            cb=cb,
+            loop=asyncio.get_running_loop(),
+            _transport=self,
+        )
+        sub._worker = asyncio.create_task(sub._run())
+        with self._lock:
+            self._subs[sub._id] = sub
+            self._match_cache.clear()
+        return sub
+
+    async def request(
+        self,
+        subject: str,
+        payload: bytes = b"",
+        timeout: float = 0.5,
+        headers: dict[str, str] | None = None,
+    ) -> LoopbackMsg:
+        """
+        Publish a request and wait for the first reply.
+
+        Args:
+            subject: Subject to send the request to
+            payload: Request bytes
+            timeout: Seconds to wait for a reply
+            headers: Optional message headers
+
+        Returns:
+            The reply message
+
+        Raises:
+            TimeoutError: If nobody is subscribed or no reply arrives in time
+        """
+        if not self._matching(subject):
+            raise TimeoutError(f"No responders on {subject}")
+
+        inbox = f"{self._INBOX_PREFIX}.{next(self._ids)}"
+        future = asyncio.get_running_loop().create_future()
+        self._pending_replies[inbox] = future
+        try:
+            await self.publish(subject, payload, reply=inbox, headers=headers)
+            return await asyncio.wait_for(future, timeout)
+        except TimeoutError:
+            raise TimeoutError(f"No reply on {subject} within {timeout}s") from None
+        finally:
+            self._pending_replies.pop(inbox, None)
+
+    async def drain(self) -> None:
+        """Wait until subscriptions on this loop have handled queued messages."""
+        loop = asyncio.get_running_loop()
+        for sub in list(self._subs.values()):
+            if sub.loop is loop and sub._worker is not None and not sub._worker.done():
+                await sub._inbox.join()
+
+    async def close(self) -> None:
+        """Cancel every subscription and refuse further use."""
+        self._closed = True
+        with self._lock:
+            subs = list(self._subs.values())
+            self._subs.clear()
+            self._match_cache.clear()
+        for sub in subs:
+            _cancel_worker(sub)
+        for future in self._pending_replies.values():
+            if not future.done():
+                future.get_loop().call_soon_threadsafe(future.cancel)
+        self._pending_replies.clear()
+
+    def _matching(self, subject: str) -> list[LoopbackSubscription]:
+        """Subscriptions whose pattern matches a subject (no round-robin side effects)."""
+        with self._lock:
+            matching = self._match_cache.get(subject)
+            if matching is not None:
+                self._match_cache.move_to_end(subject)
+                return matching
+
+            matching = [
+                sub for sub in self._subs.values() if subject_matches(sub.subject, subject)
+            ]
+            self._match_cache[subject] = matching
+            if len(self._match_cache) > self.MATCH_CACHE_SIZE:
+                self._match_cache.popitem(last=False)
+        return matching
+
+    def _targets(self, subject: str) -> list[LoopbackSubscription]:
+        """Subscriptions that receive a message on a subject."""
+        matching = self._matching(subject)
+        with self._lock:
+            targets = []
+            groups: dict[str, list[LoopbackSubscription]] = {}
+            for sub in matching:
+                if sub.queue:
+                    groups.setdefault(sub.queue, []).append(sub)
+                else:
+                    targets.append(sub)
+
+            # One member of each queue group, round-robin
+            for queue, members in groups.items():
+                cursor = self._queue_cursors.get(queue, 0)
+                targets.append(members[cursor % len(members)])
+                self._queue_cursors[queue] = cursor + 1
+        return targets
+
+    def _remove(self, sub: LoopbackSubscription) -> None:
+        """Drop a subscription and stop its worker."""
+        with self._lock:
+            if self._subs.pop(sub._id, None) is None:
+                return
+            self._match_cache.clear()
+        _cancel_worker(sub)
+
+
+def _resolve(future: asyncio.Future, msg: LoopbackMsg) -> None:
+    """Complete a reply future from any loop."""
+    def set_result() -> None:
+        if not future.done():
+            future.set_result(msg)
+
+    loop = future.get_loop()
+    try:
+        same_loop = asyncio.get_running_loop() is loop
+    except RuntimeError:
+        same_loop = False
+    if same_loop:
+        set_result()
+    elif not loop.is_closed():
+        loop.call_soon_threadsafe(set_result)
+
+
+def _cancel_worker(sub: LoopbackSubscription) -> None:
+    """Cancel a subscription's worker task on its own loop."""
+    worker = sub._worker
+    if worker is None or worker.done() or sub.loop.is_closed():
+        return
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is sub.loop:
+        worker.cancel()
+    else:
+        sub.loop.call_soon_threadsafe(worker.cancel)
+
+
+# Singleton shared by every loopback:// bus in the process
+_loopback: LoopbackTransport | None = None
+_loopback_lock = threading.Lock()
+
+
+def get_loopback_transport() -> LoopbackTransport:
+    """Get the process-wide loopback transport (recreated after close)."""
+    global _loopback
+    with _loopback_lock:
+        if _loopback is None or not _loopback.is_connected:
+            _loopback = LoopbackTransport()
+        return _loopback
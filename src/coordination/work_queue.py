@@ -0,0 +1,328 @@
+"""
+Durable Work Queue - Persisted work items with acks and redelivery.
+
+Core NATS queue groups deliver each item to one subscribed worker, but an
+item published while no worker is subscribed is dropped, and an item whose
+worker crashes mid-task is lost.
+
+DurableWorkQueue keeps items in SQLite (WAL mode), in the spirit of a
+JetStream work-queue stream with pull consumers:
+- publish() appends an item to a named queue (the stream) and returns its
+  sequence number; items survive restarts until acknowledged.
+- fetch() leases up to N available items to a consumer in sequence order,
+  never letting a consumer hold more than max_in_flight unacknowledged.
+- ack() deletes an item; nak() returns it for redelivery after a backoff
+  that grows with its delivery count.
+- A lease that is not acked within ack_wait expires, and the item is
+  redelivered to the next fetch (crashed workers lose nothing).
+- Items delivered max_deliver times without an ack are moved aside as dead
+  letters instead of being redelivered forever.
+"""
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS queue_items (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    queue TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    published_at REAL NOT NULL,
+    available_at REAL NOT NULL,
+    deliveries INTEGER NOT NULL DEFAULT 0,
+    consumer TEXT,
+    dead INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_queue_items_available
+    ON queue_items(queue, dead, available_at, seq);
+CREATE INDEX IF NOT EXISTS idx_queue_items_consumer
+    ON queue_items(queue, consumer, available_at);
+"""
+
+
+@dataclass(frozen=True)
+class QueueItem:
+    """A work item leased to a consumer."""
+
+    seq: int
+    queue: str
+    payload: bytes
+    deliveries: int  # Including this delivery
+    consumer: str | None
+
+
+class DurableWorkQueue:
+    """
+    SQLite-backed work queues with explicit acknowledgement.
+
+    Usage:
+        work_queue = DurableWorkQueue()
+        work_queue.publish("builds", payload)
+        for item in work_queue.fetch("builds", "worker-1", batch=10):
+            ...
+            work_queue.ack(item)  # or work_queue.nak(item) to retry later
+    """
+
+    DEFAULT_ACK_WAIT = 30.0  # Seconds a lease lasts before redelivery
+    DEFAULT_MAX_DELIVER = 5
+    DEFAULT_MAX_IN_FLIGHT = 100  # Unacked items per consumer
+    DEFAULT_BACKOFF = (1.0, 5.0, 30.0, 120.0)  # nak delay by delivery count
+
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        ack_wait: float | None = None,
+        max_deliver: int | None = None,
+        backoff: tuple[float, ...] | None = None,
+    ):
+        """
+        Open (and create if needed) the queue database.
+
+        Args:
+            db_path: Path to the SQLite file. Defaults to config/.work_queue.db
+            ack_wait: Seconds a consumer has to ack before the item is
+                      redelivered. Defaults to DEFAULT_ACK_WAIT
+            max_deliver: Deliveries before an item becomes a dead letter.
+                         Defaults to DEFAULT_MAX_DELIVER
+            backoff: Redelivery delays after a nak, indexed by delivery count
+                     (the last entry repeats). Defaults to DEFAULT_BACKOFF
+        """
+        if db_path is None:
+            db_path = Path(__file__).parent.parent.parent / "config" / ".work_queue.db"
+
+        self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ack_wait = ack_wait if ack_wait is not None else self.DEFAULT_ACK_WAIT
+        self.max_deliver = max_deliver if max_deliver is not None else self.DEFAULT_MAX_DELIVER
+        self.backoff = tuple(backoff) if backoff is not None else self.DEFAULT_BACKOFF
+
+        self._lock = threading.Lock()
+        # Autocommit; multi-statement operations open explicit transactions
+        self._conn = sqlite3.connect(
+            str(self.db_path), timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    # -------------------------------------------------------------------------
+    # Publishing
+    # -------------------------------------------------------------------------
+
+    def publish(self, queue: str, payload: bytes, delay: float = 0.0) -> int:
+        """
+        Append an item to a queue.
+
+        Args:
+            queue: Queue name
+            payload: Item bytes
+            delay: Seconds before the item becomes available
+
+        Returns:
+            Sequence number of the item
+        """
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO queue_items (queue, payload, published_at, available_at) "
+                "VALUES (?, ?, ?, ?)",
+                (queue, payload, now, now + delay),
+            )
+            return int(cursor.lastrowid or 0)
+
+    def publish_many(self, queue: str, payloads: list[bytes]) -> int:
+        """
+        Append several items in one transaction.
+
+        Returns:
+            Number of items published
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO queue_items (queue, payload, published_at, available_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    [(queue, payload, now, now) for payload in payloads],
+                )
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+        return len(payloads)
+
+    # -------------------------------------------------------------------------
+    # Consuming
+    # -------------------------------------------------------------------------
+
+    def fetch(
+        self,
+        queue: str,
+        consumer: str,
+        batch: int = 1,
+        max_in_flight: int | None = None,
+    ) -> list[QueueItem]:
+        """
+        Lease available items to a consumer, oldest first.
+
+        Args:
+            queue: Queue name
+            consumer: Consumer ID (unique per worker)
+            batch: Maximum number of items to return
+            max_in_flight: Cap on this consumer's unacked items.
+                           Defaults to DEFAULT_MAX_IN_FLIGHT
+
+        Returns:
+            Leased items (possibly empty)
+        """
+        if max_in_flight is None:
+            max_in_flight = self.DEFAULT_MAX_IN_FLIGHT
+        now = time.time()
+
+        with self._lock:
+            # IMMEDIATE takes the write lock up front, so two processes can
+            # never lease the same item
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "UPDATE queue_items SET dead = 1, consumer = NULL "
+                    "WHERE queue = ? AND dead = 0 AND available_at <= ? AND deliveries >= ?",
+                    (queue, now, self.max_deliver),
+                )
+                in_flight = self._conn.execute(
+                    "SELECT COUNT(*) FROM queue_items "
+                    "WHERE queue = ? AND consumer = ? AND dead = 0 AND available_at > ?",
+                    (queue, consumer, now),
+                ).fetchone()[0]
+                limit = min(batch, max_in_flight - in_flight)
+                if limit <= 0:
+                    self._conn.execute("COMMIT")
+                    return []
+
+                rows = self._conn.execute(
+                    "SELECT seq, payload, deliveries FROM queue_items "
+                    "WHERE queue = ? AND dead = 0 AND available_at <= ? "
+                    "ORDER BY seq LIMIT ?",
+                    (queue, now, limit),
+                ).fetchall()
+                self._conn.executemany(
+                    "UPDATE queue_items SET consumer = ?, deliveries = deliveries + 1, "
+                    "available_at = ? WHERE seq = ?",
+                    [(consumer, now + self.ack_wait, seq) for seq, _, _ in rows],
+                )
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        return [
+            QueueItem(seq, queue, bytes(payload), deliveries + 1, consumer)
+            for seq, payload, deliveries in rows
+        ]
+
+    def ack(self, item: QueueItem) -> bool:
+        """
+        Acknowledge an item, removing it from the queue.
+
+        Returns:
+            False if the lease was lost (expired and redelivered) first
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM queue_items WHERE seq = ? AND consumer IS ? AND deliveries = ?",
+                (item.seq, item.consumer, item.deliveries),
+            )
+            return cursor.rowcount == 1
+
+    def nak(self, item: QueueItem, delay: float | None = None) -> bool:
+        """
+        Return an item for redelivery.
+
+        Args:
+            item: Item leased by fetch()
+            delay: Seconds before redelivery. Defaults to the backoff for
+                   the item's delivery count
+
+        Returns:
+            False if the lease was lost (expired and redelivered) first
+        """
+        if delay is None:
+            delay = self.backoff[min(item.deliveries, len(self.backoff)) - 1] if self.backoff else 0
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE queue_items SET consumer = NULL, available_at = ? "
+                "WHERE seq = ? AND consumer IS ? AND deliveries = ?",
+                (time.time() + delay, item.seq, item.consumer, item.deliveries),
+            )
+            return cursor.rowcount == 1
+
+    def in_progress(self, item: QueueItem) -> bool:
+        """
+        Extend an item's lease by ack_wait (for long-running work).
+
+        Returns:
+            False if the lease was lost (expired and redelivered) first
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE queue_items SET available_at = ? "
+                "WHERE seq = ? AND consumer IS ? AND deliveries = ?",
+                (time.time() + self.ack_wait, item.seq, item.consumer, item.deliveries),
+            )
+            return cursor.rowcount == 1
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def pending(self, queue: str) -> int:
+        """Number of items not yet acknowledged (excluding dead letters)."""
+        with self._lock:
+            count = self._conn.execute(
+                "SELECT COUNT(*) FROM queue_items WHERE queue = ? AND dead = 0", (queue,)
+            ).fetchone()[0]
+        return int(count)
+
+    def in_flight(self, queue: str, consumer: str | None = None) -> int:
+        """Number of items currently leased (optionally to one consumer)."""
+        query = (
+            "SELECT COUNT(*) FROM queue_items "
+            "WHERE queue = ? AND dead = 0 AND consumer IS NOT NULL AND available_at > ?"
+        )
+        params: tuple = (queue, time.time())
+        if consumer is not None:
+            query += " AND consumer = ?"
+            params += (consumer,)
+        with self._lock:
+            count = self._conn.execute(query, params).fetchone()[0]
+        return int(count)
+
+    def dead_letters(self, queue: str) -> list[QueueItem]:
+        """Items that exhausted max_deliver, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, payload, deliveries FROM queue_items "
+                "WHERE queue = ? AND dead = 1 ORDER BY seq",
+                (queue,),
+            ).fetchall()
+        return [QueueItem(seq, queue, bytes(payload), n, None) for seq, payload, n in rows]
+
+    def purge(self, queue: str) -> int:
+        """
+        Delete every item in a queue, including dead letters.
+
+        Returns:
+            Number of items deleted
+        """
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM queue_items WHERE queue = ?", (queue,))
+            return cursor.rowcount
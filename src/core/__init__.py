@@ -1,5 +1,6 @@
 """Core orchestration logic."""
 
+from src.core.readiness import ReadinessTracker
 from src.core.role_registry import AgentRole, RoleRegistry
 from src.core.task_decomposer import (
     DecompositionResult,
@@ -24,6 +25,7 @@ __all__ = [
     "TaskDecomposer",
     "DecompositionResult",
     "DependencyGraph",
+    "ReadinessTracker",
     "SubtaskNode",
     "RoleRegistry",
     "AgentRole",
@@ -14,12 +14,32 @@ Memory Types:
 
 The system auto-summarizes when episodic entries exceed a threshold,
 creating distilled wisdom while preserving the original experiences.
+
+Persistence is write-through by default. In write-behind mode, changes mark
+the journal dirty and are committed (atomically, via temp file + rename)
+once enough writes are pending, after a flush interval, on an explicit
+flush(), or at interpreter exit.
+
+Journals can instead live in a shared SQLite database (see memory_store.py),
+where every memory is written as its own row.
 """
 
+import atexit
+import bisect
+import heapq
+import itertools
 import json
+import os
+import threading
+import weakref
+from collections.abc import Iterable, Iterator, MutableMapping
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.core.memory_store import SQLiteMemoryStore
 
 
 class MemoryType(str, Enum):
@@ -52,6 +72,7 @@ class MemoryEntry:
         self.related_to = related_to  # Could be agent name, file, concept
         self.created_at = created_at or datetime.now().isoformat()
         self.session_id = session_id
+        self.store_id: int | None = None  # Row id in a SQLiteMemoryStore
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -67,7 +88,7 @@ class MemoryEntry:
     @classmethod
     def from_dict(cls, data: dict) -> "MemoryEntry":
         """Create from dictionary."""
-        return cls(
+        entry = cls(
             content=data["content"],
             memory_type=MemoryType(data["type"]),
             tags=data.get("tags", []),
@@ -75,12 +96,208 @@ class MemoryEntry:
             created_at=data.get("created_at"),
             session_id=data.get("session_id"),
         )
+        entry.store_id = data.get("id")
+        return entry
 
     def __repr__(self) -> str:
         preview = self.content[:50] + "..." if len(self.content) > 50 else self.content
         return f"MemoryEntry({self.memory_type.value}: {preview!r})"
 
 
+class LazyMemories(MutableMapping[str, list[MemoryEntry]]):
+    """
+    Memory lists keyed by MemoryType value, hydrated on first access.
+
+    Entries are kept as the raw dicts parsed from the journal until a
+    memory type is first read, at which point that type (only) is turned
+    into MemoryEntry objects. Counting and serializing never hydrate.
+    """
+
+    def __init__(self, raw: dict[str, list[dict]] | None = None):
+        raw = raw or {}
+        self._raw: dict[str, list[dict]] = {
+            t.value: list(raw.get(t.value, [])) for t in MemoryType
+        }
+        self._hydrated: dict[str, list[MemoryEntry]] = {}
+
+    def __getitem__(self, key: str) -> list[MemoryEntry]:
+        if key not in self._hydrated:
+            if key not in self._raw:
+                raise KeyError(key)
+            self._hydrated[key] = [MemoryEntry.from_dict(e) for e in self._raw.pop(key)]
+        return self._hydrated[key]
+
+    def __setitem__(self, key: str, value: list[MemoryEntry]) -> None:
+        self._raw.pop(key, None)
+        self._hydrated[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in self._hydrated:
+            del self._hydrated[key]
+        else:
+            del self._raw[key]
+
+    def __iter__(self) -> Iterator[str]:
+        for mem_type in MemoryType:
+            if mem_type.value in self._hydrated or mem_type.value in self._raw:
+                yield mem_type.value
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def is_hydrated(self, key: str) -> bool:
+        """Whether a memory type has been turned into MemoryEntry objects."""
+        return key in self._hydrated
+
+    def count(self, key: str) -> int:
+        """Number of entries of a type, without hydrating it."""
+        if key in self._hydrated:
+            return len(self._hydrated[key])
+        return len(self._raw.get(key, []))
+
+    def tail(self, key: str, n: int) -> list[MemoryEntry]:
+        """The last n entries of a type, hydrating only those."""
+        if key in self._hydrated:
+            return self._hydrated[key][-n:] if n > 0 else []
+        raw = self._raw.get(key, [])
+        return [MemoryEntry.from_dict(e) for e in raw[-n:]] if n > 0 else []
+
+    def serialize(self, key: str) -> list[dict]:
+        """Entries of a type as dicts, reusing the raw form if never hydrated."""
+        if key in self._hydrated:
+            return [e.to_dict() for e in self._hydrated[key]]
+        return self._raw.get(key, [])
+
+
+# (created_at, sequence, entry): ordered by time, sequence breaks ties
+_IndexRecord = tuple[str, int, MemoryEntry]
+
+
+class MemoryIndex:
+    """
+    Time-ordered inverted indexes over hydrated memories.
+
+    Keeps one list per memory type, per tag and per normalized relation
+    (lowercased, stripped), each sorted by created_at. A recall merges only
+    the lists that can contain matches, newest first, and stops after
+    `limit` hits instead of filtering and sorting everything.
+
+    Removed entries are tombstoned and swept out once they outnumber the
+    live ones.
+    """
+
+    def __init__(self) -> None:
+        self.by_type: dict[str, list[_IndexRecord]] = {}
+        self.by_tag: dict[str, list[_IndexRecord]] = {}
+        self.by_relation: dict[str, list[_IndexRecord]] = {}
+        self.indexed_types: set[str] = set()
+        self._seq = itertools.count()
+        self._seq_of: dict[int, int] = {}  # id(entry) -> sequence
+        self._removed: set[int] = set()
+
+    @staticmethod
+    def normalize_relation(related_to: str) -> str:
+        """Normalize a relation for indexing and lookup."""
+        return related_to.strip().lower()
+
+    def add_type(self, mem_type: str, entries: Iterable[MemoryEntry]) -> None:
+        """Index every entry of a memory type for the first time."""
+        self.indexed_types.add(mem_type)
+        self.by_type.setdefault(mem_type, [])
+        for entry in sorted(entries, key=lambda e: e.created_at):
+            self.add(entry)
+
+    def add(self, entry: MemoryEntry) -> None:
+        """Index a single entry."""
+        seq = next(self._seq)
+        self._seq_of[id(entry)] = seq
+        record = (entry.created_at, seq, entry)
+
+        bisect.insort(self.by_type.setdefault(entry.memory_type.value, []), record)
+        for tag in set(entry.tags):
+            bisect.insort(self.by_tag.setdefault(tag, []), record)
+        if entry.related_to:
+            relation = self.normalize_relation(entry.related_to)
+            bisect.insort(self.by_relation.setdefault(relation, []), record)
+
+    def remove(self, entries: Iterable[MemoryEntry]) -> None:
+        """Tombstone entries that are no longer in the journal."""
+        for entry in entries:
+            seq = self._seq_of.pop(id(entry), None)
+            if seq is not None:
+                self._removed.add(seq)
+        if len(self._removed) > len(self._seq_of):
+            self._sweep()
+
+    def _sweep(self) -> None:
+        """Drop tombstoned records from every list."""
+        removed = self._removed
+        for index in (self.by_type, self.by_tag, self.by_relation):
+            for key in list(index):
+                live = [r for r in index[key] if r[1] not in removed]
+                if live or index is self.by_type:
+                    index[key] = live
+                else:
+                    del index[key]
+        self._removed = set()
+
+    def query(
+        self,
+        mem_types: list[str] | None = None,
+        tags: list[str] | None = None,
+        related_to: str | None = None,
+        limit: int = 10,
+    ) -> list[MemoryEntry]:
+        """
+        Return the newest entries matching every given filter.
+
+        Args:
+            mem_types: Allowed memory types (None for all indexed types)
+            tags: Match entries with any of these tags
+            related_to: Case-insensitive substring of the entry's relation
+            limit: Maximum entries to return
+
+        Returns:
+            Matching entries, newest first
+        """
+        if limit <= 0:
+            return []
+
+        relation = self.normalize_relation(related_to) if related_to else None
+        type_filter = set(mem_types) if mem_types is not None else None
+        tag_filter = set(tags) if tags else None
+
+        # Pick the narrowest family of lists that must contain every match
+        if tag_filter is not None:
+            streams = [self.by_tag[t] for t in tag_filter if t in self.by_tag]
+            tag_filter = None  # Satisfied by construction
+        elif relation is not None:
+            streams = [v for k, v in self.by_relation.items() if relation in k]
+            relation = None  # Satisfied by construction
+        else:
+            keys = mem_types if mem_types is not None else list(self.by_type)
+            streams = [self.by_type[k] for k in keys if k in self.by_type]
+            type_filter = None  # Satisfied by construction
+
+        results: list[MemoryEntry] = []
+        last_seq = -1
+        merged = heapq.merge(*(reversed(s) for s in streams), reverse=True)
+        for created_at, seq, entry in merged:
+            if seq == last_seq or seq in self._removed:
+                continue  # Same entry reached through two tags, or removed
+            last_seq = seq
+            if type_filter is not None and entry.memory_type.value not in type_filter:
+                continue
+            if relation is not None and not (
+                entry.related_to and relation in self.normalize_relation(entry.related_to)
+            ):
+                continue
+            results.append(entry)
+            if len(results) >= limit:
+                break
+        return results
+
+
 class AgentMemory:
     """
     Personal memory system for an individual agent.
@@ -97,8 +314,20 @@ class AgentMemory:
     """
 
     SUMMARIZE_THRESHOLD = 10  # Auto-summarize after this many entries per type
+    WRITE_BEHIND = False  # Default persistence mode (see enable_write_behind)
+    DEFAULT_STORE: "SQLiteMemoryStore | None" = None  # Shared store (see use_shared_store)
+    FLUSH_INTERVAL_SECONDS = 2.0  # Write-behind: max age of unflushed changes
+    MAX_PENDING_WRITES = 25  # Write-behind: flush once this many changes are pending
 
-    def __init__(self, agent_name: str, storage_path: Path | None = None):
+    def __init__(
+        self,
+        agent_name: str,
+        storage_path: Path | None = None,
+        write_behind: bool | None = None,
+        flush_interval: float | None = None,
+        max_pending: int | None = None,
+        store: "SQLiteMemoryStore | None" = None,
+    ):
         """
         Initialize memory for an agent.
 
@@ -106,8 +335,29 @@ class AgentMemory:
             agent_name: The personal name of the agent
             storage_path: Path to memory storage directory.
                          Defaults to config/agent_memories/
+            write_behind: Batch writes instead of rewriting the journal on
+                          every change. Call flush() when durability matters.
+                          Defaults to WRITE_BEHIND
+            flush_interval: Seconds before pending changes are flushed.
+                            Defaults to FLUSH_INTERVAL_SECONDS
+            max_pending: Pending changes that force an immediate flush.
+                         Defaults to MAX_PENDING_WRITES
+            store: Shared SQLite store to use instead of the JSON file.
+                   Defaults to DEFAULT_STORE. Writes are per-row, so
+                   write-behind settings do not apply.
         """
         self.agent_name = agent_name
+        self.write_behind = write_behind if write_behind is not None else self.WRITE_BEHIND
+        self.flush_interval = (
+            flush_interval if flush_interval is not None else self.FLUSH_INTERVAL_SECONDS
+        )
+        self.max_pending = max_pending if max_pending is not None else self.MAX_PENDING_WRITES
+        self.store = store if store is not None else self.DEFAULT_STORE
+
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._pending = 0
+        self._flush_timer: threading.Timer | None = None
 
         if storage_path is None:
             project_root = Path(__file__).parent.parent.parent
@@ -119,48 +369,76 @@ class AgentMemory:
         # Ensure storage directory exists
         self.storage_path.mkdir(parents=True, exist_ok=True)
 
-        self.memories: dict[str, list[MemoryEntry]] = self._load_memories()
-        self.summaries: dict[str, list[str]] = self._load_summaries()
+        self.memories, self.summaries = self._load()
+        self._index = MemoryIndex()
 
-    def _load_memories(self) -> dict[str, list[MemoryEntry]]:
-        """Load memories from disk."""
-        if not self.memory_file.exists():
-            return {t.value: [] for t in MemoryType}
+    def _load(self) -> tuple[LazyMemories, dict[str, list[str]]]:
+        """Load memories and summaries from disk with a single parse."""
+        if self.store is not None:
+            raw, summaries = self.store.load_journal(self.agent_name)
+            return LazyMemories(raw), summaries
 
-        with open(self.memory_file) as f:
-            data = json.load(f)
-
-        memories = {}
-        for mem_type in MemoryType:
-            entries = data.get("memories", {}).get(mem_type.value, [])
-            memories[mem_type.value] = [MemoryEntry.from_dict(e) for e in entries]
-
-        return memories
-
-    def _load_summaries(self) -> dict[str, list[str]]:
-        """Load summaries from disk."""
         if not self.memory_file.exists():
-            return {t.value: [] for t in MemoryType}
+            return LazyMemories(), {t.value: [] for t in MemoryType}
 
         with open(self.memory_file) as f:
             data = json.load(f)
 
-        return data.get("summaries", {t.value: [] for t in MemoryType})
+        memories = LazyMemories(data.get("memories", {}))
+        summaries = data.get("summaries", {t.value: [] for t in MemoryType})
+        return memories, summaries
 
     def _save(self) -> None:
-        """Persist memories to disk."""
+        """Persist memories to disk (or schedule it, in write-behind mode)."""
+        if not self.write_behind:
+            self._write()
+            return
+
+        with self._lock:
+            self._dirty = True
+            self._pending += 1
+            if self._pending >= self.max_pending:
+                self.flush()
+            elif self._flush_timer is None:
+                _track_write_behind(self)
+                self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _write(self) -> None:
+        """Atomically write the whole journal (temp file + rename)."""
         data = {
             "agent_name": self.agent_name,
             "last_updated": datetime.now().isoformat(),
-            "memories": {
-                mem_type: [e.to_dict() for e in entries]
-                for mem_type, entries in self.memories.items()
-            },
+            "memories": self._serialize_memories(),
             "summaries": self.summaries,
         }
 
-        with open(self.memory_file, "w") as f:
+        tmp_file = self.memory_file.with_name(f".{self.memory_file.name}.tmp")
+        with open(tmp_file, "w") as f:
             json.dump(data, f, indent=2)
+        os.replace(tmp_file, self.memory_file)
+
+    def _serialize_memories(self) -> dict[str, list[dict]]:
+        """Serialize all memory lists, skipping hydration where possible."""
+        return {mem_type: self.memories.serialize(mem_type) for mem_type in self.memories}
+
+    @property
+    def has_pending_writes(self) -> bool:
+        """Whether changes are waiting to be flushed to disk."""
+        return self._dirty
+
+    def flush(self) -> None:
+        """Commit any pending changes to disk."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return
+            self._write()
+            self._dirty = False
+            self._pending = 0
 
     def remember(
         self,
@@ -198,12 +476,18 @@ class AgentMemory:
             session_id=session_id,
         )
 
-        self.memories[memory_type.value].append(entry)
-        self._save()
+        with self._lock:
+            self.memories[memory_type.value].append(entry)
+            if memory_type.value in self._index.indexed_types:
+                self._index.add(entry)
+            if self.store is not None:
+                entry.store_id = self.store.add(self.agent_name, entry)
+            else:
+                self._save()
 
-        # Check if auto-summarization is needed
-        if len(self.memories[memory_type.value]) >= self.SUMMARIZE_THRESHOLD:
-            self._auto_summarize(memory_type)
+            # Check if auto-summarization is needed
+            if len(self.memories[memory_type.value]) >= self.SUMMARIZE_THRESHOLD:
+                self._auto_summarize(memory_type)
 
         return entry
 
@@ -401,7 +685,13 @@ class AgentMemory:
 
         # Keep remaining entries
         self.memories[memory_type.value] = remaining
-        self._save()
+        if memory_type.value in self._index.indexed_types:
+            self._index.remove(to_summarize)
+        if self.store is not None:
+            memory_ids = [e.store_id for e in to_summarize if e.store_id is not None]
+            self.store.summarize(self.agent_name, memory_type, memory_ids, summary)
+        else:
+            self._save()
 
         return summary
 
@@ -424,28 +714,19 @@ class AgentMemory:
         Returns:
             List of matching memory entries, newest first
         """
-        if memory_type:
-            entries = self.memories[memory_type.value]
-        else:
-            entries = [e for mem_list in self.memories.values() for e in mem_list]
-
-        # Filter by tags
-        if tags:
-            entries = [
-                e for e in entries
-                if any(t in e.tags for t in tags)
-            ]
-
-        # Filter by relation
-        if related_to:
-            entries = [
-                e for e in entries
-                if e.related_to and related_to.lower() in e.related_to.lower()
-            ]
-
-        # Sort by date (newest first) and limit
-        entries.sort(key=lambda e: e.created_at, reverse=True)
-        return entries[:limit]
+        mem_types = [memory_type.value] if memory_type else list(self.memories)
+
+        # Index (and hydrate) each type the first time it is recalled
+        for mem_type in mem_types:
+            if mem_type not in self._index.indexed_types:
+                self._index.add_type(mem_type, self.memories[mem_type])
+
+        return self._index.query(
+            mem_types=mem_types,
+            tags=tags,
+            related_to=related_to,
+            limit=limit,
+        )
 
     def recall_insights(self, limit: int = 10) -> list[MemoryEntry]:
         """Recall recent insights."""
@@ -468,15 +749,14 @@ class AgentMemory:
         """
         summary = {
             "agent_name": self.agent_name,
-            "total_memories": sum(len(e) for e in self.memories.values()),
+            "total_memories": sum(self.memories.count(t.value) for t in MemoryType),
             "by_type": {},
         }
 
         for mem_type in MemoryType:
-            entries = self.memories[mem_type.value]
             summary["by_type"][mem_type.value] = {
-                "count": len(entries),
-                "recent": [e.content for e in entries[-3:]],
+                "count": self.memories.count(mem_type.value),
+                "recent": [e.content for e in self.memories.tail(mem_type.value, 3)],
                 "summaries": len(self.summaries.get(mem_type.value, [])),
             }
 
@@ -566,11 +846,54 @@ class AgentMemory:
         return "\n".join(lines)
 
 
+# Write-behind instances with unflushed changes, flushed at interpreter exit
+
+_write_behind_instances: "weakref.WeakSet[AgentMemory]" = weakref.WeakSet()
+
+
+def _track_write_behind(memory: AgentMemory) -> None:
+    """Register a write-behind memory for the exit-time flush."""
+    _write_behind_instances.add(memory)
+
+
+@atexit.register
+def flush_all() -> None:
+    """Flush every write-behind memory that has pending changes."""
+    for memory in list(_write_behind_instances):
+        memory.flush()
+
+
 # Convenience functions for global access
 
 _memory_instances: dict[str, AgentMemory] = {}
 
 
+def enable_write_behind(enabled: bool = True) -> None:
+    """
+    Make AgentMemory instances created from now on use write-behind persistence.
+
+    Intended for long-running processes such as the memory MCP server,
+    where bursts of memories would otherwise rewrite the journal each time.
+    """
+    AgentMemory.WRITE_BEHIND = enabled
+
+
+def use_shared_store(db_path: Path | None = None) -> "SQLiteMemoryStore":
+    """
+    Make AgentMemory instances created from now on use a shared SQLite store.
+
+    Args:
+        db_path: Database path. Defaults to config/agent_memories/memories.db
+
+    Returns:
+        The store, which also answers cross-agent search() queries
+    """
+    from src.core.memory_store import SQLiteMemoryStore
+
+    AgentMemory.DEFAULT_STORE = SQLiteMemoryStore(db_path)
+    return AgentMemory.DEFAULT_STORE
+
+
 def get_memory(agent_name: str) -> AgentMemory:
     """Get or create memory instance for an agent."""
     if agent_name not in _memory_instances:
@@ -0,0 +1,373 @@
+"""
+Shared Memory Store - One SQLite database for every agent's journal.
+
+The default AgentMemory backend keeps one JSON file per agent, rewritten on
+save. That works for a single process but lets concurrent agent processes
+clobber each other, and offers no way to ask questions across agents.
+
+SQLiteMemoryStore keeps all journals in one database in WAL mode, so many
+processes can read while one writes. Each memory is its own row:
+- memories: agent, type, content, related_to, created_at (indexed)
+- memory_tags: one row per (tag, memory), for tag lookups across agents
+- memories_fts: FTS5 full-text index over content
+- summaries: distilled summaries per agent and type
+
+Usage:
+    store = SQLiteMemoryStore()
+    store.import_json_journals(Path("config/agent_memories"))
+    memory = AgentMemory("Aurora", store=store)
+    store.search(memory_type=MemoryType.INSIGHT, tags=["testing"])
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from src.core.agent_memory import MemoryEntry, MemoryType
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS memories (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    agent_name TEXT NOT NULL COLLATE NOCASE,
+    type TEXT NOT NULL,
+    content TEXT NOT NULL,
+    tags TEXT NOT NULL DEFAULT '[]',
+    related_to TEXT COLLATE NOCASE,
+    created_at TEXT NOT NULL,
+    session_id TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_memories_agent_type ON memories(agent_name, type, id);
+CREATE INDEX IF NOT EXISTS idx_memories_type_created ON memories(type, created_at);
+CREATE INDEX IF NOT EXISTS idx_memories_related ON memories(related_to);
+CREATE INDEX IF NOT EXISTS idx_memories_created ON memories(created_at);
+
+CREATE TABLE IF NOT EXISTS memory_tags (
+    tag TEXT NOT NULL,
+    memory_id INTEGER NOT NULL REFERENCES memories(id) ON DELETE CASCADE,
+    PRIMARY KEY (tag, memory_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_memory_tags_memory ON memory_tags(memory_id);
+
+CREATE TABLE IF NOT EXISTS summaries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    agent_name TEXT NOT NULL COLLATE NOCASE,
+    type TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_summaries_agent_type ON summaries(agent_name, type, id);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(
+    content, content='memories', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS memories_fts_insert AFTER INSERT ON memories BEGIN
+    INSERT INTO memories_fts(rowid, content) VALUES (new.id, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS memories_fts_delete AFTER DELETE ON memories BEGIN
+    INSERT INTO memories_fts(memories_fts, rowid, content) VALUES ('delete', old.id, old.content);
+END;
+"""
+
+
+def _fts_query(text: str) -> str:
+    """Quote each word so user text is matched literally (implicit AND)."""
+    words = text.split()
+    return " ".join('"' + w.replace('"', '""') + '"' for w in words)
+
+
+class SQLiteMemoryStore:
+    """
+    Shared, concurrent-safe storage for agent memory journals.
+
+    Writes are row-level (one INSERT per memory), so processes appending to
+    different journals, or the same journal, never overwrite each other.
+    """
+
+    def __init__(self, db_path: Path | None = None):
+        """
+        Open (and create if needed) the memory database.
+
+        Args:
+            db_path: Path to the SQLite file.
+                     Defaults to config/agent_memories/memories.db
+        """
+        if db_path is None:
+            project_root = Path(__file__).parent.parent.parent
+            db_path = project_root / "config" / "agent_memories" / "memories.db"
+
+        self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path), timeout=30.0, check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    # -------------------------------------------------------------------------
+    # Journal operations (used by AgentMemory)
+    # -------------------------------------------------------------------------
+
+    def load_journal(self, agent_name: str) -> tuple[dict[str, list[dict]], dict[str, list[str]]]:
+        """
+        Load one agent's journal in the JSON journal layout.
+
+        Args:
+            agent_name: Name of the agent (case-insensitive)
+
+        Returns:
+            Tuple of (raw memory dicts per type, summaries per type)
+        """
+        memories: dict[str, list[dict]] = {t.value: [] for t in MemoryType}
+        summaries: dict[str, list[str]] = {t.value: [] for t in MemoryType}
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM memories WHERE agent_name = ? ORDER BY id", (agent_name,)
+            ).fetchall()
+            summary_rows = self._conn.execute(
+                "SELECT type, summary FROM summaries WHERE agent_name = ? ORDER BY id",
+                (agent_name,),
+            ).fetchall()
+
+        for row in rows:
+            memories.setdefault(row["type"], []).append(self._row_to_dict(row))
+        for row in summary_rows:
+            summaries.setdefault(row["type"], []).append(row["summary"])
+
+        return memories, summaries
+
+    def add(self, agent_name: str, entry: MemoryEntry) -> int:
+        """
+        Insert a memory.
+
+        Args:
+            agent_name: Owner of the memory
+            entry: The memory entry
+
+        Returns:
+            Row id of the new memory
+        """
+        with self._lock, self._conn:
+            return self._insert(agent_name, entry.to_dict())
+
+    def summarize(
+        self, agent_name: str, memory_type: MemoryType, memory_ids: list[int], summary: str
+    ) -> None:
+        """
+        Replace specific memories of an agent with a summary.
+
+        Only the given rows are deleted, so memories other processes added
+        since this one loaded the journal survive.
+
+        Args:
+            agent_name: Owner of the memories
+            memory_type: Type being summarized
+            memory_ids: Row ids of the entries folded into the summary
+            summary: The summary text
+        """
+        with self._lock, self._conn:
+            if memory_ids:
+                placeholders = ", ".join("?" for _ in memory_ids)
+                self._conn.execute(
+                    "DELETE FROM memories WHERE agent_name = ? AND type = ? "
+                    f"AND id IN ({placeholders})",
+                    (agent_name, memory_type.value, *memory_ids),
+                )
+            self._conn.execute(
+                "INSERT INTO summaries (agent_name, type, summary, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (agent_name, memory_type.value, summary, datetime.now().isoformat()),
+            )
+
+    # -------------------------------------------------------------------------
+    # Cross-agent queries
+    # -------------------------------------------------------------------------
+
+    def search(
+        self,
+        text: str | None = None,
+        agent_name: str | None = None,
+        memory_type: MemoryType | None = None,
+        tags: list[str] | None = None,
+        related_to: str | None = None,
+        limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        """
+        Search memories across all agents.
+
+        Args:
+            text: Full-text query over content (all words must match)
+            agent_name: Restrict to one agent
+            memory_type: Restrict to one memory type
+            tags: Match memories with any of these tags
+            related_to: Case-insensitive substring of the relation
+            limit: Maximum results
+
+        Returns:
+            Memory dicts (with "agent_name"), newest first
+
+        Example:
+            >>> store.search(memory_type=MemoryType.INSIGHT, tags=["testing"])
+        """
+        clauses: list[str] = []
+        params: list[Any] = []
+
+        if text and text.strip():
+            clauses.append("m.id IN (SELECT rowid FROM memories_fts WHERE memories_fts MATCH ?)")
+            params.append(_fts_query(text))
+        if agent_name:
+            clauses.append("m.agent_name = ?")
+            params.append(agent_name)
+        if memory_type:
+            clauses.append("m.type = ?")
+            params.append(memory_type.value)
+        if tags:
+            placeholders = ", ".join("?" for _ in tags)
+            clauses.append(
+                f"m.id IN (SELECT memory_id FROM memory_tags WHERE tag IN ({placeholders}))"
+            )
+            params.extend(tags)
+        if related_to:
+            # instr, not LIKE: "_" and "%" in names must match literally
+            clauses.append("instr(lower(m.related_to), ?) > 0")
+            params.append(related_to.strip().lower())
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT m.* FROM memories m {where} "
+                "ORDER BY m.created_at DESC, m.id DESC LIMIT ?",
+                params,
+            ).fetchall()
+
+        return [{"agent_name": row["agent_name"], **self._row_to_dict(row)} for row in rows]
+
+    def agents(self) -> list[str]:
+        """List agents that have memories or summaries in the store."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT agent_name FROM memories UNION SELECT agent_name FROM summaries "
+                "ORDER BY 1"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    # -------------------------------------------------------------------------
+    # Import
+    # -------------------------------------------------------------------------
+
+    def import_json_journal(self, journal_file: Path, replace: bool = False) -> int:
+        """
+        Import one JSON journal written by the file-based AgentMemory.
+
+        Args:
+            journal_file: Path to <agent>.json
+            replace: Overwrite the agent's existing rows instead of skipping
+
+        Returns:
+            Number of memories imported (0 if skipped)
+        """
+        with open(journal_file) as f:
+            data = json.load(f)
+
+        agent_name = data.get("agent_name") or journal_file.stem
+
+        with self._lock, self._conn:
+            exists = self._conn.execute(
+                "SELECT 1 FROM memories WHERE agent_name = ? UNION "
+                "SELECT 1 FROM summaries WHERE agent_name = ? LIMIT 1",
+                (agent_name, agent_name),
+            ).fetchone()
+            if exists and not replace:
+                return 0
+            if exists:
+                self._conn.execute("DELETE FROM memories WHERE agent_name = ?", (agent_name,))
+                self._conn.execute("DELETE FROM summaries WHERE agent_name = ?", (agent_name,))
+
+            imported = 0
+            for entries in data.get("memories", {}).values():
+                for entry in entries:
+                    self._insert(agent_name, entry)
+                    imported += 1
+
+            now = datetime.now().isoformat()
+            for mem_type, summaries in data.get("summaries", {}).items():
+                self._conn.executemany(
+                    "INSERT INTO summaries (agent_name, type, summary, created_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    [(agent_name, mem_type, s, now) for s in summaries],
+                )
+
+        return imported
+
+    def import_json_journals(self, directory: Path, replace: bool = False) -> dict[str, int]:
+        """
+        Import every JSON journal in a directory.
+
+        Args:
+            directory: Directory containing <agent>.json files
+            replace: Overwrite agents that already exist in the store
+
+        Returns:
+            Mapping of journal file name to number of memories imported
+        """
+        return {
+            path.name: self.import_json_journal(path, replace=replace)
+            for path in sorted(directory.glob("*.json"))
+        }
+
+    # -------------------------------------------------------------------------
+    # Helpers
+    # -------------------------------------------------------------------------
+
+    def _insert(self, agent_name: str, data: dict) -> int:
+        """Insert a memory dict and its tags (caller holds lock and transaction)."""
+        tags = data.get("tags") or []
+        cursor = self._conn.execute(
+            "INSERT INTO memories "
+            "(agent_name, type, content, tags, related_to, created_at, session_id) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                agent_name,
+                data["type"],
+                data["content"],
+                json.dumps(tags),
+                data.get("related_to"),
+                data.get("created_at") or datetime.now().isoformat(),
+                data.get("session_id"),
+            ),
+        )
+        memory_id = cursor.lastrowid
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO memory_tags (tag, memory_id) VALUES (?, ?)",
+            [(tag, memory_id) for tag in tags],
+        )
+        return int(memory_id or 0)
+
+    @staticmethod
+    def _row_to_dict(row: sqlite3.Row) -> dict:
+        """Convert a memories row to the JSON journal entry layout, plus its id."""
+        return {
+            "id": row["id"],
+            "content": row["content"],
+            "type": row["type"],
+            "tags": json.loads(row["tags"]),
+            "related_to": row["related_to"],
+            "created_at": row["created_at"],
+            "session_id": row["session_id"],
+        }
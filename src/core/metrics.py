@@ -9,13 +9,14 @@ Tracks three categories of metrics:
 Based on plans/subagent-development-strategy.md success metrics.
 """
 
-import json
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from src.core.metrics_store import MetricsStore, SegmentedLogStore
+
 
 class MetricType(str, Enum):
     """Types of metrics tracked."""
@@ -74,6 +75,101 @@ class MetricEntry:
         )
 
 
+@dataclass
+class MetricRollup:
+    """Running aggregate over a stream of metric values."""
+
+    count: int = 0
+    numeric_count: int = 0
+    total: float = 0.0
+    min_value: float | None = None
+    max_value: float | None = None
+    last_value: float | int | str | None = None
+    first_timestamp: str | None = None
+    last_timestamp: str | None = None
+    daily_counts: dict[str, int] = field(default_factory=dict)
+
+    def add(self, value: float | int | str, timestamp: str) -> None:
+        """Fold one value into the aggregate in O(1)."""
+        self.count += 1
+        self.last_value = value
+
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            self.numeric_count += 1
+            self.total += value
+            if self.min_value is None or value < self.min_value:
+                self.min_value = value
+            if self.max_value is None or value > self.max_value:
+                self.max_value = value
+
+        if self.first_timestamp is None or timestamp < self.first_timestamp:
+            self.first_timestamp = timestamp
+        if self.last_timestamp is None or timestamp > self.last_timestamp:
+            self.last_timestamp = timestamp
+
+        day = timestamp[:10]
+        self.daily_counts[day] = self.daily_counts.get(day, 0) + 1
+
+    @property
+    def mean(self) -> float | None:
+        """Mean of the numeric values, or None if there are none."""
+        if self.numeric_count == 0:
+            return None
+        return self.total / self.numeric_count
+
+
+@dataclass
+class MetricsIndex:
+    """
+    Rollups and entry positions maintained incrementally by MetricsTracker.
+
+    Rollups are kept per agent per metric type and per metric type across
+    the team; positions map each agent, type and (agent, type) pair to the
+    offsets of their entries in the raw log, so filtered reads skip the scan.
+    """
+
+    agent_rollups: dict[str, dict[str, MetricRollup]] = field(default_factory=dict)
+    type_rollups: dict[str, MetricRollup] = field(default_factory=dict)
+    agent_positions: dict[str, list[int]] = field(default_factory=dict)
+    type_positions: dict[str, list[int]] = field(default_factory=dict)
+    pair_positions: dict[tuple[str, str], list[int]] = field(default_factory=dict)
+
+    def add(self, data: dict[str, Any], position: int) -> None:
+        """Index one serialized entry located at `position` in the raw log."""
+        agent = data["agent_name"]
+        metric = data["metric_type"]
+        value = data["value"]
+        timestamp = data["timestamp"]
+
+        agent_rollups = self.agent_rollups.setdefault(agent, {})
+        agent_rollups.setdefault(metric, MetricRollup()).add(value, timestamp)
+        self.type_rollups.setdefault(metric, MetricRollup()).add(value, timestamp)
+
+        self.agent_positions.setdefault(agent, []).append(position)
+        self.type_positions.setdefault(metric, []).append(position)
+        self.pair_positions.setdefault((agent, metric), []).append(position)
+
+    @classmethod
+    def build(cls, entries: list[dict[str, Any]]) -> "MetricsIndex":
+        """Build an index from scratch over the raw log."""
+        index = cls()
+        for position, data in enumerate(entries):
+            index.add(data, position)
+        return index
+
+    def rollup(self, agent_name: str, metric_type: MetricType) -> MetricRollup:
+        """Get the rollup for an agent and metric type (empty if none)."""
+        return self.agent_rollups.get(agent_name, {}).get(metric_type.value, MetricRollup())
+
+    def team_rollup(self, metric_type: MetricType) -> MetricRollup:
+        """Get the team-wide rollup for a metric type (empty if none)."""
+        return self.type_rollups.get(metric_type.value, MetricRollup())
+
+    def agent_count(self, agent_name: str, metric_type: MetricType) -> int:
+        """Count entries of a type recorded by an agent."""
+        return self.rollup(agent_name, metric_type).count
+
+
 class MetricsTracker:
     """
     Track and analyze agent metrics.
@@ -85,12 +181,14 @@ class MetricsTracker:
         summary = tracker.get_agent_summary("Nova")
     """
 
-    def __init__(self, metrics_file: Path | None = None):
+    def __init__(self, metrics_file: Path | None = None, store: MetricsStore | None = None):
         """
         Initialize metrics tracker.
 
         Args:
             metrics_file: Path to metrics JSON file. Defaults to config/metrics.json
+            store: Storage engine. Defaults to an append-only SegmentedLogStore
+                   whose snapshot lives at metrics_file
         """
         if metrics_file is None:
             project_root = Path(__file__).parent.parent.parent
@@ -98,21 +196,21 @@ class MetricsTracker:
 
         self.metrics_file = metrics_file
         self.metrics_file.parent.mkdir(parents=True, exist_ok=True)
+        self._store = store if store is not None else SegmentedLogStore(metrics_file)
         self._data = self._load()
+        self._index = MetricsIndex.build(self._data["entries"])
 
     def _load(self) -> dict[str, Any]:
-        """Load metrics from file."""
-        if self.metrics_file.exists():
-            with open(self.metrics_file) as f:
-                data: dict[str, Any] = json.load(f)
-                return data
-        return {"entries": [], "summaries": {}}
+        """Load metrics from the storage engine."""
+        return self._store.load()
 
     def _save(self) -> None:
-        """Save metrics to file."""
-        with open(self.metrics_file, "w") as f:
-            json.dump(self._data, f, indent=2)
-            f.write("\n")
+        """Write a compacted snapshot of all metrics."""
+        self._store.compact(self._data)
+
+    def compact(self) -> None:
+        """Fold the append log into a single snapshot file."""
+        self._save()
 
     def record(self, entry: MetricEntry) -> None:
         """
@@ -121,8 +219,31 @@ class MetricsTracker:
         Args:
             entry: The metric entry to record
         """
-        self._data["entries"].append(entry.to_dict())
-        self._save()
+        data = entry.to_dict()
+        self._data["entries"].append(data)
+        self._index.add(data, len(self._data["entries"]) - 1)
+        self._store.append(data, self._data)
+
+    @property
+    def index(self) -> MetricsIndex:
+        """Incrementally maintained rollups over all recorded entries."""
+        return self._index
+
+    def verify_indexes(self, repair: bool = True) -> bool:
+        """
+        Check the rollup indexes against a rebuild from the raw log.
+
+        Args:
+            repair: Replace the live indexes with the rebuilt ones on mismatch
+
+        Returns:
+            True if the live indexes matched the rebuild
+        """
+        rebuilt = MetricsIndex.build(self._data["entries"])
+        consistent = rebuilt == self._index
+        if not consistent and repair:
+            self._index = rebuilt
+        return consistent
 
     # -------------------------------------------------------------------------
     # Velocity Metrics
@@ -345,12 +466,21 @@ class MetricsTracker:
         Returns:
             List of matching MetricEntry objects
         """
+        raw = self._data["entries"]
+        positions: list[int] | None
+        if agent_name and metric_type:
+            positions = self._index.pair_positions.get((agent_name, metric_type.value), [])
+        elif agent_name:
+            positions = self._index.agent_positions.get(agent_name, [])
+        elif metric_type:
+            positions = self._index.type_positions.get(metric_type.value, [])
+        else:
+            positions = None
+
+        candidates = raw if positions is None else (raw[i] for i in positions)
+
         entries = []
-        for data in self._data["entries"]:
-            if agent_name and data["agent_name"] != agent_name:
-                continue
-            if metric_type and data["metric_type"] != metric_type.value:
-                continue
+        for data in candidates:
             if since and data["timestamp"] < since:
                 continue
             entries.append(MetricEntry.from_dict(data))
@@ -363,24 +493,21 @@ class MetricsTracker:
         Returns:
             Dict with velocity, quality, and collaboration summaries
         """
-        entries = self.get_entries(agent_name=agent_name)
+        index = self._index
 
         # Count by type
-        phases_completed = sum(1 for e in entries if e.metric_type == MetricType.PHASE_COMPLETED)
-        tasks_completed = sum(1 for e in entries if e.metric_type == MetricType.TASK_COMPLETED)
+        phases_completed = index.agent_count(agent_name, MetricType.PHASE_COMPLETED)
+        tasks_completed = index.agent_count(agent_name, MetricType.TASK_COMPLETED)
 
         # Latest quality metrics
-        coverage_entries = [e for e in entries if e.metric_type == MetricType.TEST_COVERAGE]
-        latest_coverage = coverage_entries[-1].value if coverage_entries else None
-
-        lint_entries = [e for e in entries if e.metric_type == MetricType.LINT_ERRORS]
-        latest_lint = lint_entries[-1].value if lint_entries else None
+        latest_coverage = index.rollup(agent_name, MetricType.TEST_COVERAGE).last_value
+        latest_lint = index.rollup(agent_name, MetricType.LINT_ERRORS).last_value
 
         # Collaboration counts
-        coffee_breaks = sum(1 for e in entries if e.metric_type == MetricType.COFFEE_BREAK)
-        help_given = sum(1 for e in entries if e.metric_type == MetricType.HELP_PROVIDED)
-        help_received = sum(1 for e in entries if e.metric_type == MetricType.HELP_REQUESTED)
-        knowledge_shares = sum(1 for e in entries if e.metric_type == MetricType.KNOWLEDGE_SHARED)
+        coffee_breaks = index.agent_count(agent_name, MetricType.COFFEE_BREAK)
+        help_given = index.agent_count(agent_name, MetricType.HELP_PROVIDED)
+        help_received = index.agent_count(agent_name, MetricType.HELP_REQUESTED)
+        knowledge_shares = index.agent_count(agent_name, MetricType.KNOWLEDGE_SHARED)
 
         return {
             "agent_name": agent_name,
@@ -398,7 +525,7 @@ class MetricsTracker:
                 "help_received": help_received,
                 "knowledge_shares": knowledge_shares,
             },
-            "total_entries": len(entries),
+            "total_entries": len(index.agent_positions.get(agent_name, [])),
         }
 
     def get_team_summary(self) -> dict[str, Any]:
@@ -408,23 +535,22 @@ class MetricsTracker:
         Returns:
             Dict with team-wide metrics
         """
-        entries = self._data["entries"]
+        index = self._index
 
         # Get unique agents
-        agents = set(e["agent_name"] for e in entries)
+        agents = list(index.agent_rollups)
 
         # Team totals
-        total_phases = sum(
-            1 for e in entries if e["metric_type"] == MetricType.PHASE_COMPLETED.value
-        )
-        total_tasks = sum(1 for e in entries if e["metric_type"] == MetricType.TASK_COMPLETED.value)
-        total_breaks = sum(1 for e in entries if e["metric_type"] == MetricType.COFFEE_BREAK.value)
+        total_phases = index.team_rollup(MetricType.PHASE_COMPLETED).count
+        total_tasks = index.team_rollup(MetricType.TASK_COMPLETED).count
+        total_breaks = index.team_rollup(MetricType.COFFEE_BREAK).count
 
         # Calculate average coverage from most recent per agent
-        agent_coverage = {}
-        for e in entries:
-            if e["metric_type"] == MetricType.TEST_COVERAGE.value:
-                agent_coverage[e["agent_name"]] = e["value"]
+        agent_coverage: dict[str, float] = {
+            agent: float(rollups[MetricType.TEST_COVERAGE.value].last_value or 0)
+            for agent, rollups in index.agent_rollups.items()
+            if MetricType.TEST_COVERAGE.value in rollups
+        }
 
         avg_coverage = (
             sum(agent_coverage.values()) / len(agent_coverage) if agent_coverage else None
@@ -432,7 +558,7 @@ class MetricsTracker:
 
         return {
             "total_agents": len(agents),
-            "agents": list(agents),
+            "agents": agents,
             "velocity": {
                 "total_phases_completed": total_phases,
                 "total_tasks_completed": total_tasks,
@@ -453,22 +579,22 @@ class MetricsTracker:
         Returns:
             List of {agent_name, count/value} sorted by performance
         """
-        entries = self._data["entries"]
-        agent_scores: dict[str, float] = {}
-
-        for e in entries:
-            if e["metric_type"] == metric_type.value:
-                agent = e["agent_name"]
-                if metric_type in (
-                    MetricType.TEST_COVERAGE,
-                    MetricType.LINT_ERRORS,
-                    MetricType.TYPE_ERRORS,
-                ):
-                    # For these, keep latest value
-                    agent_scores[agent] = e["value"]
-                else:
-                    # For others, count occurrences
-                    agent_scores[agent] = agent_scores.get(agent, 0) + 1
+        agent_scores: dict[str, Any] = {}
+
+        for agent, rollups in self._index.agent_rollups.items():
+            rollup = rollups.get(metric_type.value)
+            if rollup is None:
+                continue
+            if metric_type in (
+                MetricType.TEST_COVERAGE,
+                MetricType.LINT_ERRORS,
+                MetricType.TYPE_ERRORS,
+            ):
+                # For these, keep latest value
+                agent_scores[agent] = rollup.last_value
+            else:
+                # For others, count occurrences
+                agent_scores[agent] = rollup.count
 
         # Sort by score (descending for most, ascending for errors)
         reverse = metric_type not in (MetricType.LINT_ERRORS, MetricType.TYPE_ERRORS)
@@ -694,25 +820,24 @@ class MetricsDashboard:
         Returns:
             Dict with velocity trend metrics
         """
-        phase_entries = self.tracker.get_entries(
-            agent_name=agent_name, metric_type=MetricType.PHASE_COMPLETED
-        )
+        rollup = self.tracker.index.rollup(agent_name, MetricType.PHASE_COMPLETED)
 
-        if not phase_entries:
+        if rollup.count == 0:
             return {"phases_per_day": 0, "trend": "no data"}
 
         # Calculate phases per day
-        if len(phase_entries) == 1:
+        if rollup.count == 1:
             return {"phases_per_day": 1, "trend": "single data point"}
 
         # Get time span
-        timestamps = [datetime.fromisoformat(e.timestamp) for e in phase_entries]
-        time_span = (max(timestamps) - min(timestamps)).total_seconds() / 86400  # days
+        first = datetime.fromisoformat(str(rollup.first_timestamp))
+        last = datetime.fromisoformat(str(rollup.last_timestamp))
+        time_span = (last - first).total_seconds() / 86400  # days
 
         if time_span == 0:
-            phases_per_day: float = float(len(phase_entries))  # All in one day
+            phases_per_day: float = float(rollup.count)  # All in one day
         else:
-            phases_per_day = len(phase_entries) / time_span
+            phases_per_day = rollup.count / time_span
 
         return {"phases_per_day": round(phases_per_day, 2), "trend": "calculated"}
 
@@ -726,21 +851,15 @@ class MetricsDashboard:
         Returns:
             Dict with quality trend metrics
         """
-        coverage_entries = self.tracker.get_entries(
-            agent_name=agent_name, metric_type=MetricType.TEST_COVERAGE
-        )
+        rollup = self.tracker.index.rollup(agent_name, MetricType.TEST_COVERAGE)
 
-        if not coverage_entries:
+        if rollup.count == 0 or rollup.mean is None:
             return {"avg_coverage": None, "coverage_trend": "no data"}
 
-        # Calculate average coverage
-        values = [float(e.value) for e in coverage_entries]
-        avg_coverage = sum(values) / len(values)
-
         return {
-            "avg_coverage": round(avg_coverage, 2),
+            "avg_coverage": round(rollup.mean, 2),
             "coverage_trend": "calculated",
-            "data_points": len(coverage_entries),
+            "data_points": rollup.count,
         }
 
     def calculate_collaboration_trend(self, agent_name: str) -> dict[str, Any]:
@@ -753,23 +872,16 @@ class MetricsDashboard:
         Returns:
             Dict with collaboration metrics
         """
-        coffee_entries = self.tracker.get_entries(
-            agent_name=agent_name, metric_type=MetricType.COFFEE_BREAK
-        )
-        help_given_entries = self.tracker.get_entries(
-            agent_name=agent_name, metric_type=MetricType.HELP_PROVIDED
-        )
-        help_received_entries = self.tracker.get_entries(
-            agent_name=agent_name, metric_type=MetricType.HELP_REQUESTED
-        )
+        index = self.tracker.index
+        coffee_breaks = index.agent_count(agent_name, MetricType.COFFEE_BREAK)
+        help_given = index.agent_count(agent_name, MetricType.HELP_PROVIDED)
+        help_received = index.agent_count(agent_name, MetricType.HELP_REQUESTED)
 
         return {
-            "coffee_breaks": len(coffee_entries),
-            "help_given": len(help_given_entries),
-            "help_received": len(help_received_entries),
-            "collaboration_count": len(coffee_entries)
-            + len(help_given_entries)
-            + len(help_received_entries),
+            "coffee_breaks": coffee_breaks,
+            "help_given": help_given,
+            "help_received": help_received,
+            "collaboration_count": coffee_breaks + help_given + help_received,
         }
 
     # -------------------------------------------------------------------------
@@ -796,8 +908,7 @@ class MetricsDashboard:
             Percentage of phases completed (0-100)
         """
         # Get all phase completions
-        all_entries = self.tracker._data["entries"]
-        completed = sum(1 for e in all_entries if e["metric_type"] == "phase_completed")
+        completed = self.tracker.index.team_rollup(MetricType.PHASE_COMPLETED).count
 
         # Get total phases from roadmap (if available)
         try:
@@ -822,9 +933,9 @@ class MetricsDashboard:
         Returns:
             Percentage of tasks completed vs started (0-100)
         """
-        all_entries = self.tracker._data["entries"]
-        started = sum(1 for e in all_entries if e["metric_type"] == "task_started")
-        completed = sum(1 for e in all_entries if e["metric_type"] == "task_completed")
+        index = self.tracker.index
+        started = index.team_rollup(MetricType.TASK_STARTED).count
+        completed = index.team_rollup(MetricType.TASK_COMPLETED).count
 
         if started == 0:
             return 100.0 if completed > 0 else 0.0
@@ -841,19 +952,15 @@ class MetricsDashboard:
         Returns:
             Percentage of tests passed (0-100)
         """
-        passed_entries = self.tracker.get_entries(
-            agent_name=agent_name, metric_type=MetricType.TESTS_PASSED
-        )
-        failed_entries = self.tracker.get_entries(
-            agent_name=agent_name, metric_type=MetricType.TESTS_FAILED
-        )
+        passed = self.tracker.index.rollup(agent_name, MetricType.TESTS_PASSED)
+        failed = self.tracker.index.rollup(agent_name, MetricType.TESTS_FAILED)
 
-        if not passed_entries and not failed_entries:
+        if passed.count == 0 and failed.count == 0:
             return 100.0  # No test data = assume success
 
         # Get latest values (cast to int for arithmetic)
-        total_passed = int(passed_entries[-1].value) if passed_entries else 0
-        total_failed = int(failed_entries[-1].value) if failed_entries else 0
+        total_passed = int(passed.last_value) if passed.last_value is not None else 0
+        total_failed = int(failed.last_value) if failed.last_value is not None else 0
 
         total_tests = total_passed + total_failed
         if total_tests == 0:
@@ -0,0 +1,291 @@
+"""
+Metrics Storage Engines - Pluggable persistence for MetricsTracker.
+
+MetricsTracker keeps every entry in memory and delegates durability to a
+storage engine. Two engines are provided:
+
+1. JsonFileStore - The original format: one pretty-printed JSON document,
+   rewritten in full on every append. Simple, but O(history) per write.
+2. SegmentedLogStore - Append-only JSONL segments plus a compacted JSON
+   snapshot. Each append writes a single line; segments are folded into the
+   snapshot periodically, and a torn tail left by a crash is truncated on load.
+
+The snapshot written by SegmentedLogStore uses the same layout as
+JsonFileStore, so existing config/metrics.json files load unchanged.
+"""
+
+import json
+import os
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
+
+
+def _empty_document() -> dict[str, Any]:
+    """Return an empty metrics document."""
+    return {"entries": [], "summaries": {}}
+
+
+def _atomic_write_json(path: Path, data: dict[str, Any]) -> None:
+    """Write JSON to a temp file and rename it over the target."""
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class MetricsStore(ABC):
+    """Interface for metrics persistence backends."""
+
+    @abstractmethod
+    def load(self) -> dict[str, Any]:
+        """
+        Load the full metrics document.
+
+        Returns:
+            Dict with "entries" (list of entry dicts) and "summaries"
+        """
+
+    @abstractmethod
+    def append(self, entry: dict[str, Any], data: dict[str, Any]) -> None:
+        """
+        Persist a newly recorded entry.
+
+        Args:
+            entry: The serialized entry that was just appended
+            data: The full in-memory document (already containing entry)
+        """
+
+    def compact(self, data: dict[str, Any]) -> None:
+        """Fold any incremental state into a single snapshot (optional)."""
+
+
+class JsonFileStore(MetricsStore):
+    """
+    Legacy engine: rewrite the whole JSON document on every append.
+
+    Usage:
+        store = JsonFileStore(Path("config/metrics.json"))
+        tracker = MetricsTracker(store=store)
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize the store.
+
+        Args:
+            path: Path to the JSON document
+        """
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def load(self) -> dict[str, Any]:
+        """Load the document from disk."""
+        if self.path.exists():
+            with open(self.path) as f:
+                data: dict[str, Any] = json.load(f)
+                return data
+        return _empty_document()
+
+    def append(self, entry: dict[str, Any], data: dict[str, Any]) -> None:
+        """Rewrite the whole document."""
+        with open(self.path, "w") as f:
+            json.dump(data, f, indent=2)
+            f.write("\n")
+
+    def compact(self, data: dict[str, Any]) -> None:
+        """Rewrite the whole document atomically."""
+        _atomic_write_json(self.path, data)
+
+
+class SegmentedLogStore(MetricsStore):
+    """
+    Append-only segmented log with periodic compaction.
+
+    Layout on disk (for path = config/metrics.json):
+        config/metrics.json              Compacted snapshot (legacy format)
+        config/metrics.segments/
+            000001.jsonl                 Sealed segment
+            000002.jsonl                 Active segment (appended to)
+
+    The snapshot records the highest segment index it contains
+    ("compacted_through"), so a crash between writing the snapshot and
+    deleting the folded segments never double-counts entries.
+
+    Usage:
+        store = SegmentedLogStore(Path("config/metrics.json"))
+        tracker = MetricsTracker(store=store)
+    """
+
+    SEGMENT_SUFFIX = ".jsonl"
+
+    def __init__(
+        self,
+        path: Path,
+        segment_max_entries: int = 1000,
+        compact_after_segments: int = 8,
+        fsync: bool = False,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            path: Path to the snapshot JSON file
+            segment_max_entries: Entries per segment before rolling to a new one
+            compact_after_segments: Fold segments into the snapshot once this
+                                    many sealed segments have accumulated
+            fsync: Whether to fsync after every append (slower, survives power loss)
+        """
+        self.path = path
+        self.segments_dir = path.with_suffix(".segments")
+        self.segment_max_entries = segment_max_entries
+        self.compact_after_segments = compact_after_segments
+        self.fsync = fsync
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._compacted_through = 0
+        self._active_index = 0
+        self._active_count = 0
+
+    # -------------------------------------------------------------------------
+    # Segment helpers
+    # -------------------------------------------------------------------------
+
+    def _segment_path(self, index: int) -> Path:
+        """Get the path of a segment by index."""
+        return self.segments_dir / f"{index:06d}{self.SEGMENT_SUFFIX}"
+
+    def _segment_indexes(self) -> list[int]:
+        """List existing segment indexes in order."""
+        if not self.segments_dir.exists():
+            return []
+        indexes = []
+        for seg in self.segments_dir.glob(f"*{self.SEGMENT_SUFFIX}"):
+            try:
+                indexes.append(int(seg.stem))
+            except ValueError:
+                continue
+        return sorted(indexes)
+
+    def _read_segment(self, index: int, recover_tail: bool) -> list[dict[str, Any]]:
+        """
+        Read all complete entries from a segment.
+
+        Args:
+            index: Segment index
+            recover_tail: Truncate a torn or corrupt tail in place
+
+        Returns:
+            List of entry dicts
+        """
+        seg_path = self._segment_path(index)
+        with open(seg_path, "rb") as f:
+            raw = f.read()
+
+        entries: list[dict[str, Any]] = []
+        good_offset = 0
+        offset = 0
+        while offset < len(raw):
+            newline = raw.find(b"\n", offset)
+            if newline == -1:
+                break  # Torn write: line without terminator
+            line = raw[offset:newline]
+            offset = newline + 1
+            if not line.strip():
+                good_offset = offset
+                continue
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                break  # Corrupt record: drop it and everything after
+            good_offset = offset
+
+        if recover_tail and good_offset < len(raw):
+            with open(seg_path, "r+b") as f:
+                f.truncate(good_offset)
+
+        return entries
+
+    # -------------------------------------------------------------------------
+    # MetricsStore interface
+    # -------------------------------------------------------------------------
+
+    def load(self) -> dict[str, Any]:
+        """Load the snapshot and replay all segments after it."""
+        data = _empty_document()
+        if self.path.exists():
+            with open(self.path) as f:
+                data = json.load(f)
+            data.setdefault("entries", [])
+            data.setdefault("summaries", {})
+
+        self._compacted_through = data.pop("compacted_through", 0)
+
+        indexes = [i for i in self._segment_indexes() if i > self._compacted_through]
+        for pos, index in enumerate(indexes):
+            is_last = pos == len(indexes) - 1
+            segment_entries = self._read_segment(index, recover_tail=is_last)
+            data["entries"].extend(segment_entries)
+            if is_last:
+                self._active_index = index
+                self._active_count = len(segment_entries)
+
+        if not indexes:
+            self._active_index = self._compacted_through + 1
+            self._active_count = 0
+
+        # Remove segments a previous compaction folded but did not delete
+        for index in self._segment_indexes():
+            if index <= self._compacted_through:
+                self._segment_path(index).unlink(missing_ok=True)
+
+        return data
+
+    def append(self, entry: dict[str, Any], data: dict[str, Any]) -> None:
+        """Append one line to the active segment, rolling and compacting as needed."""
+        if self._active_index == 0:
+            self._active_index = self._compacted_through + 1
+
+        self.segments_dir.mkdir(parents=True, exist_ok=True)
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        with open(self._segment_path(self._active_index), "a") as f:
+            f.write(line)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        self._active_count += 1
+
+        if self._active_count >= self.segment_max_entries:
+            sealed = self._active_index - self._compacted_through
+            if sealed >= self.compact_after_segments:
+                self.compact(data)
+            else:
+                self._active_index += 1
+                self._active_count = 0
+
+    def compact(self, data: dict[str, Any]) -> None:
+        """
+        Fold every segment into the snapshot.
+
+        Args:
+            data: The full in-memory document (everything already appended)
+        """
+        through = max(self._active_index, self._compacted_through)
+        snapshot = {
+            "entries": data["entries"],
+            "summaries": data.get("summaries", {}),
+            "compacted_through": through,
+        }
+        _atomic_write_json(self.path, snapshot)
+        self._compacted_through = through
+
+        for index in self._segment_indexes():
+            if index <= through:
+                self._segment_path(index).unlink(missing_ok=True)
+
+        self._active_index = through + 1
+        self._active_count = 0
@@ -7,18 +7,48 @@ Implements dependency-aware parallel task execution with:
 - Synchronization for task handoffs
 - Resource optimization (minimal idle time)
 - Error handling and recovery
+- Pluggable execution backends (threads, processes, asyncio)
 """
 
+import asyncio
+import inspect
+import threading
 import time
 from collections.abc import Callable
-from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError, as_completed
-from dataclasses import dataclass
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from enum import Enum
 from typing import Any
 
+from src.core.readiness import ReadinessTracker
 from src.models.agent import Agent
 from src.models.task import Subtask
 
 
+class ExecutionBackend(str, Enum):
+    """Where a task's executor function runs."""
+
+    THREAD = "thread"  # I/O-bound work (subprocesses, network, files)
+    PROCESS = "process"  # CPU-bound work; task and function must be picklable
+    ASYNC = "async"  # Coroutine functions, on a shared event loop
+
+
+# Subtask.metadata key holding a task's resource hint, and where each hint runs
+RESOURCE_HINT_KEY = "resource_hint"
+RESOURCE_HINTS = {
+    "io": ExecutionBackend.THREAD,
+    "cpu": ExecutionBackend.PROCESS,
+    "async": ExecutionBackend.ASYNC,
+}
+
+
 @dataclass
 class ExecutionResult:
     """Result of a task execution."""
@@ -40,6 +70,131 @@ class ExecutionStats:
     skipped_tasks: int = 0
     total_time: float = 0.0
     max_concurrent: int = 0
+    tasks_by_backend: dict[str, int] = field(default_factory=dict)
+
+
+def _finalize_result(task: Subtask, result: dict) -> dict:
+    """Fill in the task_id and status an executor function may omit."""
+    # Ensure result has task_id
+    if "task_id" not in result:
+        result["task_id"] = task.id
+
+    # Add status if not present
+    if "status" not in result:
+        result["status"] = "completed"
+
+    return result
+
+
+def _run_task(task: Subtask, executor_func: Callable[[Subtask], dict]) -> dict:
+    """Run an executor function (module-level so process workers can unpickle it)."""
+    return _finalize_result(task, executor_func(task))
+
+
+async def _run_task_async(task: Subtask, executor_func: Callable[[Subtask], Any]) -> dict:
+    """Run an executor function on the event loop, awaiting it if needed."""
+    result = executor_func(task)
+    if inspect.isawaitable(result):
+        result = await result
+    return _finalize_result(task, result)
+
+
+async def _cancel_pending_tasks() -> None:
+    """Cancel every other task on the running loop and wait for them to finish."""
+    current = asyncio.current_task()
+    pending = [t for t in asyncio.all_tasks() if t is not current]
+    for t in pending:
+        t.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+
+class _BackendPools:
+    """
+    Lazily created worker pools for one execute_tasks run.
+
+    Every backend returns a concurrent.futures.Future, so the scheduler
+    waits on all of them together.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._threads: ThreadPoolExecutor | None = None
+        self._threads_abandoned = False
+        self._processes: ProcessPoolExecutor | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+
+    def submit(
+        self,
+        backend: ExecutionBackend,
+        task: Subtask,
+        executor_func: Callable[[Subtask], Any],
+    ) -> Future:
+        """Start a task on a backend."""
+        if backend == ExecutionBackend.PROCESS:
+            if self._processes is None:
+                self._processes = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._processes.submit(_run_task, task, executor_func)
+
+        if backend == ExecutionBackend.ASYNC:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever, name="executor-loop", daemon=True
+                )
+                self._loop_thread.start()
+            return asyncio.run_coroutine_threadsafe(
+                _run_task_async(task, executor_func), self._loop
+            )
+
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._threads.submit(_run_task, task, executor_func)
+
+    def terminate_processes(self) -> None:
+        """
+        Kill every process worker and discard the pool.
+
+        A running future cannot be cancelled and ProcessPoolExecutor does not
+        say which worker holds it, so the whole pool goes. Futures still
+        running in it fail with BrokenProcessPool; callers resubmit them.
+        """
+        pool, self._processes = self._processes, None
+        if pool is None:
+            return
+        kill_workers = getattr(pool, "kill_workers", None)  # Python 3.14+
+        if kill_workers is not None:
+            kill_workers()
+        else:
+            for process in list((pool._processes or {}).values()):
+                process.kill()
+        pool.shutdown(wait=True, cancel_futures=True)
+
+    def abandon_threads(self) -> None:
+        """
+        Stop waiting for thread work at shutdown.
+
+        Threads cannot be killed, so a timed-out thread task keeps running;
+        shutdown then returns without joining it and drops queued work.
+        """
+        self._threads_abandoned = True
+
+    def shutdown(self) -> None:
+        """Wait for thread and process work, then stop the event loop."""
+        if self._threads is not None:
+            if self._threads_abandoned:
+                self._threads.shutdown(wait=False, cancel_futures=True)
+            else:
+                self._threads.shutdown(wait=True)
+        if self._processes is not None:
+            self._processes.shutdown(wait=True)
+        if self._loop is not None:
+            # Let cancelled (timed-out) coroutines unwind before stopping
+            asyncio.run_coroutine_threadsafe(_cancel_pending_tasks(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            if self._loop_thread is not None:
+                self._loop_thread.join()
+            self._loop.close()
 
 
 class ParallelExecutionScheduler:
@@ -52,6 +207,11 @@ class ParallelExecutionScheduler:
     - Synchronizes task handoffs between agents
     - Optimizes for minimal idle time
     - Handles errors gracefully
+    - Routes each task to a thread, process or asyncio backend
+
+    A task's backend comes from Subtask.metadata["resource_hint"]: "io"
+    (threads), "cpu" (processes) or "async" (event loop). Tasks without a
+    hint use the scheduler's default backend.
     """
 
     def __init__(
@@ -59,6 +219,7 @@ class ParallelExecutionScheduler:
         agents: list[Agent],
         max_workers: int | None = None,
         task_timeout: float | None = None,
+        default_backend: ExecutionBackend = ExecutionBackend.THREAD,
     ):
         """
         Initialize the parallel execution scheduler.
@@ -67,10 +228,13 @@ class ParallelExecutionScheduler:
             agents: List of available agents
             max_workers: Maximum number of concurrent tasks (default: number of agents)
             task_timeout: Timeout per task in seconds (default: None)
+            default_backend: Backend for tasks without a resource hint
+                (coroutine executor functions always default to ASYNC)
         """
         self.agents = agents
         self.max_workers = max_workers or len(agents)
         self.task_timeout = task_timeout
+        self.default_backend = ExecutionBackend(default_backend)
         self._stats = ExecutionStats()
         self._task_results: dict[str, Any] = {}
         self._active_count = 0
@@ -85,45 +249,71 @@ class ParallelExecutionScheduler:
         """
         Execute tasks in parallel while respecting dependencies.
 
+        Timed-out thread tasks are abandoned: threads cannot be killed, so
+        they keep running, but the call returns without waiting for them.
+        Timed-out process tasks are terminated; timed-out async tasks are
+        cancelled.
+
         Args:
             tasks: List of subtasks to execute
-            executor_func: Function that executes a single task
-            continue_on_error: If True, continue executing independent tasks after failures
+            executor_func: Function that executes a single task (module-level
+                for process-backed tasks; may be a coroutine function)
+            continue_on_error: If True, continue executing independent tasks after
+                failures and skip the failed tasks' dependents. If False, stop
+                submitting tasks after the first failure and report every task
+                that did not start as skipped
 
         Returns:
             List of execution results
         """
         start_time = time.time()
 
-        # Build dependency graph
         task_map = {task.id: task for task in tasks}
-        dependency_graph = self._build_dependency_graph(tasks)
-
-        # Track task states
-        pending: set[str] = set(task.id for task in tasks)
-        completed: set[str] = set()
-        failed: set[str] = set()
-        in_progress: set[str] = set()
+        tracker = ReadinessTracker({task.id: task.dependencies for task in tasks})
+        pools = _BackendPools(self.max_workers)
+        futures: dict[Future, str] = {}  # future -> task_id
+        deadlines: dict[Future, float] = {}
+        backends: dict[Future, ExecutionBackend] = {}
+        stopped = False
 
         results: list[dict] = []
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures: dict[Future, str] = {}  # future -> task_id
-
-            while pending or in_progress:
-                # Find tasks ready to execute (all dependencies met)
-                ready = self._get_ready_tasks(pending, completed, failed, dependency_graph)
-
-                # Submit ready tasks
-                for task_id in ready:
-                    if len(futures) >= self.max_workers:
-                        break  # Wait for some tasks to complete
-
-                    task = task_map[task_id]
-                    future = executor.submit(self._execute_task, task, executor_func)
-                    futures[future] = task_id
-                    pending.remove(task_id)
-                    in_progress.add(task_id)
+        def submit(task_id: str, backend: ExecutionBackend | None = None) -> None:
+            if backend is None:
+                backend = self._get_backend(task_map[task_id], executor_func)
+            future = pools.submit(backend, task_map[task_id], executor_func)
+            futures[future] = task_id
+            backends[future] = backend
+            if self.task_timeout is not None:
+                deadlines[future] = time.monotonic() + self.task_timeout
+
+        def forget(future: Future) -> str:
+            deadlines.pop(future, None)
+            backends.pop(future, None)
+            return futures.pop(future)
+
+        def skip(task_ids: list[str], reason: str) -> None:
+            for task_id in task_ids:
+                results.append({"task_id": task_id, "status": "skipped", "error": reason})
+                self._stats.skipped_tasks += 1
+
+        def fail(task_id: str, status: str, error: str) -> None:
+            nonlocal stopped
+            results.append({"task_id": task_id, "status": status, "error": error})
+            self._stats.failed_tasks += 1
+            # Tasks downstream of the failure can never run
+            skip(tracker.mark_failed(task_id), "Dependency failed")
+            if not continue_on_error and not stopped:
+                stopped = True
+                for f in futures:
+                    f.cancel()  # Only cancels tasks that have not started
+
+        try:
+            while True:
+                # Submit ready tasks (dependencies met) up to the worker limit
+                while not stopped and tracker.has_ready and len(futures) < self.max_workers:
+                    task_id = tracker.pop_ready()
+                    submit(task_id)
 
                     # Track concurrency
                     self._active_count += 1
@@ -131,78 +321,70 @@ class ParallelExecutionScheduler:
                         self._max_concurrent_observed, self._active_count
                     )
 
+                if not futures:
+                    break
+
                 # Wait for at least one task to complete or timeout
-                if futures:
-                    done_futures, timed_out_futures = self._wait_with_timeout(futures)
-
-                    # Process completed futures
-                    for future in done_futures:
-                        task_id = futures.pop(future)
-                        in_progress.remove(task_id)
-                        self._active_count -= 1
-
-                        try:
-                            result = future.result(timeout=0.01)  # Should be immediate
-                            completed.add(task_id)
-                            self._task_results[task_id] = result
-                            results.append(result)
-                            self._stats.completed_tasks += 1
-                        except Exception as e:
-                            # Task raised an exception
-                            failed.add(task_id)
-                            error_result = {
-                                "task_id": task_id,
-                                "status": "failed",
-                                "error": str(e),
-                            }
-                            results.append(error_result)
-                            self._stats.failed_tasks += 1
-
-                            if not continue_on_error:
-                                # Cancel remaining futures
-                                for f in futures:
-                                    f.cancel()
-                                break
-
-                    # Process timed out futures
-                    for future in timed_out_futures:
-                        task_id = futures.pop(future)
-                        in_progress.remove(task_id)
-                        self._active_count -= 1
-
-                        failed.add(task_id)
-                        error_result = {
-                            "task_id": task_id,
-                            "status": "timeout",
-                            "error": "Task exceeded timeout",
-                        }
-                        results.append(error_result)
-                        self._stats.failed_tasks += 1
-
-                        # Cancel the timed out future
-                        future.cancel()
-
-                        if not continue_on_error:
-                            # Cancel remaining futures
-                            for f in futures:
-                                f.cancel()
-                            break
-
-                # If we can't make progress and continue_on_error is True,
-                # skip tasks that depend on failed tasks
-                if not ready and pending and continue_on_error:
-                    # Find tasks that can never complete (depend on failed tasks)
-                    skippable = self._find_skippable_tasks(
-                        pending, completed, failed, dependency_graph
-                    )
-                    for task_id in skippable:
-                        pending.remove(task_id)
-                        results.append({
-                            "task_id": task_id,
-                            "status": "skipped",
-                            "error": "Dependency failed",
-                        })
-                        self._stats.skipped_tasks += 1
+                done_futures, timed_out_futures = self._wait_with_timeout(futures, deadlines)
+
+                # Process timed out futures
+                if any(backends[f] == ExecutionBackend.PROCESS for f in timed_out_futures):
+                    pools.terminate_processes()
+                    # Work that shared the pool was killed too: run it again
+                    for future, task_id in list(futures.items()):
+                        if (
+                            backends[future] == ExecutionBackend.PROCESS
+                            and future not in timed_out_futures
+                            and self._was_terminated(future)
+                        ):
+                            forget(future)
+                            done_futures.discard(future)
+                            if stopped:
+                                self._active_count -= 1
+                                skip([task_id], "Execution stopped after a failure")
+                            else:
+                                # Same backend; already counted in tasks_by_backend
+                                submit(task_id, ExecutionBackend.PROCESS)
+
+                if any(backends[f] == ExecutionBackend.THREAD for f in timed_out_futures):
+                    pools.abandon_threads()
+
+                for future in timed_out_futures:
+                    task_id = forget(future)
+                    self._active_count -= 1
+
+                    # Cancel the timed out future
+                    future.cancel()
+                    fail(task_id, "timeout", "Task exceeded timeout")
+
+                # Process completed futures
+                for future in done_futures:
+                    task_id = forget(future)
+                    self._active_count -= 1
+
+                    if future.cancelled():
+                        skip([task_id], "Execution stopped after a failure")
+                        continue
+
+                    try:
+                        result = future.result(timeout=0.01)  # Should be immediate
+                    except Exception as e:
+                        # Task raised an exception
+                        fail(task_id, "failed", str(e))
+                        continue
+
+                    tracker.mark_completed(task_id)
+                    self._task_results[task_id] = result
+                    results.append(result)
+                    self._stats.completed_tasks += 1
+        finally:
+            pools.shutdown()
+
+        if stopped:
+            skip(tracker.skip_remaining(), "Execution stopped after a failure")
+        else:
+            # Anything left depends on a missing task or sits on a cycle
+            skip(tracker.blocked(), "Dependency cannot be satisfied")
 
         self._stats.total_tasks = len(tasks)
         self._stats.total_time = time.time() - start_time
@@ -210,136 +392,65 @@ class ParallelExecutionScheduler:
 
         return results
 
-    def _execute_task(self, task: Subtask, executor_func: Callable[[Subtask], dict]) -> dict:
-        """
-        Execute a single task.
-
-        Args:
-            task: Subtask to execute
-            executor_func: Function to execute the task
-
-        Returns:
-            Task result
-
-        Raises:
-            Exception: Any exception raised by executor_func
+    def _get_backend(
+        self, task: Subtask, executor_func: Callable[[Subtask], Any]
+    ) -> ExecutionBackend:
         """
-        result = executor_func(task)
-
-        # Ensure result has task_id
-        if "task_id" not in result:
-            result["task_id"] = task.id
-
-        # Add status if not present
-        if "status" not in result:
-            result["status"] = "completed"
-
-        return result
-
-    def _build_dependency_graph(self, tasks: list[Subtask]) -> dict[str, list[str]]:
-        """
-        Build a dependency graph from tasks.
+        Pick the backend for a task from its resource hint.
 
         Args:
-            tasks: List of subtasks
+            task: Subtask to route
+            executor_func: Function that will execute it
 
         Returns:
-            Dictionary mapping task_id -> list of dependency task_ids
+            Backend to run the task on
         """
-        graph = {}
-        for task in tasks:
-            graph[task.id] = task.dependencies if task.dependencies else []
-        return graph
-
-    def _get_ready_tasks(
-        self,
-        pending: set[str],
-        completed: set[str],
-        failed: set[str],
-        dependency_graph: dict[str, list[str]],
-    ) -> list[str]:
-        """
-        Get tasks that are ready to execute (all dependencies met).
+        hint = task.metadata.get(RESOURCE_HINT_KEY)
+        if hint in RESOURCE_HINTS:
+            backend = RESOURCE_HINTS[hint]
+        elif inspect.iscoroutinefunction(executor_func):
+            backend = ExecutionBackend.ASYNC
+        else:
+            backend = self.default_backend
 
-        Args:
-            pending: Set of pending task IDs
-            completed: Set of completed task IDs
-            failed: Set of failed task IDs
-            dependency_graph: Dependency graph
+        self._stats.tasks_by_backend[backend.value] = (
+            self._stats.tasks_by_backend.get(backend.value, 0) + 1
+        )
+        return backend
 
-        Returns:
-            List of task IDs ready to execute
-        """
-        ready = []
-        for task_id in pending:
-            deps = dependency_graph.get(task_id, [])
-            # Check if all dependencies are completed
-            if all(dep in completed for dep in deps):
-                ready.append(task_id)
-        return ready
-
-    def _find_skippable_tasks(
-        self,
-        pending: set[str],
-        completed: set[str],
-        failed: set[str],
-        dependency_graph: dict[str, list[str]],
-    ) -> list[str]:
-        """
-        Find tasks that should be skipped because dependencies failed.
-
-        Args:
-            pending: Set of pending task IDs
-            completed: Set of completed task IDs
-            failed: Set of failed task IDs
-            dependency_graph: Dependency graph
-
-        Returns:
-            List of task IDs to skip
-        """
-        skippable = []
-        for task_id in pending:
-            deps = dependency_graph.get(task_id, [])
-            # If any dependency failed, skip this task
-            if any(dep in failed for dep in deps):
-                skippable.append(task_id)
-        return skippable
+    @staticmethod
+    def _was_terminated(future: Future) -> bool:
+        """Whether a process-backed future was lost to a pool termination."""
+        if future.cancelled() or not future.done():
+            return True
+        return isinstance(future.exception(), BrokenProcessPool)
 
     def _wait_with_timeout(
-        self, futures: dict[Future, str]
+        self,
+        futures: dict[Future, str],
+        deadlines: dict[Future, float] | None = None,
     ) -> tuple[set[Future], set[Future]]:
         """
         Wait for futures to complete or timeout.
 
         Args:
             futures: Dictionary of futures
+            deadlines: Monotonic deadline for each future (none = no timeout)
 
         Returns:
             Tuple of (done futures, timed out futures)
         """
-        done = set()
-        timed_out = set()
-
-        if self.task_timeout is None:
-            # No timeout - wait for first completion
-            for future in as_completed(futures.keys()):
-                done.add(future)
-                break
-        else:
-            # Wait with timeout
-            try:
-                for future in as_completed(futures.keys(), timeout=self.task_timeout):
-                    done.add(future)
-                    break
-            except TimeoutError:
-                # Find which future(s) timed out
-                for future in futures.keys():
-                    if not future.done():
-                        timed_out.add(future)
-                    elif future not in done:
-                        done.add(future)
+        deadlines = deadlines or {}
+        timeout = None
+        if deadlines:
+            timeout = max(0.0, min(deadlines.values()) - time.monotonic())
+
+        done, not_done = wait(futures.keys(), timeout=timeout, return_when=FIRST_COMPLETED)
+
+        now = time.monotonic()
+        timed_out = {f for f in not_done if f in deadlines and deadlines[f] <= now}
 
-        return done, timed_out
+        return set(done), timed_out
 
     def get_execution_stats(self) -> dict:
         """
@@ -355,4 +466,5 @@ class ParallelExecutionScheduler:
             "skipped_tasks": self._stats.skipped_tasks,
             "total_time": self._stats.total_time,
             "max_concurrent": self._stats.max_concurrent,
+            "tasks_by_backend": dict(self._stats.tasks_by_backend),
         }
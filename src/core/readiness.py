@@ -0,0 +1,255 @@
+"""
+Readiness Tracker - Incremental ready-set maintenance for task DAGs.
+
+ReadinessTracker keeps, per task, the number of dependencies that have not
+completed, plus reverse edges to its dependents. Completing a task
+decrements its dependents' counters and queues any that reach zero; failing
+a task marks every task downstream of it as skipped. Each edge is touched a
+constant number of times over a whole run, so scheduling is O(V+E) overall.
+"""
+
+import heapq
+from collections import deque
+from collections.abc import Iterable, Mapping
+from typing import Any, Protocol
+
+
+class SortKey(Protocol):
+    """A task priority: any value that supports ``<`` against its peers."""
+
+    def __lt__(self, other: Any, /) -> bool: ...
+
+
+class ReadinessTracker:
+    """
+    Tracks which tasks of a dependency DAG can run next.
+
+    Task states move pending -> ready -> running -> completed/failed, or
+    pending -> skipped when an upstream task fails. Dependencies on IDs that
+    are not part of the graph are never satisfied.
+
+    Usage:
+        tracker = ReadinessTracker({t.id: t.dependencies for t in tasks})
+        while tracker.has_ready:
+            task_id = tracker.pop_ready()
+            ...
+            tracker.mark_completed(task_id)  # or tracker.mark_failed(task_id)
+    """
+
+    def __init__(
+        self,
+        dependencies: Mapping[str, Iterable[str]],
+        priority: Mapping[str, SortKey] | None = None,
+    ):
+        """
+        Build the tracker.
+
+        Args:
+            dependencies: Task ID -> IDs of the tasks it depends on, in the
+                          order ties should be broken
+            priority: Optional task ID -> sort key; lower keys are popped
+                      first (default: mapping order)
+        """
+        self._order = {task_id: i for i, task_id in enumerate(dependencies)}
+        self._priority = priority or {}
+        self._dependents: dict[str, list[str]] = {task_id: [] for task_id in dependencies}
+        self._unmet: dict[str, int] = {}
+        self._ready: list[tuple[SortKey, int, str]] = []
+        self._running: set[str] = set()
+        self._completed: set[str] = set()
+        self._failed: set[str] = set()
+        self._skipped: set[str] = set()
+
+        for task_id, deps in dependencies.items():
+            unique = set(deps)
+            for dep in unique:
+                if dep in self._dependents:
+                    self._dependents[dep].append(task_id)
+            self._unmet[task_id] = len(unique)
+
+        for task_id, unmet in self._unmet.items():
+            if unmet == 0:
+                self._push(task_id)
+
+    def _push(self, task_id: str) -> None:
+        """Queue a task whose dependencies are all complete."""
+        key = self._priority.get(task_id, 0)
+        heapq.heappush(self._ready, (key, self._order[task_id], task_id))
+
+    # -------------------------------------------------------------------------
+    # Transitions
+    # -------------------------------------------------------------------------
+
+    def pop_ready(self) -> str:
+        """
+        Take the highest-priority ready task and mark it running.
+
+        Returns:
+            Task ID
+
+        Raises:
+            IndexError: If no task is ready (check has_ready first)
+        """
+        if not self._ready:
+            raise IndexError("No task is ready")
+        task_id = heapq.heappop(self._ready)[2]
+        self._running.add(task_id)
+        return task_id
+
+    def mark_completed(self, task_id: str) -> list[str]:
+        """
+        Record a successful task and release its dependents.
+
+        Args:
+            task_id: Task that completed
+
+        Returns:
+            IDs of tasks that became ready
+        """
+        self._running.discard(task_id)
+        if task_id in self._completed:
+            return []
+        self._completed.add(task_id)
+
+        released = []
+        for dependent in self._dependents.get(task_id, ()):
+            self._unmet[dependent] -= 1
+            if self._unmet[dependent] == 0 and dependent not in self._skipped:
+                self._push(dependent)
+                released.append(dependent)
+        return released
+
+    def mark_failed(self, task_id: str) -> list[str]:
+        """
+        Record a failed task and skip everything downstream of it.
+
+        Args:
+            task_id: Task that failed
+
+        Returns:
+            IDs of tasks newly skipped, in breadth-first order
+        """
+        self._running.discard(task_id)
+        self._failed.add(task_id)
+
+        skipped = []
+        queue = deque(self._dependents.get(task_id, ()))
+        while queue:
+            dependent = queue.popleft()
+            if dependent in self._skipped or dependent in self._failed:
+                continue
+            self._skipped.add(dependent)
+            skipped.append(dependent)
+            queue.extend(self._dependents[dependent])
+        return skipped
+
+    def skip_remaining(self) -> list[str]:
+        """
+        Skip every task that has not started (e.g., when aborting a run).
+
+        Returns:
+            IDs of tasks newly skipped, in mapping order
+        """
+        started = self._running | self._completed | self._failed
+        skipped = [
+            task_id
+            for task_id in self._order
+            if task_id not in started and task_id not in self._skipped
+        ]
+        self._skipped.update(skipped)
+        self._ready.clear()
+        return skipped
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    @property
+    def has_ready(self) -> bool:
+        """Whether a task can be popped."""
+        return bool(self._ready)
+
+    @property
+    def ready_count(self) -> int:
+        """Number of tasks waiting to be popped."""
+        return len(self._ready)
+
+    @property
+    def running_count(self) -> int:
+        """Number of popped tasks not yet completed or failed."""
+        return len(self._running)
+
+    @property
+    def is_finished(self) -> bool:
+        """Whether every task is completed, failed or skipped."""
+        settled = len(self._completed) + len(self._failed) + len(self._skipped)
+        return settled == len(self._order)
+
+    @property
+    def completed(self) -> set[str]:
+        """IDs of completed tasks."""
+        return set(self._completed)
+
+    @property
+    def failed(self) -> set[str]:
+        """IDs of failed tasks."""
+        return set(self._failed)
+
+    @property
+    def skipped(self) -> set[str]:
+        """IDs of skipped tasks."""
+        return set(self._skipped)
+
+    def blocked(self) -> list[str]:
+        """
+        Tasks that are neither ready, running nor settled, in mapping order.
+
+        Once nothing is ready or running, these can never run: they depend
+        on a missing task or sit on (or downstream of) a cycle.
+        """
+        queued = {entry[2] for entry in self._ready}
+        return [
+            task_id
+            for task_id in self._order
+            if task_id not in queued
+            and task_id not in self._running
+            and task_id not in self._completed
+            and task_id not in self._failed
+            and task_id not in self._skipped
+        ]
+
+
+def find_cycle(dependencies: Mapping[str, Iterable[str]]) -> list[str]:
+    """
+    Find a dependency cycle.
+
+    Args:
+        dependencies: Task ID -> IDs of the tasks it depends on
+
+    Returns:
+        Task IDs forming a cycle (each depends on the next, the last on the
+        first), or an empty list if the graph is acyclic
+    """
+    # Ignore missing dependencies so only cycles (and tasks downstream of
+    # them) stay blocked
+    graph = {
+        task_id: [dep for dep in deps if dep in dependencies]
+        for task_id, deps in dependencies.items()
+    }
+    tracker = ReadinessTracker(graph)
+    while tracker.has_ready:
+        tracker.mark_completed(tracker.pop_ready())
+
+    stuck = set(tracker.blocked())
+    if not stuck:
+        return []
+
+    # Every stuck task has a stuck dependency; follow them until one repeats
+    path: list[str] = []
+    seen: dict[str, int] = {}
+    node = next(task_id for task_id in graph if task_id in stuck)
+    while node not in seen:
+        seen[node] = len(path)
+        path.append(node)
+        node = next(dep for dep in graph[node] if dep in stuck)
+    return path[seen[node]:]
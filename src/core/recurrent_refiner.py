@@ -3,10 +3,15 @@ Recurrent Refiner for multi-pass task understanding.
 
 This module implements recurrent refinement (RPT-1/2) - processing tasks
 through multiple passes to achieve deeper understanding before acting.
+
+The lowercased task text is built once per refinement and shared by every
+pass; the contradiction scan depends only on that text and is cached, so
+repeated coherence passes (and repeated goals) do not rescan it.
 """
 
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
 from src.core.task_parser import ParsedTask
@@ -65,6 +70,36 @@ class RefinedTask:
         )
 
 
+@lru_cache(maxsize=256)
+def _find_contradictions(full_text: str) -> tuple[str, ...]:
+    """Detect common contradictory requirements in lowercased task text."""
+    contradictions = []
+
+    # Stateless vs stateful
+    if "stateless" in full_text and any(
+        word in full_text for word in ["session", "cookie", "state"]
+    ):
+        contradictions.append("Stateless requirement conflicts with session/state usage")
+
+    # Simple vs complex
+    if "simple" in full_text and any(
+        word in full_text for word in ["oauth2", "microservice", "distributed"]
+    ):
+        contradictions.append("Simple requirement conflicts with complex technologies")
+
+    # Fast vs thorough
+    if "quick" in full_text or "fast" in full_text:
+        if any(word in full_text for word in ["comprehensive", "thorough", "extensive"]):
+            contradictions.append("Speed requirement may conflict with thoroughness")
+
+    return tuple(contradictions)
+
+
+def _task_text(task: ParsedTask) -> str:
+    """Lowercased goal and raw description, as scanned by every pass."""
+    return f"{task.goal.lower()} {task.raw_description.lower()}"
+
+
 class RecurrentRefiner:
     """
     Multi-pass task understanding and refinement.
@@ -108,8 +143,10 @@ class RecurrentRefiner:
                 final_confidence=0.0,
             )
 
+        full_text = _task_text(task)
+
         # Pass 1: Initial scan
-        initial_pass = self._initial_scan(task)
+        initial_pass = self._initial_scan(task, full_text)
         passes.append(initial_pass)
 
         # Check if we should continue
@@ -121,7 +158,7 @@ class RecurrentRefiner:
             )
 
         # Pass 2: Contextual integration
-        contextual_pass = self._contextual_integration(task, passes)
+        contextual_pass = self._contextual_integration(task, passes, full_text)
         passes.append(contextual_pass)
 
         # Check if we should continue
@@ -134,13 +171,13 @@ class RecurrentRefiner:
 
         # Pass 3: Coherence check
         if len(passes) < self.max_passes:
-            coherence_pass = self._coherence_check(task, passes)
+            coherence_pass = self._coherence_check(task, passes, full_text)
             passes.append(coherence_pass)
 
         # Additional passes if needed (up to max_passes)
         while len(passes) < self.max_passes and not self._should_stop(passes):
             # Re-run coherence check with accumulated insights
-            additional_pass = self._coherence_check(task, passes)
+            additional_pass = self._coherence_check(task, passes, full_text)
             passes.append(additional_pass)
 
         final_confidence = passes[-1].confidence if passes else 0.0
@@ -151,7 +188,7 @@ class RecurrentRefiner:
             final_confidence=final_confidence,
         )
 
-    def _initial_scan(self, task: ParsedTask) -> RefinementPass:
+    def _initial_scan(self, task: ParsedTask, full_text: str | None = None) -> RefinementPass:
         """
         Pass 1: Initial scan for rough understanding.
 
@@ -159,6 +196,7 @@ class RecurrentRefiner:
 
         Args:
             task: ParsedTask to scan
+            full_text: Lowercased goal and description (computed if omitted)
 
         Returns:
             RefinementPass with initial findings
@@ -167,15 +205,15 @@ class RecurrentRefiner:
         ambiguities: list[str] = []
         findings: dict[str, Any] = {}
 
-        # Extract key elements from goal
-        goal_lower = task.goal.lower()
-        raw_lower = task.raw_description.lower()
+        # Extract key elements from goal and description
+        if full_text is None:
+            full_text = _task_text(task)
 
         # Identify key entities (simplified heuristic)
         key_entities = []
         entity_keywords = ["api", "database", "user", "authentication", "oauth", "jwt", "token"]
         for keyword in entity_keywords:
-            if keyword in goal_lower or keyword in raw_lower:
+            if keyword in full_text:
                 key_entities.append(keyword)
 
         findings["entities"] = key_entities
@@ -208,7 +246,10 @@ class RecurrentRefiner:
         )
 
     def _contextual_integration(
-        self, task: ParsedTask, previous_passes: list[RefinementPass]
+        self,
+        task: ParsedTask,
+        previous_passes: list[RefinementPass],
+        full_text: str | None = None,
     ) -> RefinementPass:
         """
         Pass 2: Contextual integration.
@@ -218,6 +259,7 @@ class RecurrentRefiner:
         Args:
             task: ParsedTask being refined
             previous_passes: Previous refinement passes
+            full_text: Lowercased goal and description (computed if omitted)
 
         Returns:
             RefinementPass with contextual insights
@@ -231,9 +273,8 @@ class RecurrentRefiner:
         entities = initial_findings.get("entities", [])
 
         # Identify relationships and dependencies
-        goal_lower = task.goal.lower()
-        raw_lower = task.raw_description.lower()
-        full_text = f"{goal_lower} {raw_lower}"
+        if full_text is None:
+            full_text = _task_text(task)
 
         dependencies = []
         dependency_markers = ["after", "before", "once", "when", "requires", "needs"]
@@ -289,7 +330,10 @@ class RecurrentRefiner:
         )
 
     def _coherence_check(
-        self, task: ParsedTask, previous_passes: list[RefinementPass]
+        self,
+        task: ParsedTask,
+        previous_passes: list[RefinementPass],
+        full_text: str | None = None,
     ) -> RefinementPass:
         """
         Pass 3: Coherence check.
@@ -299,6 +343,7 @@ class RecurrentRefiner:
         Args:
             task: ParsedTask being refined
             previous_passes: Previous refinement passes
+            full_text: Lowercased goal and description (computed if omitted)
 
         Returns:
             RefinementPass with coherence analysis
@@ -308,29 +353,9 @@ class RecurrentRefiner:
         findings: dict[str, Any] = {}
 
         # Check for contradictions in requirements
-        goal_lower = task.goal.lower()
-        raw_lower = task.raw_description.lower()
-        full_text = f"{goal_lower} {raw_lower}"
-
-        # Common contradictions
-        contradictions = []
-
-        # Stateless vs stateful
-        if "stateless" in full_text and any(
-            word in full_text for word in ["session", "cookie", "state"]
-        ):
-            contradictions.append("Stateless requirement conflicts with session/state usage")
-
-        # Simple vs complex
-        if "simple" in full_text and any(
-            word in full_text for word in ["oauth2", "microservice", "distributed"]
-        ):
-            contradictions.append("Simple requirement conflicts with complex technologies")
-
-        # Fast vs thorough
-        if "quick" in full_text or "fast" in full_text:
-            if any(word in full_text for word in ["comprehensive", "thorough", "extensive"]):
-                contradictions.append("Speed requirement may conflict with thoroughness")
+        if full_text is None:
+            full_text = _task_text(task)
+        contradictions = list(_find_contradictions(full_text))
 
         if contradictions:
             findings["contradictions"] = contradictions
@@ -1,9 +1,15 @@
 """Agent Role Registry for managing and matching agent roles."""
 
+import heapq
+from collections import Counter, OrderedDict
+from collections.abc import Sequence
 from typing import Any, cast
 
 from src.models.agent import AgentRole
 
+# Requirement/role attributes compared by the matcher
+_MATCH_FIELDS = ("capabilities", "tools", "domain_knowledge")
+
 
 class RoleRegistry:
     """
@@ -16,6 +22,12 @@ class RoleRegistry:
     def __init__(self) -> None:
         """Initialize an empty role registry."""
         self._roles: dict[str, AgentRole] = {}
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every registration (lets matchers detect changes)."""
+        return self._version
 
     def register_role(self, role: AgentRole) -> None:
         """
@@ -33,6 +45,7 @@ class RoleRegistry:
                 "Cannot register duplicate role names."
             )
         self._roles[role.name] = role
+        self._version += 1
 
     def get_role(self, name: str) -> AgentRole | None:
         """
@@ -245,8 +258,16 @@ class RoleMatcher:
 
     The RoleMatcher analyzes task requirements and finds the best matching
     agent roles based on capabilities, tools, and domain knowledge.
+
+    Roles are encoded once against a lowercase vocabulary as one bitmask per
+    attribute (capabilities, tools, domain knowledge). A requirement is
+    encoded the same way, so counting matched requirements against a role is
+    an AND and a popcount, and a batch of requirements can be scored against
+    every role without re-reading the role definitions.
     """
 
+    ENCODED_CACHE_SIZE = 1024  # Distinct requirement sets kept encoded
+
     def __init__(self, registry: RoleRegistry):
         """
         Initialize the role matcher with a registry.
@@ -255,6 +276,136 @@ class RoleMatcher:
             registry: The RoleRegistry to use for matching
         """
         self._registry = registry
+        self._indexed_version = -1
+        self._roles: list[AgentRole] = []
+        self._vocabulary: tuple[dict[str, int], ...] = ()
+        self._role_masks: list[tuple[int, ...]] = []
+        self._encoded: OrderedDict[tuple, tuple[list[tuple[int, int, int]], int]] = (
+            OrderedDict()
+        )
+
+    @property
+    def roles(self) -> list[AgentRole]:
+        """Registered roles, in the column order used by score_batch."""
+        self._ensure_index()
+        return list(self._roles)
+
+    def _ensure_index(self) -> None:
+        """Encode the registry's roles if it changed since the last call."""
+        if self._indexed_version == self._registry.version:
+            return
+
+        self._roles = self._registry.list_roles()
+        vocabulary: tuple[dict[str, int], ...] = tuple({} for _ in _MATCH_FIELDS)
+        self._role_masks = []
+        for role in self._roles:
+            masks = []
+            for terms, bits in zip(
+                (role.capabilities, role.tools, role.domain_knowledge), vocabulary
+            ):
+                mask = 0
+                for term in terms:
+                    mask |= 1 << bits.setdefault(term.lower(), len(bits))
+                masks.append(mask)
+            self._role_masks.append(tuple(masks))
+
+        self._vocabulary = vocabulary
+        self._encoded.clear()
+        self._indexed_version = self._registry.version
+
+    def _encode(self, requirements: dict[str, Any]) -> tuple[list[tuple[int, int, int]], int]:
+        """
+        Encode requirements as bitmasks over the role vocabulary.
+
+        Args:
+            requirements: Requirements dict (capabilities/tools/domain_knowledge)
+
+        Returns:
+            (groups, total): groups of (field index, multiplicity, mask) and
+            the total number of requirements. A term listed twice counts
+            twice; terms no role has count toward the total only.
+        """
+        key = tuple(
+            tuple(term.lower() for term in requirements.get(name, []))
+            for name in _MATCH_FIELDS
+        )
+        cached = self._encoded.get(key)
+        if cached is not None:
+            self._encoded.move_to_end(key)
+            return cached
+
+        groups: list[tuple[int, int, int]] = []
+        for field_index, (terms, bits) in enumerate(zip(key, self._vocabulary)):
+            masks: dict[int, int] = {}
+            for term, multiplicity in Counter(terms).items():
+                bit = bits.get(term)
+                if bit is not None:
+                    masks[multiplicity] = masks.get(multiplicity, 0) | (1 << bit)
+            groups.extend((field_index, m, mask) for m, mask in masks.items())
+
+        encoded = (groups, sum(len(terms) for terms in key))
+        self._encoded[key] = encoded
+        if len(self._encoded) > self.ENCODED_CACHE_SIZE:
+            self._encoded.popitem(last=False)
+        return encoded
+
+    def score_batch(self, requirements_list: Sequence[dict[str, Any]]) -> list[list[float]]:
+        """
+        Score many requirement sets against every role.
+
+        Args:
+            requirements_list: Requirement dicts (see find_matching_roles)
+
+        Returns:
+            One row per requirement set with one score (0.0 to 1.0) per role,
+            columns in the order of the roles property. Empty requirements
+            score a neutral 0.5 against every role.
+        """
+        self._ensure_index()
+        role_masks = self._role_masks
+        rows = []
+        for requirements in requirements_list:
+            groups, total = self._encode(requirements)
+            if total == 0:
+                rows.append([0.5] * len(role_masks))
+                continue
+            rows.append([
+                sum(m * (mask & masks[f]).bit_count() for f, m, mask in groups) / total
+                for masks in role_masks
+            ])
+        return rows
+
+    def match_batch(
+        self,
+        requirements_list: Sequence[dict[str, Any]],
+        min_score: float = 0.0,
+        top_k: int | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Find matching roles for many requirement sets at once.
+
+        Args:
+            requirements_list: Requirement dicts (see find_matching_roles)
+            min_score: Minimum match score (0.0 to 1.0) to include in results
+            top_k: Keep only the k best matches per requirement set
+
+        Returns:
+            One list per requirement set, in the format of find_matching_roles
+        """
+        results = []
+        for row in self.score_batch(requirements_list):
+            matches = [
+                {"role": role, "score": score}
+                for role, score in zip(self._roles, row)
+                if score >= min_score
+            ]
+            if top_k is None:
+                # Sort by score in descending order
+                matches.sort(key=lambda x: cast(float, x["score"]), reverse=True)
+            else:
+                matches = heapq.nlargest(top_k, matches, key=lambda x: cast(float, x["score"]))
+            results.append(matches)
+        return results
 
     def find_matching_roles(
         self,
@@ -277,76 +428,4 @@ class RoleMatcher:
                 - score: Match score (0.0 to 1.0)
             Sorted by score in descending order
         """
-        required_capabilities = [
-            c.lower() for c in requirements.get("capabilities", [])
-        ]
-        required_tools = [t.lower() for t in requirements.get("tools", [])]
-        required_knowledge = [
-            k.lower() for k in requirements.get("domain_knowledge", [])
-        ]
-
-        matches = []
-        all_roles = self._registry.list_roles()
-
-        for role in all_roles:
-            score = self._calculate_match_score(
-                role,
-                required_capabilities,
-                required_tools,
-                required_knowledge,
-            )
-
-            if score >= min_score:
-                matches.append({"role": role, "score": score})
-
-        # Sort by score in descending order
-        matches.sort(key=lambda x: cast(float, x["score"]), reverse=True)
-
-        return matches
-
-    def _calculate_match_score(
-        self,
-        role: AgentRole,
-        required_capabilities: list[str],
-        required_tools: list[str],
-        required_knowledge: list[str],
-    ) -> float:
-        """
-        Calculate match score between a role and requirements.
-
-        Args:
-            role: The AgentRole to score
-            required_capabilities: Required capabilities (lowercase)
-            required_tools: Required tools (lowercase)
-            required_knowledge: Required domain knowledge (lowercase)
-
-        Returns:
-            Match score between 0.0 and 1.0
-        """
-        # Convert role attributes to lowercase for case-insensitive comparison
-        role_capabilities = [c.lower() for c in role.capabilities]
-        role_tools = [t.lower() for t in role.tools]
-        role_knowledge = [k.lower() for k in role.domain_knowledge]
-
-        # If no requirements specified, return neutral score
-        total_requirements = (
-            len(required_capabilities) + len(required_tools) + len(required_knowledge)
-        )
-        if total_requirements == 0:
-            return 0.5
-
-        # Count matches
-        capability_matches = sum(
-            1 for cap in required_capabilities if cap in role_capabilities
-        )
-        tool_matches = sum(1 for tool in required_tools if tool in role_tools)
-        knowledge_matches = sum(
-            1 for know in required_knowledge if know in role_knowledge
-        )
-
-        total_matches = capability_matches + tool_matches + knowledge_matches
-
-        # Calculate score as percentage of requirements met
-        score = total_matches / total_requirements
-
-        return score
+        return self.match_batch([requirements], min_score=min_score)[0]
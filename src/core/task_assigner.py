@@ -1,6 +1,15 @@
-"""Task Assignment Optimizer with Priority Queue."""
+"""Task Assignment Optimizer with Priority Queue.
 
-from dataclasses import dataclass
+TaskAssigner keeps:
+- A capability index (capability name -> agents), so the capable agents for
+  a requirement set are computed once per distinct set and reused
+- Incremental per-agent workload counters, updated on claim and release
+- A per-agent deque of claimed tasks, with work stealing: an agent whose
+  deque is empty takes work from the back of the busiest capable peer's deque
+"""
+
+from collections import defaultdict, deque
+from dataclasses import dataclass, replace
 
 from src.models.agent import Agent
 from src.models.priority import WorkQueueTask
@@ -30,6 +39,11 @@ class TaskAssigner:
     - Priority queue system (CRITICAL > HIGH > MEDIUM > LOW)
     - Workload balancing (distribute work evenly across capable agents)
     - Claim/release mechanism (prevent duplicate work)
+    - Per-agent work queues with work stealing (next_task_for)
+
+    Claim and release tasks through the assigner so its indexes stay in
+    step; tasks appended to work_queue directly are picked up on the next
+    call.
     """
 
     def __init__(self, agents: list[Agent]):
@@ -42,6 +56,120 @@ class TaskAssigner:
         self.agents = agents
         self.work_queue: list[WorkQueueTask] = []
 
+        self._agents_by_id: dict[str, Agent] = {}
+        self._capability_index: dict[str, list[Agent]] = {}
+        self._capable_cache: dict[tuple[str, ...], list[tuple[Agent, int]]] = {}
+        self._capable_ids: dict[tuple[str, ...], frozenset[str]] = {}
+        self._indexed_agents: list[str] = []
+        self._tasks_by_id: dict[str, WorkQueueTask] = {}
+        self._workloads: dict[str, WorkloadInfo] = {}
+        self._queues: dict[str, deque[WorkQueueTask]] = {}
+        self._synced_len = 0
+
+    # -------------------------------------------------------------------------
+    # Indexes
+    # -------------------------------------------------------------------------
+
+    def _index_agents(self) -> None:
+        """(Re)build the agent lookups if the agent list changed."""
+        agent_ids = [a.id for a in self.agents]
+        if agent_ids == self._indexed_agents:
+            return
+
+        self._indexed_agents = agent_ids
+        self._agents_by_id = {a.id: a for a in self.agents}
+        self._capability_index = defaultdict(list)
+        for agent in self.agents:
+            for name in {cap.name for cap in agent.capabilities}:
+                self._capability_index[name].append(agent)
+        self._capable_cache.clear()
+        self._capable_ids.clear()
+        for agent in self.agents:
+            self._workloads.setdefault(agent.id, WorkloadInfo(agent_id=agent.id))
+            self._queues.setdefault(agent.id, deque())
+
+    def _sync(self) -> None:
+        """Re-index the queue if tasks were added to work_queue directly."""
+        self._index_agents()
+        if len(self.work_queue) == self._synced_len:
+            return
+
+        self._tasks_by_id = {}
+        self._workloads = {a.id: WorkloadInfo(agent_id=a.id) for a in self.agents}
+        self._queues = {a.id: deque() for a in self.agents}
+        for task in self.work_queue:
+            self._tasks_by_id[task.id] = task
+            if task.assigned_agent:
+                self._count(task, task.assigned_agent, 1)
+                if task.status == "claimed":
+                    self._queues.setdefault(task.assigned_agent, deque()).append(task)
+        self._synced_len = len(self.work_queue)
+
+    def _count(self, task: WorkQueueTask, agent_id: str, delta: int) -> None:
+        """Adjust an agent's workload counters by one task."""
+        workload = self._workloads.setdefault(agent_id, WorkloadInfo(agent_id=agent_id))
+        workload.assigned_tasks += delta
+        workload.estimated_tokens += delta * (task.estimated_tokens or 0)
+
+    def _capable_agents(self, task: WorkQueueTask) -> list[tuple[Agent, int]]:
+        """
+        Agents able to do a task with their match scores, best first.
+
+        Computed from the capability index once per distinct requirement
+        list. Ties keep agent list order.
+        """
+        required = tuple(task.requirements.get("capabilities", []))
+        cached = self._capable_cache.get(required)
+        if cached is not None:
+            return cached
+
+        if not required:
+            # No specific requirements, any agent can do it
+            capable = [(agent, 1) for agent in self.agents]
+        else:
+            scores: dict[str, int] = defaultdict(int)
+            for name in required:
+                for agent in self._capability_index.get(name, ()):
+                    scores[agent.id] += 1
+            capable = [(agent, scores[agent.id]) for agent in self.agents if agent.id in scores]
+            capable.sort(key=lambda x: -x[1])
+
+        self._capable_cache[required] = capable
+        self._capable_ids[required] = frozenset(agent.id for agent, _ in capable)
+        return capable
+
+    def _can_do(self, agent_id: str, task: WorkQueueTask) -> bool:
+        """Whether an agent has at least one capability a task needs."""
+        required = tuple(task.requirements.get("capabilities", []))
+        if required not in self._capable_ids:
+            self._capable_agents(task)
+        return agent_id in self._capable_ids[required]
+
+    def _take(self, task: WorkQueueTask, agent_id: str) -> None:
+        """Record a claimed task against an agent."""
+        self._count(task, agent_id, 1)
+        self._queues.setdefault(agent_id, deque()).append(task)
+        agent = self._agents_by_id.get(agent_id)
+        if agent and task.id not in agent.assigned_tasks:
+            agent.assigned_tasks.append(task.id)
+
+    def _drop(self, task: WorkQueueTask, agent_id: str) -> None:
+        """Remove a claimed task from an agent."""
+        self._count(task, agent_id, -1)
+        queue = self._queues.get(agent_id)
+        if queue is not None:
+            for i, queued in enumerate(queue):
+                if queued is task:
+                    del queue[i]
+                    break
+        agent = self._agents_by_id.get(agent_id)
+        if agent and task.id in agent.assigned_tasks:
+            agent.assigned_tasks.remove(task.id)
+
+    # -------------------------------------------------------------------------
+    # Queue management
+    # -------------------------------------------------------------------------
+
     def add_tasks(self, subtasks: list[Subtask]) -> None:
         """
         Add subtasks to the work queue.
@@ -49,12 +177,17 @@ class TaskAssigner:
         Args:
             subtasks: List of subtasks to add to queue
         """
+        self._sync()
         for subtask in subtasks:
             wqt = WorkQueueTask.from_subtask(subtask)
             self.work_queue.append(wqt)
+            self._tasks_by_id[wqt.id] = wqt
+            if wqt.assigned_agent:
+                self._count(wqt, wqt.assigned_agent, 1)
 
         # Sort by priority (highest first)
         self.work_queue.sort(key=lambda t: t.priority.priority_order, reverse=True)
+        self._synced_len = len(self.work_queue)
 
     def _get_capability_match_score(self, agent: Agent, task: WorkQueueTask) -> int:
         """
@@ -73,7 +206,7 @@ class TaskAssigner:
             return 1
 
         # Count how many required capabilities the agent has
-        agent_capability_names = [cap.name for cap in agent.capabilities]
+        agent_capability_names = {cap.name for cap in agent.capabilities}
         matches = sum(
             1 for req_cap in required_capabilities if req_cap in agent_capability_names
         )
@@ -90,21 +223,12 @@ class TaskAssigner:
         Returns:
             WorkloadInfo with task count and token estimate
         """
-        # Find the agent
-        agent = next((a for a in self.agents if a.id == agent_id), None)
-        if not agent:
+        self._sync()
+        if agent_id not in self._agents_by_id:
             return WorkloadInfo(agent_id=agent_id)
 
-        # Count claimed tasks and estimate tokens
-        claimed_tasks = [t for t in self.work_queue if t.assigned_agent == agent_id]
-        task_count = len(claimed_tasks)
-        token_estimate = sum(t.estimated_tokens or 0 for t in claimed_tasks)
-
-        return WorkloadInfo(
-            agent_id=agent_id,
-            assigned_tasks=task_count,
-            estimated_tokens=token_estimate,
-        )
+        # Copy, so callers cannot disturb the live counters
+        return replace(self._workloads[agent_id])
 
     def assign_tasks(self) -> dict[str, str | None]:
         """
@@ -113,6 +237,7 @@ class TaskAssigner:
         Returns:
             Dictionary mapping task_id to assigned agent_id (or None if unassignable)
         """
+        self._sync()
         assignments: dict[str, str | None] = {}
 
         # Process tasks in priority order
@@ -123,34 +248,28 @@ class TaskAssigner:
                 continue
 
             # Find capable agents
-            capable_agents = []
-            for agent in self.agents:
-                score = self._get_capability_match_score(agent, task)
-                if score > 0:
-                    capable_agents.append((agent, score))
-
+            capable_agents = self._capable_agents(task)
             if not capable_agents:
                 # No agent can do this task
                 assignments[task.id] = None
                 continue
 
-            # Sort by capability match (higher better) then by workload (lower better)
-            capable_agents.sort(
-                key=lambda x: (
-                    -x[1],  # Higher capability score first
-                    self._get_agent_workload(x[0].id).assigned_tasks,  # Lower workload first
-                    self._get_agent_workload(x[0].id).estimated_tokens,  # Lower tokens first
-                )
-            )
+            # Among the best capability matches, pick the lowest workload
+            # (task count, then tokens); ties keep agent list order
+            best_agent, top_score = capable_agents[0]
+            best_key: tuple[int, int] | None = None
+            for agent, score in capable_agents:
+                if score < top_score:
+                    break
+                workload = self._workloads[agent.id]
+                key = (workload.assigned_tasks, workload.estimated_tokens)
+                if best_key is None or key < best_key:
+                    best_agent, best_key = agent, key
 
             # Assign to best agent
-            best_agent = capable_agents[0][0]
             task.claim(best_agent.id)
             assignments[task.id] = best_agent.id
-
-            # Update agent's assigned tasks list
-            if task.id not in best_agent.assigned_tasks:
-                best_agent.assigned_tasks.append(task.id)
+            self._take(task, best_agent.id)
 
         return assignments
 
@@ -168,16 +287,13 @@ class TaskAssigner:
         Raises:
             ValueError: If task is already claimed
         """
-        task = next((t for t in self.work_queue if t.id == task_id), None)
+        self._sync()
+        task = self._tasks_by_id.get(task_id)
         if not task:
             return False
 
         task.claim(agent_id)
-
-        # Update agent's assigned tasks
-        agent = next((a for a in self.agents if a.id == agent_id), None)
-        if agent and task_id not in agent.assigned_tasks:
-            agent.assigned_tasks.append(task_id)
+        self._take(task, agent_id)
 
         return True
 
@@ -191,16 +307,12 @@ class TaskAssigner:
         Returns:
             True if release succeeded
         """
-        task = next((t for t in self.work_queue if t.id == task_id), None)
+        self._sync()
+        task = self._tasks_by_id.get(task_id)
         if not task or not task.assigned_agent:
             return False
 
-        # Remove from agent's assigned tasks
-        agent_id = task.assigned_agent
-        agent = next((a for a in self.agents if a.id == agent_id), None)
-        if agent and task_id in agent.assigned_tasks:
-            agent.assigned_tasks.remove(task_id)
-
+        self._drop(task, task.assigned_agent)
         task.release()
         return True
 
@@ -214,8 +326,8 @@ class TaskAssigner:
         Returns:
             Next task or None if no suitable tasks available
         """
-        agent = next((a for a in self.agents if a.id == agent_id), None)
-        if not agent:
+        self._sync()
+        if agent_id not in self._agents_by_id:
             return None
 
         # Find highest priority unassigned task that agent can do
@@ -223,12 +335,77 @@ class TaskAssigner:
             if task.assigned_agent:
                 continue
 
-            score = self._get_capability_match_score(agent, task)
-            if score > 0:
+            if self._can_do(agent_id, task):
                 return task
 
         return None
 
+    def next_task_for(self, agent_id: str) -> WorkQueueTask | None:
+        """
+        Take the next task from an agent's own queue, stealing if it is empty.
+
+        Tasks leave the agent's queue in the order they were assigned
+        (priority order). An agent with an empty queue steals from the back
+        of the longest queue held by a peer that has a task it can do; the
+        stolen task is reassigned to it.
+
+        Args:
+            agent_id: ID of the idle agent
+
+        Returns:
+            Task for the agent to work on, or None if there is nothing it can do
+        """
+        self._sync()
+        if agent_id not in self._agents_by_id:
+            return None
+
+        own = self._queues[agent_id]
+        if own:
+            return own.popleft()
+
+        peers = sorted(
+            (peer for peer in self._queues if peer != agent_id and self._queues[peer]),
+            key=lambda peer: -len(self._queues[peer]),
+        )
+        for peer in peers:
+            queue = self._queues[peer]
+            for i in range(len(queue) - 1, -1, -1):
+                task = queue[i]
+                if self._can_do(agent_id, task):
+                    del queue[i]
+                    self._steal(task, peer, agent_id)
+                    return task
+
+        return None
+
+    def _steal(self, task: WorkQueueTask, victim_id: str, thief_id: str) -> None:
+        """Move a queued task's claim from one agent to another."""
+        self._count(task, victim_id, -1)
+        victim = self._agents_by_id.get(victim_id)
+        if victim and task.id in victim.assigned_tasks:
+            victim.assigned_tasks.remove(task.id)
+
+        task.release()
+        task.claim(thief_id)
+        self._count(task, thief_id, 1)
+        thief = self._agents_by_id[thief_id]
+        if task.id not in thief.assigned_tasks:
+            thief.assigned_tasks.append(task.id)
+
+    def queue_length(self, agent_id: str) -> int:
+        """
+        Number of claimed tasks waiting in an agent's queue.
+
+        Args:
+            agent_id: ID of agent to check
+
+        Returns:
+            Queue length (0 for unknown agents)
+        """
+        self._sync()
+        queue = self._queues.get(agent_id)
+        return len(queue) if queue is not None else 0
+
     def get_queue_status(self) -> dict[str, int]:
         """
         Get summary of queue status.
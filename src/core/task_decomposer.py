@@ -3,16 +3,31 @@ Task Decomposer for recursive task breakdown and dependency graph generation.
 
 This module provides the TaskDecomposer class for breaking down complex tasks
 into manageable subtasks with dependency relationships.
+
+Strategies instantiate prebuilt phase templates, subtask IDs are derived
+from task content, and whole decompositions are cached by content hash, so
+repeated goals reuse earlier results instead of rebuilding them.
 """
 
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
 import networkx as nx
 
+from src.core.readiness import ReadinessTracker, find_cycle
 from src.core.task_parser import ParsedTask
 from src.models.enums import TaskType
 
+# Relative duration of each complexity estimate, used for critical-path weighting
+COMPLEXITY_WEIGHTS = {"small": 1, "medium": 2, "large": 3}
+
 
 @dataclass
 class SubtaskNode:
@@ -35,14 +50,34 @@ class DependencyGraph:
     """
     Manages the dependency graph (DAG) for subtasks.
 
-    Uses NetworkX for graph operations like cycle detection,
-    topological sorting, and critical path analysis.
+    Edges are kept in plain adjacency lists so building and querying the
+    small graphs produced per decomposition is cheap; a NetworkX view is
+    built on demand (``_graph``) for callers that need graph algorithms.
     """
 
     def __init__(self) -> None:
         """Initialize an empty directed graph."""
-        self._graph: nx.DiGraph = nx.DiGraph()
         self._nodes: dict[str, SubtaskNode] = {}
+        self._successors: dict[str, list[str]] = {}
+        self._predecessors: dict[str, list[str]] = {}
+        self._nx_graph: nx.DiGraph | None = None
+
+    @property
+    def _graph(self) -> nx.DiGraph:
+        """NetworkX view of the graph, rebuilt after changes."""
+        if self._nx_graph is None:
+            graph: nx.DiGraph = nx.DiGraph()
+            graph.add_nodes_from(self._successors)
+            for node_id, successors in self._successors.items():
+                graph.add_edges_from((node_id, successor) for successor in successors)
+            self._nx_graph = graph
+        return self._nx_graph
+
+    def _ensure_node(self, node_id: str) -> None:
+        """Create adjacency entries for a node."""
+        if node_id not in self._successors:
+            self._successors[node_id] = []
+            self._predecessors[node_id] = []
 
     def add_node(self, node: SubtaskNode) -> None:
         """
@@ -51,8 +86,9 @@ class DependencyGraph:
         Args:
             node: SubtaskNode to add
         """
-        self._graph.add_node(node.id)
+        self._ensure_node(node.id)
         self._nodes[node.id] = node
+        self._nx_graph = None
 
     def add_dependency(self, task_id: str, depends_on: str) -> None:
         """
@@ -62,7 +98,12 @@ class DependencyGraph:
             task_id: ID of the dependent task
             depends_on: ID of the task it depends on
         """
-        self._graph.add_edge(depends_on, task_id)
+        self._ensure_node(depends_on)
+        self._ensure_node(task_id)
+        if task_id not in self._successors[depends_on]:
+            self._successors[depends_on].append(task_id)
+            self._predecessors[task_id].append(depends_on)
+            self._nx_graph = None
 
     def has_node(self, node_id: str) -> bool:
         """
@@ -74,7 +115,7 @@ class DependencyGraph:
         Returns:
             True if node exists, False otherwise
         """
-        return node_id in self._graph
+        return node_id in self._successors
 
     def has_dependency(self, task_id: str, depends_on: str) -> bool:
         """
@@ -87,7 +128,7 @@ class DependencyGraph:
         Returns:
             True if dependency exists, False otherwise
         """
-        return self._graph.has_edge(depends_on, task_id)
+        return task_id in self._successors.get(depends_on, ())
 
     def node_count(self) -> int:
         """
@@ -96,7 +137,7 @@ class DependencyGraph:
         Returns:
             Number of nodes
         """
-        return self._graph.number_of_nodes()
+        return len(self._successors)
 
     def is_acyclic(self) -> bool:
         """
@@ -105,7 +146,7 @@ class DependencyGraph:
         Returns:
             True if acyclic, False if cycles exist
         """
-        return nx.is_directed_acyclic_graph(self._graph)
+        return not find_cycle(self._predecessors)
 
     def get_independent_tasks(self) -> list[str]:
         """
@@ -114,7 +155,7 @@ class DependencyGraph:
         Returns:
             List of task IDs with no dependencies
         """
-        return [node for node in self._graph.nodes() if self._graph.in_degree(node) == 0]
+        return [node for node, deps in self._predecessors.items() if not deps]
 
     def topological_sort(self) -> list[str]:
         """
@@ -124,9 +165,45 @@ class DependencyGraph:
             List of task IDs in topological order
 
         Raises:
-            nx.NetworkXError: If graph contains cycles
+            nx.NetworkXUnfeasible: If graph contains cycles
+        """
+        tracker = ReadinessTracker(self._predecessors)
+        order = []
+        while tracker.has_ready:
+            node = tracker.pop_ready()
+            order.append(node)
+            tracker.mark_completed(node)
+        if len(order) != len(self._predecessors):
+            raise nx.NetworkXUnfeasible("Graph contains a cycle")
+        return order
+
+    def topological_generations(self) -> list[list[str]]:
         """
-        return list(nx.topological_sort(self._graph))
+        Group tasks into levels whose dependencies all lie in earlier levels.
+
+        Returns:
+            List of levels, each a list of task IDs
+
+        Raises:
+            nx.NetworkXUnfeasible: If graph contains cycles
+        """
+        unmet = {node: len(deps) for node, deps in self._predecessors.items()}
+        level = [node for node, count in unmet.items() if count == 0]
+        generations = []
+        placed = 0
+        while level:
+            generations.append(level)
+            placed += len(level)
+            next_level = []
+            for node in level:
+                for successor in self._successors[node]:
+                    unmet[successor] -= 1
+                    if unmet[successor] == 0:
+                        next_level.append(successor)
+            level = next_level
+        if placed != len(unmet):
+            raise nx.NetworkXUnfeasible("Graph contains a cycle")
+        return generations
 
     def get_critical_path(self) -> list[str]:
         """
@@ -137,67 +214,47 @@ class DependencyGraph:
 
         Returns:
             List of task IDs forming the critical path
+
+        Raises:
+            nx.NetworkXUnfeasible: If graph contains cycles
         """
         if self.node_count() == 0:
             return []
 
-        # Assign weights based on estimated complexity
-        complexity_weights = {"small": 1, "medium": 2, "large": 3}
-
-        # For longest path in DAG, we negate weights and find shortest path,
-        # then negate back (standard algorithm)
-        weighted_graph: nx.DiGraph = nx.DiGraph()
-        for node_id in self._graph.nodes():
-            weighted_graph.add_node(node_id)
-
-        for u, v in self._graph.edges():
-            # Weight is the complexity of the target node (negated for longest path)
-            weight = -complexity_weights.get(
-                self._nodes[v].estimated_complexity, 2
-            )
-            weighted_graph.add_edge(u, v, weight=weight)
+        def weight(node_id: str) -> int:
+            node = self._nodes.get(node_id)
+            complexity = node.estimated_complexity if node else "medium"
+            return COMPLEXITY_WEIGHTS.get(complexity, 2)
 
         # Find longest path using dynamic programming on DAG
-        try:
-            # Use topological sort and DP to find longest path
-            topo_order = list(nx.topological_sort(weighted_graph))
-
-            # dist[node] = longest path length ending at node
-            dist = {node: 0 for node in weighted_graph.nodes()}
-            predecessor = {node: None for node in weighted_graph.nodes()}
-
-            # Process nodes in topological order
-            for node in topo_order:
-                node_weight = complexity_weights.get(
-                    self._nodes[node].estimated_complexity, 2
-                )
+        topo_order = self.topological_sort()
 
-                # Update all successors
-                for successor in weighted_graph.successors(node):
-                    new_dist = dist[node] + node_weight
-                    if new_dist > dist[successor]:
-                        dist[successor] = new_dist
-                        predecessor[successor] = node
+        # dist[node] = longest path length ending at node
+        dist = {node: 0 for node in topo_order}
+        predecessor: dict[str, str | None] = {node: None for node in topo_order}
 
-            # Find node with maximum distance
-            if not dist:
-                return []
+        # Process nodes in topological order
+        for node in topo_order:
+            node_weight = weight(node)
 
-            end_node = max(dist, key=lambda x: dist[x])
+            # Update all successors
+            for successor in self._successors[node]:
+                new_dist = dist[node] + node_weight
+                if new_dist > dist[successor]:
+                    dist[successor] = new_dist
+                    predecessor[successor] = node
 
-            # Reconstruct path
-            path = []
-            current = end_node
-            while current is not None:
-                path.append(current)
-                current = predecessor[current]
+        end_node = max(dist, key=lambda x: dist[x])
 
-            path.reverse()
-            return path
+        # Reconstruct path
+        path = []
+        current: str | None = end_node
+        while current is not None:
+            path.append(current)
+            current = predecessor[current]
 
-        except Exception:
-            # Fallback to topological sort if something goes wrong
-            return self.topological_sort()
+        path.reverse()
+        return path
 
     def get_node(self, node_id: str) -> SubtaskNode | None:
         """
@@ -285,22 +342,154 @@ class DecompositionResult:
 
         # Use topological generations (levels in the DAG)
         try:
-            generations = list(nx.topological_generations(self.dependency_graph._graph))
-            return [list(gen) for gen in generations]
-        except Exception:
+            return self.dependency_graph.topological_generations()
+        except nx.NetworkXUnfeasible:
             # Fallback: return all tasks as separate groups
             return [[task_id] for task_id in self.dependency_graph.topological_sort()]
 
 
+# A decomposition template: (description, complexity, descriptions it depends on)
+PhaseTemplate = tuple[tuple[str, str, tuple[str, ...]], ...]
+
+RESEARCH_TEMPLATE: PhaseTemplate = (
+    ("Define research scope and questions", "small", ()),
+    ("Search and gather relevant sources", "medium", ("Define research scope and questions",)),
+    ("Review and analyze findings", "large", ("Search and gather relevant sources",)),
+    ("Synthesize and document results", "medium", ("Review and analyze findings",)),
+)
+
+ANALYSIS_TEMPLATE: PhaseTemplate = (
+    ("Collect and prepare data", "medium", ()),
+    ("Perform analysis", "large", ("Collect and prepare data",)),
+    ("Interpret results", "medium", ("Perform analysis",)),
+    ("Create report with recommendations", "medium", ("Interpret results",)),
+)
+
+CREATIVE_TEMPLATE: PhaseTemplate = (
+    ("Brainstorm and ideate concepts", "medium", ()),
+    ("Create initial drafts/mockups", "large", ("Brainstorm and ideate concepts",)),
+    ("Refine and iterate on designs", "medium", ("Create initial drafts/mockups",)),
+    ("Finalize and deliver assets", "small", ("Refine and iterate on designs",)),
+)
+
+GENERIC_TEMPLATE: PhaseTemplate = (
+    ("Prepare and plan", "small", ()),
+    ("Execute main work", "large", ("Prepare and plan",)),
+    ("Review and finalize", "medium", ("Execute main work",)),
+)
+
+# Optional on-disk decomposition cache location
+DECOMPOSITION_CACHE_FILE = (
+    Path(__file__).parent.parent.parent / "config" / ".decomposition_cache.json"
+)
+_CACHE_VERSION = 1
+
+
+@lru_cache(maxsize=1)
+def _strategy_fingerprint() -> str:
+    """
+    Digest of this module's source (templates, strategies and rationale text).
+
+    Persisted decompositions built by a different version of the code are
+    ignored, so editing a template never serves stale results.
+    """
+    try:
+        source = Path(__file__).read_bytes()
+    except OSError:
+        source = b""
+    return hashlib.blake2b(source, digest_size=8).hexdigest()
+
+
+@lru_cache(maxsize=64)
+def _software_template(
+    has_design: bool, implementation: str, needs_tests: bool, has_auth: bool, has_deploy: bool
+) -> PhaseTemplate:
+    """
+    Build the software phase template for a combination of task features.
+
+    Args:
+        has_design: Task asks to build/create/implement/develop something
+        implementation: "api", "data" or "core"
+        needs_tests: Task mentions tests
+        has_auth: Task involves authentication or security
+        has_deploy: Task mentions deployment or integration
+
+    Returns:
+        Phase template
+    """
+    phases: list[tuple[str, str, list[str]]] = []
+
+    # Design/Planning phase
+    if has_design:
+        phases.append(("Design and plan the architecture", "small", []))
+
+    # Implementation phase
+    first = [phases[0][0]] if phases else []
+    if implementation == "api":
+        phases.append(("Implement API endpoints", "large", first))
+    elif implementation == "data":
+        phases.append(("Design and implement data models", "medium", first))
+    else:
+        phases.append(("Implement core functionality", "large", first))
+
+    # Testing phase
+    if needs_tests:
+        prev_phase = phases[-1][0] if phases else None
+        phases.append(("Write and run tests", "medium", [prev_phase] if prev_phase else []))
+
+    if has_auth:
+        # Depend on the implementation phase
+        if len(phases) >= 2:
+            prev_phase = phases[1][0]
+        else:
+            prev_phase = phases[0][0] if phases else None
+
+        auth_task = (
+            "Implement authentication and security",
+            "medium",
+            [prev_phase] if prev_phase else [],
+        )
+
+        # Insert before tests if tests exist
+        if needs_tests and len(phases) >= 2:
+            phases.insert(len(phases) - 1, auth_task)
+        else:
+            phases.append(auth_task)
+
+    # Deployment/Integration
+    if has_deploy:
+        prev_phase = phases[-1][0] if phases else None
+        phases.append(("Deploy and integrate", "medium", [prev_phase] if prev_phase else []))
+
+    return tuple((desc, complexity, tuple(deps)) for desc, complexity, deps in phases)
+
+
 class TaskDecomposer:
     """
     Decomposes complex tasks into subtasks with dependency relationships.
 
     Uses a combination of rule-based decomposition strategies and
     task type-specific heuristics.
+
+    Subtask IDs are derived from the task's content, so decomposing the same
+    task twice yields identical results. Results are kept in an LRU cache
+    (optionally persisted to disk) keyed by everything the strategies read:
+    task type, goal, raw description, constraints and success criteria.
     """
 
-    def __init__(self, max_depth: int = 3, min_subtasks: int = 2, max_subtasks: int = 10):
+    # Decompositions kept in memory (least recently used evicted first)
+    CACHE_SIZE = 128
+    # Decompositions kept in the on-disk cache
+    MAX_PERSISTED = 512
+
+    def __init__(
+        self,
+        max_depth: int = 3,
+        min_subtasks: int = 2,
+        max_subtasks: int = 10,
+        cache_size: int | None = None,
+        cache_path: Path | None = None,
+    ):
         """
         Initialize the task decomposer.
 
@@ -308,11 +497,20 @@ class TaskDecomposer:
             max_depth: Maximum recursion depth for decomposition
             min_subtasks: Minimum number of subtasks to generate
             max_subtasks: Maximum number of subtasks per decomposition level
+            cache_size: Maximum number of cached decompositions
+                        (default: CACHE_SIZE; 0 disables caching)
+            cache_path: Optional JSON file to persist decompositions across
+                        processes (e.g., DECOMPOSITION_CACHE_FILE)
         """
         self.max_depth = max_depth
         self.min_subtasks = min_subtasks
         self.max_subtasks = max_subtasks
-        self._task_counter = 0
+        self.cache_size = self.CACHE_SIZE if cache_size is None else cache_size
+        self.cache_path = cache_path
+        self._cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._disk_entries: dict[str, dict[str, Any]] | None = None
+        self._task_key = ""
+        self._used_ids: set[str] = set()
 
     def decompose(self, task: ParsedTask) -> DecompositionResult:
         """
@@ -324,35 +522,190 @@ class TaskDecomposer:
         Returns:
             DecompositionResult with subtasks, dependency graph, and rationale
         """
-        self._task_counter = 0
-        graph = DependencyGraph()
-
         # Handle empty task
         if not task.goal or not task.goal.strip():
             rationale = DecompositionRationale(
                 strategy="No decomposition needed for empty task"
             )
             return DecompositionResult(
-                task=task, subtasks=[], dependency_graph=graph, rationale=rationale
+                task=task, subtasks=[], dependency_graph=DependencyGraph(), rationale=rationale
             )
 
-        # Generate subtasks based on task type
-        subtasks = self._decompose_recursive(task, depth=0, parent_id=None)
+        key = self.cache_key(task)
+        entry = self._cache_get(key)
+        if entry is None:
+            entry = self._build_entry(task, key)
+            self._cache_put(key, entry)
 
-        # Build dependency graph
-        for subtask in subtasks:
+        return self._instantiate(task, entry)
+
+    def cache_key(self, task: ParsedTask) -> str:
+        """
+        Get the content hash identifying a task's decomposition.
+
+        Args:
+            task: ParsedTask to identify
+
+        Returns:
+            Hex digest of the task content and decomposer settings
+        """
+        content = json.dumps(
+            [
+                task.task_type.value if task.task_type else None,
+                task.goal,
+                task.raw_description,
+                {k: task.constraints[k] for k in sorted(task.constraints)},
+                [str(sc) for sc in task.success_criteria],
+                self.max_depth,
+            ],
+            default=str,
+        )
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+    def clear_cache(self) -> None:
+        """Drop in-memory decompositions (the on-disk cache is kept)."""
+        self._cache.clear()
+        self._disk_entries = None
+
+    # -------------------------------------------------------------------------
+    # Cache
+    # -------------------------------------------------------------------------
+
+    def _build_entry(self, task: ParsedTask, key: str) -> dict[str, Any]:
+        """Decompose a task into a serializable cache entry."""
+        self._task_key = key
+        self._used_ids = set()
+        subtasks = self._decompose_recursive(task, depth=0, parent_id=None)
+        rationale = self._generate_rationale(task, subtasks)
+        return {
+            "subtasks": [
+                {
+                    "id": st.id,
+                    "description": st.description,
+                    "parent_id": st.parent_id,
+                    "depth": st.depth,
+                    "dependencies": st.dependencies,
+                    "estimated_complexity": st.estimated_complexity,
+                }
+                for st in subtasks
+            ],
+            "rationale": {
+                "strategy": rationale.strategy,
+                "subtask_explanations": rationale.subtask_explanations,
+                "dependency_explanations": rationale.dependency_explanations,
+            },
+        }
+
+    def _instantiate(self, task: ParsedTask, entry: dict[str, Any]) -> DecompositionResult:
+        """Build a fresh result (safe to mutate) from a cache entry."""
+        graph = DependencyGraph()
+        subtasks = []
+        for data in entry["subtasks"]:
+            subtask = SubtaskNode(
+                id=data["id"],
+                description=data["description"],
+                parent_id=data["parent_id"],
+                depth=data["depth"],
+                dependencies=list(data["dependencies"]),
+                estimated_complexity=data["estimated_complexity"],
+            )
+            subtasks.append(subtask)
             graph.add_node(subtask)
             for dep in subtask.dependencies:
                 if graph.has_node(dep):
                     graph.add_dependency(subtask.id, dep)
 
-        # Generate rationale
-        rationale = self._generate_rationale(task, subtasks)
-
+        rationale_data = entry["rationale"]
+        rationale = DecompositionRationale(
+            strategy=rationale_data["strategy"],
+            subtask_explanations=dict(rationale_data["subtask_explanations"]),
+            dependency_explanations=dict(rationale_data["dependency_explanations"]),
+        )
         return DecompositionResult(
             task=task, subtasks=subtasks, dependency_graph=graph, rationale=rationale
         )
 
+    def _cache_get(self, key: str) -> dict[str, Any] | None:
+        """Look up a decomposition in memory, then on disk."""
+        if self.cache_size <= 0:
+            return None
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._cache.move_to_end(key)
+            return entry
+        if self.cache_path is not None:
+            stored = self._load_disk_entries().get(key)
+            if isinstance(stored, dict) and "subtasks" in stored and "rationale" in stored:
+                self._remember(key, stored)
+                self._write_disk_entry(key, stored)  # Refresh used_at for eviction
+                return stored
+        return None
+
+    def _cache_put(self, key: str, entry: dict[str, Any]) -> None:
+        """Store a decomposition in memory and, if configured, on disk."""
+        if self.cache_size <= 0:
+            return
+        self._remember(key, entry)
+        if self.cache_path is not None:
+            self._write_disk_entry(key, entry)
+
+    def _remember(self, key: str, entry: dict[str, Any]) -> None:
+        """Insert into the in-memory LRU."""
+        self._cache[key] = entry
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _load_disk_entries(self) -> dict[str, dict[str, Any]]:
+        """Read the on-disk cache once per decomposer."""
+        if self._disk_entries is None:
+            self._disk_entries = {}
+            if self.cache_path is None:
+                return self._disk_entries
+            try:
+                with open(self.cache_path) as f:
+                    data = json.load(f)
+                if (
+                    data.get("version") == _CACHE_VERSION
+                    and data.get("fingerprint") == _strategy_fingerprint()
+                ):
+                    self._disk_entries = data.get("decompositions", {})
+            except (OSError, json.JSONDecodeError, AttributeError):
+                pass
+        return self._disk_entries
+
+    def _write_disk_entry(self, key: str, entry: dict[str, Any]) -> None:
+        """Add or refresh an entry in the on-disk cache, keeping the most recent ones."""
+        cache_path = self.cache_path
+        if cache_path is None:
+            return
+        entries = self._load_disk_entries()
+        entries[key] = {**entry, "used_at": time.time()}
+        if len(entries) > self.MAX_PERSISTED:
+            keep = sorted(entries, key=lambda k: entries[k].get("used_at", 0), reverse=True)
+            self._disk_entries = entries = {k: entries[k] for k in keep[: self.MAX_PERSISTED]}
+
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(
+                    {
+                        "version": _CACHE_VERSION,
+                        "fingerprint": _strategy_fingerprint(),
+                        "decompositions": entries,
+                    },
+                    f,
+                    separators=(",", ":"),
+                )
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # The cache is an optimization; decomposition still succeeded
+
+    # -------------------------------------------------------------------------
+    # Rationale
+    # -------------------------------------------------------------------------
+
     def _generate_rationale(
         self, task: ParsedTask, subtasks: list[SubtaskNode]
     ) -> DecompositionRationale:
@@ -454,232 +807,67 @@ class TaskDecomposer:
         self, task: ParsedTask, depth: int, parent_id: str | None
     ) -> list[SubtaskNode]:
         """Decompose a software development task."""
-        subtasks = []
+        if depth > 0:
+            # Deeper decomposition - break into smaller units
+            return self._decompose_generic_task(task, depth, parent_id)
 
         goal_lower = task.goal.lower()
         raw_lower = task.raw_description.lower()
         full_text = f"{goal_lower} {raw_lower}"
+        criteria = [str(sc).lower() for sc in task.success_criteria]
 
-        # Common software phases
-        if depth == 0:
-            # High-level decomposition
-            phases: list[tuple[str, str, list[str]]] = []
-
-            # Design/Planning phase
-            if any(
-                keyword in full_text
-                for keyword in ["build", "create", "implement", "develop"]
-            ):
-                phases.append(
-                    ("Design and plan the architecture", "small", [])
-                )
-
-            # Implementation phase
-            if "api" in full_text or "endpoint" in full_text:
-                phases.append(
-                    ("Implement API endpoints", "large", [phases[0][0]] if phases else [])
-                )
-            elif "database" in full_text or "model" in full_text:
-                phases.append(
-                    ("Design and implement data models", "medium", [phases[0][0]] if phases else [])
-                )
-            else:
-                phases.append(
-                    ("Implement core functionality", "large", [phases[0][0]] if phases else [])
-                )
-
-            # Testing phase (check both goal, raw description, and success criteria)
-            needs_tests = (
-                "test" in full_text
-                or any("test" in str(sc).lower() for sc in task.success_criteria)
-                or any("pytest" in str(sc).lower() for sc in task.success_criteria)
-            )
-            if needs_tests:
-                prev_phase = phases[-1][0] if phases else None
-                phases.append(
-                    ("Write and run tests", "medium", [prev_phase] if prev_phase else [])
-                )
-
-            # Authentication/Security - check raw description and success criteria too
-            has_auth = any(
-                keyword in full_text
-                for keyword in ["auth", "jwt", "login", "security", "token"]
-            ) or any(
-                keyword in str(sc).lower()
-                for sc in task.success_criteria
-                for keyword in ["auth", "jwt", "login", "token"]
-            )
-
-            if has_auth:
-                # Add authentication before tests if tests exist, else before end
-                # Find correct previous dependency
-                if len(phases) >= 2:
-                    # Depend on implementation phase
-                    prev_phase = phases[1][0] if len(phases) > 1 else phases[0][0]
-                else:
-                    prev_phase = phases[0][0] if phases else None
-
-                auth_task = (
-                    "Implement authentication and security",
-                    "medium",
-                    [prev_phase] if prev_phase else [],
-                )
-
-                # Insert before tests if tests exist
-                if needs_tests and len(phases) >= 2:
-                    phases.insert(len(phases) - 1, auth_task)
-                else:
-                    phases.append(auth_task)
-
-            # Deployment/Integration
-            if "deploy" in full_text or "integrate" in full_text:
-                prev_phase = phases[-1][0] if phases else None
-                phases.append(
-                    ("Deploy and integrate", "medium", [prev_phase] if prev_phase else [])
-                )
+        has_design = any(
+            keyword in full_text for keyword in ["build", "create", "implement", "develop"]
+        )
+        if "api" in full_text or "endpoint" in full_text:
+            implementation = "api"
+        elif "database" in full_text or "model" in full_text:
+            implementation = "data"
+        else:
+            implementation = "core"
 
-            # Create subtasks
-            task_id_map: dict[str, str] = {}
-            for description, complexity, dep_descriptions in phases:
-                task_id = self._generate_task_id()
-                deps = [task_id_map[desc] for desc in dep_descriptions if desc in task_id_map]
+        # Testing phase (check both goal, raw description, and success criteria)
+        needs_tests = "test" in full_text or any(
+            "test" in sc or "pytest" in sc for sc in criteria
+        )
 
-                subtask = SubtaskNode(
-                    id=task_id,
-                    description=description,
-                    parent_id=parent_id,
-                    depth=depth,
-                    dependencies=deps,
-                    estimated_complexity=complexity,
-                )
-                subtasks.append(subtask)
-                task_id_map[description] = task_id
+        # Authentication/Security - check raw description and success criteria too
+        has_auth = any(
+            keyword in full_text for keyword in ["auth", "jwt", "login", "security", "token"]
+        ) or any(
+            keyword in sc for sc in criteria for keyword in ["auth", "jwt", "login", "token"]
+        )
 
-        else:
-            # Deeper decomposition - break into smaller units
-            subtasks = self._decompose_generic_task(task, depth, parent_id)
+        has_deploy = "deploy" in full_text or "integrate" in full_text
 
-        return subtasks
+        template = _software_template(
+            has_design, implementation, needs_tests, has_auth, has_deploy
+        )
+        return self._instantiate_template(template, depth, parent_id)
 
     def _decompose_research_task(
         self, task: ParsedTask, depth: int, parent_id: str | None
     ) -> list[SubtaskNode]:
         """Decompose a research task."""
-        subtasks = []
-
-        if depth == 0:
-            # Research workflow
-            phases = [
-                ("Define research scope and questions", "small", []),
-                (
-                    "Search and gather relevant sources",
-                    "medium",
-                    ["Define research scope and questions"],
-                ),
-                (
-                    "Review and analyze findings",
-                    "large",
-                    ["Search and gather relevant sources"],
-                ),
-                (
-                    "Synthesize and document results",
-                    "medium",
-                    ["Review and analyze findings"],
-                ),
-            ]
-
-            task_id_map: dict[str, str] = {}
-            for description, complexity, dep_descriptions in phases:
-                task_id = self._generate_task_id()
-                deps = [task_id_map[desc] for desc in dep_descriptions if desc in task_id_map]
-
-                subtask = SubtaskNode(
-                    id=task_id,
-                    description=description,
-                    parent_id=parent_id,
-                    depth=depth,
-                    dependencies=deps,
-                    estimated_complexity=complexity,
-                )
-                subtasks.append(subtask)
-                task_id_map[description] = task_id
-
-        else:
-            subtasks = self._decompose_generic_task(task, depth, parent_id)
-
-        return subtasks
+        if depth > 0:
+            return self._decompose_generic_task(task, depth, parent_id)
+        return self._instantiate_template(RESEARCH_TEMPLATE, depth, parent_id)
 
     def _decompose_analysis_task(
         self, task: ParsedTask, depth: int, parent_id: str | None
     ) -> list[SubtaskNode]:
         """Decompose an analysis task."""
-        subtasks = []
-
-        if depth == 0:
-            # Analysis workflow
-            phases = [
-                ("Collect and prepare data", "medium", []),
-                ("Perform analysis", "large", ["Collect and prepare data"]),
-                ("Interpret results", "medium", ["Perform analysis"]),
-                ("Create report with recommendations", "medium", ["Interpret results"]),
-            ]
-
-            task_id_map: dict[str, str] = {}
-            for description, complexity, dep_descriptions in phases:
-                task_id = self._generate_task_id()
-                deps = [task_id_map[desc] for desc in dep_descriptions if desc in task_id_map]
-
-                subtask = SubtaskNode(
-                    id=task_id,
-                    description=description,
-                    parent_id=parent_id,
-                    depth=depth,
-                    dependencies=deps,
-                    estimated_complexity=complexity,
-                )
-                subtasks.append(subtask)
-                task_id_map[description] = task_id
-
-        else:
-            subtasks = self._decompose_generic_task(task, depth, parent_id)
-
-        return subtasks
+        if depth > 0:
+            return self._decompose_generic_task(task, depth, parent_id)
+        return self._instantiate_template(ANALYSIS_TEMPLATE, depth, parent_id)
 
     def _decompose_creative_task(
         self, task: ParsedTask, depth: int, parent_id: str | None
     ) -> list[SubtaskNode]:
         """Decompose a creative task."""
-        subtasks = []
-
-        if depth == 0:
-            # Creative workflow
-            phases = [
-                ("Brainstorm and ideate concepts", "medium", []),
-                ("Create initial drafts/mockups", "large", ["Brainstorm and ideate concepts"]),
-                ("Refine and iterate on designs", "medium", ["Create initial drafts/mockups"]),
-                ("Finalize and deliver assets", "small", ["Refine and iterate on designs"]),
-            ]
-
-            task_id_map: dict[str, str] = {}
-            for description, complexity, dep_descriptions in phases:
-                task_id = self._generate_task_id()
-                deps = [task_id_map[desc] for desc in dep_descriptions if desc in task_id_map]
-
-                subtask = SubtaskNode(
-                    id=task_id,
-                    description=description,
-                    parent_id=parent_id,
-                    depth=depth,
-                    dependencies=deps,
-                    estimated_complexity=complexity,
-                )
-                subtasks.append(subtask)
-                task_id_map[description] = task_id
-
-        else:
-            subtasks = self._decompose_generic_task(task, depth, parent_id)
-
-        return subtasks
+        if depth > 0:
+            return self._decompose_generic_task(task, depth, parent_id)
+        return self._instantiate_template(CREATIVE_TEMPLATE, depth, parent_id)
 
     def _decompose_hybrid_task(
         self, task: ParsedTask, depth: int, parent_id: str | None
@@ -692,34 +880,56 @@ class TaskDecomposer:
         self, task: ParsedTask, depth: int, parent_id: str | None
     ) -> list[SubtaskNode]:
         """Generic task decomposition fallback."""
-        subtasks = []
-
         # Simple 3-phase approach
-        phases = [
-            ("Prepare and plan", "small", []),
-            ("Execute main work", "large", ["Prepare and plan"]),
-            ("Review and finalize", "medium", ["Execute main work"]),
-        ]
+        return self._instantiate_template(GENERIC_TEMPLATE, depth, parent_id)
 
+    def _instantiate_template(
+        self, template: PhaseTemplate, depth: int, parent_id: str | None
+    ) -> list[SubtaskNode]:
+        """
+        Create subtasks from a phase template.
+
+        Args:
+            template: Phases as (description, complexity, dependency descriptions)
+            depth: Depth of the created subtasks
+            parent_id: ID of the parent task
+
+        Returns:
+            List of SubtaskNode objects
+        """
+        subtasks = []
         task_id_map: dict[str, str] = {}
-        for description, complexity, dep_descriptions in phases:
-            task_id = self._generate_task_id()
+        for description, complexity, dep_descriptions in template:
+            task_id = self._generate_task_id(description, depth, parent_id)
             deps = [task_id_map[desc] for desc in dep_descriptions if desc in task_id_map]
 
-            subtask = SubtaskNode(
-                id=task_id,
-                description=description,
-                parent_id=parent_id,
-                depth=depth,
-                dependencies=deps,
-                estimated_complexity=complexity,
+            subtasks.append(
+                SubtaskNode(
+                    id=task_id,
+                    description=description,
+                    parent_id=parent_id,
+                    depth=depth,
+                    dependencies=deps,
+                    estimated_complexity=complexity,
+                )
             )
-            subtasks.append(subtask)
             task_id_map[description] = task_id
 
         return subtasks
 
-    def _generate_task_id(self) -> str:
-        """Generate a unique task ID."""
-        self._task_counter += 1
-        return f"task-{self._task_counter}"
+    def _generate_task_id(self, description: str, depth: int, parent_id: str | None) -> str:
+        """
+        Generate a content-addressed task ID.
+
+        The ID hashes the task being decomposed with the subtask's place in
+        the decomposition, so it is stable across runs and processes.
+        """
+        seed = f"{self._task_key}|{parent_id}|{depth}|{description}"
+        task_id = f"task-{hashlib.blake2b(seed.encode('utf-8'), digest_size=6).hexdigest()}"
+        suffix = 1
+        base = task_id
+        while task_id in self._used_ids:
+            suffix += 1
+            task_id = f"{base}-{suffix}"
+        self._used_ids.add(task_id)
+        return task_id
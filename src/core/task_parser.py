@@ -3,9 +3,16 @@ Task Parser for extracting structured information from natural language.
 
 This module provides the TaskParser class for parsing natural language
 task descriptions into structured data models.
+
+Each description is tokenized once into a shared word set and sentence list
+that every extractor reads, and parses are cached per parser keyed by a hash
+of the stripped description, so repeated goals skip extraction entirely.
 """
 
+import hashlib
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 
 from src.models.enums import TaskType
@@ -56,6 +63,78 @@ class ParsedTask:
         return clarifications
 
 
+# Words and sentence terminators, matched in one sweep over the text
+_TOKEN_PATTERN = re.compile(r"\w+|[.!?]+")
+
+
+@dataclass(frozen=True)
+class TokenizedText:
+    """
+    A task description split once for all extractors.
+
+    Attributes:
+        text: The description as given
+        lower: Lowercased description for substring checks
+        words: Distinct lowercase word tokens
+        word_count: Number of whitespace-separated tokens
+        sentences: Non-empty, stripped sentences in order
+    """
+
+    text: str
+    lower: str
+    words: frozenset[str]
+    word_count: int
+    sentences: tuple[str, ...]
+
+
+def tokenize(text: str) -> TokenizedText:
+    """
+    Split text into words and sentences in a single pass.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        TokenizedText for the text
+    """
+    words = set()
+    sentences = []
+    start = 0
+    for match in _TOKEN_PATTERN.finditer(text):
+        token = match.group()
+        if token[0] in ".!?":
+            sentence = text[start:match.start()].strip()
+            if sentence:
+                sentences.append(sentence)
+            start = match.end()
+        else:
+            words.add(token.lower())
+    tail = text[start:].strip()
+    if tail:
+        sentences.append(tail)
+
+    return TokenizedText(
+        text=text,
+        lower=text.lower(),
+        words=frozenset(words),
+        word_count=len(text.split()),
+        sentences=tuple(sentences),
+    )
+
+
+def _copy_parsed(parsed: ParsedTask) -> ParsedTask:
+    """Copy a cached parse so callers cannot mutate the cache entry."""
+    return ParsedTask(
+        goal=parsed.goal,
+        task_type=parsed.task_type,
+        constraints={k: list(v) for k, v in parsed.constraints.items()},
+        context={k: list(v) for k, v in parsed.context.items()},
+        success_criteria=list(parsed.success_criteria),
+        ambiguities=list(parsed.ambiguities),
+        raw_description=parsed.raw_description,
+    )
+
+
 class TaskParser:
     """
     Parses natural language task descriptions into structured data.
@@ -175,10 +254,106 @@ class TaskParser:
         "performant",
     }
 
+    # Patterns, compiled once and shared by every parse
+    TIME_PATTERNS = [
+        re.compile(r"\b(?:within|in|by)\s+(\d+\s+(?:day|week|month|hour)s?)\b", re.I),
+        re.compile(
+            r"\b(?:by|before)\s+(monday|tuesday|wednesday|thursday|friday"
+            r"|saturday|sunday)\b",
+            re.I,
+        ),
+        re.compile(r"\b(?:deadline|due date):\s*([^.!?]+)", re.I),
+    ]
+
+    TECH_PATTERNS = [
+        re.compile(
+            r"\b(?:using|with|in)\s+(react|vue|angular|python|java|typescript"
+            r"|javascript|postgresql|mysql|mongodb|redis)\b",
+            re.I,
+        ),
+        re.compile(
+            r"\b(?:must use|should use|require)\s+"
+            r"([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)?)\b",
+            re.I,
+        ),
+    ]
+
+    QUALITY_PATTERNS = [
+        re.compile(r"(\d+%)\s+(?:test\s+)?coverage", re.I),
+        re.compile(r"(?:must|should)\s+pass\s+([^.!?]+(?:lint|test|check))", re.I),
+        re.compile(r"\b(no\s+(?:errors|warnings|bugs))\b", re.I),
+    ]
+
+    MUST_SHOULD_PATTERN = re.compile(
+        r"\b(?:must|should|need to|required to)\s+([^.!?]+)", re.I
+    )
+
+    BACKGROUND_PATTERNS = [
+        re.compile(r"\b(?:current|currently|existing|old|outdated|legacy)\s+([^.!?]+)", re.I),
+        re.compile(r"\b(?:problem|issue|challenge):\s*([^.!?]+)", re.I),
+        re.compile(r"\bhas\s+(\d+[,\d]*\s+(?:users|customers|records|entries))", re.I),
+    ]
+
+    STAKEHOLDER_PATTERNS = [
+        re.compile(
+            r"\b((?:marketing|sales|engineering|product|customer|user)s?"
+            r"\s+team)\b",
+            re.I,
+        ),
+        re.compile(r"\b(?:for|to)\s+((?:users|customers|clients|stakeholders))\b", re.I),
+    ]
+
+    EXPLICIT_CRITERIA_PATTERNS = [
+        re.compile(
+            r"(?:success criteria|done when|acceptance criteria):\s*"
+            r"([^.!?]+(?:[.!?][^.!?]+)*)",
+            re.I,
+        ),
+        re.compile(r"\b(?:returns?|responds?)\s+(\d+\s+status)", re.I),
+        re.compile(r"\b(?:must|should)\s+(handle\s+\d+[^.!?]+)", re.I),
+        re.compile(
+            r"\b(?:within|under|less than)\s+(\d+\s*(?:ms|seconds?"
+            r"|milliseconds?))",
+            re.I,
+        ),
+        re.compile(r"\b(?:must|should)\s+support\s+([^.!?]+)", re.I),
+    ]
+
+    PERF_CRITERIA_PATTERNS = [
+        re.compile(r"(\d+[,\d]*\s+(?:requests?|queries)\s+per\s+(?:second|minute))", re.I),
+        re.compile(
+            r"(?:respond|response time)(?:\s+(?:within|under))?\s+"
+            r"(\d+\s*(?:ms|milliseconds?|seconds?))",
+            re.I,
+        ),
+    ]
+
+    NUMBERED_ITEM_PATTERN = re.compile(r"\d+\)")
+
+    # Parsed descriptions kept per parser (least recently used evicted first)
+    CACHE_SIZE = 256
+
+    def __init__(self, cache_size: int | None = None):
+        """
+        Initialize the parser.
+
+        Args:
+            cache_size: Maximum number of cached parses (default: CACHE_SIZE;
+                        0 disables caching)
+        """
+        self.cache_size = self.CACHE_SIZE if cache_size is None else cache_size
+        self._cache: OrderedDict[str, ParsedTask] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
     def parse(self, task_description: str) -> ParsedTask:
         """
         Parse a natural language task description into structured data.
 
+        Repeated descriptions (after stripping surrounding whitespace) are
+        served from an LRU cache; each call returns its own copy.
+
         Args:
             task_description: The task description to parse
 
@@ -196,17 +371,63 @@ class TaskParser:
                 raw_description="",
             )
 
+        if self.cache_size <= 0:
+            return self._parse_uncached(task_description)
+
+        key = hashlib.blake2b(task_description.encode("utf-8"), digest_size=16).hexdigest()
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return _copy_parsed(cached)
+            self._misses += 1
+
+        parsed = self._parse_uncached(task_description)
+
+        with self._cache_lock:
+            self._cache[key] = parsed
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return _copy_parsed(parsed)
+
+    def cache_info(self) -> dict[str, int]:
+        """
+        Get parse cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, size and maxsize
+        """
+        with self._cache_lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._cache),
+                "maxsize": self.cache_size,
+            }
+
+    def clear_cache(self) -> None:
+        """Drop all cached parses and reset statistics."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def _parse_uncached(self, task_description: str) -> ParsedTask:
+        """Tokenize once and run every extractor over the shared tokens."""
+        tokens = tokenize(task_description)
         return ParsedTask(
-            goal=self._extract_goal(task_description),
-            task_type=self._classify_task_type(task_description),
-            constraints=self._extract_constraints(task_description),
-            context=self._extract_context(task_description),
-            success_criteria=self._extract_success_criteria(task_description),
-            ambiguities=self._detect_ambiguities(task_description),
+            goal=self._extract_goal(tokens),
+            task_type=self._classify_task_type(tokens),
+            constraints=self._extract_constraints(tokens),
+            context=self._extract_context(tokens),
+            success_criteria=self._extract_success_criteria(tokens),
+            ambiguities=self._detect_ambiguities(tokens),
             raw_description=task_description,
         )
 
-    def _extract_goal(self, text: str) -> str:
+    def _extract_goal(self, tokens: TokenizedText) -> str:
         """
         Extract the primary goal from the task description.
 
@@ -214,33 +435,28 @@ class TaskParser:
         Future: Could use more sophisticated NLP.
 
         Args:
-            text: Task description
+            tokens: Tokenized task description
 
         Returns:
             The primary goal statement
         """
-        # Split into sentences
-        sentences = re.split(r"[.!?]+", text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-
-        if not sentences:
-            return text
+        if not tokens.sentences:
+            return tokens.text
 
         # First sentence is usually the main goal
-        return sentences[0]
+        return tokens.sentences[0]
 
-    def _classify_task_type(self, text: str) -> TaskType:
+    def _classify_task_type(self, tokens: TokenizedText) -> TaskType:
         """
         Classify the task type based on keywords.
 
         Args:
-            text: Task description
+            tokens: Tokenized task description
 
         Returns:
             TaskType classification
         """
-        text_lower = text.lower()
-        words = set(re.findall(r"\b\w+\b", text_lower))
+        words = tokens.words
 
         # Count matches for each type
         software_score = len(words & self.SOFTWARE_KEYWORDS)
@@ -275,16 +491,17 @@ class TaskParser:
 
         return TaskType.SOFTWARE  # Default
 
-    def _extract_constraints(self, text: str) -> dict[str, list[str]]:
+    def _extract_constraints(self, tokens: TokenizedText) -> dict[str, list[str]]:
         """
         Extract constraints from the task description.
 
         Args:
-            text: Task description
+            tokens: Tokenized task description
 
         Returns:
             Dictionary of constraint types to constraint values
         """
+        text = tokens.text
         constraints: dict[str, list[str]] = {
             "time": [],
             "technology": [],
@@ -293,47 +510,22 @@ class TaskParser:
         }
 
         # Time constraints
-        time_patterns = [
-            r"\b(?:within|in|by)\s+(\d+\s+(?:day|week|month|hour)s?)\b",
-            r"\b(?:by|before)\s+(monday|tuesday|wednesday|thursday|friday"
-            r"|saturday|sunday)\b",
-            r"\b(?:deadline|due date):\s*([^.!?]+)",
-        ]
-        for pattern in time_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern in self.TIME_PATTERNS:
+            for match in pattern.finditer(text):
                 constraints["time"].append(match.group(1))
 
         # Technology constraints
-        tech_patterns = [
-            r"\b(?:using|with|in)\s+(react|vue|angular|python|java|typescript"
-            r"|javascript|postgresql|mysql|mongodb|redis)\b",
-            r"\b(?:must use|should use|require)\s+"
-            r"([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)?)\b",
-        ]
-        for pattern in tech_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern in self.TECH_PATTERNS:
+            for match in pattern.finditer(text):
                 constraints["technology"].append(match.group(1))
 
         # Quality constraints
-        quality_patterns = [
-            r"(\d+%)\s+(?:test\s+)?coverage",
-            r"(?:must|should)\s+pass\s+([^.!?]+(?:lint|test|check))",
-            r"\b(no\s+(?:errors|warnings|bugs))\b",
-        ]
-        for pattern in quality_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern in self.QUALITY_PATTERNS:
+            for match in pattern.finditer(text):
                 constraints["quality"].append(match.group(1))
 
         # Must/should statements
-        must_should = re.finditer(
-            r"\b(?:must|should|need to|required to)\s+([^.!?]+)",
-            text,
-            re.IGNORECASE,
-        )
-        for match in must_should:
+        for match in self.MUST_SHOULD_PATTERN.finditer(text):
             constraint = match.group(1).strip()
             # Categorize or add to 'other'
             if not any(constraint in v for v in constraints.values()):
@@ -342,16 +534,17 @@ class TaskParser:
         # Remove empty categories
         return {k: v for k, v in constraints.items() if v}
 
-    def _extract_context(self, text: str) -> dict[str, list[str]]:
+    def _extract_context(self, tokens: TokenizedText) -> dict[str, list[str]]:
         """
         Extract context information from the task description.
 
         Args:
-            text: Task description
+            tokens: Tokenized task description
 
         Returns:
             Dictionary of context types to context values
         """
+        text = tokens.text
         context: dict[str, list[str]] = {
             "background": [],
             "stakeholder": [],
@@ -359,87 +552,59 @@ class TaskParser:
         }
 
         # Background context (current state, problems)
-        background_patterns = [
-            r"\b(?:current|currently|existing|old|outdated|legacy)\s+([^.!?]+)",
-            r"\b(?:problem|issue|challenge):\s*([^.!?]+)",
-            r"\bhas\s+(\d+[,\d]*\s+(?:users|customers|records|entries))",
-        ]
-        for pattern in background_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern in self.BACKGROUND_PATTERNS:
+            for match in pattern.finditer(text):
                 context["background"].append(match.group(1).strip())
 
         # Stakeholder context
-        stakeholder_patterns = [
-            r"\b((?:marketing|sales|engineering|product|customer|user)s?"
-            r"\s+team)\b",
-            r"\b(?:for|to)\s+((?:users|customers|clients|stakeholders))\b",
-        ]
-        for pattern in stakeholder_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern in self.STAKEHOLDER_PATTERNS:
+            for match in pattern.finditer(text):
                 context["stakeholder"].append(match.group(1).strip())
 
         # Remove empty categories
         return {k: v for k, v in context.items() if v}
 
-    def _extract_success_criteria(self, text: str) -> list[str]:
+    def _extract_success_criteria(self, tokens: TokenizedText) -> list[str]:
         """
         Extract success criteria from the task description.
 
         Args:
-            text: Task description
+            tokens: Tokenized task description
 
         Returns:
             List of success criteria
         """
+        text = tokens.text
         criteria = []
 
         # Explicit success criteria
-        explicit_patterns = [
-            r"(?:success criteria|done when|acceptance criteria):\s*"
-            r"([^.!?]+(?:[.!?][^.!?]+)*)",
-            r"\b(?:returns?|responds?)\s+(\d+\s+status)",
-            r"\b(?:must|should)\s+(handle\s+\d+[^.!?]+)",
-            r"\b(?:within|under|less than)\s+(\d+\s*(?:ms|seconds?"
-            r"|milliseconds?))",
-            r"\b(?:must|should)\s+support\s+([^.!?]+)",
-        ]
-
-        for pattern in explicit_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern in self.EXPLICIT_CRITERIA_PATTERNS:
+            for match in pattern.finditer(text):
                 criterion = match.group(1).strip()
                 # Split on numbered lists
-                sub_criteria = re.split(r"\d+\)", criterion)
+                sub_criteria = self.NUMBERED_ITEM_PATTERN.split(criterion)
                 criteria.extend([c.strip() for c in sub_criteria if c.strip()])
 
         # Performance criteria
-        perf_patterns = [
-            r"(\d+[,\d]*\s+(?:requests?|queries)\s+per\s+(?:second|minute))",
-            r"(?:respond|response time)(?:\s+(?:within|under))?\s+"
-            r"(\d+\s*(?:ms|milliseconds?|seconds?))",
-        ]
-        for pattern in perf_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern in self.PERF_CRITERIA_PATTERNS:
+            for match in pattern.finditer(text):
                 criteria.append(match.group(1).strip())
 
         return list(set(criteria))  # Remove duplicates
 
-    def _detect_ambiguities(self, text: str) -> list[str]:
+    def _detect_ambiguities(self, tokens: TokenizedText) -> list[str]:
         """
         Detect ambiguities and unclear requirements in the task description.
 
         Args:
-            text: Task description
+            tokens: Tokenized task description
 
         Returns:
             List of detected ambiguities
         """
         ambiguities = []
-        text_lower = text.lower()
-        words = set(re.findall(r"\b\w+\b", text_lower))
+        text_lower = tokens.lower
+        words = tokens.words
 
         # Check for vague terms
         vague_found = words & self.VAGUE_TERMS
@@ -450,7 +615,7 @@ class TaskParser:
             )
 
         # Check for very short descriptions
-        if len(text.split()) < 5:
+        if tokens.word_count < 5:
             ambiguities.append(
                 "Task description is very short and may be missing "
                 "critical details"
@@ -474,7 +639,7 @@ class TaskParser:
 
         # Check for unclear scope
         if "feature" in text_lower or "system" in text_lower:
-            if len(text.split()) < 20:
+            if tokens.word_count < 20:
                 ambiguities.append(
                     "Unclear scope: The feature/system description may "
                     "need more detail"
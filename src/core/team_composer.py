@@ -209,12 +209,12 @@ class TeamComposer:
         """
         role_scores: dict[str, dict[str, Any]] = {}
 
-        for subtask in subtasks:
-            requirements = subtask.requirements or {}
-
-            # Find matching roles for this subtask
-            matches = self._matcher.find_matching_roles(requirements, min_score=0.1)
+        # Find matching roles for every subtask in one batch
+        all_matches = self._matcher.match_batch(
+            [subtask.requirements or {} for subtask in subtasks], min_score=0.1
+        )
 
+        for matches in all_matches:
             for match in matches:
                 role = match["role"]
                 score = match["score"]
@@ -365,11 +365,18 @@ class TeamComposer:
         # Create a list to track workload per agent
         agent_workload = [0 for _ in agents]
 
+        # Score every subtask against every role once, then project onto agents
+        score_rows = self._matcher.score_batch([st.requirements or {} for st in subtasks])
+        columns = [self._role_columns().get(agent.role) for agent in agents]
+
         # Assign each subtask to the best available agent
-        for subtask in subtasks:
+        for subtask, row in zip(subtasks, score_rows):
             # Find best matching agent with lowest workload
             best_agent_idx = self._find_best_agent(
-                agents, agent_workload, subtask.requirements or {}
+                agents,
+                agent_workload,
+                subtask.requirements or {},
+                [row[col] if col is not None else 0.0 for col in columns],
             )
 
             # Assign task
@@ -378,11 +385,16 @@ class TeamComposer:
 
         return agents
 
+    def _role_columns(self) -> dict[str, int]:
+        """Map role names to their column in RoleMatcher.score_batch rows."""
+        return {role.name: i for i, role in enumerate(self._matcher.roles)}
+
     def _find_best_agent(
         self,
         agents: list[Agent],
         workload: list[int],
         requirements: dict[str, Any],
+        match_scores: list[float] | None = None,
     ) -> int:
         """
         Find the best agent for a task based on role match and workload balance.
@@ -391,6 +403,8 @@ class TeamComposer:
             agents: List of available agents
             workload: Current workload per agent
             requirements: Task requirements
+            match_scores: Precomputed role match score per agent (computed
+                from requirements if None)
 
         Returns:
             Index of best agent
@@ -398,25 +412,22 @@ class TeamComposer:
         if not agents:
             return 0
 
+        if match_scores is None:
+            row = self._matcher.score_batch([requirements])[0]
+            columns = self._role_columns()
+            match_scores = [
+                row[columns[agent.role]] if agent.role in columns else 0.0
+                for agent in agents
+            ]
+
+        # Factor in workload balance (prefer less loaded agents)
+        # Normalize workload (inverse: lower workload = higher score)
+        max_workload = max(workload) if max(workload) > 0 else 1
+
         best_idx = 0
         best_score = -1.0
 
-        for idx, agent in enumerate(agents):
-            # Calculate match score for this agent's role
-            role = self._registry.get_role(agent.role)
-            if role:
-                match_score = self._matcher._calculate_match_score(
-                    role,
-                    [c.lower() for c in requirements.get("capabilities", [])],
-                    [t.lower() for t in requirements.get("tools", [])],
-                    [k.lower() for k in requirements.get("domain_knowledge", [])],
-                )
-            else:
-                match_score = 0.0
-
-            # Factor in workload balance (prefer less loaded agents)
-            # Normalize workload (inverse: lower workload = higher score)
-            max_workload = max(workload) if max(workload) > 0 else 1
+        for idx, match_score in enumerate(match_scores):
             workload_score = 1.0 - (workload[idx] / max_workload)
 
             # Combined score: 70% match, 30% workload balance
@@ -9,25 +9,31 @@ Handles:
 - NATS-based coordination for race condition prevention
 """
 
-import asyncio
-import fcntl
 import json
 import os
+import re
+import sqlite3
 import subprocess
 import threading
 import time
+from array import array
+from collections import deque
 from collections.abc import Callable
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
-from src.coordination.nats_bus import MessageType, NATSMessageBus, get_message_bus
+from src.coordination.nats_bus import MessageType, NATSMessageBus
 from src.core.agent_memory import get_memory
 from src.core.agent_naming import get_naming
 from src.core.target_repos import get_target
 from src.core.work_history import get_work_history
+from src.orchestrator.bus_bridge import BusBridge, get_bus_bridge
+from src.orchestrator.claims_store import ClaimsStore
+from src.orchestrator.output_monitor import get_output_monitor
 
 
 class AgentState(str, Enum):
@@ -40,6 +46,11 @@ class AgentState(str, Enum):
     KILLED = "killed"
 
 
+# Markers that make an output line "important". Matched against the lowercased
+# line: a plain alternation is much faster than re.IGNORECASE here.
+IMPORTANT_LINE_PATTERN = re.compile(r"error|failed|exception|traceback|warning")
+
+
 @dataclass
 class AgentProcess:
     """Represents a running or completed agent process."""
@@ -53,13 +64,20 @@ class AgentProcess:
     exit_code: int | None = None
     # Output storage: head (first lines), tail (recent lines), important (errors/warnings)
     _output_head: list[str] = field(default_factory=list)  # First 100 lines
-    _output_tail: list[str] = field(default_factory=list)  # Rolling last 200 lines
+    _output_tail: deque[str] = field(
+        default_factory=lambda: deque(maxlen=AgentProcess.TAIL_LIMIT)
+    )  # Ring buffer of the last 200 lines
     _output_important: list[str] = field(default_factory=list)  # Errors/warnings
     _total_lines: int = 0
     error_lines: list[str] = field(default_factory=list)
     log_file: Path | None = None
     personal_name: str | None = None
     target_id: str | None = None  # Target repository ID (None = self)
+    # Spill-to-disk: every line is appended here and indexed by byte offset
+    spill_file: Path | None = None
+    _spill_handle: BinaryIO | None = field(default=None, repr=False)
+    _spill_offsets: array = field(default_factory=lambda: array("q"), repr=False)
+    _spill_size: int = 0
 
     # Limits for output storage
     HEAD_LIMIT = 100
@@ -70,40 +88,102 @@ class AgentProcess:
     def output_lines(self) -> list[str]:
         """Get all stored output lines (head + ... + tail)."""
         if self._total_lines <= self.HEAD_LIMIT + self.TAIL_LIMIT:
-            return self._output_head + self._output_tail
+            return self._output_head + list(self._output_tail)
         else:
             gap = self._total_lines - self.HEAD_LIMIT - len(self._output_tail)
             omitted_msg = (
                 f"... [{gap} lines omitted, "
                 f"{len(self._output_important)} important lines captured] ..."
             )
-            return self._output_head + [omitted_msg] + self._output_tail
+            return self._output_head + [omitted_msg] + list(self._output_tail)
+
+    @property
+    def total_lines(self) -> int:
+        """Total number of output lines seen."""
+        return self._total_lines
 
     def add_output_line(self, line: str) -> None:
         """Add an output line with smart storage."""
         self._total_lines += 1
 
-        # Store in head if still filling
+        # Store in head if still filling, else in the rolling tail
         if len(self._output_head) < self.HEAD_LIMIT:
             self._output_head.append(line)
         else:
-            # Add to rolling tail
             self._output_tail.append(line)
-            if len(self._output_tail) > self.TAIL_LIMIT:
-                self._output_tail.pop(0)
 
         # Check for important lines (errors, warnings, failures)
-        line_lower = line.lower()
-        error_markers = ["error", "failed", "exception", "traceback", "warning"]
-        if any(marker in line_lower for marker in error_markers):
-            if len(self._output_important) < self.IMPORTANT_LIMIT:
-                self._output_important.append(f"[L{self._total_lines}] {line}")
+        if (
+            len(self._output_important) < self.IMPORTANT_LIMIT
+            and IMPORTANT_LINE_PATTERN.search(line.lower())
+        ):
+            self._output_important.append(f"[L{self._total_lines}] {line}")
+
+        if self.spill_file is not None:
+            self._spill_line(line)
 
     @property
     def important_lines(self) -> list[str]:
         """Get important lines (errors, warnings, etc.)."""
         return self._output_important.copy()
 
+    # -------------------------------------------------------------------------
+    # Spill-to-disk
+    # -------------------------------------------------------------------------
+
+    def _spill_line(self, line: str) -> None:
+        """Append a line to the spill file and record its offset."""
+        handle = self._spill_handle
+        if handle is None:
+            if self.spill_file is None:
+                return
+            self.spill_file.parent.mkdir(parents=True, exist_ok=True)
+            handle = self._spill_handle = open(self.spill_file, "ab")
+            self._spill_size = handle.tell()
+        data = line.encode("utf-8", errors="replace") + b"\n"
+        self._spill_offsets.append(self._spill_size)
+        handle.write(data)
+        self._spill_size += len(data)
+
+    def close_spill(self) -> None:
+        """Flush and close the spill file (lines remain retrievable)."""
+        if self._spill_handle is not None:
+            self._spill_handle.close()
+            self._spill_handle = None
+
+    def get_output_range(self, start: int, end: int | None = None) -> list[str]:
+        """
+        Get output lines by 0-based line number, from memory or the spill file.
+
+        Args:
+            start: First line number (inclusive)
+            end: Last line number (exclusive). Defaults to the end of output
+
+        Returns:
+            The requested lines. Without a spill file, lines that were
+            evicted from the head/tail buffers are not available and omitted.
+        """
+        end = self._total_lines if end is None else min(end, self._total_lines)
+        start = max(start, 0)
+        if start >= end:
+            return []
+
+        if self.spill_file is None or not self._spill_offsets:
+            tail_start = self._total_lines - len(self._output_tail)
+            lines = self._output_head[start:min(end, len(self._output_head))]
+            tail = list(self._output_tail)
+            lines.extend(tail[max(start, tail_start) - tail_start:max(end - tail_start, 0)])
+            return lines
+
+        if self._spill_handle is not None:
+            self._spill_handle.flush()
+        begin = self._spill_offsets[start]
+        stop = self._spill_offsets[end] if end < len(self._spill_offsets) else self._spill_size
+        with open(self.spill_file, "rb") as f:
+            f.seek(begin)
+            data = f.read(stop - begin)
+        return data.decode("utf-8", errors="replace").split("\n")[:-1]
+
     @property
     def duration_seconds(self) -> float | None:
         """Get duration of agent run in seconds."""
@@ -130,126 +210,73 @@ class AgentProcess:
 
 class WorkStreamCoordinator:
     """
-    Coordinates work stream claims via persistent file + NATS.
+    Coordinates work stream claims via a shared claims store + NATS.
 
-    Uses file-based locking (fcntl) for cross-process coordination
-    and NATS broadcasts for status updates.
+    Claims are rows in a SQLite ClaimsStore (one per stream, claimed with an
+    atomic compare-and-set and expired by TTL) for cross-process coordination,
+    and NATS broadcasts carry status updates. Broadcasts are best effort and
+    queued on a BusBridge, so callers never wait on the message bus.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        claims_store: ClaimsStore | None = None,
+        bus_bridge: BusBridge | None = None,
+    ):
+        """
+        Initialize the coordinator.
+
+        Args:
+            claims_store: Store to claim through. Defaults to config/.work_claims.db
+            bus_bridge: Bridge to broadcast through. Defaults to the global bridge
+        """
         self._claimed: dict[str, str] = {}  # work_stream_id -> agent_id (in-memory cache)
         self._lock = threading.Lock()
-        self._nats_bus: NATSMessageBus | None = None
-        self._loop: asyncio.AbstractEventLoop | None = None
+        self._bridge = bus_bridge if bus_bridge is not None else get_bus_bridge()
 
-        # Persistent claims file for cross-process coordination
-        self._claims_file = Path(__file__).parent.parent.parent / "config" / ".work_claims.json"
-        self._claims_file.parent.mkdir(parents=True, exist_ok=True)
+        self._store = claims_store if claims_store is not None else ClaimsStore()
 
-        # Load existing claims and clean up stale ones
-        self._cleanup_stale_claims()
+        # Carry over live claims from the legacy JSON claims file, once
+        legacy_file = self._store.db_path.with_name(".work_claims.json")
+        if legacy_file.exists():
+            self._store.import_json_claims(legacy_file)
+            legacy_file.unlink(missing_ok=True)
 
-    def _load_claims_from_file(self) -> dict:
-        """Load claims from persistent file."""
-        if not self._claims_file.exists():
-            return {}
-        try:
-            with open(self._claims_file) as f:
-                return json.load(f)
-        except (json.JSONDecodeError, OSError):
-            return {}
+        # Drop expired rows and seed the cache
+        self._cleanup_stale_claims()
 
     def _cleanup_stale_claims(self) -> None:
-        """Remove claims from dead processes."""
-        if not self._claims_file.exists():
-            return
-
-        try:
-            with open(self._claims_file, "r+") as f:
-                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-                try:
-                    claims = json.load(f)
-                except json.JSONDecodeError:
-                    claims = {}
-
-                # Check each claim's PID
-                active_claims = {}
-                for ws_id, info in claims.items():
-                    pid = info.get("pid")
-                    if pid:
-                        try:
-                            os.kill(pid, 0)  # Check if process exists
-                            active_claims[ws_id] = info
-                        except OSError:
-                            # Process dead, skip this claim
-                            print(f"Cleaned up stale claim: {ws_id} (PID {pid} dead)")
-                    else:
-                        # No PID, keep claim (legacy)
-                        active_claims[ws_id] = info
-
-                # Write cleaned claims
-                f.seek(0)
-                f.truncate()
-                json.dump(active_claims, f, indent=2)
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-
-                # Update in-memory cache
-                self._claimed = {ws_id: info["agent_id"] for ws_id, info in active_claims.items()}
-
-        except OSError:
-            pass  # File doesn't exist or can't be locked
+        """Remove expired claims and refresh the in-memory cache."""
+        self._store.purge_expired()
+        with self._lock:
+            self._claimed = self._store.active_claims()
 
     def clear_all_claims(self) -> None:
         """Clear all claims (for testing purposes)."""
         with self._lock:
             self._claimed.clear()
-            if self._claims_file.exists():
-                try:
-                    with open(self._claims_file, "w") as f:
-                        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-                        json.dump({}, f)
-                        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-                except OSError:
-                    pass
+            self._store.clear()
 
-    async def _get_bus(self) -> NATSMessageBus:
-        """Get or create NATS connection."""
-        if self._nats_bus is None:
-            self._nats_bus = await get_message_bus()
-        return self._nats_bus
+    def _broadcast(self, what: str, fn: Callable[[NATSMessageBus], Any]) -> None:
+        """Queue a best-effort broadcast on the bus bridge."""
+        def report(future: Future) -> None:
+            error = future.exception()
+            # Connection failures are already reported by the bridge
+            if error is not None and not isinstance(error, ConnectionError):
+                print(f"NATS {what} broadcast failed: {error}")
 
-    def _run_async(self, coro):
-        """Run async code from sync context."""
         try:
-            # Try to get existing loop
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # Schedule in running loop
-                import concurrent.futures
-                future = concurrent.futures.Future()
-                def callback():
-                    try:
-                        result = asyncio.ensure_future(coro)
-                        result.add_done_callback(
-                            lambda f: future.set_result(f.result()) if not f.exception()
-                            else future.set_exception(f.exception())
-                        )
-                    except Exception as e:
-                        future.set_exception(e)
-                loop.call_soon_threadsafe(callback)
-                return future.result(timeout=5)
-            else:
-                return loop.run_until_complete(coro)
-        except RuntimeError:
-            # No event loop, create new one
-            return asyncio.run(coro)
+            self._bridge.submit(fn).add_done_callback(report)
+        except Exception as e:
+            print(f"NATS {what} broadcast failed: {e}")
 
     def claim_work_stream(self, work_stream_id: str, agent_id: str) -> bool:
         """
         Attempt to claim a work stream for an agent.
 
-        Uses file-based locking for cross-process coordination
-        and NATS broadcasts for status updates.
+        Claims go through an atomic compare-and-set in the shared SQLite
+        ClaimsStore, so concurrent processes cannot both win a stream;
+        NATS broadcasts carry status updates.
 
         Args:
             work_stream_id: The work stream to claim
@@ -266,71 +293,29 @@ class WorkStreamCoordinator:
                     return False
                 return True  # Already claimed by this agent
 
-            # Atomic file-based claim with locking
-            self._claims_file.parent.mkdir(parents=True, exist_ok=True)
-
-            try:
-                # Open file for read+write, create if doesn't exist
-                with open(self._claims_file, "a+") as f:
-                    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-                    f.seek(0)
-                    content = f.read().strip()
-
-                    try:
-                        claims = json.loads(content) if content else {}
-                    except json.JSONDecodeError:
-                        claims = {}
-
-                    # Check if already claimed by another agent
-                    if work_stream_id in claims:
-                        existing = claims[work_stream_id]
-                        if existing.get("agent_id") != agent_id:
-                            # Check if owner process is still alive
-                            owner_pid = existing.get("pid")
-                            if owner_pid:
-                                try:
-                                    os.kill(owner_pid, 0)
-                                    # Process alive, claim denied
-                                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-                                    return False
-                                except OSError:
-                                    # Owner dead, we can take over
-                                    pass
-                            else:
-                                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-                                return False
-
-                    # Claim it
-                    claims[work_stream_id] = {
-                        "agent_id": agent_id,
-                        "pid": os.getpid(),
-                        "claimed_at": datetime.now().isoformat()
-                    }
-
-                    # Write atomically
-                    f.seek(0)
-                    f.truncate()
-                    json.dump(claims, f, indent=2)
-                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        # Atomic per-stream compare-and-set (no global lock held)
+        try:
+            claimed = self._store.claim(work_stream_id, agent_id)
+        except sqlite3.Error as e:
+            print(f"Claims store unavailable: {e}, using memory-only")
+            claimed = True
+        if not claimed:
+            return False
 
-                # Update in-memory cache
-                self._claimed[work_stream_id] = agent_id
+        with self._lock:
+            self._claimed[work_stream_id] = agent_id
 
-            except OSError as e:
-                print(f"File-based claim failed: {e}, using memory-only")
-                self._claimed[work_stream_id] = agent_id
+        # Broadcast via NATS (best effort)
+        self._broadcast(
+            "claim", lambda bus: self._broadcast_claim(bus, work_stream_id, agent_id)
+        )
 
-            # Broadcast via NATS (best effort)
-            try:
-                self._run_async(self._broadcast_claim(work_stream_id, agent_id))
-            except Exception as e:
-                print(f"NATS claim broadcast failed: {e}")
+        return True
 
-            return True
-
-    async def _broadcast_claim(self, work_stream_id: str, agent_id: str) -> None:
+    async def _broadcast_claim(
+        self, bus: NATSMessageBus, work_stream_id: str, agent_id: str
+    ) -> None:
         """Broadcast work stream claim via NATS."""
-        bus = await self._get_bus()
         await bus.broadcast(
             from_agent=agent_id,
             message_type=MessageType.TASK_ASSIGNED,
@@ -353,48 +338,31 @@ class WorkStreamCoordinator:
         Returns:
             True if released, False if not owned by agent
         """
-        with self._lock:
-            # Release from file first (source of truth)
-            try:
-                if self._claims_file.exists():
-                    with open(self._claims_file, "r+") as f:
-                        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-                        try:
-                            claims = json.load(f)
-                        except json.JSONDecodeError:
-                            claims = {}
-
-                        if work_stream_id in claims:
-                            if claims[work_stream_id].get("agent_id") != agent_id:
-                                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-                                return False  # Not owned by this agent
-                            del claims[work_stream_id]
-
-                        f.seek(0)
-                        f.truncate()
-                        json.dump(claims, f, indent=2)
-                        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-
-            except OSError as e:
-                print(f"File-based release failed: {e}")
+        # Release in the store first (source of truth)
+        try:
+            if not self._store.release(work_stream_id, agent_id):
+                return False  # Not owned by this agent
+        except sqlite3.Error as e:
+            print(f"Claims store release failed: {e}")
 
+        with self._lock:
             # Update in-memory cache
             if work_stream_id in self._claimed:
                 if self._claimed[work_stream_id] != agent_id:
                     return False
                 del self._claimed[work_stream_id]
 
-            # Broadcast via NATS (best effort)
-            try:
-                self._run_async(self._broadcast_release(work_stream_id, agent_id))
-            except Exception:
-                pass
+        # Broadcast via NATS (best effort)
+        self._broadcast(
+            "release", lambda bus: self._broadcast_release(bus, work_stream_id, agent_id)
+        )
 
-            return True
+        return True
 
-    async def _broadcast_release(self, work_stream_id: str, agent_id: str) -> None:
+    async def _broadcast_release(
+        self, bus: NATSMessageBus, work_stream_id: str, agent_id: str
+    ) -> None:
         """Broadcast work stream release via NATS."""
-        bus = await self._get_bus()
         await bus.broadcast(
             from_agent=agent_id,
             message_type=MessageType.TASK_COMPLETE,
@@ -422,24 +390,22 @@ class WorkStreamCoordinator:
             status: Status string (started, completed, failed, etc.)
             details: Additional details
         """
-        try:
-            self._run_async(
-                self._do_broadcast_status(
-                    agent_id, work_stream_id, status, details or {}
-                )
-            )
-        except Exception as e:
-            print(f"NATS status broadcast failed: {e}")
+        self._broadcast(
+            "status",
+            lambda bus: self._do_broadcast_status(
+                bus, agent_id, work_stream_id, status, details or {}
+            ),
+        )
 
     async def _do_broadcast_status(
         self,
+        bus: NATSMessageBus,
         agent_id: str,
         work_stream_id: str,
         status: str,
         details: dict,
     ) -> None:
         """Actually broadcast status via NATS."""
-        bus = await self._get_bus()
         await bus.broadcast(
             from_agent=agent_id,
             message_type=MessageType.STATUS_UPDATE,
@@ -452,48 +418,17 @@ class WorkStreamCoordinator:
         )
 
     def get_claimed_streams(self) -> dict[str, str]:
-        """Get all currently claimed work streams from persistent file."""
-        import os
+        """Get all currently claimed work streams from the claims store."""
+        active = self._store.active_claims()
 
         with self._lock:
-            # Read from file (source of truth)
-            claims = self._load_claims_from_file()
-
-            # Filter out claims from dead processes
-            active = {}
-            for ws_id, info in claims.items():
-                pid = info.get("pid")
-                if pid:
-                    try:
-                        os.kill(pid, 0)
-                        active[ws_id] = info.get("agent_id", "unknown")
-                    except OSError:
-                        pass  # Dead process, skip
-                else:
-                    active[ws_id] = info.get("agent_id", "unknown")
-
             # Update in-memory cache
             self._claimed = active.copy()
-            return active
+        return active
 
     def is_claimed(self, work_stream_id: str) -> str | None:
         """Check if a work stream is claimed. Returns agent_id if claimed, None otherwise."""
-        import os
-
-        with self._lock:
-            # Check file first (source of truth)
-            claims = self._load_claims_from_file()
-            if work_stream_id in claims:
-                info = claims[work_stream_id]
-                pid = info.get("pid")
-                if pid:
-                    try:
-                        os.kill(pid, 0)
-                        return info.get("agent_id")
-                    except OSError:
-                        return None  # Dead process, not claimed
-                return info.get("agent_id")
-            return None
+        return self._store.owner(work_stream_id)
 
 
 # Global coordinator instance
@@ -523,6 +458,7 @@ class AgentRunner:
         project_root: Path | None = None,
         max_concurrent: int = 3,
         timeout_seconds: int = 1800,  # 30 minutes default
+        spill_output: bool = False,
     ):
         """
         Initialize the agent runner.
@@ -531,6 +467,8 @@ class AgentRunner:
             project_root: Root of the project. Defaults to auto-detect.
             max_concurrent: Maximum concurrent agents
             timeout_seconds: Timeout per agent in seconds
+            spill_output: Write each agent's full output to agent-logs/output/
+                          so any line range can be retrieved later
         """
         if project_root is None:
             project_root = Path(__file__).parent.parent.parent
@@ -538,6 +476,7 @@ class AgentRunner:
         self.project_root = project_root
         self.max_concurrent = max_concurrent
         self.timeout_seconds = timeout_seconds
+        self.spill_output = spill_output
 
         self.script_path = project_root / "scripts" / "autonomous_agent.sh"
         self.log_dir = project_root / "agent-logs"
@@ -548,6 +487,7 @@ class AgentRunner:
         self._callbacks: list[Callable[[AgentProcess], None]] = []
         self._naming = get_naming()
         self._coordinator = get_coordinator()
+        self._monitor = get_output_monitor()
         self._work_history = get_work_history()
 
         # Load agent experience from persistent storage
@@ -556,6 +496,12 @@ class AgentRunner:
         # Reconnect to any orphaned agents from previous runs
         self._reconnect_orphaned_agents()
 
+    def _spill_path(self, agent_id: str) -> Path | None:
+        """Get the spill file for an agent's output, if spilling is enabled."""
+        if not self.spill_output:
+            return None
+        return self.log_dir / "output" / f"{agent_id}-{int(time.time())}.log"
+
     def add_callback(self, callback: Callable[[AgentProcess], None]) -> None:
         """Add a callback to be called when agent state changes."""
         self._callbacks.append(callback)
@@ -745,6 +691,7 @@ class AgentRunner:
             work_stream_id=work_stream_id,
             personal_name=personal_name,
             target_id=target_id,
+            spill_file=self._spill_path(agent_id),
         )
 
         # Start the agent with context
@@ -827,40 +774,7 @@ class AgentRunner:
         except Exception as e:
             agent.state = AgentState.FAILED
             agent.error_lines.append(str(e))
-
-        finally:
-            agent.completed_at = datetime.now()
-            self._save_running_agents()  # Update PID file on completion
-
-            # Broadcast completion/failure via NATS
-            status = "completed" if agent.state == AgentState.COMPLETED else "failed"
-            self._coordinator.broadcast_status(
-                agent.agent_id,
-                agent.work_stream_id,
-                status,
-                {
-                    "personal_name": agent.personal_name,
-                    "exit_code": agent.exit_code,
-                    "duration_seconds": agent.duration_seconds,
-                }
-            )
-
-            # Release work stream claim
-            self._coordinator.release_work_stream(agent.work_stream_id, agent.agent_id)
-
-            # Record experience if completed (persistent)
-            if agent.state == AgentState.COMPLETED and agent.personal_name:
-                self._work_history.record_completion(
-                    agent.personal_name,
-                    agent.work_stream_id,
-                    details={"duration_seconds": agent.duration_seconds},
-                )
-                # Also update local cache
-                if agent.personal_name not in self._agent_experience:
-                    self._agent_experience[agent.personal_name] = []
-                if agent.work_stream_id not in self._agent_experience[agent.personal_name]:
-                    self._agent_experience[agent.personal_name].append(agent.work_stream_id)
-            self._notify_callbacks(agent)
+            self._finish_agent(agent)
 
     def _monitor_agent(
         self,
@@ -868,23 +782,16 @@ class AgentRunner:
         process: subprocess.Popen,
         on_output: Callable[[str], None] | None,
     ) -> None:
-        """Monitor agent output and detect completion."""
-        start_time = time.time()
-
-        while True:
-            # Check timeout
-            if time.time() - start_time > self.timeout_seconds:
-                agent.state = AgentState.TIMEOUT
-                process.kill()
-                break
+        """
+        Hand the agent's output pipe to the shared output monitor.
 
-            # Read output
-            line = process.stdout.readline()
-            if not line and process.poll() is not None:
-                break
+        Returns immediately; the monitor dispatches output lines as they
+        arrive, kills the agent after timeout_seconds of wall-clock time
+        (even if it is silent), and calls _finish_agent once it exits.
+        """
 
-            if line:
-                line = line.rstrip()
+        def handle_lines(lines: list[str]) -> None:
+            for line in lines:
                 agent.add_output_line(line)
 
                 # Extract personal name from output
@@ -895,15 +802,62 @@ class AgentRunner:
                 if on_output:
                     on_output(line)
 
-        # Get exit code
-        agent.exit_code = process.returncode
+        def handle_exit(returncode: int | None, timed_out: bool) -> None:
+            agent.exit_code = returncode
+
+            # Determine final state (a kill_agent() call already set KILLED)
+            if timed_out:
+                agent.state = AgentState.TIMEOUT
+            elif agent.state != AgentState.KILLED:
+                if agent.exit_code == 0:
+                    agent.state = AgentState.COMPLETED
+                else:
+                    agent.state = AgentState.FAILED
+
+            self._finish_agent(agent)
+
+        self._monitor.watch(
+            process,
+            on_lines=handle_lines,
+            on_exit=handle_exit,
+            timeout=self.timeout_seconds,
+        )
+
+    def _finish_agent(self, agent: AgentProcess) -> None:
+        """Broadcast the outcome, release the claim, and record experience."""
+        agent.completed_at = datetime.now()
+        agent.close_spill()
+        self._save_running_agents()  # Update PID file on completion
+
+        # Broadcast completion/failure via NATS
+        status = "completed" if agent.state == AgentState.COMPLETED else "failed"
+        self._coordinator.broadcast_status(
+            agent.agent_id,
+            agent.work_stream_id,
+            status,
+            {
+                "personal_name": agent.personal_name,
+                "exit_code": agent.exit_code,
+                "duration_seconds": agent.duration_seconds,
+            }
+        )
 
-        # Determine final state
-        if agent.state != AgentState.TIMEOUT:
-            if agent.exit_code == 0:
-                agent.state = AgentState.COMPLETED
-            else:
-                agent.state = AgentState.FAILED
+        # Release work stream claim
+        self._coordinator.release_work_stream(agent.work_stream_id, agent.agent_id)
+
+        # Record experience if completed (persistent)
+        if agent.state == AgentState.COMPLETED and agent.personal_name:
+            self._work_history.record_completion(
+                agent.personal_name,
+                agent.work_stream_id,
+                details={"duration_seconds": agent.duration_seconds},
+            )
+            # Also update local cache
+            if agent.personal_name not in self._agent_experience:
+                self._agent_experience[agent.personal_name] = []
+            if agent.work_stream_id not in self._agent_experience[agent.personal_name]:
+                self._agent_experience[agent.personal_name].append(agent.work_stream_id)
+        self._notify_callbacks(agent)
 
     def _notify_callbacks(self, agent: AgentProcess) -> None:
         """Notify all callbacks of agent state change."""
@@ -974,6 +928,7 @@ class AgentRunner:
             agent_id=agent_id,
             work_stream_id=work_stream_id,
             target_id=target_id,
+            spill_file=self._spill_path(agent_id),
         )
 
         # Start the agent in a background thread
@@ -1053,40 +1008,7 @@ class AgentRunner:
         except Exception as e:
             agent.state = AgentState.FAILED
             agent.error_lines.append(str(e))
-
-        finally:
-            agent.completed_at = datetime.now()
-            self._save_running_agents()  # Update PID file on completion
-
-            # Broadcast completion/failure via NATS
-            status = "completed" if agent.state == AgentState.COMPLETED else "failed"
-            self._coordinator.broadcast_status(
-                agent.agent_id,
-                agent.work_stream_id,
-                status,
-                {
-                    "personal_name": agent.personal_name,
-                    "exit_code": agent.exit_code,
-                    "duration_seconds": agent.duration_seconds,
-                }
-            )
-
-            # Release work stream claim
-            self._coordinator.release_work_stream(agent.work_stream_id, agent.agent_id)
-
-            # Record experience if completed (persistent)
-            if agent.state == AgentState.COMPLETED and agent.personal_name:
-                self._work_history.record_completion(
-                    agent.personal_name,
-                    agent.work_stream_id,
-                    details={"duration_seconds": agent.duration_seconds},
-                )
-                # Also update local cache
-                if agent.personal_name not in self._agent_experience:
-                    self._agent_experience[agent.personal_name] = []
-                if agent.work_stream_id not in self._agent_experience[agent.personal_name]:
-                    self._agent_experience[agent.personal_name].append(agent.work_stream_id)
-            self._notify_callbacks(agent)
+            self._finish_agent(agent)
 
     def kill_agent(self, agent_id: str) -> bool:
         """
@@ -0,0 +1,280 @@
+"""
+Bus Bridge - One long-lived message bus connection for synchronous callers.
+
+WorkStreamCoordinator is called from sync code (agent spawning, exit
+callbacks on worker threads) but broadcasts through the async
+NATSMessageBus, whose connection is bound to the loop that created it.
+
+BusBridge runs one event loop on a daemon thread, and that loop owns the
+bus connection:
+- submit() queues a coroutine function for the loop and returns a
+  concurrent.futures.Future right away. The backlog is bounded; when it is
+  full, callers block (up to a timeout), which pushes back on bursts.
+- Submissions run one at a time in FIFO order, so a claim broadcast is
+  never overtaken by the matching release.
+- Connecting is bounded by CONNECT_TIMEOUT (nats-py otherwise keeps
+  retrying an absent server for minutes), and a failed connect is retried
+  at most every RECONNECT_INTERVAL seconds; in between, submissions fail
+  fast instead of waiting on a dead server.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from typing import Any
+
+from src.coordination.nats_bus import NATSMessageBus, default_nats_url
+
+# Queue markers for the loop's worker
+_BARRIER = object()
+_STOP = object()
+
+
+class BusBridge:
+    """
+    Runs message bus operations on a dedicated event-loop thread.
+
+    Usage:
+        bridge = get_bus_bridge()
+        bridge.submit(lambda bus: bus.broadcast(...))  # Fire and forget
+        result = bridge.call(lambda bus: bus.get_stats())  # Wait for result
+    """
+
+    MAX_PENDING = 1024  # Submissions queued or running before callers block
+    SUBMIT_TIMEOUT = 1.0  # Seconds a caller waits for backlog room
+    CONNECT_TIMEOUT = 5.0
+    RECONNECT_INTERVAL = 30.0  # Seconds between connection attempts after a failure
+
+    def __init__(
+        self,
+        bus_factory: Callable[[], NATSMessageBus] | None = None,
+        max_pending: int | None = None,
+    ):
+        """
+        Initialize the bridge (the loop thread starts on first submit).
+
+        Args:
+            bus_factory: Creates the bus, on the bridge's loop (default: a
+                         NATSMessageBus for default_nats_url())
+            max_pending: Backlog bound. Defaults to MAX_PENDING
+        """
+        self._bus_factory = bus_factory or (lambda: NATSMessageBus(default_nats_url()))
+        self.max_pending = max_pending or self.MAX_PENDING
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue | None = None
+        self._bus: NATSMessageBus | None = None
+        self._connect_failed_at: float | None = None
+        self._closed = False
+
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+
+    @property
+    def pending(self) -> int:
+        """Submissions queued or running."""
+        with self._lock:
+            return self.submitted - self.completed - self.failed
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether the bridge holds a live bus connection."""
+        return self._bus is not None and self._bus.nc is not None
+
+    # -------------------------------------------------------------------------
+    # Submitting work
+    # -------------------------------------------------------------------------
+
+    def submit(
+        self,
+        fn: Callable[[NATSMessageBus], Awaitable[Any]],
+        timeout: float | None = None,
+    ) -> Future:
+        """
+        Queue a bus operation.
+
+        Args:
+            fn: Called with the connected bus on the bridge's loop; returns
+                the awaitable to run
+            timeout: Seconds to wait for backlog room. Defaults to
+                     SUBMIT_TIMEOUT
+
+        Returns:
+            Future resolving to the operation's result
+
+        Raises:
+            queue.Full: If the backlog stayed full for the whole timeout
+            RuntimeError: If the bridge is closed
+        """
+        return self._enqueue(fn, timeout)
+
+    def call(
+        self,
+        fn: Callable[[NATSMessageBus], Awaitable[Any]],
+        timeout: float = 5.0,
+    ) -> Any:
+        """
+        Run a bus operation and wait for its result.
+
+        Args:
+            fn: Called with the connected bus; returns the awaitable to run
+            timeout: Seconds to wait for room and for the result
+
+        Returns:
+            The operation's result
+        """
+        return self.submit(fn, timeout).result(timeout)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Wait until everything submitted so far has run.
+
+        Returns:
+            True if the backlog drained within the timeout
+        """
+        if self._thread is None:
+            return True
+        try:
+            self._enqueue(_BARRIER, timeout).result(timeout)
+            return True
+        except (TimeoutError, queue.Full):
+            return False
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Run what is queued, disconnect the bus and stop the loop thread."""
+        with self._lock:
+            if self._closed:
+                return
+            thread = self._thread
+        if thread is not None:
+            try:
+                self._enqueue(_STOP, timeout).result(timeout)
+            except (TimeoutError, queue.Full):
+                pass
+            thread.join(timeout)
+        with self._lock:
+            self._closed = True
+
+    def _enqueue(self, item: Any, timeout: float | None) -> Future:
+        """Take a backlog slot and hand an item to the loop."""
+        loop, work = self._ensure_started()
+
+        # Never block the bridge's own loop waiting for itself to make room
+        on_loop_thread = threading.current_thread() is self._thread
+        wait = 0 if on_loop_thread else (self.SUBMIT_TIMEOUT if timeout is None else timeout)
+        if not self._slots.acquire(timeout=wait):
+            with self._lock:
+                self.rejected += 1
+            raise queue.Full(f"Bus bridge backlog full ({self.max_pending} pending)")
+
+        future: Future = Future()
+        future.add_done_callback(lambda _: self._slots.release())
+        if item is not _BARRIER and item is not _STOP:
+            with self._lock:
+                self.submitted += 1
+        loop.call_soon_threadsafe(work.put_nowait, (item, future))
+        return future
+
+    def _ensure_started(self) -> tuple[asyncio.AbstractEventLoop, asyncio.Queue]:
+        """Start the loop thread if it is not running; returns its loop and queue."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Bus bridge is closed")
+            if self._loop is None or self._queue is None:
+                self._loop = asyncio.new_event_loop()
+                self._queue = asyncio.Queue()
+                self._thread = threading.Thread(
+                    target=self._run, args=(self._loop, self._queue), name="bus-bridge", daemon=True
+                )
+                self._thread.start()
+            return self._loop, self._queue
+
+    # -------------------------------------------------------------------------
+    # Event loop
+    # -------------------------------------------------------------------------
+
+    def _run(self, loop: asyncio.AbstractEventLoop, work: asyncio.Queue) -> None:
+        """Loop thread: process submissions until stopped."""
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self._worker(work))
+        finally:
+            loop.close()
+
+    async def _worker(self, work: asyncio.Queue) -> None:
+        """Run queued operations one at a time, in order."""
+        while True:
+            item, future = await work.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            if item is _BARRIER:
+                future.set_result(None)
+                continue
+            if item is _STOP:
+                await self._disconnect()
+                future.set_result(None)
+                return
+
+            try:
+                bus = await self._get_bus()
+                result = await item(bus)
+            except Exception as e:
+                with self._lock:
+                    self.failed += 1
+                future.set_exception(e)
+            else:
+                with self._lock:
+                    self.completed += 1
+                future.set_result(result)
+
+    async def _get_bus(self) -> NATSMessageBus:
+        """Connect on first use, backing off after failures."""
+        if self._bus is not None:
+            return self._bus
+
+        if self._connect_failed_at is not None:
+            retry_in = self.RECONNECT_INTERVAL - (time.monotonic() - self._connect_failed_at)
+            if retry_in > 0:
+                raise ConnectionError(f"Message bus unavailable (retrying in {retry_in:.0f}s)")
+
+        bus = self._bus_factory()
+        try:
+            await asyncio.wait_for(bus.connect(), self.CONNECT_TIMEOUT)
+        except Exception as e:
+            self._connect_failed_at = time.monotonic()
+            print(f"Message bus connection failed: {e}")
+            raise ConnectionError(f"Message bus unavailable: {e}") from e
+
+        self._connect_failed_at = None
+        self._bus = bus
+        return bus
+
+    async def _disconnect(self) -> None:
+        """Disconnect the bus, if connected."""
+        if self._bus is not None:
+            try:
+                await self._bus.disconnect()
+            except Exception as e:
+                print(f"Error disconnecting message bus: {e}")
+            self._bus = None
+
+
+_bridge: BusBridge | None = None
+_bridge_lock = threading.Lock()
+
+
+def get_bus_bridge() -> BusBridge:
+    """Get the global bus bridge instance."""
+    global _bridge
+    with _bridge_lock:
+        if _bridge is None:
+            _bridge = BusBridge()
+        return _bridge
@@ -0,0 +1,246 @@
+"""
+Claims Store - Atomic, per-stream work stream claims.
+
+ClaimsStore keeps one SQLite row per claimed stream (WAL mode):
+- claim() is a single compare-and-set upsert: it inserts the row, or takes
+  it over only if the existing claim expired or belongs to the same agent.
+- Claims carry a TTL (expires_at); expired rows are simply ignored, so
+  there is no periodic sweep over every claim.
+- A claim whose owning process died can be taken over, checking only the
+  PID of the stream being claimed.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS claims (
+    work_stream_id TEXT PRIMARY KEY,
+    agent_id TEXT NOT NULL,
+    pid INTEGER,
+    claimed_at TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_claims_expires ON claims(expires_at);
+"""
+
+
+def _pid_alive(pid: int | None) -> bool:
+    """Check whether a process exists (claims without a PID count as alive)."""
+    if not pid:
+        return True
+    try:
+        os.kill(pid, 0)
+        return True
+    except OSError:
+        return False
+
+
+class ClaimsStore:
+    """
+    SQLite-backed work stream claims with per-stream atomic compare-and-set.
+
+    Usage:
+        store = ClaimsStore()
+        if store.claim("2.1", "agent-7"):
+            ...
+            store.release("2.1", "agent-7")
+    """
+
+    DEFAULT_TTL_SECONDS = 4 * 60 * 60  # Longer than any agent timeout
+
+    def __init__(self, db_path: Path | None = None, ttl_seconds: float | None = None):
+        """
+        Open (and create if needed) the claims database.
+
+        Args:
+            db_path: Path to the SQLite file. Defaults to config/.work_claims.db
+            ttl_seconds: Lifetime of a claim unless renewed.
+                         Defaults to DEFAULT_TTL_SECONDS
+        """
+        if db_path is None:
+            db_path = Path(__file__).parent.parent.parent / "config" / ".work_claims.db"
+
+        self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else self.DEFAULT_TTL_SECONDS
+
+        self._lock = threading.Lock()
+        # Autocommit: every statement below is its own atomic transaction
+        self._conn = sqlite3.connect(
+            str(self.db_path), timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def claim(self, work_stream_id: str, agent_id: str, pid: int | None = None) -> bool:
+        """
+        Atomically claim a work stream.
+
+        Succeeds if the stream is unclaimed, its claim expired, it is already
+        claimed by this agent (renewing the TTL), or its owning process died.
+
+        Args:
+            work_stream_id: The work stream to claim
+            agent_id: The claiming agent
+            pid: Owning process. Defaults to the current process
+
+        Returns:
+            True if this agent now holds the claim
+        """
+        pid = pid if pid is not None else os.getpid()
+        if self._compare_and_set(work_stream_id, agent_id, pid):
+            return True
+
+        # Held by someone else: take over only if the holder's process died
+        owner = self._get_row(work_stream_id)
+        if owner is None:
+            return self._compare_and_set(work_stream_id, agent_id, pid)
+        owner_agent, owner_pid = owner
+        if _pid_alive(owner_pid):
+            return False
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM claims WHERE work_stream_id = ? AND agent_id = ? AND pid IS ?",
+                (work_stream_id, owner_agent, owner_pid),
+            )
+        return self._compare_and_set(work_stream_id, agent_id, pid)
+
+    def _compare_and_set(self, work_stream_id: str, agent_id: str, pid: int) -> bool:
+        """Insert the claim, or replace it if expired or already ours."""
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                """
+                INSERT INTO claims (work_stream_id, agent_id, pid, claimed_at, expires_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(work_stream_id) DO UPDATE SET
+                    agent_id = excluded.agent_id,
+                    pid = excluded.pid,
+                    claimed_at = excluded.claimed_at,
+                    expires_at = excluded.expires_at
+                WHERE claims.expires_at <= ? OR claims.agent_id = excluded.agent_id
+                """,
+                (
+                    work_stream_id,
+                    agent_id,
+                    pid,
+                    datetime.now().isoformat(),
+                    now + self.ttl_seconds,
+                    now,
+                ),
+            )
+            return cursor.rowcount == 1
+
+    def renew(self, work_stream_id: str, agent_id: str) -> bool:
+        """
+        Extend a claim's TTL.
+
+        Returns:
+            True if the agent still holds the claim
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE claims SET expires_at = ? WHERE work_stream_id = ? AND agent_id = ?",
+                (time.time() + self.ttl_seconds, work_stream_id, agent_id),
+            )
+            return cursor.rowcount == 1
+
+    def release(self, work_stream_id: str, agent_id: str) -> bool:
+        """
+        Release a claim.
+
+        Returns:
+            True if released or not claimed, False if held by another agent
+        """
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM claims WHERE work_stream_id = ? AND agent_id = ?",
+                (work_stream_id, agent_id),
+            )
+            row = self._conn.execute(
+                "SELECT 1 FROM claims WHERE work_stream_id = ? AND expires_at > ?",
+                (work_stream_id, time.time()),
+            ).fetchone()
+        return row is None
+
+    def owner(self, work_stream_id: str) -> str | None:
+        """Get the agent holding a live claim on a stream, if any."""
+        row = self._get_row(work_stream_id)
+        if row is None or not _pid_alive(row[1]):
+            return None
+        return row[0]
+
+    def active_claims(self) -> dict[str, str]:
+        """Get all live claims as work_stream_id -> agent_id."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT work_stream_id, agent_id, pid FROM claims WHERE expires_at > ?",
+                (time.time(),),
+            ).fetchall()
+        return {ws_id: agent for ws_id, agent, pid in rows if _pid_alive(pid)}
+
+    def count_active(self) -> int:
+        """Number of live claims."""
+        return len(self.active_claims())
+
+    def purge_expired(self) -> int:
+        """
+        Delete expired rows (housekeeping only; expired claims are already ignored).
+
+        Returns:
+            Number of rows deleted
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM claims WHERE expires_at <= ?", (time.time(),)
+            )
+            return cursor.rowcount
+
+    def clear(self) -> None:
+        """Remove every claim (for testing purposes)."""
+        with self._lock:
+            self._conn.execute("DELETE FROM claims")
+
+    def import_json_claims(self, claims_file: Path) -> int:
+        """
+        Import live claims from the legacy .work_claims.json file.
+
+        Args:
+            claims_file: Path to the JSON claims file
+
+        Returns:
+            Number of claims imported
+        """
+        try:
+            with open(claims_file) as f:
+                claims = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return 0
+
+        imported = 0
+        for ws_id, info in claims.items():
+            pid = info.get("pid")
+            if _pid_alive(pid) and self.claim(ws_id, info.get("agent_id", "unknown"), pid):
+                imported += 1
+        return imported
+
+    def _get_row(self, work_stream_id: str) -> tuple[str, int | None] | None:
+        """Get (agent_id, pid) of an unexpired claim."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT agent_id, pid FROM claims WHERE work_stream_id = ? AND expires_at > ?",
+                (work_stream_id, time.time()),
+            ).fetchone()
+        return (row[0], row[1]) if row else None
@@ -9,6 +9,7 @@ The Orchestrator:
 5. Generates reports and handles failures
 """
 
+import queue
 import subprocess
 import time
 from collections.abc import Callable
@@ -26,6 +27,7 @@ from src.orchestrator.work_stream import (
     WorkStream,
     WorkStreamStatus,
     get_prioritized_work_streams,
+    load_roadmap,
     parse_roadmap,
 )
 
@@ -59,6 +61,52 @@ class OrchestratorEvent:
     data: dict = field(default_factory=dict)
 
 
+@dataclass
+class BatchStats:
+    """Slot usage for one run_batch call."""
+    slots: int
+    started_at: float = field(default_factory=time.monotonic)
+    finished_at: float | None = None
+    agents_spawned: int = 0
+    busy_seconds: float = 0.0  # Sum of agent run times (spawn to finish)
+    # Seconds between a slot freeing up and the next spawn, while work was ready
+    idle_gaps: list[float] = field(default_factory=list)
+
+    @property
+    def wall_seconds(self) -> float:
+        """Elapsed time of the batch."""
+        end = self.finished_at if self.finished_at is not None else time.monotonic()
+        return end - self.started_at
+
+    @property
+    def slot_utilization(self) -> float:
+        """Fraction of available slot-time spent running agents (0.0 - 1.0)."""
+        capacity = self.slots * self.wall_seconds
+        return min(self.busy_seconds / capacity, 1.0) if capacity > 0 else 0.0
+
+    @property
+    def max_idle_gap(self) -> float:
+        """Longest time a slot sat idle while work was ready."""
+        return max(self.idle_gaps, default=0.0)
+
+    @property
+    def mean_idle_gap(self) -> float:
+        """Mean time a slot sat idle while work was ready."""
+        return sum(self.idle_gaps) / len(self.idle_gaps) if self.idle_gaps else 0.0
+
+    def to_dict(self) -> dict:
+        """Convert to a dictionary for events and reports."""
+        return {
+            "slots": self.slots,
+            "agents_spawned": self.agents_spawned,
+            "wall_seconds": round(self.wall_seconds, 3),
+            "busy_seconds": round(self.busy_seconds, 3),
+            "slot_utilization": round(self.slot_utilization, 3),
+            "max_idle_gap_seconds": round(self.max_idle_gap, 3),
+            "mean_idle_gap_seconds": round(self.mean_idle_gap, 3),
+        }
+
+
 class Orchestrator:
     """
     Main orchestrator that coordinates autonomous agent teams.
@@ -97,6 +145,10 @@ class Orchestrator:
         self.events: list[OrchestratorEvent] = []
         self._event_callbacks: list[Callable[[OrchestratorEvent], None]] = []
 
+        # Finished agents (agent_id, monotonic time), consumed by run_batch
+        self._finished: queue.Queue[tuple[str, float]] = queue.Queue()
+        self.last_batch_stats: BatchStats | None = None
+
         # Set up agent callbacks
         self.runner.add_callback(self._on_agent_state_change)
 
@@ -135,6 +187,8 @@ class Orchestrator:
 
     def _on_agent_state_change(self, agent: AgentProcess) -> None:
         """Handle agent state changes."""
+        if agent.is_finished:
+            self._finished.put((agent.agent_id, time.monotonic()))
         self._emit_event(
             event_type=f"agent_{agent.state.value}",
             message=f"Agent {agent.agent_id} is now {agent.state.value}",
@@ -305,6 +359,10 @@ class Orchestrator:
 
         return agents
 
+    # Fallback wake-up for run_batch, in case work becomes ready without an
+    # agent finishing (e.g. the roadmap is edited by hand)
+    BATCH_POLL_SECONDS = 30.0
+
     def run_batch(
         self,
         on_output: Callable[[str, str], None] | None = None,
@@ -313,6 +371,12 @@ class Orchestrator:
         """
         Run all available work in the current batch.
 
+        Event-driven: the loop sleeps until an agent finishes (signalled by
+        the AgentRunner callback) and then immediately fills the freed slot
+        with the next ready work stream. Work unblocked by a completion is
+        picked up in the same wake-up. Slot utilization and idle gaps are
+        reported in a "batch_stats" event and kept in last_batch_stats.
+
         Args:
             on_output: Callback for output (receives agent_id and line)
             wait: Whether to wait for all agents to complete
@@ -320,40 +384,72 @@ class Orchestrator:
         Returns:
             List of all spawned AgentProcess instances
         """
-        all_agents = []
-
-        while True:
-            available = self.get_available_work()
-            if not available:
-                break
+        all_agents: list[AgentProcess] = []
+        stats = BatchStats(slots=self.config.max_concurrent_agents)
+        spawned_at: dict[str, float] = {}
+        freed_at: list[float] = []  # Slots freed and not yet refilled
 
-            # Spawn up to max_concurrent
-            running = len(self.runner.get_running_agents())
-            to_spawn = min(
-                len(available),
-                self.config.max_concurrent_agents - running,
-            )
+        # Ignore completions from before this batch
+        while not self._finished.empty():
+            self._finished.get_nowait()
 
-            if to_spawn == 0:
-                # Wait for some to finish
-                time.sleep(5)
+        while True:
+            active = len(self.runner.get_active_agents())
+            free = self.config.max_concurrent_agents - active
+            available = self.get_available_work() if free > 0 else []
+
+            if available:
+                agents = self.run_parallel(
+                    max_agents=min(len(available), free),
+                    on_output=on_output,
+                )
+                now = time.monotonic()
+                for agent in agents:
+                    spawned_at[agent.agent_id] = now
+                    if freed_at:
+                        stats.idle_gaps.append(now - freed_at.pop(0))
+                stats.agents_spawned += len(agents)
+                all_agents.extend(agents)
+
+                if not wait:
+                    break
+                if agents:
+                    continue  # Fill remaining slots before sleeping
+            else:
+                freed_at.clear()  # Idle for lack of work, not scheduling delay
+
+            if not self.runner.get_active_agents():
+                break  # Nothing running and nothing to start
+
+            # Sleep until an agent finishes
+            try:
+                finished = [self._finished.get(timeout=self.BATCH_POLL_SECONDS)]
+            except queue.Empty:
                 continue
+            while not self._finished.empty():
+                finished.append(self._finished.get_nowait())
 
-            agents = self.run_parallel(
-                max_agents=to_spawn,
-                on_output=on_output,
-            )
-            all_agents.extend(agents)
-
-            if not wait:
-                break
-
-            # Wait for current batch to have some completions
-            time.sleep(10)
+            for agent_id, finished_time in finished:
+                started = spawned_at.pop(agent_id, None)
+                if started is not None:  # Ours, and not already counted
+                    stats.busy_seconds += finished_time - started
+                    freed_at.append(finished_time)
 
         if wait:
             self.runner.wait_for_all()
 
+        # Account for agents still running (wait=False)
+        now = time.monotonic()
+        stats.busy_seconds += sum(now - started for started in spawned_at.values())
+        stats.finished_at = now
+        self.last_batch_stats = stats
+        self._emit_event(
+            "batch_stats",
+            f"Batch finished: {stats.agents_spawned} agents, "
+            f"{stats.slot_utilization:.0%} slot utilization",
+            **stats.to_dict(),
+        )
+
         return all_agents
 
     def verify_completion(self, agent: AgentProcess) -> dict:
@@ -411,11 +507,8 @@ class Orchestrator:
             results["passed"] = False
 
         # Check roadmap updated
-        roadmap = parse_roadmap(self.project_root / "plans" / "roadmap.md")
-        work_stream = next(
-            (ws for ws in roadmap if ws.id == agent.work_stream_id),
-            None,
-        )
+        roadmap = load_roadmap(self.project_root / "plans" / "roadmap.md")
+        work_stream = roadmap.get(agent.work_stream_id)
         if work_stream:
             results["checks"]["roadmap"] = {
                 "passed": work_stream.status in (
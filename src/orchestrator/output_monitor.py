@@ -0,0 +1,289 @@
+"""
+Output Monitor - Event-driven supervision of agent processes.
+
+OutputMonitor runs a single selector loop that multiplexes the stdout pipes
+of every watched process:
+- Pipes are read non-blocking in chunks; complete lines are handed to the
+  watcher's on_lines callback in one batch per wakeup.
+- Wall-clock timeouts are enforced from a deadline heap, independent of
+  whether the process produces any output.
+- Exit callbacks run on a small worker pool, so slow completion handling
+  (NATS broadcasts, history writes) never stalls the loop.
+"""
+
+import codecs
+import heapq
+import itertools
+import os
+import selectors
+import subprocess
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+
+@dataclass
+class _Watch:
+    """Book-keeping for one watched process."""
+
+    process: subprocess.Popen
+    fd: int
+    on_lines: Callable[[list[str]], None]
+    on_exit: Callable[[int | None, bool], None]
+    deadline: float | None
+    decoder: codecs.IncrementalDecoder = field(
+        default_factory=lambda: codecs.getincrementaldecoder("utf-8")(errors="replace")
+    )
+    partial: str = ""
+    eof: bool = False
+    timed_out: bool = False
+    killed_at: float | None = None
+
+
+class OutputMonitor:
+    """
+    Single-threaded multiplexer for agent stdout pipes.
+
+    Usage:
+        monitor = get_output_monitor()
+        monitor.watch(
+            process,
+            on_lines=lambda lines: ...,
+            on_exit=lambda returncode, timed_out: ...,
+            timeout=1800,
+        )
+    """
+
+    READ_CHUNK_BYTES = 65536
+    POLL_INTERVAL_SECONDS = 0.5  # Exit polling for processes that closed stdout
+    KILL_GRACE_SECONDS = 5.0  # Wait for EOF after a timeout kill before giving up
+    EXIT_WORKERS = 4
+
+    def __init__(self) -> None:
+        """Initialize the monitor (the loop thread starts on first watch)."""
+        self._selector = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+        self._watches: dict[int, _Watch] = {}
+        self._pending: list[_Watch] = []
+        # (deadline, seq, watch): fds are reused once a pipe closes, so entries
+        # are tied to the watch itself; seq keeps ties from comparing watches
+        self._deadlines: list[tuple[float, int, _Watch]] = []
+        self._deadline_seq = itertools.count()
+        self._thread: threading.Thread | None = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.EXIT_WORKERS, thread_name_prefix="agent-exit"
+        )
+
+        # Self-pipe used to wake the loop when a process is added
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ, None)
+
+    @property
+    def watched_count(self) -> int:
+        """Number of processes currently being supervised."""
+        with self._lock:
+            return len(self._watches) + len(self._pending)
+
+    def watch(
+        self,
+        process: subprocess.Popen,
+        on_lines: Callable[[list[str]], None],
+        on_exit: Callable[[int | None, bool], None],
+        timeout: float | None = None,
+    ) -> None:
+        """
+        Start supervising a process.
+
+        Args:
+            process: Process started with stdout=subprocess.PIPE
+            on_lines: Called with each batch of complete output lines
+                      (trailing whitespace stripped), on the monitor thread
+            on_exit: Called once with (returncode, timed_out) after all
+                     output has been dispatched, on an exit worker thread
+            timeout: Wall-clock seconds before the process is killed
+
+        Raises:
+            ValueError: If the process has no stdout pipe
+        """
+        if process.stdout is None:
+            raise ValueError("Process must be started with stdout=subprocess.PIPE")
+        fd = process.stdout.fileno()
+        os.set_blocking(fd, False)
+        deadline = time.monotonic() + timeout if timeout else None
+        watch = _Watch(process, fd, on_lines, on_exit, deadline)
+
+        with self._lock:
+            self._pending.append(watch)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._loop, name="agent-output-monitor", daemon=True
+                )
+                self._thread.start()
+        self._wake()
+
+    # -------------------------------------------------------------------------
+    # Event loop
+    # -------------------------------------------------------------------------
+
+    def _wake(self) -> None:
+        """Interrupt the selector wait."""
+        try:
+            os.write(self._wake_w, b"\0")
+        except BlockingIOError:
+            pass  # Already has a pending wakeup
+
+    def _loop(self) -> None:
+        """Multiplex all pipes until nothing is left to watch."""
+        while True:
+            self._register_pending()
+            with self._lock:
+                if not self._watches and not self._pending:
+                    self._thread = None
+                    return
+
+            for key, _ in self._selector.select(self._next_wait()):
+                if key.data is None:
+                    self._drain_wakeups()
+                else:
+                    self._read(key.data)
+
+            self._check_deadlines()
+            self._reap()
+
+    def _register_pending(self) -> None:
+        """Move newly watched processes into the selector."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            for watch in pending:
+                self._watches[watch.fd] = watch
+                self._selector.register(watch.fd, selectors.EVENT_READ, watch)
+                if watch.deadline is not None:
+                    heapq.heappush(
+                        self._deadlines, (watch.deadline, next(self._deadline_seq), watch)
+                    )
+
+    def _next_wait(self) -> float | None:
+        """Seconds until the loop has timed work to do (None = only I/O)."""
+        with self._lock:
+            waits = []
+            if self._deadlines:
+                waits.append(max(0.0, self._deadlines[0][0] - time.monotonic()))
+            if any(w.eof or w.timed_out for w in self._watches.values()):
+                waits.append(self.POLL_INTERVAL_SECONDS)
+        return min(waits) if waits else None
+
+    def _drain_wakeups(self) -> None:
+        """Empty the self-pipe."""
+        try:
+            while os.read(self._wake_r, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _read(self, watch: _Watch) -> None:
+        """Read everything available from one pipe and dispatch complete lines."""
+        chunks = []
+        while True:
+            try:
+                chunk = os.read(watch.fd, self.READ_CHUNK_BYTES)
+            except BlockingIOError:
+                break
+            except OSError:
+                chunk = b""
+            if not chunk:
+                watch.eof = True
+                self._selector.unregister(watch.fd)
+                break
+            chunks.append(chunk)
+            if len(chunk) < self.READ_CHUNK_BYTES:
+                break
+
+        text = watch.partial + watch.decoder.decode(b"".join(chunks), final=watch.eof)
+        lines = text.split("\n")
+        tail = lines.pop()  # Text after the last newline
+        if watch.eof:
+            watch.partial = ""
+            if tail:
+                lines.append(tail)  # Unterminated final line
+        else:
+            watch.partial = tail
+
+        batch = [line.rstrip() for line in lines]
+        if batch:
+            try:
+                watch.on_lines(batch)
+            except Exception as e:
+                print(f"Output callback error: {e}")
+
+    def _check_deadlines(self) -> None:
+        """Kill processes whose wall-clock timeout has passed."""
+        now = time.monotonic()
+        with self._lock:
+            while self._deadlines and self._deadlines[0][0] <= now:
+                deadline, _, watch = heapq.heappop(self._deadlines)
+                if (
+                    self._watches.get(watch.fd) is not watch  # Reaped; fd may be reused
+                    or watch.deadline != deadline
+                    or watch.timed_out
+                    or watch.process.poll() is not None
+                ):
+                    continue
+                watch.timed_out = True
+                watch.killed_at = now
+                try:
+                    watch.process.kill()
+                except OSError:
+                    pass
+
+    def _reap(self) -> None:
+        """Finish watches whose pipe closed and whose process exited."""
+        now = time.monotonic()
+        finished = []
+        with self._lock:
+            for fd, watch in list(self._watches.items()):
+                exited = watch.process.poll() is not None
+                if watch.eof and exited:
+                    finished.append(watch)
+                elif (
+                    watch.killed_at is not None
+                    and exited
+                    and now - watch.killed_at > self.KILL_GRACE_SECONDS
+                ):
+                    # A grandchild still holds the pipe open; stop waiting for EOF
+                    self._selector.unregister(fd)
+                    finished.append(watch)
+            for watch in finished:
+                del self._watches[watch.fd]
+
+        for watch in finished:
+            if watch.process.stdout is not None:
+                watch.process.stdout.close()
+            self._executor.submit(
+                self._run_exit_callback, watch, watch.process.returncode, watch.timed_out
+            )
+
+    @staticmethod
+    def _run_exit_callback(watch: _Watch, returncode: int | None, timed_out: bool) -> None:
+        """Invoke on_exit, reporting (not raising) callback errors."""
+        try:
+            watch.on_exit(returncode, timed_out)
+        except Exception as e:
+            print(f"Exit callback error: {e}")
+
+
+# Global monitor instance
+_monitor: OutputMonitor | None = None
+_monitor_lock = threading.Lock()
+
+
+def get_output_monitor() -> OutputMonitor:
+    """Get the global output monitor instance."""
+    global _monitor
+    with _monitor_lock:
+        if _monitor is None:
+            _monitor = OutputMonitor()
+        return _monitor
@@ -8,9 +8,10 @@ Responsibilities:
 - Validate roadmap consistency
 """
 
-import re
 from pathlib import Path
 
+from src.orchestrator.roadmap_state import get_roadmap_state
+from src.orchestrator.roadmap_writer import RoadmapWriter
 from src.orchestrator.work_stream import (
     WorkStream,
     WorkStreamStatus,
@@ -55,22 +56,10 @@ class RoadmapGardener:
         # Refresh cache
         clear_roadmap_cache()
 
-        # Get all work streams
-        all_streams = parse_roadmap(self.roadmap_path)
-
-        # Build completion map
-        completed_phases = {
-            ws.id for ws in all_streams
-            if ws.status == WorkStreamStatus.COMPLETE
-        }
-
-        # Check blocked phases
-        blocked_streams = [
-            ws for ws in all_streams
-            if ws.status == WorkStreamStatus.BLOCKED
-        ]
+        # Dependency state (DAG parsed once, refreshed incrementally)
+        state = get_roadmap_state(self.roadmap_path)
 
-        for ws in blocked_streams:
+        for ws in state.with_status(WorkStreamStatus.BLOCKED):
             if not ws.depends_on:
                 # No dependencies listed but blocked - unblock it
                 results["unblocked"].append({
@@ -80,26 +69,18 @@ class RoadmapGardener:
                 })
                 continue
 
-            # Parse dependencies
-            deps = self._parse_dependencies(ws.depends_on)
-            all_satisfied = all(
-                dep in completed_phases or "✅" in dep
-                for dep in deps
-            )
-
-            if all_satisfied:
+            if state.dependencies_met(ws.id):
                 results["unblocked"].append({
                     "id": ws.id,
                     "name": ws.name,
-                    "dependencies": deps,
+                    "dependencies": list(state.dependencies(ws.id)),
                     "reason": "All dependencies completed",
                 })
             else:
-                pending = [d for d in deps if d not in completed_phases and "✅" not in d]
                 results["still_blocked"].append({
                     "id": ws.id,
                     "name": ws.name,
-                    "pending_deps": pending,
+                    "pending_deps": state.pending_dependencies(ws.id),
                 })
 
         # Apply changes to roadmap
@@ -108,34 +89,16 @@ class RoadmapGardener:
 
         return results
 
-    def _parse_dependencies(self, depends_on: str) -> list[str]:
-        """Parse dependencies string into list of phase IDs."""
-        # Handle formats like "Phase 1.4", "Phase 1.4 ✅", "Phase 1.4, Phase 2.1"
-        deps = []
-        parts = re.split(r"[,;]", depends_on)
-        for part in parts:
-            part = part.strip()
-            # Extract phase ID
-            match = re.search(r"(?:Phase\s+)?(\d+\.\d+)", part)
-            if match:
-                deps.append(match.group(1))
-        return deps
-
     def _apply_unblocks(self, unblocked: list[dict]) -> None:
         """Apply unblock changes to roadmap file."""
-        content = self.roadmap_path.read_text()
-
+        writer = RoadmapWriter(self.roadmap_path)
         for item in unblocked:
-            phase_id = item["id"]
-
-            # Find and replace status for this phase
-            # Pattern: After "### Phase X.X:" find "- **Status:** 🔴 Blocked"
-            pattern = rf"(### Phase {re.escape(phase_id)}:.*?- \*\*Status:\*\*) 🔴 Blocked"
-            replacement = r"\1 ⚪ Not Started"
-            content = re.sub(pattern, replacement, content, flags=re.DOTALL)
-
-        self.roadmap_path.write_text(content)
-        clear_roadmap_cache()
+            writer.set_status(
+                item["id"],
+                WorkStreamStatus.NOT_STARTED,
+                only_if=WorkStreamStatus.BLOCKED,
+            )
+        writer.commit()
 
     def check_health(self) -> dict:
         """
@@ -163,13 +126,10 @@ class RoadmapGardener:
                 issues.append(f"Phase {ws.id} is blocked but has no dependencies listed")
 
         # Issue: Dependencies satisfied but still blocked
-        completed = {ws.id for ws in all_streams if ws.status == WorkStreamStatus.COMPLETE}
-        for ws in all_streams:
-            if ws.status == WorkStreamStatus.BLOCKED and ws.depends_on:
-                deps = self._parse_dependencies(ws.depends_on)
-                all_met = all(d in completed or "✅" in ws.depends_on for d in deps)
-                if all_met:
-                    issues.append(f"Phase {ws.id} should be unblocked - dependencies satisfied")
+        state = get_roadmap_state(self.roadmap_path)
+        for ws in state.with_status(WorkStreamStatus.BLOCKED):
+            if ws.depends_on and (state.dependencies_met(ws.id) or "✅" in ws.depends_on):
+                issues.append(f"Phase {ws.id} should be unblocked - dependencies satisfied")
 
         return {
             "total_phases": len(all_streams),
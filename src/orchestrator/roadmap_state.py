@@ -0,0 +1,239 @@
+"""
+Roadmap State - Materialized dependency DAG and ready frontier.
+
+RoadmapState parses each phase's "Depends On" line once into a DAG with
+reverse edges and keeps, per phase, a count of dependencies that are not yet
+complete. When the roadmap changes, only the phases whose block changed are
+re-evaluated: a phase that becomes complete decrements its dependents'
+counters and moves any that reach zero onto the ready frontier. "What can I
+claim next" is then a lookup rather than a scan.
+"""
+
+from collections import defaultdict
+from pathlib import Path
+
+from src.orchestrator.work_stream import (
+    ParsedRoadmap,
+    WorkStream,
+    WorkStreamStatus,
+    load_roadmap,
+)
+
+
+class RoadmapState:
+    """
+    Incrementally maintained dependency state for one roadmap.
+
+    Usage:
+        state = get_roadmap_state(roadmap_path)  # Refreshed from disk
+        for ws in state.prioritized():
+            ...
+    """
+
+    def __init__(self, parsed: ParsedRoadmap):
+        """
+        Build the state from a parsed roadmap.
+
+        Args:
+            parsed: The parsed roadmap to index
+        """
+        self._rebuild(parsed)
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+
+    def _rebuild(self, parsed: ParsedRoadmap) -> None:
+        """Index every phase from scratch."""
+        self._parsed = parsed
+        self._digests = {pid: block.digest for pid, block in parsed.blocks.items()}
+        self._deps: dict[str, tuple[str, ...]] = {}
+        self._dependents: dict[str, set[str]] = defaultdict(set)
+        self._unmet: dict[str, int] = {}
+        self._completed: set[str] = set()
+        self._by_status: dict[WorkStreamStatus, set[str]] = {
+            status: set() for status in WorkStreamStatus
+        }
+        self._ready: set[str] = set()
+
+        for pid, ws in parsed.by_id.items():
+            self._by_status[ws.status].add(pid)
+            if ws.status == WorkStreamStatus.COMPLETE:
+                self._completed.add(pid)
+        for ws in parsed.by_id.values():
+            self._link(ws)
+        for pid in parsed.by_id:
+            self._update_ready(pid)
+
+    def refresh(self, parsed: ParsedRoadmap) -> int:
+        """
+        Bring the state up to date with a newer parse of the same roadmap.
+
+        Only phases whose block text changed are re-evaluated. Adding,
+        removing or reordering phases triggers a full rebuild.
+
+        Args:
+            parsed: The new parse
+
+        Returns:
+            Number of phases re-evaluated
+        """
+        if parsed is self._parsed:
+            return 0
+
+        digests = {pid: block.digest for pid, block in parsed.blocks.items()}
+        if list(digests) != list(self._digests):
+            self._rebuild(parsed)
+            return len(digests)
+
+        old_by_id = self._parsed.by_id
+        self._parsed = parsed
+        changed = [pid for pid, digest in digests.items() if self._digests[pid] != digest]
+        self._digests = digests
+
+        for pid in changed:
+            old, new = old_by_id[pid], parsed.by_id[pid]
+            if old.depends_on != new.depends_on:
+                self._unlink(pid)
+                self._link(new)
+            if old.status != new.status:
+                self._by_status[old.status].discard(pid)
+                self._by_status[new.status].add(pid)
+                self._set_complete(pid, new.status == WorkStreamStatus.COMPLETE)
+            self._update_ready(pid)
+
+        return len(changed)
+
+    def _link(self, ws: WorkStream) -> None:
+        """Parse a phase's dependencies and add its edges."""
+        deps = tuple(ws.get_dependency_ids())
+        self._deps[ws.id] = deps
+        for dep in set(deps):
+            self._dependents[dep].add(ws.id)
+        self._unmet[ws.id] = sum(1 for dep in set(deps) if dep not in self._completed)
+
+    def _unlink(self, phase_id: str) -> None:
+        """Remove a phase's dependency edges."""
+        for dep in set(self._deps.pop(phase_id, ())):
+            self._dependents[dep].discard(phase_id)
+        self._unmet.pop(phase_id, None)
+
+    def _set_complete(self, phase_id: str, complete: bool) -> None:
+        """Record a completion change and propagate it to dependents."""
+        if complete == (phase_id in self._completed):
+            return
+        if complete:
+            self._completed.add(phase_id)
+            delta = -1
+        else:
+            self._completed.discard(phase_id)
+            delta = 1
+        for dependent in self._dependents.get(phase_id, ()):
+            self._unmet[dependent] += delta
+            self._update_ready(dependent)
+
+    def _update_ready(self, phase_id: str) -> None:
+        """Add or remove a phase from the ready frontier."""
+        ws = self._parsed.by_id[phase_id]
+        satisfied = self._unmet[phase_id] == 0 or "✅" in (ws.depends_on or "")
+        if ws.is_claimable and satisfied:
+            self._ready.add(phase_id)
+        else:
+            self._ready.discard(phase_id)
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    @property
+    def completed_ids(self) -> set[str]:
+        """IDs of completed phases."""
+        return set(self._completed)
+
+    def get(self, phase_id: str) -> WorkStream | None:
+        """Get a work stream by phase ID."""
+        return self._parsed.by_id.get(phase_id)
+
+    def with_status(self, status: WorkStreamStatus) -> list[WorkStream]:
+        """Get work streams with a status, in roadmap order."""
+        return self._in_order(self._by_status[status])
+
+    def dependencies(self, phase_id: str) -> tuple[str, ...]:
+        """Phase IDs a phase depends on, as written."""
+        return self._deps.get(phase_id, ())
+
+    def dependents(self, phase_id: str) -> set[str]:
+        """Phase IDs that depend on a phase."""
+        return set(self._dependents.get(phase_id, ()))
+
+    def pending_dependencies(self, phase_id: str) -> list[str]:
+        """Dependencies of a phase that are not complete."""
+        return [dep for dep in self._deps.get(phase_id, ()) if dep not in self._completed]
+
+    def dependencies_met(self, phase_id: str) -> bool:
+        """Whether every listed dependency is complete (ignores inline ✅ markers)."""
+        return self._unmet.get(phase_id, 0) == 0
+
+    def is_ready(self, phase_id: str) -> bool:
+        """Whether a phase is claimable with all dependencies satisfied."""
+        return phase_id in self._ready
+
+    def ready(self) -> list[WorkStream]:
+        """Claimable phases with satisfied dependencies, in roadmap order."""
+        return self._in_order(self._ready)
+
+    def prioritized(self) -> list[WorkStream]:
+        """Ready phases, bootstrap first, then by batch and phase ID."""
+        return sorted(
+            (self._parsed.by_id[pid] for pid in self._ready),
+            key=lambda ws: (0 if ws.is_bootstrap else 1, ws.batch, ws.id),
+        )
+
+    def bootstrap(self) -> list[WorkStream]:
+        """Ready bootstrap phases, by batch and phase ID."""
+        return sorted(
+            (self._parsed.by_id[pid] for pid in self._ready
+             if self._parsed.by_id[pid].is_bootstrap),
+            key=lambda ws: (ws.batch, ws.id),
+        )
+
+    def _in_order(self, phase_ids: set[str]) -> list[WorkStream]:
+        """Resolve phase IDs to streams in roadmap order."""
+        if len(phase_ids) * 4 < len(self._parsed.streams):
+            order = self._parsed.blocks
+            return [
+                self._parsed.by_id[pid]
+                for pid in sorted(phase_ids, key=lambda pid: order[pid].start)
+            ]
+        return [ws for ws in self._parsed.by_id.values() if ws.id in phase_ids]
+
+
+# Per-roadmap state instances
+_states: dict[Path, RoadmapState] = {}
+
+
+def get_roadmap_state(roadmap_path: Path | None = None) -> RoadmapState:
+    """
+    Get the up-to-date state for a roadmap.
+
+    Reloads the roadmap through the parse cache (a stat call when unchanged)
+    and applies any changes incrementally.
+
+    Args:
+        roadmap_path: Path to roadmap.md. Defaults to plans/roadmap.md
+
+    Returns:
+        RoadmapState for the roadmap
+    """
+    parsed = load_roadmap(roadmap_path)
+    state = _states.get(parsed.path)
+    if state is None:
+        state = _states[parsed.path] = RoadmapState(parsed)
+    else:
+        state.refresh(parsed)
+    return state
+
+
+def clear_roadmap_states() -> None:
+    """Forget all materialized roadmap states (useful for testing)."""
+    _states.clear()
@@ -0,0 +1,143 @@
+"""
+Roadmap Writer - Batched, offset-based edits to roadmap.md.
+
+RoadmapWriter collects edits, locates each phase's Status line from the
+offsets recorded by the parser, splices every edit in a single pass over the
+text, writes the result atomically, and hands the new content to the parse
+cache so the next read does not reparse the file.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+from src.orchestrator.work_stream import (
+    ParsedRoadmap,
+    WorkStreamStatus,
+    cache_roadmap_content,
+    clear_roadmap_cache,
+    load_roadmap,
+)
+
+# Canonical Status line values written for each status
+STATUS_LABELS = {
+    WorkStreamStatus.NOT_STARTED: "⚪ Not Started",
+    WorkStreamStatus.IN_PROGRESS: "🔄 In Progress",
+    WorkStreamStatus.COMPLETE: "✅ Complete",
+    WorkStreamStatus.BLOCKED: "🔴 Blocked",
+}
+
+
+class RoadmapWriter:
+    """
+    Applies a batch of phase status edits to the roadmap in one write.
+
+    Usage:
+        writer = RoadmapWriter(roadmap_path)
+        writer.set_status("2.1", WorkStreamStatus.NOT_STARTED,
+                          only_if=WorkStreamStatus.BLOCKED)
+        writer.set_status("2.2", WorkStreamStatus.COMPLETE)
+        applied = writer.commit()
+    """
+
+    def __init__(self, roadmap_path: Path | None = None):
+        """
+        Initialize the writer.
+
+        Args:
+            roadmap_path: Path to roadmap.md. Defaults to plans/roadmap.md
+        """
+        if roadmap_path is None:
+            roadmap_path = Path(__file__).parent.parent.parent / "plans" / "roadmap.md"
+
+        self.roadmap_path = roadmap_path
+        self._edits: dict[str, tuple[WorkStreamStatus, WorkStreamStatus | None]] = {}
+
+    @property
+    def pending(self) -> int:
+        """Number of queued edits."""
+        return len(self._edits)
+
+    def set_status(
+        self,
+        phase_id: str,
+        status: WorkStreamStatus,
+        only_if: WorkStreamStatus | None = None,
+    ) -> None:
+        """
+        Queue a status change (the last edit queued for a phase wins).
+
+        Args:
+            phase_id: Phase to update (e.g., "2.1")
+            status: New status
+            only_if: Apply only if the phase currently has this status
+        """
+        self._edits[phase_id] = (status, only_if)
+
+    def commit(self) -> list[str]:
+        """
+        Apply all queued edits in one pass and write the roadmap atomically.
+
+        Edits for phases that do not exist, have no Status line, or fail
+        their only_if condition are skipped.
+
+        Returns:
+            IDs of the phases whose Status line was rewritten
+        """
+        if not self._edits:
+            return []
+
+        raw, parsed = self._load_consistent()
+        content = raw.decode("utf-8")
+
+        splices: list[tuple[int, int, str, str]] = []
+        for phase_id, (status, only_if) in self._edits.items():
+            ws = parsed.get(phase_id)
+            block = parsed.blocks.get(phase_id)
+            if ws is None or block is None or block.status_span is None:
+                continue
+            if only_if is not None and ws.status != only_if:
+                continue
+            start, end = block.status_span
+            splices.append((start, end, f"- **Status:** {STATUS_LABELS[status]}", phase_id))
+
+        self._edits.clear()
+        if not splices:
+            return []
+
+        # Single pass: copy the text between edits, substituting each Status line
+        splices.sort()
+        parts = []
+        cursor = 0
+        for start, end, line, _ in splices:
+            parts.append(content[cursor:start])
+            parts.append(line)
+            cursor = end
+        parts.append(content[cursor:])
+        new_raw = "".join(parts).encode("utf-8")
+
+        self._atomic_write(new_raw)
+        cache_roadmap_content(self.roadmap_path, new_raw, previous=parsed)
+
+        return [phase_id for _, _, _, phase_id in splices]
+
+    def _load_consistent(self) -> tuple[bytes, ParsedRoadmap]:
+        """Read the file and a parse whose offsets match those exact bytes."""
+        raw = self.roadmap_path.read_bytes()
+        parsed = load_roadmap(self.roadmap_path)
+        if parsed.content_hash != hashlib.blake2b(raw, digest_size=16).hexdigest():
+            # Modified between the stat check and our read: parse what we read
+            clear_roadmap_cache()
+            parsed = cache_roadmap_content(self.roadmap_path, raw, previous=parsed)
+        return raw, parsed
+
+    def _atomic_write(self, raw: bytes) -> None:
+        """Write to a temp file and rename it over the roadmap."""
+        tmp_path = self.roadmap_path.with_name(
+            f".{self.roadmap_path.name}.{os.getpid()}.tmp"
+        )
+        with open(tmp_path, "wb") as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.roadmap_path)
@@ -9,22 +9,38 @@ Parses the roadmap to identify:
 
 Optimizations:
 - Caches parsed roadmap with file modification time check
+- Persistent on-disk parse cache keyed by content hash
+- Incremental reparsing: only changed "### Phase" blocks are parsed again
+- Per-phase dict index (ParsedRoadmap.by_id) instead of list scans
 - Pre-compiled regex patterns
 """
 
+import hashlib
+import json
+import os
 import re
+import time
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
+from typing import Any
 
 # Pre-compiled regex patterns for efficiency
 _BATCH_PATTERN = re.compile(r"^## Batch (\d+)")
 # Captures phase ID, name, and optional priority tag (e.g., "⭐ BOOTSTRAP")
 _PHASE_PATTERN = re.compile(r"^### Phase (\d+\.\d+): (.+?)(?:\s+⭐\s*(\w+))?$")
 _TASK_PATTERN = re.compile(r"\s*-\s*\[(.?)\]\s*(.+)")
+# Multiline variants used to locate headers without splitting the whole file
+_PHASE_HEADER_PATTERN = re.compile(_PHASE_PATTERN.pattern, re.MULTILINE)
+_BATCH_HEADER_PATTERN = re.compile(_BATCH_PATTERN.pattern, re.MULTILINE)
 
-# Cache for parsed roadmap
-_roadmap_cache: dict[Path, tuple[float, list["WorkStream"]]] = {}
+# On-disk parse cache shared by every CLI invocation
+ROADMAP_CACHE_FILE = Path(__file__).parent.parent.parent / "config" / ".roadmap_cache.json"
+MAX_CACHED_ROADMAPS = 8
+_CACHE_VERSION = 1
+
+# In-memory cache: path -> ((mtime_ns, size), parsed roadmap)
+_roadmap_cache: dict[Path, tuple[tuple[int, int], "ParsedRoadmap"]] = {}
 
 
 class WorkStreamStatus(str, Enum):
@@ -118,16 +134,50 @@ class WorkStream:
         return f"[{status_emoji[self.status]}] Phase {self.id}: {self.name}{priority_marker}"
 
 
-def parse_roadmap(roadmap_path: Path | None = None, use_cache: bool = True) -> list[WorkStream]:
+@dataclass
+class PhaseBlock:
+    """Location of one ``### Phase`` section within the roadmap text."""
+
+    phase_id: str
+    start: int  # Offset of the "### Phase" header
+    end: int  # Offset where the next phase header (or EOF) begins
+    digest: str  # Hash of the block text, the key into the block cache
+    status_span: tuple[int, int] | None = None  # Offsets of the "- **Status:**" line
+
+
+@dataclass
+class ParsedRoadmap:
+    """A parsed roadmap with per-phase indexes."""
+
+    path: Path
+    content_hash: str
+    streams: list[WorkStream]
+    by_id: dict[str, WorkStream]
+    blocks: dict[str, PhaseBlock]
+    reparsed_blocks: int = 0  # Blocks actually parsed (not served from cache)
+    _entries: dict[str, dict] = field(default_factory=dict, repr=False)
+
+    def get(self, phase_id: str) -> WorkStream | None:
+        """Get a work stream by phase ID."""
+        return self.by_id.get(phase_id)
+
+
+def load_roadmap(roadmap_path: Path | None = None, use_cache: bool = True) -> ParsedRoadmap:
     """
-    Parse the roadmap.md file to extract work streams.
+    Load the roadmap, reparsing only the phase sections that changed.
+
+    Lookup order:
+    1. In-memory cache keyed by file mtime and size
+    2. Whole-file content hash (an unchanged file is never reparsed)
+    3. Per-block hashes from memory or the on-disk parse cache: only
+       ``### Phase`` blocks whose text changed are parsed again
 
     Args:
         roadmap_path: Path to roadmap.md. Defaults to plans/roadmap.md
         use_cache: Whether to use cached results if available
 
     Returns:
-        List of WorkStream objects
+        ParsedRoadmap with streams in file order and a phase ID index
     """
     if roadmap_path is None:
         project_root = Path(__file__).parent.parent.parent
@@ -138,95 +188,243 @@ def parse_roadmap(roadmap_path: Path | None = None, use_cache: bool = True) -> l
     if not roadmap_path.exists():
         raise FileNotFoundError(f"Roadmap not found: {roadmap_path}")
 
-    # Check cache
-    mtime = roadmap_path.stat().st_mtime
-    if use_cache and roadmap_path in _roadmap_cache:
-        cached_mtime, cached_streams = _roadmap_cache[roadmap_path]
-        if cached_mtime == mtime:
-            return cached_streams
+    stat = roadmap_path.stat()
+    stat_key = (stat.st_mtime_ns, stat.st_size)
+    cached = _roadmap_cache.get(roadmap_path) if use_cache else None
+    if cached and cached[0] == stat_key:
+        return cached[1]
+
+    raw = roadmap_path.read_bytes()
+    content_hash = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    if cached and cached[1].content_hash == content_hash:
+        _roadmap_cache[roadmap_path] = (stat_key, cached[1])
+        return cached[1]
+
+    known: dict[str, dict] = {}
+    disk_hash = None
+    if use_cache:
+        disk_entry = _read_disk_cache(roadmap_path)
+        if disk_entry:
+            disk_hash = disk_entry["content_hash"]
+            known.update(disk_entry["blocks"])
+        if cached:
+            known.update(cached[1]._entries)
+
+    parsed = _build_roadmap(roadmap_path, raw.decode("utf-8"), content_hash, known)
 
-    content = roadmap_path.read_text()
-    work_streams = []
+    if use_cache:
+        _roadmap_cache[roadmap_path] = (stat_key, parsed)
+        if disk_hash != content_hash:
+            _write_disk_cache(roadmap_path, parsed)
+
+    return parsed
+
+
+def parse_roadmap(roadmap_path: Path | None = None, use_cache: bool = True) -> list[WorkStream]:
+    """
+    Parse the roadmap.md file to extract work streams.
+
+    Args:
+        roadmap_path: Path to roadmap.md. Defaults to plans/roadmap.md
+        use_cache: Whether to use cached results if available
+
+    Returns:
+        List of WorkStream objects
+    """
+    return load_roadmap(roadmap_path, use_cache).streams
+
+
+def get_work_stream(phase_id: str, roadmap_path: Path | None = None) -> WorkStream | None:
+    """Get a single work stream by phase ID (e.g., "2.1")."""
+    return load_roadmap(roadmap_path).get(phase_id)
+
+
+def cache_roadmap_content(
+    roadmap_path: Path, raw: bytes, previous: ParsedRoadmap | None = None
+) -> ParsedRoadmap:
+    """
+    Store content just written to a roadmap in the parse caches.
+
+    Used by writers so the next read does not reparse the file: only blocks
+    whose text differs from the previous parse are parsed.
+
+    Args:
+        roadmap_path: Path of the roadmap that was written
+        raw: The exact bytes written
+        previous: The parse the edits were computed from
+
+    Returns:
+        ParsedRoadmap for the new content
+    """
+    roadmap_path = roadmap_path.resolve()
+    content_hash = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    known = previous._entries if previous else {}
+    parsed = _build_roadmap(roadmap_path, raw.decode("utf-8"), content_hash, known)
+
+    stat = roadmap_path.stat()
+    _roadmap_cache[roadmap_path] = ((stat.st_mtime_ns, stat.st_size), parsed)
+    _write_disk_cache(roadmap_path, parsed)
+    return parsed
+
+
+def clear_roadmap_cache() -> None:
+    """Clear the in-memory roadmap cache (useful for testing or after edits)."""
+    _roadmap_cache.clear()
+
+
+# -----------------------------------------------------------------------------
+# Block parsing
+# -----------------------------------------------------------------------------
+
+
+def _build_roadmap(
+    path: Path, content: str, content_hash: str, known: dict[str, dict]
+) -> ParsedRoadmap:
+    """Split content into phase blocks, parsing only blocks not in known."""
+    headers = list(_PHASE_HEADER_PATTERN.finditer(content))
+
+    # Batch headers before the first phase set its batch
+    preamble = content[:headers[0].start()] if headers else content
     current_batch = 1
+    for batch_match in _BATCH_HEADER_PATTERN.finditer(preamble):
+        current_batch = int(batch_match.group(1))
+
+    streams: list[WorkStream] = []
+    by_id: dict[str, WorkStream] = {}
+    blocks: dict[str, PhaseBlock] = {}
+    entries: dict[str, dict] = {}
+    reparsed = 0
+
+    for i, header in enumerate(headers):
+        start = header.start()
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(content)
+        text = content[start:end]
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+        entry = known.get(digest)
+        if entry is None:
+            entry = _parse_block(text)
+            reparsed += 1
+        entries[digest] = entry
+
+        ws = _create_work_stream({
+            **entry["fields"],
+            "status": WorkStreamStatus(entry["fields"]["status"]),
+            "tasks": list(entry["fields"]["tasks"]),
+            "batch": current_batch,
+        })
+        streams.append(ws)
+        by_id.setdefault(ws.id, ws)
+
+        span = entry["status_span"]
+        blocks.setdefault(ws.id, PhaseBlock(
+            phase_id=ws.id,
+            start=start,
+            end=end,
+            digest=digest,
+            status_span=(start + span[0], start + span[1]) if span else None,
+        ))
+
+        # Batch headers inside this block apply from the next phase on
+        if entry["last_batch"] is not None:
+            current_batch = entry["last_batch"]
+
+    return ParsedRoadmap(
+        path=path,
+        content_hash=content_hash,
+        streams=streams,
+        by_id=by_id,
+        blocks=blocks,
+        reparsed_blocks=reparsed,
+        _entries=entries,
+    )
 
-    # Split into sections by "## Batch" or "### Phase"
-    lines = content.split("\n")
-    current_stream: dict | None = None
+
+def _parse_block(text: str) -> dict:
+    """
+    Parse one ``### Phase`` block (header line through the next header).
+
+    Returns:
+        JSON-serializable cache entry with the stream fields (without batch),
+        the last batch number declared inside the block, and the offsets of
+        the Status line relative to the block start.
+
+    Raises:
+        ValueError: If the block does not start with a phase header
+    """
+    lines = text.split("\n")
+    phase_match = _PHASE_PATTERN.match(lines[0])
+    if phase_match is None:
+        raise ValueError(f"Not a phase header: {lines[0]!r}")
+
+    # Extract priority tag if present (group 3 captures "BOOTSTRAP", "PRIORITY", etc.)
+    priority_tag = phase_match.group(3)
+    priority = priority_tag.lower() if priority_tag else "normal"
+
+    stream: dict[str, Any] = {
+        "id": phase_match.group(1),
+        "name": phase_match.group(2).strip(),
+        "tasks": [],
+        "status": WorkStreamStatus.NOT_STARTED.value,
+        "assigned_to": None,
+        "depends_on": None,
+        "effort": "M",
+        "done_when": None,
+        "priority": priority,
+    }
+    last_batch = None
+    status_span = None
     in_tasks = False
+    offset = len(lines[0]) + 1
+
+    for line in lines[1:]:
+        line_start = offset
+        offset += len(line) + 1
 
-    for line in lines:
         # Detect batch headers (use pre-compiled pattern)
         batch_match = _BATCH_PATTERN.match(line)
         if batch_match:
-            current_batch = int(batch_match.group(1))
-            continue
-
-        # Detect phase headers (use pre-compiled pattern)
-        phase_match = _PHASE_PATTERN.match(line)
-        if phase_match:
-            # Save previous stream if exists
-            if current_stream:
-                work_streams.append(_create_work_stream(current_stream))
-
-            # Extract priority tag if present (group 3 captures "BOOTSTRAP", "PRIORITY", etc.)
-            priority_tag = phase_match.group(3)
-            priority = priority_tag.lower() if priority_tag else "normal"
-
-            current_stream = {
-                "id": phase_match.group(1),
-                "name": phase_match.group(2).strip(),
-                "batch": current_batch,
-                "tasks": [],
-                "status": WorkStreamStatus.NOT_STARTED,
-                "assigned_to": None,
-                "depends_on": None,
-                "effort": "M",
-                "done_when": None,
-                "priority": priority,
-            }
-            in_tasks = False
-            continue
-
-        if not current_stream:
+            last_batch = int(batch_match.group(1))
             continue
 
         # Parse status
         if line.startswith("- **Status:**"):
             status_text = line.split(":**")[1].strip()
             if "✅" in status_text or "Complete" in status_text:
-                current_stream["status"] = WorkStreamStatus.COMPLETE
+                stream["status"] = WorkStreamStatus.COMPLETE.value
             elif "🔄" in status_text or "In Progress" in status_text:
-                current_stream["status"] = WorkStreamStatus.IN_PROGRESS
+                stream["status"] = WorkStreamStatus.IN_PROGRESS.value
             elif "🔴" in status_text or "Blocked" in status_text:
-                current_stream["status"] = WorkStreamStatus.BLOCKED
+                stream["status"] = WorkStreamStatus.BLOCKED.value
             else:
-                current_stream["status"] = WorkStreamStatus.NOT_STARTED
+                stream["status"] = WorkStreamStatus.NOT_STARTED.value
+            status_span = [line_start, line_start + len(line)]
             continue
 
         # Parse assigned to
         if line.startswith("- **Assigned To:**"):
             assigned = line.split(":**")[1].strip()
             if assigned and assigned != "-":
-                current_stream["assigned_to"] = assigned
+                stream["assigned_to"] = assigned
             continue
 
         # Parse depends on
         if line.startswith("- **Depends On:**"):
             depends = line.split(":**")[1].strip()
             if depends:
-                current_stream["depends_on"] = depends
+                stream["depends_on"] = depends
             continue
 
         # Parse effort
         if line.startswith("- **Effort:**"):
             effort = line.split(":**")[1].strip()
-            current_stream["effort"] = effort
+            stream["effort"] = effort
             continue
 
         # Parse done when
         if line.startswith("- **Done When:**"):
             done_when = line.split(":**")[1].strip()
-            current_stream["done_when"] = done_when
+            stream["done_when"] = done_when
             continue
 
         # Parse tasks section
@@ -239,26 +437,66 @@ def parse_roadmap(roadmap_path: Path | None = None, use_cache: bool = True) -> l
             task_match = _TASK_PATTERN.match(line)
             if task_match:
                 task_text = task_match.group(2).strip()
-                current_stream["tasks"].append(task_text)
+                stream["tasks"].append(task_text)
             continue
 
         # End of tasks section
         if in_tasks and line.startswith("- **"):
             in_tasks = False
 
-    # Don't forget the last stream
-    if current_stream:
-        work_streams.append(_create_work_stream(current_stream))
-
-    # Update cache
-    _roadmap_cache[roadmap_path] = (mtime, work_streams)
-
-    return work_streams
-
-
-def clear_roadmap_cache() -> None:
-    """Clear the roadmap cache (useful for testing or after edits)."""
-    _roadmap_cache.clear()
+    return {"fields": stream, "last_batch": last_batch, "status_span": status_span}
+
+
+# -----------------------------------------------------------------------------
+# On-disk parse cache
+# -----------------------------------------------------------------------------
+
+
+def _read_disk_cache(roadmap_path: Path) -> dict | None:
+    """Get the cached blocks for a roadmap from the on-disk parse cache."""
+    try:
+        with open(ROADMAP_CACHE_FILE) as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if data.get("version") != _CACHE_VERSION:
+        return None
+    entry = data.get("roadmaps", {}).get(str(roadmap_path))
+    if not isinstance(entry, dict) or "content_hash" not in entry:
+        return None
+    return entry
+
+
+def _write_disk_cache(roadmap_path: Path, parsed: ParsedRoadmap) -> None:
+    """Store a roadmap's parsed blocks, keeping the most recently used roadmaps."""
+    try:
+        with open(ROADMAP_CACHE_FILE) as f:
+            data = json.load(f)
+        if data.get("version") != _CACHE_VERSION:
+            raise ValueError("stale cache version")
+    except (OSError, ValueError):
+        data = {"version": _CACHE_VERSION, "roadmaps": {}}
+
+    roadmaps = data["roadmaps"]
+    roadmaps[str(roadmap_path)] = {
+        "content_hash": parsed.content_hash,
+        "used_at": time.time(),
+        "blocks": parsed._entries,
+    }
+    if len(roadmaps) > MAX_CACHED_ROADMAPS:
+        keep = sorted(roadmaps, key=lambda p: roadmaps[p].get("used_at", 0), reverse=True)
+        data["roadmaps"] = {p: roadmaps[p] for p in keep[:MAX_CACHED_ROADMAPS]}
+
+    try:
+        ROADMAP_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = ROADMAP_CACHE_FILE.with_name(
+            f".{ROADMAP_CACHE_FILE.name}.{os.getpid()}.tmp"
+        )
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, ROADMAP_CACHE_FILE)
+    except OSError:
+        pass  # The cache is an optimization; parsing still succeeded
 
 
 def _create_work_stream(data: dict) -> WorkStream:
@@ -286,19 +524,9 @@ def get_available_work_streams(roadmap_path: Path | None = None) -> list[WorkStr
     - In progress but not assigned
     - Have all dependencies completed
     """
-    all_streams = parse_roadmap(roadmap_path)
+    from src.orchestrator.roadmap_state import get_roadmap_state
 
-    # Build set of completed phase IDs
-    completed_ids = {
-        ws.id for ws in all_streams
-        if ws.status == WorkStreamStatus.COMPLETE
-    }
-
-    # Filter to claimable with met dependencies
-    return [
-        ws for ws in all_streams
-        if ws.is_claimable and not ws.has_unmet_dependencies(completed_ids)
-    ]
+    return get_roadmap_state(roadmap_path).ready()
 
 
 def get_blocked_work_streams(roadmap_path: Path | None = None) -> list[WorkStream]:
@@ -327,21 +555,9 @@ def get_bootstrap_phases(roadmap_path: Path | None = None) -> list[WorkStream]:
     These are force-multiplier phases that improve all subsequent work.
     Only includes phases with all dependencies met.
     """
-    all_streams = parse_roadmap(roadmap_path)
-
-    # Build set of completed phase IDs
-    completed_ids = {
-        ws.id for ws in all_streams
-        if ws.status == WorkStreamStatus.COMPLETE
-    }
+    from src.orchestrator.roadmap_state import get_roadmap_state
 
-    # Filter to claimable bootstrap phases with met dependencies
-    bootstrap = [
-        ws for ws in all_streams
-        if ws.is_bootstrap and ws.is_claimable
-        and not ws.has_unmet_dependencies(completed_ids)
-    ]
-    return sorted(bootstrap, key=lambda ws: (ws.batch, ws.id))
+    return get_roadmap_state(roadmap_path).bootstrap()
 
 
 def get_prioritized_work_streams(roadmap_path: Path | None = None) -> list[WorkStream]:
@@ -355,22 +571,6 @@ def get_prioritized_work_streams(roadmap_path: Path | None = None) -> list[WorkS
     Returns:
         List of claimable work streams, bootstrap phases first
     """
-    all_streams = parse_roadmap(roadmap_path)
-
-    # Build set of completed phase IDs
-    completed_ids = {
-        ws.id for ws in all_streams
-        if ws.status == WorkStreamStatus.COMPLETE
-    }
+    from src.orchestrator.roadmap_state import get_roadmap_state
 
-    # Filter to claimable with met dependencies
-    claimable = [
-        ws for ws in all_streams
-        if ws.is_claimable and not ws.has_unmet_dependencies(completed_ids)
-    ]
-
-    # Sort: bootstrap first (0), then normal (1), then by batch and ID
-    return sorted(
-        claimable,
-        key=lambda ws: (0 if ws.is_bootstrap else 1, ws.batch, ws.id)
-    )
+    return get_roadmap_state(roadmap_path).prioritized()
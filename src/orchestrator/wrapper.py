@@ -9,10 +9,15 @@ language request and routes it appropriately:
 
 from dataclasses import dataclass, field
 from enum import Enum
+from pathlib import Path
 from typing import Any
 
 from src.core.role_registry import RoleRegistry
-from src.core.task_decomposer import DecompositionResult, TaskDecomposer
+from src.core.task_decomposer import (
+    DECOMPOSITION_CACHE_FILE,
+    DecompositionResult,
+    TaskDecomposer,
+)
 from src.core.task_parser import ParsedTask, TaskParser
 
 
@@ -93,16 +98,23 @@ class OrchestratorWrapper:
         ExecutionMode.SINGLE_AGENT
     """
 
-    def __init__(self, dry_run: bool = False):
+    # Decompositions persist here across runs (None keeps them in memory only)
+    DECOMPOSITION_CACHE: Path | None = DECOMPOSITION_CACHE_FILE
+
+    def __init__(self, dry_run: bool = False, decomposition_cache: Path | None = None):
         """
         Initialize the orchestrator wrapper.
 
         Args:
             dry_run: If True, don't actually spawn agents (for testing)
+            decomposition_cache: JSON file that persists decompositions
+                across runs. Defaults to DECOMPOSITION_CACHE.
         """
         self.dry_run = dry_run
         self.task_parser = TaskParser()
-        self.task_decomposer = TaskDecomposer()
+        if decomposition_cache is None:
+            decomposition_cache = self.DECOMPOSITION_CACHE
+        self.task_decomposer = TaskDecomposer(cache_path=decomposition_cache)
         self.role_registry = RoleRegistry.create_standard_registry()
 
     def process_request(self, request: str) -> ExecutionResult:
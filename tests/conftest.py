@@ -0,0 +1,13 @@
+"""Shared fixtures for the test suite."""
+
+import pytest
+
+from src.orchestrator import work_stream
+
+
+@pytest.fixture(autouse=True)
+def roadmap_cache_file(tmp_path, monkeypatch):
+    """Keep the on-disk roadmap parse cache out of the checkout."""
+    cache_file = tmp_path / ".roadmap_cache.json"
+    monkeypatch.setattr(work_stream, "ROADMAP_CACHE_FILE", cache_file)
+    return cache_file
@@ -1,11 +1,13 @@
 """Tests for the InteractionLogger."""
 
+import time
 from datetime import datetime, timedelta
 
 from src.coordination.interaction_logger import (
     InteractionLogger,
     InteractionQuery,
     LoggedInteraction,
+    read_archive,
 )
 from src.coordination.nats_bus import AgentMessage, MessageType
 
@@ -111,13 +113,13 @@ class TestInteractionLogger:
             now,
         ]
 
-        for time in times:
+        for moment in times:
             message = AgentMessage(
                 from_agent="agent-1",
                 to_agent="agent-2",
                 message_type=MessageType.STATUS_UPDATE,
                 content={},
-                timestamp=time.isoformat(),
+                timestamp=moment.isoformat(),
             )
             logger.log_interaction(message)
 
@@ -145,13 +147,13 @@ class TestInteractionLogger:
             ("agent-1", "agent-2", MessageType.STATUS_UPDATE, now),
         ]
 
-        for from_agent, to_agent, msg_type, time in interactions:
+        for from_agent, to_agent, msg_type, moment in interactions:
             message = AgentMessage(
                 from_agent=from_agent,
                 to_agent=to_agent,
                 message_type=msg_type,
                 content={},
-                timestamp=time.isoformat(),
+                timestamp=moment.isoformat(),
             )
             logger.log_interaction(message)
 
@@ -214,13 +216,13 @@ class TestInteractionLogger:
             ("agent-2", "agent-3", now - timedelta(minutes=10)),  # Unrelated
         ]
 
-        for from_agent, to_agent, time in interactions:
+        for from_agent, to_agent, moment in interactions:
             message = AgentMessage(
                 from_agent=from_agent,
                 to_agent=to_agent,
                 message_type=MessageType.STATUS_UPDATE,
                 content={},
-                timestamp=time.isoformat(),
+                timestamp=moment.isoformat(),
             )
             logger.log_interaction(message)
 
@@ -329,3 +331,169 @@ class TestInteractionLogger:
         assert len(results) == 2
         for interaction in results:
             assert interaction.to_agent is None
+
+
+def _message(
+    from_agent: str,
+    to_agent: str | None,
+    timestamp: datetime,
+    message_type: MessageType = MessageType.STATUS_UPDATE,
+    **content,
+) -> AgentMessage:
+    return AgentMessage(
+        from_agent=from_agent,
+        to_agent=to_agent,
+        message_type=message_type,
+        content=content,
+        timestamp=timestamp.isoformat(),
+    )
+
+
+class TestIndexedQueries:
+    """Test index-backed queries against out-of-order input."""
+
+    def test_timeline_sorted_when_logged_out_of_order(self):
+        """Timelines and conversations are chronological regardless of log order."""
+        logger = InteractionLogger()
+        now = datetime.now()
+        for minutes, n in [(5, 0), (1, 1), (3, 2), (1, 3)]:
+            logger.log_interaction(
+                _message("agent-1", "agent-2", now - timedelta(minutes=minutes), n=n)
+            )
+
+        timeline = [i.content["n"] for i in logger.get_agent_timeline("agent-1")]
+        conversation = [i.content["n"] for i in logger.get_conversation("agent-2", "agent-1")]
+
+        # Equal timestamps keep log order
+        assert timeline == [0, 2, 1, 3]
+        assert conversation == timeline
+
+    def test_query_keeps_log_order(self):
+        """Query results come back in the order they were logged."""
+        logger = InteractionLogger()
+        now = datetime.now()
+        for minutes, n in [(1, 0), (3, 1), (2, 2)]:
+            logger.log_interaction(_message("agent-1", None, now - timedelta(minutes=minutes), n=n))
+
+        results = logger.query_interactions(
+            InteractionQuery(start_time=now - timedelta(minutes=10), end_time=now)
+        )
+
+        assert [i.content["n"] for i in results] == [0, 1, 2]
+
+    def test_time_bounds_are_inclusive(self):
+        """Interactions exactly at start_time or end_time match."""
+        logger = InteractionLogger()
+        now = datetime.now()
+        logger.log_interaction(_message("agent-1", "agent-2", now))
+
+        query = InteractionQuery(agent_id="agent-2", start_time=now, end_time=now)
+
+        assert len(logger.query_interactions(query)) == 1
+
+    def test_self_addressed_message_indexed_once(self):
+        """An agent messaging itself appears once in its timeline."""
+        logger = InteractionLogger()
+        logger.log_interaction(_message("agent-1", "agent-1", datetime.now()))
+
+        assert len(logger.get_agent_timeline("agent-1")) == 1
+        assert len(logger.get_conversation("agent-1", "agent-1")) == 1
+
+
+class TestRetention:
+    """Test bounded retention and archive spill."""
+
+    def test_max_rows_keeps_newest(self):
+        """Beyond max_rows, the oldest interactions are dropped from every index."""
+        logger = InteractionLogger(max_rows=3)
+        now = datetime.now()
+        for n in range(5):
+            logger.log_interaction(_message("agent-1", "agent-2", now + timedelta(seconds=n), n=n))
+
+        assert [i.content["n"] for i in logger.get_all_interactions()] == [2, 3, 4]
+        assert [i.content["n"] for i in logger.get_agent_timeline("agent-2")] == [2, 3, 4]
+        assert len(logger.get_conversation("agent-1", "agent-2")) == 3
+
+    def test_max_age_drops_old_interactions(self):
+        """Interactions older than max_age are dropped as new ones arrive."""
+        logger = InteractionLogger(max_age_seconds=60)
+        now = datetime.utcnow()
+        logger.log_interaction(_message("agent-1", "agent-2", now - timedelta(minutes=5)))
+        logger.log_interaction(_message("agent-3", "agent-2", now))
+
+        assert [i.from_agent for i in logger.get_all_interactions()] == ["agent-3"]
+        assert logger.get_agent_timeline("agent-1") == []
+
+    def test_max_age_reads_naive_timestamps_as_utc(self, monkeypatch):
+        """Message timestamps (naive UTC) age correctly outside a UTC timezone."""
+        monkeypatch.setenv("TZ", "Asia/Tokyo")
+        time.tzset()
+        try:
+            logger = InteractionLogger(max_age_seconds=3600)
+            now = datetime.utcnow()
+            logger.log_interaction(_message("agent-1", "agent-2", now - timedelta(hours=2)))
+            logger.log_interaction(_message("agent-3", "agent-2", now))
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+        assert [i.from_agent for i in logger.get_all_interactions()] == ["agent-3"]
+
+    def test_spill_to_jsonl_archive(self, tmp_path):
+        """Evicted interactions are appended to a JSONL archive."""
+        archive = tmp_path / "interactions.jsonl"
+        logger = InteractionLogger(max_rows=2, archive_path=archive)
+        now = datetime.now()
+        for n in range(4):
+            logger.log_interaction(_message("agent-1", None, now + timedelta(seconds=n), n=n))
+
+        archived = list(read_archive(archive))
+
+        assert [i.content["n"] for i in archived] == [0, 1]
+        assert archived[0].message_type == MessageType.STATUS_UPDATE
+        assert logger.archived_count == 2
+
+    def test_spill_to_sqlite_archive(self, tmp_path):
+        """A .db archive path spills to SQLite."""
+        archive = tmp_path / "interactions.db"
+        logger = InteractionLogger(max_rows=1, archive_path=archive)
+        now = datetime.now()
+        for n in range(3):
+            logger.log_interaction(
+                _message(
+                    "agent-1", "agent-2", now + timedelta(seconds=n), MessageType.QUESTION, n=n
+                )
+            )
+
+        archived = list(read_archive(archive))
+
+        assert [(i.to_agent, i.content["n"]) for i in archived] == [("agent-2", 0), ("agent-2", 1)]
+        assert logger.get_all_interactions()[0].content == {"n": 2}
+
+
+class TestLargeLog:
+    """Test indexed queries over a large log."""
+
+    def test_indexed_query_matches_scan(self):
+        """Agent time-range queries return what a full scan would."""
+        logger = InteractionLogger()
+        start = datetime(2026, 1, 1)
+        for n in range(20000):
+            logger.log_interaction(
+                _message(f"agent-{n % 50}", f"agent-{(n + 1) % 50}", start + timedelta(seconds=n))
+            )
+        query = InteractionQuery(
+            agent_id="agent-7",
+            start_time=start + timedelta(seconds=5000),
+            end_time=start + timedelta(seconds=6000),
+        )
+
+        scanned = [
+            i
+            for i in logger.get_all_interactions()
+            if query.agent_id in (i.from_agent, i.to_agent)
+            and query.start_time <= datetime.fromisoformat(i.timestamp) <= query.end_time
+        ]
+
+        assert logger.query_interactions(query) == scanned
+        assert len(scanned) == 40
@@ -0,0 +1,318 @@
+"""Tests for the NATS message bus wire format and batching."""
+
+import asyncio
+import itertools
+from types import SimpleNamespace
+
+import pytest
+
+from src.coordination.nats_bus import (
+    BATCH_HEADER,
+    CODEC_HEADER,
+    AgentMessage,
+    MessageCodec,
+    MessageType,
+    NATSMessageBus,
+    decode_message,
+    decode_payload,
+    encode_message,
+    msgpack,
+    pack_batch,
+)
+
+
+def _subject_matches(pattern: str, subject: str) -> bool:
+    """NATS subject matching with * and > wildcards."""
+    pattern_tokens = pattern.split(".")
+    subject_tokens = subject.split(".")
+    for i, token in enumerate(pattern_tokens):
+        if token == ">":
+            return len(subject_tokens) > i
+        if i >= len(subject_tokens) or (token != "*" and token != subject_tokens[i]):
+            return False
+    return len(pattern_tokens) == len(subject_tokens)
+
+
+class FakeNATSClient:
+    """In-process stand-in for nats.aio.client.Client."""
+
+    def __init__(self, headers: bool = True):
+        self._server_info = {"headers": headers}
+        self.is_connected = True
+        self.published: list[tuple[str, bytes, dict | None]] = []
+        self._subs: list[tuple[str, object]] = []
+        self._ids = itertools.count(1)
+        self._replies: dict[str, asyncio.Future] = {}
+
+    async def publish(self, subject, payload=b"", reply="", headers=None):
+        if headers and not self._server_info["headers"]:
+            raise RuntimeError("Server does not support headers")
+        self.published.append((subject, payload, headers))
+        if subject in self._replies:
+            self._replies.pop(subject).set_result(
+                SimpleNamespace(data=payload, headers=headers)
+            )
+            return
+        msg = SimpleNamespace(subject=subject, data=payload, headers=headers, reply=reply)
+        for pattern, cb in self._subs:
+            if _subject_matches(pattern, subject):
+                await cb(msg)
+
+    async def subscribe(self, subject, queue=None, cb=None):
+        self._subs.append((subject, cb))
+        return SimpleNamespace(_id=next(self._ids))
+
+    async def request(self, subject, payload=b"", timeout=0.5, headers=None):
+        inbox = f"_INBOX.{next(self._ids)}"
+        future = asyncio.get_running_loop().create_future()
+        self._replies[inbox] = future
+        await self.publish(subject, payload, reply=inbox, headers=headers)
+        return await asyncio.wait_for(future, timeout)
+
+    async def drain(self):
+        pass
+
+    async def close(self):
+        self.is_connected = False
+
+
+def _attach(bus: NATSMessageBus, client: FakeNATSClient) -> FakeNATSClient:
+    """Connect a bus to a fake client, as connect() would."""
+    bus.nc = client
+    bus._negotiate()
+    return client
+
+
+def _message(**overrides) -> AgentMessage:
+    fields = {
+        "from_agent": "agent-1",
+        "to_agent": None,
+        "message_type": MessageType.STATUS_UPDATE,
+        "content": {"progress": 0.5, "note": "héllo", "files": ["a.py", "b.py"]},
+        "timestamp": "2026-01-01T00:00:00",
+        "correlation_id": None,
+    }
+    fields.update(overrides)
+    return AgentMessage(**fields)
+
+
+class TestCodecs:
+    """Test message encodings."""
+
+    @pytest.mark.parametrize("codec", [MessageCodec.JSON, MessageCodec.BINARY])
+    def test_round_trip(self, codec):
+        """Messages survive encoding, including None and unicode fields."""
+        message = _message(to_agent="agent-2", correlation_id="req-1")
+
+        assert decode_message(encode_message(message, codec), codec) == message
+        assert decode_message(encode_message(_message(), codec), codec) == _message()
+
+    @pytest.mark.skipif(msgpack is None, reason="msgpack not installed")
+    def test_msgpack_round_trip(self):
+        """The optional msgpack codec round-trips messages."""
+        message = _message()
+        data = encode_message(message, MessageCodec.MSGPACK)
+
+        assert decode_message(data, MessageCodec.MSGPACK) == message
+
+    def test_binary_is_smaller_than_json(self):
+        """The binary layout drops field names and the type string."""
+        message = _message()
+
+        binary = encode_message(message, MessageCodec.BINARY)
+        assert len(binary) < len(encode_message(message, MessageCodec.JSON))
+
+    def test_binary_rejects_truncated_payload(self):
+        """Corrupt binary payloads raise instead of decoding garbage."""
+        data = encode_message(_message(), MessageCodec.BINARY)
+
+        with pytest.raises(ValueError):
+            decode_message(data[:-5], MessageCodec.BINARY)
+
+    def test_headerless_payload_is_json(self):
+        """Payloads from publishers without codec headers decode as JSON."""
+        message = _message()
+
+        assert decode_payload(message.to_json().encode()) == [message]
+
+    def test_batch_payload_unpacks_in_order(self):
+        """Batched payloads decode to every message in publish order."""
+        messages = [_message(content={"i": i}) for i in range(3)]
+        data = pack_batch([encode_message(m, MessageCodec.BINARY) for m in messages])
+
+        headers = {CODEC_HEADER: "binary", BATCH_HEADER: "3"}
+        assert decode_payload(data, headers) == messages
+
+
+class TestNegotiation:
+    """Test codec negotiation with the server."""
+
+    def test_uses_requested_codec_with_headers(self):
+        """Servers with header support get the requested codec."""
+        bus = NATSMessageBus(codec=MessageCodec.BINARY, batching=True)
+        _attach(bus, FakeNATSClient(headers=True))
+
+        assert bus.codec == MessageCodec.BINARY
+        assert bus._batcher is not None
+
+    def test_falls_back_to_json_without_headers(self):
+        """Servers without header support get plain JSON, unbatched."""
+        bus = NATSMessageBus(codec=MessageCodec.BINARY, batching=True)
+        client = _attach(bus, FakeNATSClient(headers=False))
+
+        asyncio.run(bus.publish("orchestrator.broadcast.status_update", _message()))
+
+        assert bus.codec == MessageCodec.JSON
+        assert bus._batcher is None
+        assert client.published[0][2] is None
+
+    @pytest.mark.skipif(msgpack is not None, reason="msgpack installed")
+    def test_msgpack_requires_package(self):
+        """Requesting msgpack without the package fails early."""
+        with pytest.raises(ValueError):
+            NATSMessageBus(codec=MessageCodec.MSGPACK)
+
+
+class TestBatching:
+    """Test publisher-side batching."""
+
+    SUBJECT = "orchestrator.broadcast.status_update"
+
+    def test_status_updates_coalesced(self):
+        """Status updates within the window go out as one NATS message."""
+        async def scenario():
+            bus = NATSMessageBus(codec=MessageCodec.BINARY, batching=True, flush_interval=10)
+            client = _attach(bus, FakeNATSClient())
+            received = []
+
+            async def on_message(msg):
+                received.append(msg)
+
+            await bus.subscribe("orchestrator.broadcast.>", on_message)
+            for i in range(10):
+                await bus.publish(self.SUBJECT, _message(content={"i": i}))
+            assert client.published == []
+
+            await bus.flush()
+            return client, received
+
+        client, received = asyncio.run(scenario())
+
+        assert len(client.published) == 1
+        assert client.published[0][2] == {CODEC_HEADER: "binary", BATCH_HEADER: "10"}
+        assert [m.content["i"] for m in received] == list(range(10))
+
+    def test_unbatched_message_flushes_pending_first(self):
+        """A completion is never delivered ahead of earlier status updates."""
+        async def scenario():
+            bus = NATSMessageBus(batching=True, flush_interval=10)
+            _attach(bus, FakeNATSClient())
+            received = []
+
+            async def on_message(msg):
+                received.append(msg.message_type)
+
+            await bus.subscribe("orchestrator.>", on_message)
+            await bus.publish(self.SUBJECT, _message())
+            await bus.publish(
+                "orchestrator.broadcast.task_complete",
+                _message(message_type=MessageType.TASK_COMPLETE),
+            )
+            return received
+
+        assert asyncio.run(scenario()) == [MessageType.STATUS_UPDATE, MessageType.TASK_COMPLETE]
+
+    def test_flush_window_elapses(self):
+        """Buffered messages are sent once the flush window passes."""
+        async def scenario():
+            bus = NATSMessageBus(batching=True, flush_interval=0.01)
+            client = _attach(bus, FakeNATSClient())
+            await bus.publish(self.SUBJECT, _message())
+            await bus.publish(self.SUBJECT, _message())
+            await asyncio.sleep(0.05)
+            return client
+
+        client = asyncio.run(scenario())
+
+        assert len(client.published) == 1
+        assert client.published[0][2] == {BATCH_HEADER: "2"}
+
+    def test_full_buffer_sends_immediately(self):
+        """Reaching max_batch sends without waiting for the window."""
+        async def scenario():
+            bus = NATSMessageBus(batching=True, flush_interval=10, max_batch=3)
+            client = _attach(bus, FakeNATSClient())
+            for _ in range(7):
+                await bus.publish(self.SUBJECT, _message())
+            sent = len(client.published)
+            await bus.disconnect()
+            return sent, client
+
+        sent, client = asyncio.run(scenario())
+
+        assert sent == 2
+        assert len(client.published) == 3  # Remainder flushed on disconnect
+
+    def test_request_reply_uses_requester_codec(self):
+        """Replies are encoded in the codec the request arrived in."""
+        async def scenario():
+            client = FakeNATSClient()
+            responder = NATSMessageBus(codec=MessageCodec.JSON)
+            requester = NATSMessageBus(codec=MessageCodec.BINARY, batching=True)
+            _attach(responder, client)
+            _attach(requester, client)
+
+            async def answer(msg):
+                return _message(
+                    from_agent="agent-2",
+                    message_type=MessageType.PONG,
+                    content={"echo": msg.content["n"]},
+                )
+
+            await responder.subscribe("orchestrator.agent.agent-2.>", answer)
+            reply = await requester.request(
+                "agent-1", "agent-2", MessageType.PING, {"n": 7}, timeout=1.0
+            )
+            return client, reply
+
+        client, reply = asyncio.run(scenario())
+
+        assert reply.content == {"echo": 7}
+        assert client.published[-1][2] == {CODEC_HEADER: "binary"}
+
+
+class TestThroughput:
+    """Test the wire format against the original JSON path at volume."""
+
+    def test_status_broadcasts_batched(self):
+        """Binary batching cuts publishes and bytes for status broadcasts."""
+        messages = [
+            _message(from_agent=f"agent-{a}", content={"progress": i / 100, "step": i})
+            for i in range(100)
+            for a in range(50)
+        ]
+
+        async def run(bus: NATSMessageBus) -> FakeNATSClient:
+            client = _attach(bus, FakeNATSClient())
+            received = 0
+
+            async def on_message(msg):
+                nonlocal received
+                received += 1
+
+            await bus.subscribe("orchestrator.broadcast.>", on_message)
+            for message in messages:
+                await bus.publish("orchestrator.broadcast.status_update", message)
+            await bus.flush()
+            assert received == len(messages)
+            return client
+
+        json_client = asyncio.run(run(NATSMessageBus()))
+        batch_client = asyncio.run(
+            run(NATSMessageBus(codec=MessageCodec.BINARY, batching=True, flush_interval=10))
+        )
+
+        json_bytes = sum(len(p) for _, p, _ in json_client.published)
+        batch_bytes = sum(len(p) for _, p, _ in batch_client.published)
+        assert len(batch_client.published) <= len(messages) // 50
+        assert batch_bytes < json_bytes
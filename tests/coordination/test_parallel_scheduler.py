@@ -5,6 +5,9 @@ and idle time optimization components.
 """
 
 import asyncio
+import heapq
+import itertools
+import random
 from datetime import UTC, datetime
 
 import pytest
@@ -14,8 +17,11 @@ from src.coordination.parallel_scheduler import (
     IdleTimeOptimizer,
     ParallelTaskDispatcher,
     SchedulerMetrics,
+    SchedulingStrategy,
     SynchronizationManager,
     TaskExecutionState,
+    compute_upward_ranks,
+    get_task_weight,
 )
 from src.models.agent import Agent, AgentCapability, AgentStatus
 from src.models.enums import TaskStatus
@@ -194,6 +200,25 @@ class TestDependencyResolver:
             resolver = DependencyResolver(tasks)
             resolver.validate_dependencies()
 
+    def test_validate_long_chain(self):
+        """Test validating a chain deeper than the recursion limit."""
+        tasks = [Subtask(id="t0", description="Task 0", dependencies=[])]
+        tasks.extend(
+            Subtask(id=f"t{i}", description=f"Task {i}", dependencies=[f"t{i - 1}"])
+            for i in range(1, 5000)
+        )
+
+        DependencyResolver(tasks).validate_dependencies()
+
+    def test_tracker_follows_completions(self, dependent_tasks):
+        """Test the readiness tracker releases tasks as dependencies complete."""
+        tracker = DependencyResolver(dependent_tasks).create_tracker()
+
+        assert tracker.pop_ready() == "task-1"
+        assert tracker.mark_completed("task-1") == ["task-2", "task-4"]
+        assert tracker.pop_ready() == "task-2"
+        assert tracker.mark_completed("task-2") == ["task-3"]
+
     def test_all_tasks_complete(self, dependent_tasks):
         """Test when all tasks are complete."""
         resolver = DependencyResolver(dependent_tasks)
@@ -352,6 +377,177 @@ class TestParallelTaskDispatcher:
         assert failed[0].task_id == "task-2"
 
 
+def _weighted(task_id: str, deps: list[str], complexity: str) -> Subtask:
+    """Create a task with an estimated complexity."""
+    return Subtask(
+        id=task_id,
+        description=f"Task {task_id}",
+        dependencies=deps,
+        metadata={"estimated_complexity": complexity},
+    )
+
+
+def _synthetic_dag(seed: int, size: int = 60) -> list[Subtask]:
+    """Create a random layered DAG with mixed complexities."""
+    rng = random.Random(seed)
+    tasks: list[Subtask] = []
+    for i in range(size):
+        candidates = [t.id for t in tasks[max(0, i - 15):i]]
+        deps = rng.sample(candidates, k=min(len(candidates), rng.randint(0, 2)))
+        tasks.append(_weighted(f"t{i}", deps, rng.choice(["small", "medium", "large"])))
+    # Present tasks in an arbitrary (but still dependency-valid) order
+    rng.shuffle(tasks)
+    return tasks
+
+
+async def _simulate_makespan(
+    agents: list[Agent],
+    tasks: list[Subtask],
+    strategy: SchedulingStrategy,
+) -> tuple[int, ParallelTaskDispatcher]:
+    """Run the dispatcher against a virtual clock; each task takes its weight.
+
+    Returns:
+        (makespan in weight units, dispatcher)
+    """
+    dispatcher = ParallelTaskDispatcher(
+        agents=agents,
+        tasks=tasks,
+        max_concurrent=len(agents),
+        strategy=strategy,
+    )
+    loop = asyncio.get_running_loop()
+    clock = 0
+    timers: list[tuple[int, int, asyncio.Future]] = []
+    counter = itertools.count()
+
+    async def execute(task: Subtask, agent: Agent) -> TaskExecutionState:
+        done = loop.create_future()
+        heapq.heappush(timers, (clock + get_task_weight(task), next(counter), done))
+        await done
+        return TaskExecutionState(
+            task_id=task.id,
+            agent_id=agent.id,
+            status=TaskStatus.COMPLETED,
+            started_at=datetime.now(UTC),
+        )
+
+    run = asyncio.create_task(dispatcher.dispatch_all(execute))
+    while not run.done():
+        # Let the dispatcher react until it is blocked on running tasks
+        for _ in range(20):
+            await asyncio.sleep(0)
+        if not timers:
+            continue
+        clock = timers[0][0]
+        while timers and timers[0][0] == clock:
+            heapq.heappop(timers)[2].set_result(None)
+
+    results = await run
+    assert len(results) == len(tasks)
+    return clock, dispatcher
+
+
+class TestCriticalPathScheduling:
+    """Test critical-path list scheduling."""
+
+    def test_upward_ranks(self):
+        """Test rank is own weight plus the longest dependent chain."""
+        tasks = [
+            _weighted("a", [], "small"),
+            _weighted("b", ["a"], "large"),
+            _weighted("c", ["a"], "medium"),
+            _weighted("d", ["b", "c"], "small"),
+            _weighted("e", [], "medium"),
+        ]
+
+        ranks = compute_upward_ranks(tasks)
+
+        assert ranks == {"d": 1, "b": 4, "c": 3, "a": 5, "e": 2}
+
+    def test_task_weight_defaults_to_medium(self):
+        """Test tasks without a complexity estimate weigh as medium."""
+        assert get_task_weight(Subtask(id="t", description="x")) == 2
+        assert get_task_weight(_weighted("t", [], "bogus")) == 2
+        assert get_task_weight(_weighted("t", [], "large")) == 3
+
+    @pytest.mark.asyncio
+    async def test_dispatch_spreads_across_idle_agents(self, sample_agents, dependent_tasks):
+        """Test each agent runs one task at a time and work is spread."""
+        dispatcher = ParallelTaskDispatcher(
+            agents=sample_agents,
+            tasks=dependent_tasks,
+            max_concurrent=5,
+            strategy=SchedulingStrategy.CRITICAL_PATH,
+        )
+        active: set[str] = set()
+        overlaps = []
+        started = []
+
+        async def mock_execute(task: Subtask, agent: Agent):
+            if agent.id in active:
+                overlaps.append(agent.id)
+            active.add(agent.id)
+            started.append(task.id)
+            await asyncio.sleep(0.01)
+            active.discard(agent.id)
+            return TaskExecutionState(
+                task_id=task.id,
+                agent_id=agent.id,
+                status=TaskStatus.COMPLETED,
+                started_at=datetime.now(UTC),
+            )
+
+        results = await dispatcher.dispatch_all(execute_fn=mock_execute)
+
+        assert len(results) == 4
+        assert overlaps == []
+        assert len({r.agent_id for r in results}) >= 2
+        # task-2 heads the longer chain, so it is dispatched before task-4
+        assert started.index("task-2") < started.index("task-4")
+
+    @pytest.mark.asyncio
+    async def test_long_chain_starts_first(self, sample_agents):
+        """Test a chain listed last is not starved by independent work."""
+        tasks = [_weighted(f"wide-{i}", [], "large") for i in range(12)]
+        chain = [_weighted("chain-0", [], "medium")]
+        for i in range(1, 6):
+            chain.append(_weighted(f"chain-{i}", [f"chain-{i - 1}"], "medium"))
+
+        fifo, _ = await _simulate_makespan(sample_agents, tasks + chain, SchedulingStrategy.FIFO)
+        ranked, _ = await _simulate_makespan(
+            sample_agents, tasks + chain, SchedulingStrategy.CRITICAL_PATH
+        )
+
+        # FIFO runs the 12 wide tasks first (4 rounds x 3) and then the chain (6 x 2)
+        assert fifo == 24
+        # Starting the chain at once overlaps it with the wide tasks
+        assert ranked == 17
+
+    @pytest.mark.asyncio
+    async def test_makespan_beats_fifo_on_synthetic_dags(self, sample_agents):
+        """Critical-path scheduling shortens the simulated makespan over FIFO."""
+        fifo_total = 0
+        ranked_total = 0
+        for seed in range(20):
+            tasks = _synthetic_dag(seed)
+            fifo, _ = await _simulate_makespan(sample_agents, tasks, SchedulingStrategy.FIFO)
+            ranked, dispatcher = await _simulate_makespan(
+                sample_agents, tasks, SchedulingStrategy.CRITICAL_PATH
+            )
+            total_work = sum(get_task_weight(t) for t in tasks)
+            lower_bound = max(
+                max(compute_upward_ranks(tasks).values()),
+                -(-total_work // len(sample_agents)),
+            )
+            assert ranked >= lower_bound
+            assert sum(dispatcher.agent_load.values()) == total_work
+            fifo_total += fifo
+            ranked_total += ranked
+
+        assert ranked_total < fifo_total
+
+
 class TestSynchronizationManager:
     """Test task handoff synchronization."""
 
@@ -0,0 +1,325 @@
+"""Tests for the in-process loopback transport."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.coordination.nats_bus import MessageCodec, MessageType, NATSMessageBus
+from src.coordination.transport import (
+    LoopbackTransport,
+    MessageTransport,
+    get_loopback_transport,
+    subject_matches,
+)
+
+
+class TestSubjectMatching:
+    """Test NATS subject wildcard semantics."""
+
+    @pytest.mark.parametrize(
+        ("pattern", "subject", "expected"),
+        [
+            ("a.b.c", "a.b.c", True),
+            ("a.b.c", "a.b", False),
+            ("a.*.c", "a.x.c", True),
+            ("a.*", "a.x.c", False),
+            ("a.>", "a.x.c", True),
+            ("a.>", "a", False),
+            ("*.b.>", "a.b.c.d", True),
+            ("a.b", "a.b.c", False),
+        ],
+    )
+    def test_wildcards(self, pattern, subject, expected):
+        """* matches one token; > matches one or more trailing tokens."""
+        assert subject_matches(pattern, subject) is expected
+
+
+class TestLoopbackTransport:
+    """Test delivery, queue groups and request/reply."""
+
+    def test_is_message_transport(self):
+        """The loopback transport implements the transport interface."""
+        assert isinstance(LoopbackTransport(), MessageTransport)
+
+    def test_fan_out_to_matching_subscribers(self):
+        """Every matching subscription receives the message, in order."""
+        async def scenario():
+            transport = LoopbackTransport()
+            received: dict[str, list[bytes]] = {"all": [], "status": [], "other": []}
+
+            def collect(name):
+                async def cb(msg):
+                    received[name].append(msg.data)
+                return cb
+
+            await transport.subscribe("orchestrator.>", cb=collect("all"))
+            await transport.subscribe("orchestrator.*.status", cb=collect("status"))
+            await transport.subscribe("other.>", cb=collect("other"))
+            for i in range(3):
+                await transport.publish("orchestrator.broadcast.status", str(i).encode())
+            await transport.drain()
+            return received
+
+        received = asyncio.run(scenario())
+
+        assert received == {"all": [b"0", b"1", b"2"], "status": [b"0", b"1", b"2"], "other": []}
+
+    def test_queue_group_delivers_once(self):
+        """Queue group members share messages round-robin."""
+        async def scenario():
+            transport = LoopbackTransport()
+            counts = [0, 0, 0]
+            plain = []
+
+            def worker(i):
+                async def cb(msg):
+                    counts[i] += 1
+                return cb
+
+            for i in range(3):
+                await transport.subscribe("orchestrator.queue.build", queue="build", cb=worker(i))
+
+            async def listener(msg):
+                plain.append(msg)
+
+            await transport.subscribe("orchestrator.queue.build", cb=listener)
+            for _ in range(9):
+                await transport.publish("orchestrator.queue.build", b"job")
+            await transport.drain()
+            return counts, len(plain)
+
+        counts, plain = asyncio.run(scenario())
+
+        assert counts == [3, 3, 3]
+        assert plain == 9
+
+    def test_request_reply(self):
+        """Requests get the responder's reply."""
+        async def scenario():
+            transport = LoopbackTransport()
+
+            async def responder(msg):
+                await transport.publish(msg.reply, msg.data.upper())
+
+            await transport.subscribe("svc.echo", cb=responder)
+            return await transport.request("svc.echo", b"ping", timeout=1.0)
+
+        assert asyncio.run(scenario()).data == b"PING"
+
+    def test_requests_round_robin_queue_group(self):
+        """Requests to a queue group alternate between its members."""
+        async def scenario():
+            transport = LoopbackTransport()
+
+            def responder(name):
+                async def cb(msg):
+                    await transport.publish(msg.reply, name)
+                return cb
+
+            for name in (b"a", b"b"):
+                await transport.subscribe("svc.work", queue="workers", cb=responder(name))
+            return [(await transport.request("svc.work", timeout=1.0)).data for _ in range(4)]
+
+        assert asyncio.run(scenario()) == [b"a", b"b", b"a", b"b"]
+
+    def test_match_cache_bounded(self):
+        """Publishing to many distinct subjects keeps the match cache bounded."""
+        async def scenario():
+            transport = LoopbackTransport()
+            transport.MATCH_CACHE_SIZE = 10
+            received = []
+
+            async def cb(msg):
+                received.append(msg.subject)
+
+            await transport.subscribe("agent.>", cb=cb)
+            for i in range(50):
+                await transport.publish(f"agent.{i}", b"")
+            await transport.drain()
+            return transport, received
+
+        transport, received = asyncio.run(scenario())
+
+        assert len(received) == 50
+        assert len(transport._match_cache) == 10
+
+    def test_request_without_responders_fails_fast(self):
+        """With nobody subscribed, requests fail instead of waiting."""
+        async def scenario():
+            start = time.perf_counter()
+            with pytest.raises(TimeoutError):
+                await LoopbackTransport().request("svc.none", b"", timeout=5.0)
+            return time.perf_counter() - start
+
+        assert asyncio.run(scenario()) < 1.0
+
+    def test_unsubscribe_stops_delivery(self):
+        """Unsubscribed callbacks receive nothing further."""
+        async def scenario():
+            transport = LoopbackTransport()
+            received = []
+
+            async def cb(msg):
+                received.append(msg.data)
+
+            sub = await transport.subscribe("a.b", cb=cb)
+            await transport.publish("a.b", b"1")
+            await transport.drain()
+            await sub.unsubscribe()
+            await transport.publish("a.b", b"2")
+            return received, transport.subscription_count
+
+        assert asyncio.run(scenario()) == ([b"1"], 0)
+
+    def test_delivery_across_event_loops(self):
+        """Publishers on another thread's loop reach the subscriber's loop."""
+        transport = LoopbackTransport()
+        loop = asyncio.new_event_loop()
+        received = []
+        done = asyncio.Event()
+
+        async def cb(msg):
+            received.append(msg.data)
+            if len(received) == 5:
+                done.set()
+
+        async def publish_all():
+            for i in range(5):
+                await transport.publish("x.y", str(i).encode())
+
+        try:
+            loop.run_until_complete(transport.subscribe("x.y", cb=cb))
+            thread = threading.Thread(target=lambda: asyncio.run(publish_all()))
+            thread.start()
+            thread.join()
+            loop.run_until_complete(asyncio.wait_for(done.wait(), 1.0))
+        finally:
+            loop.run_until_complete(transport.close())
+            loop.close()
+
+        assert received == [b"0", b"1", b"2", b"3", b"4"]
+
+    def test_closed_loop_subscriptions_dropped(self):
+        """Subscriptions whose event loop has closed are removed on publish."""
+        transport = LoopbackTransport()
+
+        async def subscribe():
+            async def cb(msg):
+                pass
+            await transport.subscribe("a.b", cb=cb)
+
+        asyncio.run(subscribe())
+        asyncio.run(transport.publish("a.b", b"x"))
+
+        assert transport.subscription_count == 0
+
+    def test_shared_transport_recreated_after_close(self):
+        """The process-wide transport is replaced once closed."""
+        first = get_loopback_transport()
+        assert get_loopback_transport() is first
+
+        asyncio.run(first.close())
+
+        assert get_loopback_transport() is not first
+
+
+class TestBusOverLoopback:
+    """Test NATSMessageBus running without a broker."""
+
+    def test_loopback_url_shares_transport(self):
+        """Buses connected to loopback:// talk to each other."""
+        async def scenario():
+            listener = NATSMessageBus("loopback://")
+            sender = NATSMessageBus("loopback://", codec=MessageCodec.BINARY)
+            await listener.connect()
+            await sender.connect()
+            received = []
+
+            async def on_message(msg):
+                received.append(msg)
+
+            await listener.subscribe("orchestrator.broadcast.>", on_message)
+            await sender.broadcast("agent-1", MessageType.STATUS_UPDATE, {"progress": 0.5})
+            await sender.nc.drain()
+            await listener.disconnect()
+            await sender.disconnect()
+            return received, sender.codec
+
+        received, codec = asyncio.run(scenario())
+
+        assert [m.content for m in received] == [{"progress": 0.5}]
+        assert codec == MessageCodec.BINARY
+
+    def test_disconnect_keeps_shared_transport_open(self):
+        """One bus disconnecting does not cut off the others."""
+        async def scenario():
+            transport = LoopbackTransport()
+            first = NATSMessageBus(transport=transport)
+            second = NATSMessageBus(transport=transport)
+            await first.connect()
+            await second.connect()
+
+            async def on_message(msg):
+                pass
+
+            await first.subscribe("orchestrator.>", on_message)
+            await second.subscribe("orchestrator.>", on_message)
+            await first.disconnect()
+            return transport, await second.get_stats()
+
+        transport, stats = asyncio.run(scenario())
+
+        assert transport.is_connected
+        assert transport.subscription_count == 1
+        assert stats["connected"] is True
+
+    def test_request_reply_between_agents(self):
+        """Agents answer direct requests over loopback."""
+        async def scenario():
+            transport = LoopbackTransport()
+            agent = NATSMessageBus(transport=transport)
+            orchestrator = NATSMessageBus(transport=transport)
+            await agent.connect()
+            await orchestrator.connect()
+
+            async def on_ping(msg):
+                return msg.__class__(
+                    from_agent="agent-2",
+                    to_agent=msg.from_agent,
+                    message_type=MessageType.PONG,
+                    content={"echo": msg.content["n"]},
+                    timestamp=msg.timestamp,
+                )
+
+            await agent.subscribe_to_agent_messages("agent-2", on_ping)
+            return await orchestrator.request(
+                "orchestrator", "agent-2", MessageType.PING, {"n": 3}, timeout=1.0
+            )
+
+        reply = asyncio.run(scenario())
+
+        assert reply.message_type == MessageType.PONG
+        assert reply.content == {"echo": 3}
+
+    def test_many_deliveries_in_order(self):
+        """Loopback delivery through the bus keeps every message, in order."""
+        count = 2000
+
+        async def scenario():
+            transport = LoopbackTransport()
+            bus = NATSMessageBus(transport=transport, codec=MessageCodec.BINARY)
+            await bus.connect()
+            received = []
+
+            async def on_message(msg):
+                received.append(msg.content["i"])
+
+            await bus.subscribe("orchestrator.broadcast.>", on_message)
+            for i in range(count):
+                await bus.broadcast("agent-1", MessageType.STATUS_UPDATE, {"i": i})
+            await transport.drain()
+            return received
+
+        assert asyncio.run(scenario()) == list(range(count))
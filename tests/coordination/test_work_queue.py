@@ -0,0 +1,266 @@
+"""Tests for the durable work queue."""
+
+import asyncio
+import time
+
+from src.coordination.nats_bus import MessageType, NATSMessageBus
+from src.coordination.transport import LoopbackTransport
+from src.coordination.work_queue import DurableWorkQueue
+
+
+class TestDurableWorkQueue:
+    """Test persistence, leasing and redelivery."""
+
+    def test_items_survive_reopen(self, tmp_path):
+        """Unacked items are still there after the store is reopened."""
+        store = DurableWorkQueue(tmp_path / "queue.db")
+        store.publish("builds", b"one")
+        store.publish("builds", b"two")
+        store.close()
+
+        reopened = DurableWorkQueue(tmp_path / "queue.db")
+
+        assert [i.payload for i in reopened.fetch("builds", "w1", batch=5)] == [b"one", b"two"]
+
+    def test_fetch_leases_each_item_once(self, tmp_path):
+        """Consumers never receive the same live lease."""
+        store = DurableWorkQueue(tmp_path / "queue.db")
+        store.publish_many("builds", [str(i).encode() for i in range(5)])
+
+        first = store.fetch("builds", "w1", batch=3)
+        second = store.fetch("builds", "w2", batch=3)
+
+        assert [i.payload for i in first] == [b"0", b"1", b"2"]
+        assert [i.payload for i in second] == [b"3", b"4"]
+        assert store.fetch("builds", "w3", batch=3) == []
+        assert store.in_flight("builds") == 5
+
+    def test_max_in_flight_per_consumer(self, tmp_path):
+        """A consumer cannot hold more than max_in_flight unacked items."""
+        store = DurableWorkQueue(tmp_path / "queue.db")
+        store.publish_many("builds", [b"x"] * 5)
+
+        held = store.fetch("builds", "w1", batch=10, max_in_flight=2)
+        assert len(held) == 2
+        assert store.fetch("builds", "w1", batch=10, max_in_flight=2) == []
+
+        store.ack(held[0])
+        assert len(store.fetch("builds", "w1", batch=10, max_in_flight=2)) == 1
+
+    def test_ack_removes_item(self, tmp_path):
+        """Acked items are gone for good."""
+        store = DurableWorkQueue(tmp_path / "queue.db")
+        store.publish("builds", b"x")
+        [item] = store.fetch("builds", "w1")
+
+        assert store.ack(item) is True
+        assert store.pending("builds") == 0
+
+    def test_nak_redelivers_after_backoff(self, tmp_path):
+        """A nak'd item comes back once its backoff passes."""
+        store = DurableWorkQueue(tmp_path / "queue.db", backoff=(0.05,))
+        store.publish("builds", b"x")
+        [item] = store.fetch("builds", "w1")
+
+        store.nak(item)
+        assert store.fetch("builds", "w2") == []
+        time.sleep(0.1)
+        [redelivered] = store.fetch("builds", "w2")
+
+        assert redelivered.deliveries == 2
+
+    def test_expired_lease_redelivered(self, tmp_path):
+        """Items held by a crashed consumer are redelivered after ack_wait."""
+        store = DurableWorkQueue(tmp_path / "queue.db", ack_wait=0.05)
+        store.publish("builds", b"x")
+        [lost] = store.fetch("builds", "crashed")
+
+        time.sleep(0.1)
+        [item] = store.fetch("builds", "w2")
+
+        assert item.seq == lost.seq
+        assert store.ack(lost) is False  # Late ack from the old lease is ignored
+        assert store.ack(item) is True
+
+    def test_in_progress_extends_lease(self, tmp_path):
+        """Long-running consumers can keep their lease."""
+        store = DurableWorkQueue(tmp_path / "queue.db", ack_wait=0.1)
+        store.publish("builds", b"x")
+        [item] = store.fetch("builds", "w1")
+
+        time.sleep(0.06)
+        assert store.in_progress(item) is True
+        time.sleep(0.06)
+
+        assert store.fetch("builds", "w2") == []
+
+    def test_dead_letter_after_max_deliver(self, tmp_path):
+        """Items failing max_deliver times stop being redelivered."""
+        store = DurableWorkQueue(tmp_path / "queue.db", max_deliver=2)
+        store.publish("builds", b"poison")
+        store.publish("builds", b"fine")
+
+        for _ in range(2):
+            [item] = store.fetch("builds", "w1", max_in_flight=1)
+            store.nak(item, delay=0)
+
+        [fine] = store.fetch("builds", "w1")
+        assert fine.payload == b"fine"
+        assert [i.payload for i in store.dead_letters("builds")] == [b"poison"]
+        assert store.pending("builds") == 1
+
+
+class TestDurableBusQueue:
+    """Test durable queues through NATSMessageBus."""
+
+    def test_work_published_before_workers_is_processed(self, tmp_path):
+        """Items published with no worker subscribed are not lost."""
+        async def scenario():
+            bus = NATSMessageBus(
+                transport=LoopbackTransport(),
+                work_queue=DurableWorkQueue(tmp_path / "queue.db"),
+            )
+            await bus.connect()
+            for i in range(5):
+                await bus.publish_to_queue(
+                    "builds", "orchestrator", MessageType.TASK_ASSIGNED, {"i": i}, durable=True
+                )
+
+            done = asyncio.Event()
+            processed = []
+
+            async def worker(msg):
+                processed.append(msg.content["i"])
+                if len(processed) == 5:
+                    done.set()
+
+            await bus.create_work_queue("builds", worker, num_workers=2, durable=True)
+            await asyncio.wait_for(done.wait(), 2.0)
+            for _ in range(100):  # The last ack lands after its callback returns
+                if bus.work_queue.pending("builds") == 0:
+                    break
+                await asyncio.sleep(0.01)
+            await bus.disconnect()
+            return processed, bus.work_queue.pending("builds")
+
+        processed, pending = asyncio.run(scenario())
+
+        assert sorted(processed) == [0, 1, 2, 3, 4]
+        assert pending == 0
+
+    def test_new_work_wakes_idle_workers(self, tmp_path):
+        """Idle workers pick up new items without waiting for the poll interval."""
+        async def scenario():
+            bus = NATSMessageBus(
+                transport=LoopbackTransport(),
+                work_queue=DurableWorkQueue(tmp_path / "queue.db"),
+            )
+            bus.QUEUE_POLL_INTERVAL = 10
+            await bus.connect()
+            received = asyncio.Event()
+
+            async def worker(msg):
+                received.set()
+
+            await bus.create_work_queue("builds", worker, durable=True)
+            await asyncio.sleep(0.01)  # Let the worker go idle
+            await bus.publish_to_queue(
+                "builds", "orchestrator", MessageType.TASK_ASSIGNED, {}, durable=True
+            )
+            await asyncio.wait_for(received.wait(), 1.0)
+            await bus.disconnect()
+
+        asyncio.run(scenario())
+
+    def test_failed_item_redelivered(self, tmp_path):
+        """A callback that raises gets the item again after the backoff."""
+        async def scenario():
+            bus = NATSMessageBus(
+                transport=LoopbackTransport(),
+                work_queue=DurableWorkQueue(tmp_path / "queue.db", backoff=(0.01,)),
+            )
+            bus.QUEUE_POLL_INTERVAL = 0.02
+            await bus.connect()
+            attempts = []
+            done = asyncio.Event()
+
+            async def flaky(msg):
+                attempts.append(msg.content["job"])
+                if len(attempts) == 1:
+                    raise RuntimeError("worker crashed")
+                done.set()
+
+            await bus.publish_to_queue(
+                "builds", "orchestrator", MessageType.TASK_ASSIGNED, {"job": "a"}, durable=True
+            )
+            await bus.create_work_queue("builds", flaky, durable=True)
+            await asyncio.wait_for(done.wait(), 2.0)
+            await bus.disconnect()
+            return attempts
+
+        assert asyncio.run(scenario()) == ["a", "a"]
+
+    def test_manual_fetch_and_ack(self, tmp_path):
+        """Pull consumers fetch batches and settle them explicitly."""
+        async def scenario():
+            bus = NATSMessageBus(work_queue=DurableWorkQueue(tmp_path / "queue.db"))
+            for i in range(4):
+                await bus.publish_to_queue(
+                    "builds", "orchestrator", MessageType.TASK_ASSIGNED, {"i": i}, durable=True
+                )
+            batch = await bus.fetch("builds", "puller", batch=3)
+            for queued in batch:
+                await bus.ack(queued)
+            return [q.message.content["i"] for q in batch], bus.work_queue.pending("builds")
+
+        assert asyncio.run(scenario()) == ([0, 1, 2], 1)
+
+    def test_slow_batch_not_processed_twice(self, tmp_path):
+        """Items waiting behind slow ones in a batch are not run by two workers."""
+        async def scenario():
+            bus = NATSMessageBus(
+                transport=LoopbackTransport(),
+                work_queue=DurableWorkQueue(tmp_path / "queue.db", ack_wait=0.25),
+            )
+            bus.QUEUE_POLL_INTERVAL = 0.02
+            await bus.connect()
+            for i in range(3):
+                await bus.publish_to_queue(
+                    "builds", "orchestrator", MessageType.TASK_ASSIGNED, {"i": i}, durable=True
+                )
+            runs = []
+
+            async def slow(msg):
+                runs.append(msg.content["i"])
+                await asyncio.sleep(0.15)
+
+            await bus.create_work_queue(
+                "builds", slow, num_workers=2, durable=True, max_in_flight=3
+            )
+            for _ in range(100):
+                if bus.work_queue.pending("builds") == 0:
+                    break
+                await asyncio.sleep(0.02)
+            await asyncio.sleep(0.3)  # Give a duplicate delivery time to show up
+            await bus.disconnect()
+            return runs, bus.work_queue.pending("builds")
+
+        runs, pending = asyncio.run(scenario())
+
+        assert sorted(runs) == [0, 1, 2]
+        assert pending == 0
+
+    def test_batch_fetch_drains_queue(self, tmp_path):
+        """Fetching in batches leases every item once, in order."""
+        count = 2000
+        store = DurableWorkQueue(tmp_path / "queue.db")
+        store.publish_many("batched", [str(i).encode() for i in range(count)])
+
+        seen = []
+        while items := store.fetch("batched", "w1", batch=100):
+            for item in items:
+                seen.append(int(item.payload))
+                store.ack(item)
+
+        assert seen == list(range(count))
+        assert store.pending("batched") == 0
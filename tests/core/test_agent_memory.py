@@ -7,7 +7,9 @@ import pytest
 
 from src.core.agent_memory import (
     AgentMemory,
+    LazyMemories,
     MemoryEntry,
+    MemoryIndex,
     MemoryType,
     get_memory,
 )
@@ -328,6 +330,246 @@ class TestAutoSummarization:
         assert "Insight 0" in summary or "Insight 1" in summary
 
 
+class TestWriteBehind:
+    """Tests for batched write-behind persistence."""
+
+    @pytest.fixture
+    def storage(self, tmp_path):
+        """Create temporary storage directory."""
+        storage = tmp_path / "memories"
+        storage.mkdir()
+        return storage
+
+    def test_write_through_by_default(self, storage):
+        """Test that the default mode writes on every memory."""
+        memory = AgentMemory("Direct", storage_path=storage)
+        memory.record_insight("Saved now")
+
+        assert memory.memory_file.exists()
+        assert not memory.has_pending_writes
+
+    def test_writes_are_deferred(self, storage):
+        """Test that write-behind defers the file write."""
+        memory = AgentMemory(
+            "Batched", storage_path=storage, write_behind=True, flush_interval=60
+        )
+        memory.record_insight("Pending")
+
+        assert not memory.memory_file.exists()
+        assert memory.has_pending_writes
+        assert memory.recall_insights()[0].content == "Pending"
+
+        memory.flush()
+        assert not memory.has_pending_writes
+        assert "Pending" in memory.memory_file.read_text()
+
+    def test_max_pending_forces_flush(self, storage):
+        """Test that reaching max_pending commits immediately."""
+        memory = AgentMemory(
+            "Burst", storage_path=storage, write_behind=True, flush_interval=60, max_pending=3
+        )
+        memory.record_insight("One")
+        memory.record_insight("Two")
+        assert not memory.memory_file.exists()
+
+        memory.record_insight("Three")
+        assert not memory.has_pending_writes
+        data = json.loads(memory.memory_file.read_text())
+        assert len(data["memories"]["insight"]) == 3
+
+    def test_flush_interval_commits_in_background(self, storage):
+        """Test that pending changes are flushed after the interval."""
+        memory = AgentMemory(
+            "Timed", storage_path=storage, write_behind=True, flush_interval=0.05
+        )
+        memory.record_insight("Eventually saved")
+
+        memory._flush_timer.join(timeout=2)
+        assert not memory.has_pending_writes
+        assert "Eventually saved" in memory.memory_file.read_text()
+
+    def test_flush_all_commits_pending_instances(self, storage):
+        """Test the interpreter-exit hook flushes dirty journals."""
+        from src.core.agent_memory import flush_all
+
+        memory = AgentMemory(
+            "AtExit", storage_path=storage, write_behind=True, flush_interval=60
+        )
+        memory.record_insight("Saved at exit")
+
+        flush_all()
+        assert "Saved at exit" in memory.memory_file.read_text()
+
+    def test_atomic_write_leaves_no_temp_file(self, storage):
+        """Test that commits go through a temp file that is renamed away."""
+        memory = AgentMemory("Atomic", storage_path=storage)
+        memory.record_insight("Whole file")
+
+        assert [p.name for p in storage.iterdir()] == ["atomic.json"]
+
+
+class TestLazyLoading:
+    """Tests for single-parse loading and per-type lazy hydration."""
+
+    @staticmethod
+    def _write_journal(storage, name, per_type):
+        """Write a journal file with per_type entries of every memory type."""
+        memories = {
+            t.value: [
+                {
+                    "content": f"{t.value} {i}",
+                    "type": t.value,
+                    "tags": ["bulk"],
+                    "related_to": None,
+                    "created_at": f"2025-01-01T00:00:{i % 60:02d}.{i:06d}",
+                    "session_id": None,
+                }
+                for i in range(per_type)
+            ]
+            for t in MemoryType
+        }
+        data = {"agent_name": name, "memories": memories, "summaries": {}}
+        (storage / f"{name.lower()}.json").write_text(json.dumps(data))
+
+    def test_file_is_parsed_once(self, tmp_path):
+        """Test that init reads the journal a single time."""
+        self._write_journal(tmp_path, "Once", per_type=3)
+
+        with patch("src.core.agent_memory.json.load", wraps=json.load) as load:
+            AgentMemory("Once", storage_path=tmp_path)
+        assert load.call_count == 1
+
+    def test_types_hydrate_on_first_access(self, tmp_path):
+        """Test that only accessed memory types are hydrated."""
+        self._write_journal(tmp_path, "Lazy", per_type=3)
+        memory = AgentMemory("Lazy", storage_path=tmp_path)
+
+        assert isinstance(memory.memories, LazyMemories)
+        assert not any(memory.memories.is_hydrated(t.value) for t in MemoryType)
+
+        memory.recall_insights()
+        assert memory.memories.is_hydrated("insight")
+        assert not memory.memories.is_hydrated("meaningful")
+
+    def test_summary_and_save_do_not_hydrate(self, tmp_path):
+        """Test that counting and saving work from the raw entries."""
+        self._write_journal(tmp_path, "Counter", per_type=4)
+        memory = AgentMemory("Counter", storage_path=tmp_path)
+
+        summary = memory.get_journal_summary()
+        assert summary["total_memories"] == 4 * len(MemoryType)
+        assert summary["by_type"]["context"]["recent"] == ["context 1", "context 2", "context 3"]
+
+        memory.mark_meaningful("New moment")
+        assert not memory.memories.is_hydrated("context")
+
+        reloaded = AgentMemory("Counter", storage_path=tmp_path)
+        assert reloaded.memories.count("context") == 4
+        assert reloaded.memories.count("meaningful") == 5
+
+    def test_large_journal(self, tmp_path):
+        """Test loading a 10k+ entry journal and rendering context."""
+        self._write_journal(tmp_path, "Veteran", per_type=1500)  # 10,500 entries
+        memory = AgentMemory("Veteran", storage_path=tmp_path)
+
+        assert memory.format_for_context()
+        assert memory.get_journal_summary()["total_memories"] == 10_500
+        assert all(len(memory.memories[t.value]) == 1500 for t in MemoryType)
+
+class TestRecallIndex:
+    """Tests for the inverted tag/relation index behind recall."""
+
+    @pytest.fixture
+    def memory(self, tmp_path):
+        """Create AgentMemory that never auto-summarizes."""
+        memory = AgentMemory("Indexed", storage_path=tmp_path)
+        memory.SUMMARIZE_THRESHOLD = 10**9
+        return memory
+
+    def test_entry_matching_several_tags_is_returned_once(self, memory):
+        """Test that overlapping tag lists are deduplicated."""
+        memory.record_insight("Both", tags=["a", "b"])
+        memory.record_insight("Only a", tags=["a"])
+
+        results = memory.recall(tags=["a", "b"])
+        assert [e.content for e in results] == ["Only a", "Both"]
+
+    def test_relation_substring_is_case_insensitive(self, memory):
+        """Test that relation lookups match normalized substrings."""
+        memory.note_context("Broker", about="NATS-JetStream")
+        memory.note_context("Other", about="redis")
+
+        results = memory.recall(related_to="jetstream")
+        assert [e.content for e in results] == ["Broker"]
+
+    def test_combined_filters(self, memory):
+        """Test type, tag and relation filters applied together."""
+        memory.note_context("Match", about="pytest", tags=["testing"])
+        memory.note_uncertainty("Wrong type", about="pytest", tags=["testing"])
+        memory.note_context("Wrong relation", about="mypy", tags=["testing"])
+
+        results = memory.recall(MemoryType.CONTEXT, tags=["testing"], related_to="py")
+        assert {e.content for e in results} == {"Match", "Wrong relation"}
+
+        results = memory.recall(MemoryType.CONTEXT, tags=["testing"], related_to="pytest")
+        assert [e.content for e in results] == ["Match"]
+
+    def test_loaded_entries_are_time_ordered(self, tmp_path):
+        """Test that out-of-order journal entries are recalled newest first."""
+        entries = [
+            {"content": c, "type": "insight", "tags": [], "created_at": ts}
+            for c, ts in [("mid", "2025-01-02"), ("new", "2025-01-03"), ("old", "2025-01-01")]
+        ]
+        data = {"memories": {"insight": entries}, "summaries": {}}
+        (tmp_path / "ordered.json").write_text(json.dumps(data))
+
+        memory = AgentMemory("Ordered", storage_path=tmp_path)
+        assert [e.content for e in memory.recall_insights()] == ["new", "mid", "old"]
+
+    def test_summarized_entries_leave_the_index(self, tmp_path):
+        """Test that auto-summarized entries are no longer recalled."""
+        memory = AgentMemory("Composter", storage_path=tmp_path)
+        memory.SUMMARIZE_THRESHOLD = 4
+        memory.recall_insights()  # Build the index before summarizing
+
+        for i in range(5):
+            memory.record_insight(f"Insight {i}", tags=["bulk"])
+
+        recalled = {e.content for e in memory.recall(tags=["bulk"], limit=100)}
+        assert recalled == {e.content for e in memory.memories["insight"]}
+
+    def test_index_sweeps_tombstones(self):
+        """Test that removed records are swept once they outnumber live ones."""
+        index = MemoryIndex()
+        entries = [MemoryEntry(f"e{i}", MemoryType.INSIGHT, tags=["t"]) for i in range(4)]
+        index.add_type("insight", entries)
+
+        index.remove(entries[:3])
+        assert len(index.by_tag["t"]) == 1
+        assert index.query(tags=["t"]) == [entries[3]]
+
+    def test_recall_large_journal(self, memory):
+        """Test top-k recall over 20k memories."""
+        tags = ["testing", "nats", "typing", "docs"]
+        for i in range(20_000):
+            mem_type = MemoryType.INSIGHT if i % 2 else MemoryType.CONTEXT
+            entry = MemoryEntry(
+                f"memory {i}",
+                mem_type,
+                tags=[tags[i % 4]],
+                related_to=f"module_{i % 50}",
+                created_at=f"2025-01-01T00:00:00.{i:06d}",
+            )
+            memory.memories[mem_type.value].append(entry)
+
+        assert memory.recall(tags=["testing"], limit=1)[0].content == "memory 19996"
+        assert [m.content for m in memory.recall_about("module_7", limit=2)] == [
+            "memory 19957",
+            "memory 19907",
+        ]
+        assert memory.recall_insights(limit=1)[0].content == "memory 19999"
+
+
 class TestConvenienceFunctions:
     """Tests for module-level convenience functions."""
 
@@ -0,0 +1,177 @@
+"""Tests for the shared SQLite memory store."""
+
+import json
+import multiprocessing
+
+import pytest
+
+from src.core.agent_memory import AgentMemory, MemoryType
+from src.core.memory_store import SQLiteMemoryStore
+
+
+def _write_memories(db_path, agent_name, count):
+    """Append memories from a separate process."""
+    store = SQLiteMemoryStore(db_path)
+    memory = AgentMemory(agent_name, store=store)
+    memory.SUMMARIZE_THRESHOLD = 10**9
+    for i in range(count):
+        memory.record_insight(f"{agent_name} insight {i}", tags=["concurrent"])
+    store.close()
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a store in a temp directory."""
+    store = SQLiteMemoryStore(tmp_path / "memories.db")
+    yield store
+    store.close()
+
+
+class TestSQLiteMemoryStore:
+    """Tests for SQLiteMemoryStore."""
+
+    def test_uses_wal_mode(self, store):
+        """Test that the database is opened in WAL mode."""
+        mode = store._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_agent_memory_round_trip(self, store, tmp_path):
+        """Test that AgentMemory persists to and reloads from the store."""
+        memory = AgentMemory("Aurora", storage_path=tmp_path, store=store)
+        memory.record_insight("Use fixtures", tags=["testing"])
+        memory.note_context("Bus choice", about="nats")
+
+        reloaded = AgentMemory("Aurora", storage_path=tmp_path, store=store)
+        assert reloaded.recall_insights()[0].content == "Use fixtures"
+        assert reloaded.recall_about("NATS")[0].content == "Bus choice"
+        assert not (tmp_path / "aurora.json").exists()
+
+    def test_auto_summarize_replaces_rows(self, store, tmp_path):
+        """Test that summarization deletes the oldest rows and stores a summary."""
+        memory = AgentMemory("Echo", storage_path=tmp_path, store=store)
+        memory.SUMMARIZE_THRESHOLD = 4
+        for i in range(4):
+            memory.record_insight(f"Insight {i}")
+
+        reloaded = AgentMemory("Echo", storage_path=tmp_path, store=store)
+        assert [e.content for e in reloaded.memories["insight"]] == ["Insight 2", "Insight 3"]
+        assert "Insight 0" in reloaded.summaries["insight"][0]
+
+    def test_summarize_keeps_other_writers_rows(self, tmp_path):
+        """Test that summarizing deletes only the entries folded into the summary."""
+        db_path = tmp_path / "memories.db"
+        store_a = SQLiteMemoryStore(db_path)
+        store_b = SQLiteMemoryStore(db_path)
+        try:
+            memory_a = AgentMemory("Echo", storage_path=tmp_path, store=store_a)
+            memory_a.SUMMARIZE_THRESHOLD = 10
+            memory_a.memories["insight"]  # Load before the other writer adds rows
+
+            memory_b = AgentMemory("Echo", storage_path=tmp_path, store=store_b)
+            memory_b.SUMMARIZE_THRESHOLD = 10**9
+            for i in range(5):
+                memory_b.record_insight(f"B {i}")
+            for i in range(10):
+                memory_a.record_insight(f"A {i}")
+
+            reloaded = AgentMemory("Echo", storage_path=tmp_path, store=store_a)
+            contents = [e.content for e in reloaded.memories["insight"]]
+            assert contents == [f"B {i}" for i in range(5)] + [f"A {i}" for i in range(5, 10)]
+            assert "A 0" in reloaded.summaries["insight"][0]
+            assert "B 0" not in reloaded.summaries["insight"][0]
+        finally:
+            store_a.close()
+            store_b.close()
+
+    def test_cross_agent_tag_query(self, store, tmp_path):
+        """Test "all insights tagged testing" across agents."""
+        AgentMemory("Aurora", storage_path=tmp_path, store=store).record_insight(
+            "Aurora on tests", tags=["testing"]
+        )
+        AgentMemory("Phoenix", storage_path=tmp_path, store=store).record_insight(
+            "Phoenix on tests", tags=["testing", "async"]
+        )
+        AgentMemory("Phoenix", storage_path=tmp_path, store=store).note_context(
+            "Not an insight", about="ci", tags=["testing"]
+        )
+
+        results = store.search(memory_type=MemoryType.INSIGHT, tags=["testing"])
+        assert {r["agent_name"] for r in results} == {"Aurora", "Phoenix"}
+        assert all(r["type"] == "insight" for r in results)
+
+    def test_full_text_search(self, store, tmp_path):
+        """Test FTS5 search over content."""
+        memory = AgentMemory("Nova", storage_path=tmp_path, store=store)
+        memory.record_insight("JetStream consumers need explicit acks")
+        memory.record_insight("Prefer small commits")
+
+        results = store.search(text="jetstream acks")
+        assert [r["content"] for r in results] == ["JetStream consumers need explicit acks"]
+        assert store.search(text='"unbalanced quote') == []
+
+    def test_search_filters_and_order(self, store, tmp_path):
+        """Test agent/relation filters and newest-first ordering."""
+        memory = AgentMemory("Atlas", storage_path=tmp_path, store=store)
+        memory.note_context("First", about="src/core/metrics.py")
+        memory.note_context("Second", about="src/core/metrics.py")
+
+        results = store.search(agent_name="atlas", related_to="METRICS")
+        assert [r["content"] for r in results] == ["Second", "First"]
+
+    def test_related_to_matches_wildcards_literally(self, store, tmp_path):
+        """Test that "_" and "%" in a relation filter are not LIKE wildcards."""
+        memory = AgentMemory("Atlas", storage_path=tmp_path, store=store)
+        memory.note_context("Underscore", about="src/orchestrator/agent_runner.py")
+        memory.note_context("Hyphen", about="docs/agent-runner.md")
+        memory.note_context("Percent", about="coverage 100%")
+
+        results = store.search(related_to="Agent_Runner")
+        assert [r["content"] for r in results] == ["Underscore"]
+        assert [r["content"] for r in store.search(related_to="0%")] == ["Percent"]
+        assert [e.content for e in memory.recall(related_to="agent_runner")] == ["Underscore"]
+
+    def test_import_json_journals(self, store, tmp_path):
+        """Test importing existing per-agent JSON journals."""
+        journals = tmp_path / "journals"
+        legacy = AgentMemory("Legacy", storage_path=journals)
+        legacy.record_insight("Imported insight", tags=["history"])
+        legacy.summaries["insight"].append("Old summary")
+        legacy._save()
+
+        assert store.import_json_journals(journals) == {"legacy.json": 1}
+        assert store.import_json_journals(journals) == {"legacy.json": 0}  # Already present
+
+        memory = AgentMemory("Legacy", storage_path=tmp_path, store=store)
+        assert memory.recall_insights()[0].tags == ["history"]
+        assert memory.summaries["insight"] == ["Old summary"]
+        assert store.agents() == ["Legacy"]
+
+    def test_import_replace(self, store, tmp_path):
+        """Test that replace=True re-imports an existing agent."""
+        journal = tmp_path / "nova.json"
+        entry = {"content": "v1", "type": "insight", "tags": [], "created_at": "2025-01-01"}
+        journal.write_text(json.dumps({"agent_name": "Nova", "memories": {"insight": [entry]}}))
+        store.import_json_journal(journal)
+
+        entry["content"] = "v2"
+        journal.write_text(json.dumps({"agent_name": "Nova", "memories": {"insight": [entry]}}))
+        assert store.import_json_journal(journal, replace=True) == 1
+        assert [r["content"] for r in store.search(agent_name="Nova")] == ["v2"]
+
+    def test_concurrent_processes_do_not_clobber(self, tmp_path):
+        """Test that parallel writers all land in the shared store."""
+        db_path = tmp_path / "memories.db"
+        SQLiteMemoryStore(db_path).close()
+
+        ctx = multiprocessing.get_context("spawn")
+        procs = [
+            ctx.Process(target=_write_memories, args=(db_path, "Shared", 20)) for _ in range(3)
+        ]
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join(timeout=60)
+
+        store = SQLiteMemoryStore(db_path)
+        assert len(store.search(tags=["concurrent"], limit=1000)) == 60
+        store.close()
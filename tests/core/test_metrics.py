@@ -7,6 +7,7 @@ import pytest
 import src.core.metrics as metrics_module
 from src.core.metrics import (
     MetricEntry,
+    MetricsIndex,
     MetricsTracker,
     MetricType,
     get_agent_summary,
@@ -20,6 +21,7 @@ from src.core.metrics import (
     record_phase_completed,
     record_quality,
 )
+from src.core.metrics_store import JsonFileStore, SegmentedLogStore
 
 
 class TestMetricEntry:
@@ -333,6 +335,163 @@ class TestMetricsTracker:
         assert leaderboard[0]["score"] == 0
 
 
+class TestMetricsIndex:
+    """Tests for incrementally maintained metric rollups."""
+
+    @pytest.fixture
+    def tracker(self, tmp_path):
+        """Create a tracker with a mix of entries."""
+        tracker = MetricsTracker(tmp_path / "metrics.json")
+        tracker.record_quality("Nova", test_coverage=80.0, lint_errors=4)
+        tracker.record_quality("Nova", test_coverage=90.0, lint_errors=1)
+        tracker.record_quality("Atlas", test_coverage=70.0)
+        tracker.record_phase_completed("Nova", "2.1")
+        return tracker
+
+    def test_rollup_aggregates(self, tracker):
+        """Test count, sum, min/max, last value and time buckets."""
+        rollup = tracker.index.rollup("Nova", MetricType.TEST_COVERAGE)
+
+        assert rollup.count == 2
+        assert rollup.total == 170.0
+        assert rollup.min_value == 80.0
+        assert rollup.max_value == 90.0
+        assert rollup.last_value == 90.0
+        assert rollup.mean == 85.0
+        assert sum(rollup.daily_counts.values()) == 2
+
+    def test_team_rollup(self, tracker):
+        """Test team-wide rollups per metric type."""
+        rollup = tracker.index.team_rollup(MetricType.TEST_COVERAGE)
+        assert rollup.count == 3
+        assert rollup.min_value == 70.0
+
+    def test_non_numeric_values_are_counted_only(self, tracker):
+        """Test that string values count but do not contribute to sums."""
+        rollup = tracker.index.rollup("Nova", MetricType.PHASE_COMPLETED)
+        assert rollup.count == 1
+        assert rollup.numeric_count == 0
+        assert rollup.mean is None
+
+    def test_incremental_index_matches_rebuild(self, tracker):
+        """Test that the live index equals one rebuilt from the raw log."""
+        assert tracker.index == MetricsIndex.build(tracker._data["entries"])
+        assert tracker.verify_indexes() is True
+
+    def test_index_is_rebuilt_on_load(self, tracker):
+        """Test that a reloaded tracker serves the same rollups."""
+        reloaded = MetricsTracker(tracker.metrics_file)
+        assert reloaded.index == tracker.index
+
+    def test_verify_indexes_repairs_drift(self, tracker):
+        """Test that a drifted index is detected and rebuilt."""
+        tracker.index.rollup("Nova", MetricType.TEST_COVERAGE).count = 99
+
+        assert tracker.verify_indexes() is False
+        assert tracker.index.rollup("Nova", MetricType.TEST_COVERAGE).count == 2
+        assert tracker.verify_indexes() is True
+
+    def test_verify_indexes_without_repair(self, tracker):
+        """Test that repair=False leaves the live index untouched."""
+        tracker.index.type_rollups.clear()
+
+        assert tracker.verify_indexes(repair=False) is False
+        assert tracker.index.type_rollups == {}
+
+    def test_get_entries_uses_positions_in_order(self, tracker):
+        """Test that indexed reads preserve record order."""
+        entries = tracker.get_entries(agent_name="Nova", metric_type=MetricType.LINT_ERRORS)
+        assert [e.value for e in entries] == [4, 1]
+
+
+class TestSegmentedLogStore:
+    """Tests for the append-only segmented metrics store."""
+
+    def _entry(self, n: int) -> MetricEntry:
+        return MetricEntry(metric_type=MetricType.TASK_COMPLETED, agent_name="Nova", value=n)
+
+    def test_record_appends_without_rewriting_snapshot(self, tmp_path):
+        """Test that recording writes to a segment, not the snapshot."""
+        metrics_file = tmp_path / "metrics.json"
+        tracker = MetricsTracker(metrics_file)
+        tracker.record(self._entry(1))
+
+        assert not metrics_file.exists()
+        segments = list((tmp_path / "metrics.segments").glob("*.jsonl"))
+        assert len(segments) == 1
+        assert segments[0].read_text().count("\n") == 1
+
+    def test_segments_roll_and_compact(self, tmp_path):
+        """Test rolling to new segments and folding them into the snapshot."""
+        metrics_file = tmp_path / "metrics.json"
+        store = SegmentedLogStore(metrics_file, segment_max_entries=3, compact_after_segments=2)
+        tracker = MetricsTracker(metrics_file, store=store)
+        for i in range(7):
+            tracker.record(self._entry(i))
+
+        assert metrics_file.exists()
+        reloaded = MetricsTracker(metrics_file)
+        assert [e.value for e in reloaded.get_entries()] == list(range(7))
+
+    def test_explicit_compact(self, tmp_path):
+        """Test that compact() leaves only the snapshot behind."""
+        metrics_file = tmp_path / "metrics.json"
+        tracker = MetricsTracker(metrics_file)
+        tracker.record(self._entry(1))
+        tracker.compact()
+        tracker.record(self._entry(2))
+
+        assert len(list((tmp_path / "metrics.segments").glob("*.jsonl"))) == 1
+        reloaded = MetricsTracker(metrics_file)
+        assert [e.value for e in reloaded.get_entries()] == [1, 2]
+
+    def test_torn_tail_is_recovered(self, tmp_path):
+        """Test that a partially written last line is dropped and truncated."""
+        metrics_file = tmp_path / "metrics.json"
+        tracker = MetricsTracker(metrics_file)
+        tracker.record(self._entry(1))
+        tracker.record(self._entry(2))
+
+        segment = next((tmp_path / "metrics.segments").glob("*.jsonl"))
+        with open(segment, "a") as f:
+            f.write('{"metric_type": "task_comp')
+
+        recovered = MetricsTracker(metrics_file)
+        assert [e.value for e in recovered.get_entries()] == [1, 2]
+        assert segment.read_text().endswith("\n")
+
+        recovered.record(self._entry(3))
+        assert [e.value for e in MetricsTracker(metrics_file).get_entries()] == [1, 2, 3]
+
+    def test_stale_segments_after_compaction_are_ignored(self, tmp_path):
+        """Test that segments already folded into the snapshot are not replayed."""
+        metrics_file = tmp_path / "metrics.json"
+        tracker = MetricsTracker(metrics_file)
+        tracker.record(self._entry(1))
+        segment = next((tmp_path / "metrics.segments").glob("*.jsonl"))
+        leftover = segment.read_text()
+        tracker.compact()
+
+        # Simulate a crash between snapshot rename and segment deletion
+        segment.write_text(leftover)
+
+        reloaded = MetricsTracker(metrics_file)
+        assert [e.value for e in reloaded.get_entries()] == [1]
+        assert not segment.exists()
+
+    def test_loads_legacy_json_file(self, tmp_path):
+        """Test that an existing full-JSON metrics file is used as the snapshot."""
+        metrics_file = tmp_path / "metrics.json"
+        legacy = MetricsTracker(metrics_file, store=JsonFileStore(metrics_file))
+        legacy.record_phase_completed("Nova", "2.1")
+
+        tracker = MetricsTracker(metrics_file)
+        tracker.record_phase_completed("Nova", "2.2")
+
+        summary = MetricsTracker(metrics_file).get_agent_summary("Nova")
+        assert summary["velocity"]["phases_completed"] == 2
+
+
 class TestConvenienceFunctions:
     """Tests for module-level convenience functions."""
 
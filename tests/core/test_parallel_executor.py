@@ -1,5 +1,8 @@
 """Tests for parallel execution scheduler."""
 
+import asyncio
+import os
+import threading
 import time
 
 from src.models.agent import Agent
@@ -334,6 +337,92 @@ class TestErrorHandling:
         assert "task-fail" in executed_tasks
         assert "task-dependent" not in executed_tasks
 
+    def test_failure_skips_transitive_dependents(self):
+        """Dependents of a failed task are skipped, all the way down."""
+        from src.core.parallel_executor import ParallelExecutionScheduler
+
+        agents = [Agent(id=f"agent-{i}", role="worker", capabilities=[]) for i in range(2)]
+
+        tasks = [
+            Subtask(id="task-fail", description="Failing task", dependencies=[]),
+            Subtask(id="task-child", description="Child", dependencies=["task-fail"]),
+            Subtask(id="task-grandchild", description="Grandchild", dependencies=["task-child"]),
+            Subtask(id="task-ok", description="Independent", dependencies=[]),
+        ]
+
+        scheduler = ParallelExecutionScheduler(agents=agents)
+
+        def mock_executor(task: Subtask) -> dict:
+            if task.id == "task-fail":
+                raise RuntimeError("Task failed")
+            return {"task_id": task.id}
+
+        results = scheduler.execute_tasks(
+            tasks, executor_func=mock_executor, continue_on_error=True
+        )
+
+        by_id = {r["task_id"]: r["status"] for r in results}
+        assert by_id == {
+            "task-fail": "failed",
+            "task-child": "skipped",
+            "task-grandchild": "skipped",
+            "task-ok": "completed",
+        }
+        assert scheduler.get_execution_stats()["skipped_tasks"] == 2
+
+    def test_stop_on_error_skips_unstarted_tasks(self):
+        """Without continue_on_error, nothing new starts after a failure."""
+        from src.core.parallel_executor import ParallelExecutionScheduler
+
+        agents = [Agent(id="agent-1", role="worker", capabilities=[])]
+
+        tasks = [
+            Subtask(id="task-fail", description="Failing task", dependencies=[]),
+            Subtask(id="task-dependent", description="Dependent", dependencies=["task-fail"]),
+            Subtask(id="task-later", description="Independent", dependencies=[]),
+        ]
+
+        scheduler = ParallelExecutionScheduler(agents=agents)
+
+        executed_tasks = []
+
+        def mock_executor(task: Subtask) -> dict:
+            executed_tasks.append(task.id)
+            if task.id == "task-fail":
+                raise RuntimeError("Task failed")
+            return {"task_id": task.id}
+
+        results = scheduler.execute_tasks(tasks, executor_func=mock_executor)
+
+        assert executed_tasks == ["task-fail"]
+        assert {r["task_id"]: r["status"] for r in results} == {
+            "task-fail": "failed",
+            "task-dependent": "skipped",
+            "task-later": "skipped",
+        }
+
+    def test_unsatisfiable_dependency_does_not_hang(self):
+        """Tasks depending on a missing task are reported, not waited on forever."""
+        from src.core.parallel_executor import ParallelExecutionScheduler
+
+        agents = [Agent(id="agent-1", role="worker", capabilities=[])]
+
+        tasks = [
+            Subtask(id="task-1", description="Task 1", dependencies=[]),
+            Subtask(id="task-2", description="Task 2", dependencies=["task-missing"]),
+        ]
+
+        scheduler = ParallelExecutionScheduler(agents=agents)
+
+        results = scheduler.execute_tasks(
+            tasks, executor_func=lambda task: {"task_id": task.id}
+        )
+
+        assert {r["task_id"]: r["status"] for r in results} == {
+            "task-1": "completed",
+            "task-2": "skipped",
+        }
+
     def test_timeout_handling(self):
         """Tasks that exceed time limit should timeout gracefully."""
         from src.core.parallel_executor import ParallelExecutionScheduler
@@ -356,6 +445,32 @@ class TestErrorHandling:
         assert len(results) == 1
         assert results[0].get("error") is not None or results[0].get("status") == "timeout"
 
+    def test_timed_out_thread_is_not_awaited(self):
+        """execute_tasks returns without joining a hung thread task."""
+        from src.core.parallel_executor import ParallelExecutionScheduler
+
+        agents = [Agent(id="agent-1", role="worker", capabilities=[])]
+        tasks = [Subtask(id="task-hang", description="Hangs", dependencies=[])]
+        release = threading.Event()
+
+        scheduler = ParallelExecutionScheduler(agents=agents, task_timeout=0.1)
+
+        def mock_executor(task: Subtask) -> dict:
+            release.wait(timeout=10)
+            return {"task_id": task.id}
+
+        start = time.time()
+        try:
+            results = scheduler.execute_tasks(
+                tasks, executor_func=mock_executor, continue_on_error=True
+            )
+            elapsed = time.time() - start
+        finally:
+            release.set()
+
+        assert elapsed < 5
+        assert results[0]["status"] == "timeout"
+
 
 class TestSchedulerConfiguration:
     """Test scheduler configuration and initialization."""
@@ -402,3 +517,167 @@ class TestSchedulerConfiguration:
         assert "total_time" in stats
         assert stats["total_tasks"] == 3
         assert stats["completed_tasks"] == 3
+
+
+# Process-backed executor functions must be importable by worker processes
+
+
+def _cpu_executor(task: Subtask) -> dict:
+    """Burn CPU and report which process ran the task."""
+    if task.metadata.get("hang"):
+        time.sleep(30)
+    time.sleep(task.metadata.get("pause", 0))
+    total = sum(i * i for i in range(task.metadata.get("work", 1000)))
+    return {"task_id": task.id, "pid": os.getpid(), "total": total}
+
+
+async def _async_executor(task: Subtask) -> dict:
+    """Yield to the event loop before returning."""
+    await asyncio.sleep(0.1)
+    return {"task_id": task.id, "loop": id(asyncio.get_running_loop())}
+
+
+class TestExecutionBackends:
+    """Test routing tasks to thread, process and asyncio backends."""
+
+    def test_cpu_hint_runs_in_worker_process(self):
+        """Tasks hinted as CPU-bound run outside the scheduler's process."""
+        from src.core.parallel_executor import ParallelExecutionScheduler
+
+        agents = [Agent(id=f"agent-{i}", role="worker", capabilities=[]) for i in range(2)]
+
+        tasks = [
+            Subtask(id="task-cpu", description="CPU", metadata={"resource_hint": "cpu"}),
+            Subtask(id="task-io", description="I/O", metadata={"resource_hint": "io"}),
+            Subtask(id="task-default", description="Default", dependencies=["task-cpu"]),
+        ]
+
+        scheduler = ParallelExecutionScheduler(agents=agents)
+        results = scheduler.execute_tasks(tasks, executor_func=_cpu_executor)
+
+        by_id = {r["task_id"]: r for r in results}
+        assert by_id["task-cpu"]["pid"] != os.getpid()
+        assert by_id["task-io"]["pid"] == os.getpid()
+        assert by_id["task-default"]["pid"] == os.getpid()
+        assert all(r["status"] == "completed" for r in results)
+        assert scheduler.get_execution_stats()["tasks_by_backend"] == {
+            "process": 1,
+            "thread": 2,
+        }
+
+    def test_default_backend(self):
+        """Unhinted tasks use the scheduler's default backend."""
+        from src.core.parallel_executor import ExecutionBackend, ParallelExecutionScheduler
+
+        agents = [Agent(id="agent-1", role="worker", capabilities=[])]
+        tasks = [Subtask(id="task-1", description="Task 1")]
+
+        scheduler = ParallelExecutionScheduler(
+            agents=agents, default_backend=ExecutionBackend.PROCESS
+        )
+        results = scheduler.execute_tasks(tasks, executor_func=_cpu_executor)
+
+        assert results[0]["pid"] != os.getpid()
+
+    def test_process_timeout_terminates_work(self):
+        """A timed-out process task is killed and its pool-mates are rerun."""
+        from src.core.parallel_executor import ParallelExecutionScheduler
+
+        agents = [Agent(id=f"agent-{i}", role="worker", capabilities=[]) for i in range(2)]
+
+        tasks = [
+            Subtask(
+                id="task-hang",
+                description="Hangs",
+                metadata={"resource_hint": "cpu", "hang": True},
+            ),
+            Subtask(
+                id="task-ok",
+                description="Finishes",
+                dependencies=[],
+                metadata={"resource_hint": "cpu", "work": 10},
+            ),
+        ]
+
+        scheduler = ParallelExecutionScheduler(agents=agents, task_timeout=0.5)
+
+        start = time.time()
+        results = scheduler.execute_tasks(
+            tasks, executor_func=_cpu_executor, continue_on_error=True
+        )
+        elapsed = time.time() - start
+
+        # Returning at all means the hung worker was killed, not awaited
+        assert elapsed < 10
+        by_id = {r["task_id"]: r["status"] for r in results}
+        assert by_id == {"task-hang": "timeout", "task-ok": "completed"}
+
+    def test_rerun_after_termination_counted_once(self):
+        """Process tasks rerun after a pool termination count once per backend."""
+        from src.core.parallel_executor import ParallelExecutionScheduler
+
+        agents = [Agent(id=f"agent-{i}", role="worker", capabilities=[]) for i in range(3)]
+        cpu = {"resource_hint": "cpu"}
+        tasks = [
+            Subtask(id="task-hang", description="Hangs", metadata={**cpu, "hang": True}),
+            # Starts after the gate and is still running when task-hang times out
+            Subtask(id="task-gate", description="Gate", metadata={"pause": 1.0}),
+            Subtask(
+                id="task-ok",
+                description="Killed with the pool",
+                dependencies=["task-gate"],
+                metadata={**cpu, "pause": 1.5},
+            ),
+        ]
+
+        scheduler = ParallelExecutionScheduler(agents=agents, task_timeout=2.0)
+        results = scheduler.execute_tasks(
+            tasks, executor_func=_cpu_executor, continue_on_error=True
+        )
+
+        by_id = {r["task_id"]: r["status"] for r in results}
+        assert by_id == {"task-hang": "timeout", "task-gate": "completed", "task-ok": "completed"}
+        assert scheduler.get_execution_stats()["tasks_by_backend"] == {
+            "process": 2,
+            "thread": 1,
+        }
+
+    def test_async_executor_runs_on_event_loop(self):
+        """Coroutine executor functions run concurrently on one event loop."""
+        from src.core.parallel_executor import ParallelExecutionScheduler
+
+        agents = [Agent(id=f"agent-{i}", role="worker", capabilities=[]) for i in range(4)]
+        tasks = [Subtask(id=f"task-{i}", description=f"Task {i}") for i in range(4)]
+
+        scheduler = ParallelExecutionScheduler(agents=agents)
+
+        start = time.time()
+        results = scheduler.execute_tasks(tasks, executor_func=_async_executor)
+        elapsed = time.time() - start
+
+        assert len(results) == 4
+        assert len({r["loop"] for r in results}) == 1
+        assert elapsed < 0.3, "Async tasks should overlap"
+        assert scheduler.get_execution_stats()["tasks_by_backend"] == {"async": 4}
+
+    def test_async_timeout_cancels_coroutine(self):
+        """A timed-out async task is cancelled."""
+        from src.core.parallel_executor import ParallelExecutionScheduler
+
+        agents = [Agent(id="agent-1", role="worker", capabilities=[])]
+        tasks = [Subtask(id="task-slow", description="Slow")]
+        cancelled = []
+
+        async def slow(task: Subtask) -> dict:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(task.id)
+                raise
+            return {"task_id": task.id}
+
+        scheduler = ParallelExecutionScheduler(agents=agents, task_timeout=0.1)
+        results = scheduler.execute_tasks(tasks, executor_func=slow, continue_on_error=True)
+
+        assert results[0]["status"] == "timeout"
+        assert cancelled == ["task-slow"]
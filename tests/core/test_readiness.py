@@ -0,0 +1,147 @@
+"""Tests for the incremental readiness tracker."""
+
+import random
+
+import pytest
+
+from src.core.readiness import ReadinessTracker, find_cycle
+
+
+def _drain(tracker: ReadinessTracker) -> list[str]:
+    """Complete every task in pop order."""
+    order = []
+    while tracker.has_ready:
+        task_id = tracker.pop_ready()
+        order.append(task_id)
+        tracker.mark_completed(task_id)
+    return order
+
+
+class TestReadinessTracker:
+    """Test ready-set maintenance."""
+
+    def test_initial_ready_in_mapping_order(self):
+        """Dependency-free tasks start ready, in mapping order."""
+        tracker = ReadinessTracker({"b": [], "a": [], "c": ["a"]})
+
+        assert tracker.ready_count == 2
+        assert tracker.pop_ready() == "b"
+        assert tracker.pop_ready() == "a"
+        with pytest.raises(IndexError):
+            tracker.pop_ready()
+
+    def test_completion_releases_dependents(self):
+        """A task becomes ready when its last dependency completes."""
+        tracker = ReadinessTracker({"a": [], "b": [], "c": ["a", "b"]})
+        tracker.pop_ready()
+        tracker.pop_ready()
+
+        assert tracker.mark_completed("a") == []
+        assert tracker.mark_completed("b") == ["c"]
+        assert tracker.pop_ready() == "c"
+        assert tracker.running_count == 1
+        tracker.mark_completed("c")
+        assert tracker.is_finished
+
+    def test_duplicate_dependencies_counted_once(self):
+        """Listing a dependency twice does not block the task."""
+        tracker = ReadinessTracker({"a": [], "b": ["a", "a"]})
+
+        assert _drain(tracker) == ["a", "b"]
+
+    def test_priority_order(self):
+        """Lower priority keys pop first; ties follow mapping order."""
+        tracker = ReadinessTracker(
+            {"a": [], "b": [], "c": [], "d": []},
+            priority={"c": -5, "d": -5},
+        )
+
+        assert _drain(tracker) == ["c", "d", "a", "b"]
+
+    def test_failure_skips_transitive_dependents(self):
+        """Everything downstream of a failed task is skipped."""
+        tracker = ReadinessTracker({
+            "a": [],
+            "b": ["a"],
+            "c": ["b"],
+            "d": ["a", "e"],
+            "e": [],
+            "f": ["e"],
+        })
+        tracker.pop_ready()
+
+        skipped = tracker.mark_failed("a")
+
+        assert set(skipped) == {"b", "c", "d"}
+        assert tracker.failed == {"a"}
+        # e completing must not revive d
+        assert tracker.pop_ready() == "e"
+        assert tracker.mark_completed("e") == ["f"]
+        tracker.mark_completed(tracker.pop_ready())
+        assert tracker.is_finished
+
+    def test_skip_remaining(self):
+        """Aborting skips everything not yet started."""
+        tracker = ReadinessTracker({"a": [], "b": [], "c": ["a"]})
+        tracker.pop_ready()
+
+        assert tracker.skip_remaining() == ["b", "c"]
+        assert not tracker.has_ready
+        tracker.mark_completed("a")
+        assert tracker.is_finished
+
+    def test_missing_dependency_is_blocked(self):
+        """Tasks depending on unknown IDs never become ready."""
+        tracker = ReadinessTracker({"a": [], "b": ["ghost"], "c": ["b"]})
+
+        assert _drain(tracker) == ["a"]
+        assert tracker.blocked() == ["b", "c"]
+        assert not tracker.is_finished
+
+
+class TestFindCycle:
+    """Test cycle detection."""
+
+    def test_acyclic(self):
+        """A DAG has no cycle."""
+        assert find_cycle({"a": [], "b": ["a"], "c": ["a", "b"]}) == []
+
+    def test_reports_cycle_members(self):
+        """The returned path is a cycle, not a task downstream of one."""
+        cycle = find_cycle({
+            "d": ["c"],
+            "a": ["c"],
+            "b": ["a"],
+            "c": ["b"],
+        })
+
+        assert set(cycle) == {"a", "b", "c"}
+
+    def test_ignores_missing_dependencies(self):
+        """Missing dependencies are not cycles."""
+        assert find_cycle({"a": ["ghost"], "b": ["a"]}) == []
+
+    def test_long_chain(self):
+        """Deep chains do not hit the recursion limit."""
+        deps = {"t0": []}
+        deps.update({f"t{i}": [f"t{i - 1}"] for i in range(1, 20000)})
+
+        assert find_cycle(deps) == []
+
+
+class TestLargeDag:
+    """Test incremental tracking on a large DAG."""
+
+    def test_large_dag_drains_in_dependency_order(self):
+        """A 5000-task DAG drains completely, each task after its dependencies."""
+        rng = random.Random(7)
+        deps = {
+            f"t{i}": [f"t{j}" for j in rng.sample(range(max(0, i - 50), i), k=min(i, 3))]
+            for i in range(5000)
+        }
+
+        order = _drain(ReadinessTracker(deps))
+
+        position = {task_id: i for i, task_id in enumerate(order)}
+        assert len(order) == 5000
+        assert all(position[d] < position[t] for t, ds in deps.items() for d in ds)
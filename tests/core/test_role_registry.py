@@ -1,5 +1,7 @@
 """Tests for Agent Role Registry."""
 
+import random
+
 import pytest
 
 from src.core.role_registry import RoleMatcher, RoleRegistry
@@ -457,3 +459,112 @@ class TestRoleMatcher:
         matches = matcher.find_matching_roles(requirements)
         assert len(matches) > 0
         assert matches[0]["role"].name == "developer"
+
+
+def _reference_score(role: AgentRole, requirements: dict) -> float:
+    """Score a role by direct list membership (the matcher's definition)."""
+    pairs = [
+        (requirements.get("capabilities", []), role.capabilities),
+        (requirements.get("tools", []), role.tools),
+        (requirements.get("domain_knowledge", []), role.domain_knowledge),
+    ]
+    total = sum(len(required) for required, _ in pairs)
+    if total == 0:
+        return 0.5
+    matches = sum(
+        1
+        for required, have in pairs
+        for term in required
+        if term.lower() in [h.lower() for h in have]
+    )
+    return matches / total
+
+
+class TestBatchMatching:
+    """Test bitmask-encoded batch scoring."""
+
+    def test_score_batch_matches_reference(self):
+        """Batch scores equal direct membership scoring, including duplicates."""
+        registry = RoleRegistry.create_standard_registry()
+        matcher = RoleMatcher(registry)
+        requirements_list = [
+            {"capabilities": ["Coding", "testing"], "tools": ["pytest", "unknown"]},
+            {"tools": ["pandas", "pandas"], "domain_knowledge": ["statistics"]},
+            {},
+            {"capabilities": ["nothing_matches"]},
+        ]
+
+        rows = matcher.score_batch(requirements_list)
+
+        for requirements, row in zip(requirements_list, rows):
+            expected = [_reference_score(role, requirements) for role in matcher.roles]
+            assert row == pytest.approx(expected)
+
+    def test_match_batch_top_k(self):
+        """top_k keeps the best matches in score order."""
+        registry = RoleRegistry.create_standard_registry()
+        matcher = RoleMatcher(registry)
+
+        results = matcher.match_batch(
+            [{"tools": ["pytest", "git", "ruff"]}, {"tools": ["jupyter"]}],
+            min_score=0.1,
+            top_k=2,
+        )
+
+        assert [m["role"].name for m in results[0]] == ["developer", "reviewer"]
+        assert [m["role"].name for m in results[1]] == ["researcher", "analyst"]
+
+    def test_index_follows_registry_changes(self):
+        """Roles registered after the first match are picked up."""
+        registry = RoleRegistry()
+        matcher = RoleMatcher(registry)
+        assert matcher.find_matching_roles({"capabilities": ["rust"]}) == []
+
+        registry.register_role(
+            AgentRole(
+                name="rustacean",
+                description="Rust developer",
+                capabilities=["Rust"],
+                tools=["cargo"],
+                domain_knowledge=[],
+            )
+        )
+
+        matches = matcher.find_matching_roles({"capabilities": ["rust"]})
+        assert matches[0]["role"].name == "rustacean"
+        assert matches[0]["score"] == 1.0
+
+    def test_large_batch_matches_reference(self):
+        """Test scoring 500 subtasks against 50 roles matches per-pair scans."""
+        rng = random.Random(11)
+        vocabulary = [f"term_{i}" for i in range(200)]
+        registry = RoleRegistry()
+        for i in range(50):
+            registry.register_role(
+                AgentRole(
+                    name=f"role-{i}",
+                    description=f"Role {i}",
+                    capabilities=rng.sample(vocabulary, 8),
+                    tools=rng.sample(vocabulary, 8),
+                    domain_knowledge=rng.sample(vocabulary, 8),
+                )
+            )
+        requirements_list = [
+            {
+                "capabilities": rng.sample(vocabulary, 3),
+                "tools": rng.sample(vocabulary, 2),
+                "domain_knowledge": rng.sample(vocabulary, 2),
+            }
+            for _ in range(500)
+        ]
+        matcher = RoleMatcher(registry)
+        matcher.ENCODED_CACHE_SIZE = 100
+
+        rows = matcher.score_batch(requirements_list)
+
+        expected = [
+            [_reference_score(role, requirements) for role in matcher.roles]
+            for requirements in requirements_list
+        ]
+        assert rows == expected
+        assert len(matcher._encoded) == 100
@@ -1,5 +1,7 @@
 """Tests for task assignment optimizer."""
 
+import random
+
 import pytest
 
 from src.core.task_assigner import TaskAssigner, WorkloadInfo
@@ -372,3 +374,151 @@ class TestTaskAssigner:
 
         # Verify only agent 1 has the task
         assert task.assigned_agent == "backend-1"
+
+
+class TestWorkStealing:
+    """Test per-agent queues and work stealing."""
+
+    @pytest.fixture
+    def agents(self):
+        """Two python agents and one react agent."""
+        return [
+            Agent(
+                id="py-1",
+                role="backend_developer",
+                capabilities=[AgentCapability(name="python", description="Python", tools=[])],
+            ),
+            Agent(
+                id="py-2",
+                role="backend_developer",
+                capabilities=[AgentCapability(name="python", description="Python", tools=[])],
+            ),
+            Agent(
+                id="ui-1",
+                role="frontend_developer",
+                capabilities=[AgentCapability(name="react", description="React", tools=[])],
+            ),
+        ]
+
+    def test_own_queue_in_priority_order(self, agents):
+        """Agents take their own claimed tasks highest priority first."""
+        assigner = TaskAssigner(agents)
+        assigner.add_tasks([
+            Subtask(
+                id="low",
+                description="Low",
+                requirements={"capabilities": ["react"]},
+                metadata={"priority": "low"},
+            ),
+            Subtask(
+                id="high",
+                description="High",
+                requirements={"capabilities": ["react"]},
+                metadata={"priority": "high"},
+            ),
+        ])
+        assigner.assign_tasks()
+
+        assert assigner.queue_length("ui-1") == 2
+        assert assigner.next_task_for("ui-1").id == "high"
+        assert assigner.next_task_for("ui-1").id == "low"
+        assert assigner.next_task_for("ui-1") is None
+
+    def test_idle_agent_steals_from_busiest_capable_peer(self, agents):
+        """An idle agent takes queued work it can do and becomes its owner."""
+        assigner = TaskAssigner(agents)
+        assigner.add_tasks([
+            Subtask(id=f"py-{i}", description="Python", requirements={"capabilities": ["python"]})
+            for i in range(4)
+        ])
+        assigner.assign_tasks()
+
+        # py-2 drains its own queue, then steals from py-1's
+        assert assigner.next_task_for("py-2") is not None
+        assert assigner.next_task_for("py-2") is not None
+        stolen = assigner.next_task_for("py-2")
+
+        assert stolen is not None
+        assert stolen.assigned_agent == "py-2"
+        assert assigner.queue_length("py-1") == 1
+        assert assigner._get_agent_workload("py-1").assigned_tasks == 1
+        assert assigner._get_agent_workload("py-2").assigned_tasks == 3
+        assert stolen.id in agents[1].assigned_tasks
+        assert stolen.id not in agents[0].assigned_tasks
+
+    def test_no_stealing_without_capability(self, agents):
+        """Agents never steal tasks they cannot do."""
+        assigner = TaskAssigner(agents)
+        assigner.add_tasks([
+            Subtask(id=f"py-{i}", description="Python", requirements={"capabilities": ["python"]})
+            for i in range(4)
+        ])
+        assigner.assign_tasks()
+
+        assert assigner.next_task_for("ui-1") is None
+        assert assigner.queue_length("py-1") + assigner.queue_length("py-2") == 4
+
+    def test_release_removes_from_queue(self, agents):
+        """Released tasks leave the agent's queue and workload."""
+        assigner = TaskAssigner(agents)
+        assigner.add_tasks([
+            Subtask(
+                id="task-1",
+                description="UI",
+                requirements={"capabilities": ["react"]},
+                metadata={"estimated_tokens": 5000},
+            ),
+        ])
+        assigner.assign_tasks()
+
+        assert assigner.release_task("task-1")
+
+        assert assigner.queue_length("ui-1") == 0
+        assert assigner._get_agent_workload("ui-1").estimated_tokens == 0
+        assert assigner.next_task_for("ui-1") is None
+
+    def test_assign_and_drain_many_tasks(self):
+        """Test assigning 1k tasks across 50 agents and draining with stealing."""
+        rng = random.Random(3)
+        skills = [f"skill-{i}" for i in range(10)]
+        agents = [
+            Agent(
+                id=f"agent-{i}",
+                role="developer",
+                capabilities=[
+                    AgentCapability(name=name, description=name, tools=[])
+                    for name in rng.sample(skills, k=3)
+                ],
+            )
+            for i in range(50)
+        ]
+        tasks = [
+            Subtask(
+                id=f"task-{i}",
+                description=f"Task {i}",
+                requirements={"capabilities": rng.sample(skills, k=rng.randint(1, 2))},
+                metadata={
+                    "priority": rng.choice(["critical", "high", "medium", "low"]),
+                    "estimated_tokens": rng.randint(1, 50) * 1000,
+                },
+            )
+            for i in range(1000)
+        ]
+
+        assigner = TaskAssigner(agents)
+        assigner.add_tasks(tasks)
+        assignments = assigner.assign_tasks()
+
+        # Drain: agents repeatedly take work (own queue first, then steal)
+        taken = 0
+        while True:
+            progress = False
+            for agent in agents:
+                if assigner.next_task_for(agent.id) is not None:
+                    taken += 1
+                    progress = True
+            if not progress:
+                break
+
+        assert sum(1 for a in assignments.values() if a) == taken
+        assert all(assigner.queue_length(agent.id) == 0 for agent in agents)
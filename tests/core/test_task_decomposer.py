@@ -1,5 +1,11 @@
 """Tests for TaskDecomposer - recursive task decomposition and dependency graph generation."""
 
+import json
+
+import networkx as nx
+import pytest
+
+from src.core import task_decomposer
 from src.core.task_decomposer import (
     DecompositionResult,
     DependencyGraph,
@@ -821,3 +827,163 @@ class TestGenericDecomposition:
 
         # Execute should depend on prepare
         assert result.dependency_graph.has_dependency(execute_task.id, prepare_task.id)
+
+
+class TestDependencyGraphNative:
+    """Test the adjacency-list graph operations."""
+
+    def _diamond(self) -> DependencyGraph:
+        graph = DependencyGraph()
+        for node_id in ["a", "b", "c", "d"]:
+            graph.add_node(SubtaskNode(id=node_id, description=node_id, parent_id=None, depth=0))
+        graph.add_dependency("b", "a")
+        graph.add_dependency("c", "a")
+        graph.add_dependency("d", "b")
+        graph.add_dependency("d", "c")
+        return graph
+
+    def test_generations_match_networkx(self):
+        """Levels match NetworkX's topological generations."""
+        graph = self._diamond()
+
+        assert graph.topological_generations() == [["a"], ["b", "c"], ["d"]]
+        assert [sorted(g) for g in nx.topological_generations(graph._graph)] == [
+            ["a"],
+            ["b", "c"],
+            ["d"],
+        ]
+
+    def test_networkx_view_tracks_changes(self):
+        """The NetworkX view is rebuilt after edges are added."""
+        graph = self._diamond()
+        assert graph._graph.number_of_edges() == 4
+
+        graph.add_dependency("e", "d")
+
+        assert graph._graph.has_edge("d", "e")
+        assert graph.node_count() == 5
+
+    def test_cycle_raises_on_sort(self):
+        """Sorting a cyclic graph raises like NetworkX does."""
+        graph = self._diamond()
+        graph.add_dependency("a", "d")
+
+        assert not graph.is_acyclic()
+        with pytest.raises(nx.NetworkXUnfeasible):
+            graph.topological_sort()
+        with pytest.raises(nx.NetworkXUnfeasible):
+            graph.topological_generations()
+
+
+class TestDecompositionCache:
+    """Test deterministic IDs and decomposition caching."""
+
+    TASK = ParsedTask(
+        goal="Build a REST API with JWT authentication",
+        task_type=TaskType.SOFTWARE,
+        raw_description="Build a REST API with JWT authentication. Write tests and deploy it.",
+    )
+
+    def _shape(self, result: DecompositionResult) -> list[tuple]:
+        return [(st.id, st.description, st.dependencies) for st in result.subtasks]
+
+    def test_ids_are_deterministic(self):
+        """Separate decomposers produce identical IDs for the same task."""
+        first = TaskDecomposer(cache_size=0).decompose(self.TASK)
+        second = TaskDecomposer(cache_size=0).decompose(self.TASK)
+
+        assert self._shape(first) == self._shape(second)
+        assert len({st.id for st in first.subtasks}) == len(first.subtasks)
+
+    def test_ids_differ_between_tasks(self):
+        """Different goals do not share subtask IDs."""
+        other = ParsedTask(
+            goal="Build a REST API for orders",
+            task_type=TaskType.SOFTWARE,
+            raw_description="Build a REST API for orders. Write tests and deploy it.",
+        )
+        decomposer = TaskDecomposer()
+
+        first = {st.id for st in decomposer.decompose(self.TASK).subtasks}
+        second = {st.id for st in decomposer.decompose(other).subtasks}
+
+        assert not first & second
+
+    def test_cached_results_are_independent(self):
+        """Mutating a cached result does not leak into the next one."""
+        decomposer = TaskDecomposer()
+        first = decomposer.decompose(self.TASK)
+        first.subtasks[0].dependencies.append("bogus")
+        first.rationale.subtask_explanations.clear()
+
+        second = decomposer.decompose(self.TASK)
+
+        assert "bogus" not in second.subtasks[0].dependencies
+        assert second.rationale.subtask_explanations
+        assert second.task is self.TASK
+
+    def test_cache_matches_uncached(self):
+        """Cached decompositions equal freshly built ones."""
+        decomposer = TaskDecomposer()
+        decomposer.decompose(self.TASK)
+
+        cached = decomposer.decompose(self.TASK)
+        fresh = TaskDecomposer(cache_size=0).decompose(self.TASK)
+
+        assert self._shape(cached) == self._shape(fresh)
+        assert cached.get_parallel_groups() == fresh.get_parallel_groups()
+        assert cached.rationale.format_as_text() == fresh.rationale.format_as_text()
+
+    def test_disk_cache_round_trip(self, tmp_path):
+        """Decompositions persist across decomposer instances."""
+        cache_path = tmp_path / "decompositions.json"
+        first = TaskDecomposer(cache_path=cache_path).decompose(self.TASK)
+        assert cache_path.exists()
+
+        reader = TaskDecomposer(cache_path=cache_path)
+        reader._build_entry = None  # Any miss would fail loudly
+        second = reader.decompose(self.TASK)
+
+        assert self._shape(second) == self._shape(first)
+
+    def test_corrupt_disk_cache_ignored(self, tmp_path):
+        """An unreadable cache file falls back to decomposing."""
+        cache_path = tmp_path / "decompositions.json"
+        cache_path.write_text("{not json")
+
+        result = TaskDecomposer(cache_path=cache_path).decompose(self.TASK)
+
+        assert len(result.subtasks) >= 3
+
+    def test_disk_cache_ignored_after_code_change(self, tmp_path, monkeypatch):
+        """Entries persisted by different templates or strategies are not served."""
+        cache_path = tmp_path / "decompositions.json"
+        TaskDecomposer(cache_path=cache_path).decompose(self.TASK)
+
+        monkeypatch.setattr(task_decomposer, "_strategy_fingerprint", lambda: "edited")
+        reader = TaskDecomposer(cache_path=cache_path)
+        built = []
+        build_entry = reader._build_entry
+        reader._build_entry = lambda task, key: built.append(key) or build_entry(task, key)
+        reader.decompose(self.TASK)
+
+        assert len(built) == 1
+
+    def test_disk_hits_count_as_use_for_eviction(self, tmp_path, monkeypatch):
+        """Reading an entry from disk protects it from eviction."""
+        cache_path = tmp_path / "decompositions.json"
+        tasks = [
+            ParsedTask(goal=f"Build service {name}", task_type=TaskType.SOFTWARE)
+            for name in ("a", "b", "c")
+        ]
+        monkeypatch.setattr(TaskDecomposer, "MAX_PERSISTED", 2)
+        writer = TaskDecomposer(cache_path=cache_path)
+        writer.decompose(tasks[0])
+        writer.decompose(tasks[1])
+
+        reader = TaskDecomposer(cache_path=cache_path)
+        reader.decompose(tasks[0])  # Disk hit
+        reader.decompose(tasks[2])  # Evicts the least recently used entry
+
+        kept = set(json.loads(cache_path.read_text())["decompositions"])
+        assert kept == {reader.cache_key(tasks[0]), reader.cache_key(tasks[2])}
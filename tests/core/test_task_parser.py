@@ -1,7 +1,6 @@
 """Tests for TaskParser - extracting goal, constraints, context from task descriptions."""
 
-
-from src.core.task_parser import ParsedTask, TaskParser
+from src.core.task_parser import ParsedTask, TaskParser, tokenize
 from src.models.enums import TaskType
 
 
@@ -329,3 +328,89 @@ class TestClarificationRequests:
 
         clarifications = result.generate_clarification_requests()
         assert len(clarifications) <= 1
+
+
+class TestTokenizer:
+    """Test the shared single-pass tokenizer."""
+
+    def test_words_and_sentences(self):
+        """Words are lowercased and deduplicated; sentences keep their text."""
+        tokens = tokenize("Build an API. Test the API!! Then   deploy")
+
+        assert tokens.words == {"build", "an", "api", "test", "the", "then", "deploy"}
+        assert tokens.sentences == ("Build an API", "Test the API", "Then   deploy")
+        assert tokens.word_count == 8
+
+    def test_terminators_only(self):
+        """Text with no sentence content has no sentences."""
+        assert tokenize("...!?").sentences == ()
+
+
+class TestParseCache:
+    """Test the LRU parse cache."""
+
+    DESCRIPTION = (
+        "Build a REST API for user authentication using Python. "
+        "Must handle 1000 requests per second with 80% test coverage."
+    )
+
+    def test_repeated_description_hits_cache(self):
+        """Descriptions differing only in surrounding whitespace share an entry."""
+        parser = TaskParser()
+
+        first = parser.parse(self.DESCRIPTION)
+        second = parser.parse(f"  {self.DESCRIPTION}\n")
+
+        assert second == first
+        assert parser.cache_info() == {"hits": 1, "misses": 1, "size": 1, "maxsize": 256}
+
+    def test_cached_results_are_independent_copies(self):
+        """Mutating a returned parse does not affect later hits."""
+        parser = TaskParser()
+
+        first = parser.parse(self.DESCRIPTION)
+        first.ambiguities.append("mutated")
+        first.constraints.setdefault("time", []).append("mutated")
+
+        second = parser.parse(self.DESCRIPTION)
+        assert "mutated" not in second.ambiguities
+        assert "time" not in second.constraints
+
+    def test_cache_matches_uncached_parse(self):
+        """Cached and uncached parsers produce the same result."""
+        assert TaskParser().parse(self.DESCRIPTION) == TaskParser(cache_size=0).parse(
+            self.DESCRIPTION
+        )
+
+    def test_least_recently_used_evicted(self):
+        """The oldest untouched entry is evicted first."""
+        parser = TaskParser(cache_size=2)
+        parser.parse("Build service one")
+        parser.parse("Build service two")
+        parser.parse("Build service one")
+        parser.parse("Build service three")
+
+        parser.parse("Build service one")
+        assert parser.cache_info()["hits"] == 2
+        parser.parse("Build service two")
+        assert parser.cache_info()["misses"] == 4
+
+    def test_clear_cache(self):
+        """Clearing drops entries and statistics."""
+        parser = TaskParser()
+        parser.parse(self.DESCRIPTION)
+
+        parser.clear_cache()
+
+        assert parser.cache_info() == {"hits": 0, "misses": 0, "size": 0, "maxsize": 256}
+
+    def test_cached_parse_matches_fresh_parse(self):
+        """Repeated long goals are served from the cache with the same result."""
+        description = " ".join([self.DESCRIPTION] * 20)
+        uncached = TaskParser(cache_size=0)
+        cached = TaskParser()
+
+        results = [cached.parse(description) for _ in range(20)]
+
+        assert all(result == uncached.parse(description) for result in results)
+        assert cached.cache_info()["hits"] == 19
@@ -0,0 +1,13 @@
+"""Shared fixtures for orchestrator tests."""
+
+import pytest
+
+from src.orchestrator.wrapper import OrchestratorWrapper
+
+
+@pytest.fixture(autouse=True)
+def decomposition_cache_file(tmp_path, monkeypatch):
+    """Keep the wrapper's on-disk decomposition cache out of the checkout."""
+    cache_file = tmp_path / ".decomposition_cache.json"
+    monkeypatch.setattr(OrchestratorWrapper, "DECOMPOSITION_CACHE", cache_file)
+    return cache_file
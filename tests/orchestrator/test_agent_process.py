@@ -0,0 +1,80 @@
+"""Tests for AgentProcess output capture."""
+
+from src.orchestrator.agent_runner import AgentProcess
+
+
+def _agent(**kwargs) -> AgentProcess:
+    return AgentProcess(agent_id="coder-1.1", work_stream_id="1.1", **kwargs)
+
+
+class TestOutputCapture:
+    """Tests for head/tail/important line storage."""
+
+    def test_short_output_kept_in_full(self):
+        """Test that short output is returned unchanged."""
+        agent = _agent()
+        for i in range(50):
+            agent.add_output_line(f"line {i}")
+
+        assert agent.output_lines == [f"line {i}" for i in range(50)]
+
+    def test_tail_is_bounded(self):
+        """Test that only the most recent lines are kept after the head."""
+        agent = _agent()
+        for i in range(1000):
+            agent.add_output_line(f"line {i}")
+
+        lines = agent.output_lines
+        assert lines[:AgentProcess.HEAD_LIMIT] == [f"line {i}" for i in range(100)]
+        assert "700 lines omitted" in lines[AgentProcess.HEAD_LIMIT]
+        assert lines[-AgentProcess.TAIL_LIMIT:] == [f"line {i}" for i in range(800, 1000)]
+        assert agent.total_lines == 1000
+
+    def test_important_lines_case_insensitive(self):
+        """Test that error markers are detected regardless of case."""
+        agent = _agent()
+        agent.add_output_line("all good")
+        agent.add_output_line("Traceback (most recent call last):")
+        agent.add_output_line("tests FAILED")
+        agent.add_output_line("DeprecationWarning: old api")
+
+        assert agent.important_lines == [
+            "[L2] Traceback (most recent call last):",
+            "[L3] tests FAILED",
+            "[L4] DeprecationWarning: old api",
+        ]
+
+    def test_output_range_from_memory(self):
+        """Test that ranges without spilling only cover buffered lines."""
+        agent = _agent()
+        for i in range(1000):
+            agent.add_output_line(f"line {i}")
+
+        assert agent.get_output_range(98, 102) == ["line 98", "line 99"]
+        assert agent.get_output_range(998) == ["line 998", "line 999"]
+        assert agent.get_output_range(500, 510) == []
+
+    def test_output_range_from_spill_file(self, tmp_path):
+        """Test that any range can be retrieved once spilled to disk."""
+        spill = tmp_path / "output" / "agent.log"
+        agent = _agent(spill_file=spill)
+        for i in range(1000):
+            agent.add_output_line(f"line {i} ✓")
+
+        assert agent.get_output_range(500, 503) == ["line 500 ✓", "line 501 ✓", "line 502 ✓"]
+        agent.close_spill()
+        assert agent.get_output_range(997) == ["line 997 ✓", "line 998 ✓", "line 999 ✓"]
+        assert agent.get_output_range(0, 1) == ["line 0 ✓"]
+        assert len(spill.read_text().splitlines()) == 1000
+
+    def test_large_capture_stays_bounded(self, tmp_path):
+        """Test that 100k lines keep memory bounded while the spill file has them all."""
+        lines = [f"step {i}: compiling module_{i % 97}.py" for i in range(100_000)]
+        agent = _agent(spill_file=tmp_path / "agent.log")
+        for line in lines:
+            agent.add_output_line(line)
+        agent.close_spill()
+
+        assert agent.total_lines == 100_000
+        assert len(agent.output_lines) == AgentProcess.HEAD_LIMIT + 1 + AgentProcess.TAIL_LIMIT
+        assert agent.get_output_range(50_000, 50_001) == [lines[50_000]]
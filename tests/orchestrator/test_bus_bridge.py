@@ -0,0 +1,148 @@
+"""Tests for the background message bus bridge."""
+
+import asyncio
+import queue
+import threading
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.coordination.nats_bus import MessageType, NATSMessageBus
+from src.coordination.transport import LoopbackTransport
+from src.orchestrator.bus_bridge import BusBridge
+
+
+class TestBusBridge:
+    """Test submission, ordering and failure handling."""
+
+    def test_call_returns_result(self):
+        """call() runs the operation on the bridge's loop and returns its result."""
+        bridge = BusBridge(bus_factory=AsyncMock)
+
+        async def which_thread(bus):
+            return threading.current_thread().name
+
+        try:
+            assert bridge.call(which_thread) == "bus-bridge"
+        finally:
+            bridge.close()
+
+    def test_single_connection_shared_by_all_callers(self):
+        """Every submission from every thread uses one bus connection."""
+        created = []
+
+        def factory():
+            bus = AsyncMock()
+            created.append(bus)
+            return bus
+
+        bridge = BusBridge(bus_factory=factory)
+        threads = [
+            threading.Thread(target=lambda: bridge.submit(lambda bus: bus.publish("x", None)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert bridge.flush()
+        bridge.close()
+        assert len(created) == 1
+        assert created[0].publish.await_count == 8
+        assert created[0].disconnect.await_count == 1
+
+    def test_fifo_order(self):
+        """Submissions from one thread run in order."""
+        bridge = BusBridge(bus_factory=AsyncMock)
+        seen = []
+
+        def record(i):
+            async def op(bus):
+                await asyncio.sleep(0.001 * (5 - i))  # Earlier ops are slower
+                seen.append(i)
+            return op
+
+        for i in range(5):
+            bridge.submit(record(i))
+        assert bridge.flush()
+        bridge.close()
+
+        assert seen == [0, 1, 2, 3, 4]
+
+    def test_backlog_full_applies_backpressure(self):
+        """A full backlog blocks submitters, then rejects them."""
+        release = threading.Event()
+
+        async def stuck(bus):
+            while not release.is_set():
+                await asyncio.sleep(0.005)
+
+        bridge = BusBridge(bus_factory=AsyncMock, max_pending=2)
+        bridge.submit(stuck)
+        bridge.submit(stuck)
+
+        start = time.perf_counter()
+        with pytest.raises(queue.Full):
+            bridge.submit(stuck, timeout=0.05)
+        waited = time.perf_counter() - start
+
+        release.set()
+        assert bridge.flush()
+        bridge.close()
+        assert waited >= 0.05
+        assert bridge.rejected == 1
+        assert bridge.completed == 2
+
+    def test_connect_failure_backs_off(self):
+        """After a failed connect, submissions fail fast without reconnecting."""
+        bus = AsyncMock()
+        bus.connect.side_effect = OSError("connection refused")
+        bridge = BusBridge(bus_factory=lambda: bus)
+
+        futures = [bridge.submit(lambda b: b.publish("x", None)) for _ in range(3)]
+        assert bridge.flush()
+        bridge.close()
+
+        assert all(isinstance(f.exception(), ConnectionError) for f in futures)
+        assert bus.connect.await_count == 1
+        assert bridge.failed == 3
+
+    def test_closed_bridge_rejects_work(self):
+        """Submitting after close raises."""
+        bridge = BusBridge(bus_factory=AsyncMock)
+        bridge.call(lambda bus: bus.publish("x", None))
+        bridge.close()
+
+        with pytest.raises(RuntimeError):
+            bridge.submit(lambda bus: bus.publish("x", None))
+
+
+class TestBusBridgeBroadcasts:
+    """Test broadcasts through the bridge over a real bus."""
+
+    def test_broadcasts_from_many_agents_delivered_in_order(self):
+        """Every broadcast reaches subscribers, in submission order."""
+        transport = LoopbackTransport()
+        bridge = BusBridge(bus_factory=lambda: NATSMessageBus(transport=transport))
+        received = []
+
+        async def on_message(msg):
+            received.append(msg.content["i"])
+
+        try:
+            bridge.call(lambda bus: bus.subscribe("orchestrator.broadcast.>", on_message))
+            for i in range(200):
+                bridge.submit(
+                    lambda bus, i=i: bus.broadcast(
+                        f"agent-{i % 50}", MessageType.STATUS_UPDATE, {"i": i}
+                    )
+                )
+            assert bridge.flush()
+            bridge.call(lambda bus: transport.drain())
+        finally:
+            bridge.close()
+
+        assert bridge.failed == 0
+        assert received == list(range(200))
@@ -0,0 +1,162 @@
+"""Tests for the atomic work stream claims store."""
+
+import json
+import multiprocessing
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from src.orchestrator.agent_runner import WorkStreamCoordinator
+from src.orchestrator.claims_store import ClaimsStore
+
+
+def _claim_all(db_path, agent_id, stream_ids, results):
+    """Try to claim every stream from a separate process."""
+    store = ClaimsStore(db_path)
+    won = [ws for ws in stream_ids if store.claim(ws, agent_id)]
+    store.close()
+    results.put((agent_id, won))
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a claims store in a temp directory."""
+    store = ClaimsStore(tmp_path / "claims.db")
+    yield store
+    store.close()
+
+
+class TestClaimsStore:
+    """Tests for ClaimsStore compare-and-set semantics."""
+
+    def test_claim_and_owner(self, store):
+        """Test claiming an unclaimed stream."""
+        assert store.claim("1.1", "agent-1") is True
+        assert store.owner("1.1") == "agent-1"
+
+    def test_claim_is_exclusive(self, store):
+        """Test that a live claim blocks other agents."""
+        store.claim("1.1", "agent-1")
+        assert store.claim("1.1", "agent-2") is False
+        assert store.owner("1.1") == "agent-1"
+
+    def test_same_agent_reclaim_renews(self, store):
+        """Test that re-claiming by the owner succeeds."""
+        store.claim("1.1", "agent-1")
+        assert store.claim("1.1", "agent-1") is True
+
+    def test_release(self, store):
+        """Test releasing owned, foreign and unclaimed streams."""
+        store.claim("1.1", "agent-1")
+        assert store.release("1.1", "agent-2") is False
+        assert store.release("1.1", "agent-1") is True
+        assert store.release("1.1", "agent-1") is True
+        assert store.owner("1.1") is None
+
+    def test_expired_claim_can_be_taken_over(self, tmp_path):
+        """Test TTL expiry without any sweep."""
+        store = ClaimsStore(tmp_path / "claims.db", ttl_seconds=0.05)
+        store.claim("1.1", "agent-1")
+        time.sleep(0.1)
+
+        assert store.owner("1.1") is None
+        assert store.active_claims() == {}
+        assert store.claim("1.1", "agent-2") is True
+        store.close()
+
+    def test_renew_extends_ttl(self, tmp_path):
+        """Test that renewing keeps a claim alive."""
+        store = ClaimsStore(tmp_path / "claims.db", ttl_seconds=0.2)
+        store.claim("1.1", "agent-1")
+        time.sleep(0.1)
+        assert store.renew("1.1", "agent-1") is True
+        time.sleep(0.15)
+
+        assert store.owner("1.1") == "agent-1"
+        assert store.renew("1.1", "agent-2") is False
+        store.close()
+
+    def test_dead_owner_can_be_taken_over(self, store):
+        """Test takeover when the owning process has exited."""
+        proc = subprocess.Popen([sys.executable, "-c", "pass"])
+        proc.wait()
+
+        assert store.claim("1.1", "agent-1", pid=proc.pid) is True
+        assert store.owner("1.1") is None
+        assert store.claim("1.1", "agent-2") is True
+
+    def test_purge_expired(self, tmp_path):
+        """Test housekeeping of expired rows."""
+        store = ClaimsStore(tmp_path / "claims.db", ttl_seconds=0.01)
+        store.claim("1.1", "agent-1")
+        store.claim("1.2", "agent-1")
+        time.sleep(0.05)
+
+        assert store.purge_expired() == 2
+        store.close()
+
+    def test_import_json_claims(self, store, tmp_path):
+        """Test importing live claims from the legacy JSON file."""
+        legacy = tmp_path / ".work_claims.json"
+        legacy.write_text(json.dumps({"2.1": {"agent_id": "agent-9", "pid": None}}))
+
+        assert store.import_json_claims(legacy) == 1
+        assert store.active_claims() == {"2.1": "agent-9"}
+
+    def test_coordinator_migrates_legacy_file(self, tmp_path):
+        """Test that the coordinator imports and removes the legacy file."""
+        legacy = tmp_path / ".work_claims.json"
+        legacy.write_text(json.dumps({"2.1": {"agent_id": "agent-9"}}))
+
+        coordinator = WorkStreamCoordinator(ClaimsStore(tmp_path / ".work_claims.db"))
+        assert coordinator.get_claimed_streams() == {"2.1": "agent-9"}
+        assert not legacy.exists()
+
+
+class TestClaimsContention:
+    """Contention tests: N concurrent claimers over shared streams."""
+
+    def test_thread_contention(self, store):
+        """Test 32 threads racing for 50 streams, one winner each."""
+        streams = [f"{i // 10}.{i % 10}" for i in range(50)]
+        winners: dict[str, list[str]] = {ws: [] for ws in streams}
+        lock = threading.Lock()
+
+        def claimer(agent_id):
+            for ws in streams:
+                if store.claim(ws, agent_id):
+                    with lock:
+                        winners[ws].append(agent_id)
+
+        threads = [threading.Thread(target=claimer, args=(f"agent-{i}",)) for i in range(32)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert all(len(w) == 1 for w in winners.values())
+        assert len(store.active_claims()) == 50
+
+    def test_process_contention(self, tmp_path):
+        """Test 8 processes racing for 50 streams, one winner each."""
+        db_path = tmp_path / "claims.db"
+        ClaimsStore(db_path).close()
+        streams = [f"s{i}" for i in range(50)]
+
+        ctx = multiprocessing.get_context("spawn")
+        results = ctx.Queue()
+        procs = [
+            ctx.Process(target=_claim_all, args=(db_path, f"agent-{i}", streams, results))
+            for i in range(8)
+        ]
+        for proc in procs:
+            proc.start()
+        outcomes = [results.get(timeout=60) for _ in procs]
+        for proc in procs:
+            proc.join(timeout=60)
+
+        won = [ws for _, claimed in outcomes for ws in claimed]
+        assert sorted(won) == sorted(streams)
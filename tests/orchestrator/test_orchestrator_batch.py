@@ -0,0 +1,155 @@
+"""Tests for the event-driven Orchestrator.run_batch scheduler."""
+
+import threading
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from src.orchestrator.agent_runner import AgentProcess, AgentState
+from src.orchestrator.orchestrator import Orchestrator, OrchestratorConfig
+from src.orchestrator.roadmap_state import clear_roadmap_states
+from src.orchestrator.roadmap_writer import RoadmapWriter
+from src.orchestrator.work_stream import WorkStreamStatus, clear_roadmap_cache
+
+
+class FakeRunner:
+    """AgentRunner stand-in whose agents complete their phase after a delay."""
+
+    def __init__(self, project_root, max_concurrent, timeout_seconds, durations):
+        self.roadmap_path = project_root / "plans" / "roadmap.md"
+        self.max_concurrent = max_concurrent
+        self.durations = durations
+        self.agents: dict[str, AgentProcess] = {}
+        self.callbacks = []
+        self.peak_active = 0
+        self._lock = threading.Lock()
+
+    def add_callback(self, callback):
+        self.callbacks.append(callback)
+
+    def get_claimed_streams(self):
+        return {a.work_stream_id: a.agent_id for a in self.get_active_agents()}
+
+    def get_active_agents(self):
+        return [a for a in list(self.agents.values()) if not a.is_finished]
+
+    def get_running_agents(self):
+        return [a for a in list(self.agents.values()) if a.is_running]
+
+    def wait_for_all(self, timeout=None):
+        while self.get_active_agents():
+            time.sleep(0.01)
+        return True
+
+    def spawn_agent(self, work_stream_id, on_output=None):
+        agent = AgentProcess(
+            agent_id=f"coder-{work_stream_id}",
+            work_stream_id=work_stream_id,
+            state=AgentState.RUNNING,
+            started_at=datetime.now(),
+        )
+        self.agents[agent.agent_id] = agent
+        self.peak_active = max(self.peak_active, len(self.get_active_agents()))
+        threading.Timer(self.durations.get(work_stream_id, 0.05), self._finish, [agent]).start()
+        return agent
+
+    def _finish(self, agent):
+        with self._lock:
+            writer = RoadmapWriter(self.roadmap_path)
+            writer.set_status(agent.work_stream_id, WorkStreamStatus.COMPLETE)
+            writer.commit()
+        agent.exit_code = 0
+        agent.state = AgentState.COMPLETED
+        for callback in self.callbacks:
+            callback(agent)
+
+
+def _phase(phase_id, depends_on=None):
+    lines = [f"### Phase {phase_id}: Phase {phase_id}", "- **Status:** ⚪ Not Started"]
+    if depends_on:
+        lines.append(f"- **Depends On:** Phase {depends_on}")
+    return "\n".join(lines) + "\n\n"
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches():
+    """Keep parse caches and roadmap states per test."""
+    clear_roadmap_cache()
+    clear_roadmap_states()
+    yield
+    clear_roadmap_cache()
+    clear_roadmap_states()
+
+
+def _orchestrator(tmp_path, phases, durations=None, slots=2):
+    (tmp_path / "plans").mkdir()
+    (tmp_path / "plans" / "roadmap.md").write_text("# Roadmap\n\n## Batch 1\n\n" + phases)
+
+    def make_runner(project_root, max_concurrent, timeout_seconds):
+        return FakeRunner(project_root, max_concurrent, timeout_seconds, durations or {})
+
+    with patch("src.orchestrator.orchestrator.AgentRunner", side_effect=make_runner):
+        return Orchestrator(tmp_path, OrchestratorConfig(max_concurrent_agents=slots))
+
+
+class TestRunBatch:
+    """Tests for the completion-driven batch loop."""
+
+    def test_runs_dependency_chain_without_polling_delay(self, tmp_path):
+        """Test that work unblocked by a completion starts immediately."""
+        orchestrator = _orchestrator(
+            tmp_path, _phase("1.1") + _phase("1.2", "1.1") + _phase("1.3", "1.2")
+        )
+
+        start = time.monotonic()
+        agents = orchestrator.run_batch()
+        elapsed = time.monotonic() - start
+
+        assert [a.work_stream_id for a in agents] == ["1.1", "1.2", "1.3"]
+        assert all(a.state == AgentState.COMPLETED for a in agents)
+        assert elapsed < 2  # The old loop slept 10s after every spawn wave
+
+    def test_respects_concurrency_cap(self, tmp_path):
+        """Test that no more than max_concurrent_agents run at once."""
+        phases = "".join(_phase(f"1.{n}") for n in range(1, 9))
+        orchestrator = _orchestrator(tmp_path, phases, slots=3)
+
+        agents = orchestrator.run_batch()
+
+        assert len(agents) == 8
+        assert orchestrator.runner.peak_active <= 3
+
+    def test_reports_slot_metrics(self, tmp_path):
+        """Test that utilization and idle gaps are reported."""
+        phases = "".join(_phase(f"1.{n}") for n in range(1, 7))
+        durations = {f"1.{n}": 0.1 for n in range(1, 7)}
+        orchestrator = _orchestrator(tmp_path, phases, durations, slots=2)
+
+        orchestrator.run_batch()
+        stats = orchestrator.last_batch_stats
+
+        assert stats.agents_spawned == 6
+        assert len(stats.idle_gaps) == 4  # Every refill after the first wave
+        assert stats.max_idle_gap < 0.5
+        assert stats.slot_utilization > 0.6
+        event = [e for e in orchestrator.events if e.event_type == "batch_stats"][-1]
+        assert event.data["agents_spawned"] == 6
+
+    def test_no_wait_returns_after_first_wave(self, tmp_path):
+        """Test wait=False spawns one wave and returns."""
+        phases = "".join(_phase(f"1.{n}") for n in range(1, 5))
+        orchestrator = _orchestrator(tmp_path, phases, slots=2)
+
+        agents = orchestrator.run_batch(wait=False)
+
+        assert len(agents) == 2
+        orchestrator.runner.wait_for_all()
+
+    def test_empty_roadmap(self, tmp_path):
+        """Test that a batch with nothing to do returns immediately."""
+        orchestrator = _orchestrator(tmp_path, "")
+
+        assert orchestrator.run_batch() == []
+        assert orchestrator.last_batch_stats.agents_spawned == 0
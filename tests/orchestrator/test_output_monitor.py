@@ -0,0 +1,144 @@
+"""Tests for the event-driven agent output monitor."""
+
+import heapq
+import subprocess
+import sys
+import threading
+import time
+from unittest.mock import MagicMock
+
+from src.orchestrator.output_monitor import OutputMonitor, _Watch
+
+
+def _spawn(code: str) -> subprocess.Popen:
+    """Start a Python child whose stdout is piped."""
+    return subprocess.Popen(
+        [sys.executable, "-c", code],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+
+
+class _Collector:
+    """Collects output batches and the exit result of one watched process."""
+
+    def __init__(self):
+        self.batches: list[list[str]] = []
+        self.result: tuple[int | None, bool] | None = None
+        self.done = threading.Event()
+
+    @property
+    def lines(self) -> list[str]:
+        return [line for batch in self.batches for line in batch]
+
+    def on_lines(self, lines: list[str]) -> None:
+        self.batches.append(lines)
+
+    def on_exit(self, returncode: int | None, timed_out: bool) -> None:
+        self.result = (returncode, timed_out)
+        self.done.set()
+
+
+def _watch(monitor, code, timeout=None) -> _Collector:
+    collector = _Collector()
+    monitor.watch(_spawn(code), collector.on_lines, collector.on_exit, timeout=timeout)
+    return collector
+
+
+class TestOutputMonitor:
+    """Tests for OutputMonitor."""
+
+    def test_dispatches_lines_and_exit_code(self):
+        """Test that all lines arrive before the exit callback."""
+        monitor = OutputMonitor()
+        collector = _watch(monitor, "print('one'); print('two  '); print('three', end='')")
+
+        assert collector.done.wait(10)
+        assert collector.lines == ["one", "two", "three"]
+        assert collector.result == (0, False)
+
+    def test_preserves_blank_lines(self):
+        """Test that empty output lines are dispatched."""
+        monitor = OutputMonitor()
+        collector = _watch(monitor, "print('a'); print(); print('b')")
+
+        assert collector.done.wait(10)
+        assert collector.lines == ["a", "", "b"]
+
+    def test_nonzero_exit(self):
+        """Test that failing processes report their exit code."""
+        monitor = OutputMonitor()
+        collector = _watch(monitor, "import sys; sys.exit(3)")
+
+        assert collector.done.wait(10)
+        assert collector.result == (3, False)
+
+    def test_silent_process_times_out(self):
+        """Test that a hung process with no output is killed on time."""
+        monitor = OutputMonitor()
+        start = time.monotonic()
+        collector = _watch(monitor, "import time; time.sleep(60)", timeout=0.5)
+
+        assert collector.done.wait(10)
+        elapsed = time.monotonic() - start
+        returncode, timed_out = collector.result
+        assert timed_out is True
+        assert returncode != 0
+        assert elapsed < 5
+
+    def test_reused_fd_keeps_its_own_deadline(self):
+        """Test that a stale deadline for a reused fd does not kill its new owner."""
+        monitor = OutputMonitor()
+        fd = 99
+        stale = _Watch(MagicMock(), fd, lambda lines: None, lambda *args: None, 0.0)
+        stale.process.poll.return_value = None
+        current = _Watch(
+            MagicMock(), fd, lambda lines: None, lambda *args: None, time.monotonic() + 30
+        )
+        current.process.poll.return_value = None
+        monitor._watches[fd] = current
+        heapq.heappush(monitor._deadlines, (0.0, 0, stale))
+
+        monitor._check_deadlines()
+
+        assert monitor._deadlines == []
+        stale.process.kill.assert_not_called()
+        current.process.kill.assert_not_called()
+        assert current.timed_out is False
+
+    def test_lines_are_batched(self):
+        """Test that a burst of output is dispatched in a few batches."""
+        monitor = OutputMonitor()
+        collector = _watch(monitor, "print('\\n'.join(str(i) for i in range(5000)))")
+
+        assert collector.done.wait(10)
+        assert collector.lines == [str(i) for i in range(5000)]
+        assert len(collector.batches) < 100
+
+    def test_callback_errors_do_not_stop_monitor(self):
+        """Test that a raising output callback does not break supervision."""
+        monitor = OutputMonitor()
+        done = threading.Event()
+
+        def bad_lines(lines):
+            raise ValueError("boom")
+
+        monitor.watch(_spawn("print('x')"), bad_lines, lambda rc, t: done.set())
+        assert done.wait(10)
+
+    def test_supervises_many_processes_with_one_thread(self):
+        """Test 100 concurrent processes on a single monitor thread."""
+        monitor = OutputMonitor()
+        threads_before = threading.active_count()
+        code = "import time\nfor i in range(20):\n    print(i, flush=True)\n    time.sleep(0.01)"
+
+        collectors = [_watch(monitor, code) for _ in range(100)]
+        peak_threads = threading.active_count() - threads_before
+        for collector in collectors:
+            assert collector.done.wait(60)
+
+        assert all(c.lines == [str(i) for i in range(20)] for c in collectors)
+        assert all(c.result == (0, False) for c in collectors)
+        assert peak_threads <= 1 + OutputMonitor.EXIT_WORKERS
+        assert monitor.watched_count == 0
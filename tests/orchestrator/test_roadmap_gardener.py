@@ -174,58 +174,6 @@ class TestRoadmapGardenerInit:
         assert gardener.archive_path == temp_project / "plans" / "completed" / "roadmap-archive.md"
 
 
-class TestParseDependencies:
-    """Tests for _parse_dependencies method."""
-
-    def test_parse_single_dependency(self, temp_project, sample_roadmap_content):
-        """Test parsing a single dependency."""
-        (temp_project / "plans" / "roadmap.md").write_text(sample_roadmap_content)
-        gardener = RoadmapGardener(project_root=temp_project)
-
-        deps = gardener._parse_dependencies("Phase 1.1")
-        assert deps == ["1.1"]
-
-    def test_parse_multiple_dependencies_comma(self, temp_project, sample_roadmap_content):
-        """Test parsing multiple dependencies separated by comma."""
-        (temp_project / "plans" / "roadmap.md").write_text(sample_roadmap_content)
-        gardener = RoadmapGardener(project_root=temp_project)
-
-        deps = gardener._parse_dependencies("Phase 1.1, Phase 1.2")
-        assert deps == ["1.1", "1.2"]
-
-    def test_parse_multiple_dependencies_semicolon(self, temp_project, sample_roadmap_content):
-        """Test parsing multiple dependencies separated by semicolon."""
-        (temp_project / "plans" / "roadmap.md").write_text(sample_roadmap_content)
-        gardener = RoadmapGardener(project_root=temp_project)
-
-        deps = gardener._parse_dependencies("Phase 1.1; Phase 1.2")
-        assert deps == ["1.1", "1.2"]
-
-    def test_parse_dependency_with_checkmark(self, temp_project, sample_roadmap_content):
-        """Test parsing dependency with checkmark symbol."""
-        (temp_project / "plans" / "roadmap.md").write_text(sample_roadmap_content)
-        gardener = RoadmapGardener(project_root=temp_project)
-
-        deps = gardener._parse_dependencies("Phase 1.1 ✅")
-        assert deps == ["1.1"]
-
-    def test_parse_dependency_without_phase_prefix(self, temp_project, sample_roadmap_content):
-        """Test parsing dependency without 'Phase' prefix."""
-        (temp_project / "plans" / "roadmap.md").write_text(sample_roadmap_content)
-        gardener = RoadmapGardener(project_root=temp_project)
-
-        deps = gardener._parse_dependencies("1.1, 1.2")
-        assert deps == ["1.1", "1.2"]
-
-    def test_parse_empty_dependencies(self, temp_project, sample_roadmap_content):
-        """Test parsing empty dependency string."""
-        (temp_project / "plans" / "roadmap.md").write_text(sample_roadmap_content)
-        gardener = RoadmapGardener(project_root=temp_project)
-
-        deps = gardener._parse_dependencies("")
-        assert deps == []
-
-
 class TestGarden:
     """Tests for the garden method."""
 
@@ -0,0 +1,164 @@
+"""Tests for the materialized roadmap dependency state."""
+
+import pytest
+
+from src.orchestrator.roadmap_state import (
+    RoadmapState,
+    clear_roadmap_states,
+    get_roadmap_state,
+)
+from src.orchestrator.work_stream import (
+    WorkStream,
+    WorkStreamStatus,
+    clear_roadmap_cache,
+    get_prioritized_work_streams,
+    load_roadmap,
+    parse_roadmap,
+)
+
+
+def _phase(phase_id, status="⚪ Not Started", depends_on=None, tag=""):
+    lines = [f"### Phase {phase_id}: Phase {phase_id}{tag}", f"- **Status:** {status}"]
+    if depends_on:
+        lines.append(f"- **Depends On:** {depends_on}")
+    lines.append("- **Effort:** S")
+    return "\n".join(lines) + "\n\n"
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches():
+    """Keep parse caches and states per test."""
+    clear_roadmap_cache()
+    clear_roadmap_states()
+    yield
+    clear_roadmap_cache()
+    clear_roadmap_states()
+
+
+@pytest.fixture
+def roadmap(tmp_path):
+    """A small roadmap with a dependency chain and a fan-in."""
+    path = tmp_path / "roadmap.md"
+    path.write_text(
+        "# Roadmap\n\n## Batch 1\n\n"
+        + _phase("1.1", "✅ Complete")
+        + _phase("1.2", depends_on="Phase 1.1")
+        + _phase("1.3", "🔴 Blocked", depends_on="Phase 1.2")
+        + _phase("1.4", depends_on="Phase 1.2, Phase 1.3")
+        + "## Batch 2\n\n"
+        + _phase("2.1", depends_on="Phase 9.9 ✅")
+        + _phase("2.2", tag=" ⭐ BOOTSTRAP", depends_on="Phase 1.1")
+    )
+    return path
+
+
+def _set_status(path, phase_id, old, new):
+    content = path.read_text()
+    header = f"### Phase {phase_id}: Phase {phase_id}"
+    start = content.index(header)
+    status_at = content.index(f"- **Status:** {old}", start)
+    path.write_text(
+        content[:status_at] + f"- **Status:** {new}" + content[status_at + 14 + len(old):]
+    )
+
+
+class TestRoadmapState:
+    """Tests for RoadmapState."""
+
+    def test_ready_frontier(self, roadmap):
+        """Test the initial frontier."""
+        state = get_roadmap_state(roadmap)
+
+        assert [ws.id for ws in state.ready()] == ["1.2", "2.1", "2.2"]
+        assert [ws.id for ws in state.prioritized()] == ["2.2", "1.2", "2.1"]
+        assert [ws.id for ws in state.bootstrap()] == ["2.2"]
+
+    def test_dependency_edges(self, roadmap):
+        """Test forward and reverse edges."""
+        state = get_roadmap_state(roadmap)
+
+        assert state.dependencies("1.4") == ("1.2", "1.3")
+        assert state.dependents("1.2") == {"1.3", "1.4"}
+        assert state.pending_dependencies("1.4") == ["1.2", "1.3"]
+        assert state.dependencies_met("1.2") is True
+
+    def test_completion_updates_frontier_incrementally(self, roadmap):
+        """Test that completing a phase re-evaluates only what changed."""
+        state = get_roadmap_state(roadmap)
+        _set_status(roadmap, "1.2", "⚪ Not Started", "✅ Complete")
+        _set_status(roadmap, "1.3", "🔴 Blocked", "⚪ Not Started")
+
+        parsed = load_roadmap(roadmap)
+        assert state.refresh(parsed) == 2
+
+        assert [ws.id for ws in state.ready()] == ["1.3", "2.1", "2.2"]
+        assert state.pending_dependencies("1.4") == ["1.3"]
+
+        _set_status(roadmap, "1.3", "⚪ Not Started", "✅ Complete")
+        state = get_roadmap_state(roadmap)
+        assert state.is_ready("1.4")
+        assert "1.3" in state.completed_ids
+
+    def test_reopened_phase_blocks_dependents(self, roadmap):
+        """Test that un-completing a phase removes dependents from the frontier."""
+        state = get_roadmap_state(roadmap)
+        _set_status(roadmap, "1.1", "✅ Complete", "🔄 In Progress")
+
+        state = get_roadmap_state(roadmap)
+        assert not state.is_ready("1.2")
+        assert not state.is_ready("2.2")
+
+    def test_dependency_edit_relinks(self, roadmap):
+        """Test that changing a Depends On line rewires the DAG."""
+        get_roadmap_state(roadmap)
+        roadmap.write_text(roadmap.read_text().replace(
+            "- **Depends On:** Phase 1.2, Phase 1.3", "- **Depends On:** Phase 1.1"
+        ))
+
+        state = get_roadmap_state(roadmap)
+        assert state.is_ready("1.4")
+        assert "1.4" not in state.dependents("1.3")
+
+    def test_added_phase_rebuilds(self, roadmap):
+        """Test that structural changes fall back to a rebuild."""
+        get_roadmap_state(roadmap)
+        roadmap.write_text(roadmap.read_text() + _phase("2.3", depends_on="Phase 2.2"))
+
+        state = get_roadmap_state(roadmap)
+        assert state.dependencies("2.3") == ("2.2",)
+        assert not state.is_ready("2.3")
+
+    def test_matches_full_scan(self, roadmap):
+        """Test that the frontier equals the original per-stream scan."""
+        all_streams = parse_roadmap(roadmap)
+        completed = {ws.id for ws in all_streams if ws.status == WorkStreamStatus.COMPLETE}
+        expected = [
+            ws.id for ws in all_streams
+            if ws.is_claimable and not ws.has_unmet_dependencies(completed)
+        ]
+
+        assert [ws.id for ws in RoadmapState(load_roadmap(roadmap)).ready()] == expected
+
+    def test_large_roadmap_frontier(self, tmp_path):
+        """Repeated polls over a 2000-phase roadmap match a full dependency scan."""
+        path = tmp_path / "large.md"
+        parts = ["# Roadmap\n\n"]
+        for batch in range(1, 41):
+            parts.append(f"## Batch {batch}\n\n")
+            for n in range(1, 51):
+                dep = f"Phase {batch - 1}.{n}" if batch > 1 else None
+                status = "✅ Complete" if batch < 20 else "⚪ Not Started"
+                parts.append(_phase(f"{batch}.{n}", status, depends_on=dep))
+        path.write_text("".join(parts))
+
+        for _ in range(3):
+            available = get_prioritized_work_streams(path)
+
+        streams = parse_roadmap(path)
+        completed = {ws.id for ws in streams if ws.status == WorkStreamStatus.COMPLETE}
+        expected = [
+            ws for ws in streams if ws.is_claimable and not ws.has_unmet_dependencies(completed)
+        ]
+        assert [ws.id for ws in available] == sorted(f"20.{n}" for n in range(1, 51))
+        assert sorted(ws.id for ws in available) == sorted(ws.id for ws in expected)
+        assert all(isinstance(ws, WorkStream) for ws in available)
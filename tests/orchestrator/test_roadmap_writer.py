@@ -0,0 +1,140 @@
+"""Tests for the batched roadmap writer."""
+
+import re
+
+import pytest
+
+from src.orchestrator.roadmap_writer import RoadmapWriter
+from src.orchestrator.work_stream import (
+    WorkStreamStatus,
+    clear_roadmap_cache,
+    load_roadmap,
+)
+
+ROADMAP = """# Roadmap
+
+## Batch 1
+
+### Phase 1.1: Done
+- **Status:** ✅ Complete
+- **Effort:** S
+
+### Phase 1.2: Waiting
+- **Status:** 🔴 Blocked (needs 1.1)
+- **Depends On:** Phase 1.1
+
+### Phase 1.3: No Status Line
+- **Effort:** M
+
+### Phase 1.4: Also Waiting
+- **Status:** 🔴 Blocked
+- **Depends On:** Phase 1.1
+"""
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache():
+    """Keep the parse cache per test."""
+    clear_roadmap_cache()
+    yield
+    clear_roadmap_cache()
+
+
+@pytest.fixture
+def roadmap(tmp_path):
+    """Write the sample roadmap."""
+    path = tmp_path / "roadmap.md"
+    path.write_text(ROADMAP)
+    return path
+
+
+class TestRoadmapWriter:
+    """Tests for RoadmapWriter."""
+
+    def test_batch_status_edits(self, roadmap):
+        """Test applying several edits in one commit."""
+        writer = RoadmapWriter(roadmap)
+        writer.set_status("1.2", WorkStreamStatus.NOT_STARTED)
+        writer.set_status("1.4", WorkStreamStatus.IN_PROGRESS)
+
+        assert writer.commit() == ["1.2", "1.4"]
+        assert writer.pending == 0
+        assert roadmap.read_text() == (
+            ROADMAP
+            .replace("🔴 Blocked (needs 1.1)", "⚪ Not Started")
+            .replace("- **Status:** 🔴 Blocked\n", "- **Status:** 🔄 In Progress\n")
+        )
+
+    def test_only_if_condition(self, roadmap):
+        """Test that conditional edits skip phases in another status."""
+        writer = RoadmapWriter(roadmap)
+        writer.set_status("1.1", WorkStreamStatus.NOT_STARTED, only_if=WorkStreamStatus.BLOCKED)
+        writer.set_status("1.2", WorkStreamStatus.NOT_STARTED, only_if=WorkStreamStatus.BLOCKED)
+
+        assert writer.commit() == ["1.2"]
+        assert "✅ Complete" in roadmap.read_text()
+
+    def test_phase_without_status_does_not_touch_next_phase(self, roadmap):
+        """Test that edits never spill into a later phase's Status line."""
+        writer = RoadmapWriter(roadmap)
+        writer.set_status("1.3", WorkStreamStatus.COMPLETE)
+        writer.set_status("9.9", WorkStreamStatus.COMPLETE)
+
+        assert writer.commit() == []
+        assert roadmap.read_text() == ROADMAP
+
+    def test_parse_cache_refreshed_in_place(self, roadmap):
+        """Test that the next read is served from the refreshed cache."""
+        load_roadmap(roadmap)
+        writer = RoadmapWriter(roadmap)
+        writer.set_status("1.2", WorkStreamStatus.NOT_STARTED)
+        writer.commit()
+
+        parsed = load_roadmap(roadmap)
+        assert parsed.get("1.2").status == WorkStreamStatus.NOT_STARTED
+        assert parsed.reparsed_blocks == 1  # Only the edited block, during commit
+
+        clear_roadmap_cache()
+        assert load_roadmap(roadmap).reparsed_blocks == 0  # Served from disk cache
+
+    def test_detects_external_modification(self, roadmap):
+        """Test that offsets are recomputed if the file changed under the cache."""
+        load_roadmap(roadmap)
+        roadmap.write_text("<!-- header note -->\n" + ROADMAP)
+
+        writer = RoadmapWriter(roadmap)
+        writer.set_status("1.4", WorkStreamStatus.NOT_STARTED)
+        writer.commit()
+
+        content = roadmap.read_text()
+        assert content.startswith("<!-- header note -->\n# Roadmap")
+        assert content.count("⚪ Not Started") == 1
+        assert "🔴 Blocked (needs 1.1)" in content
+
+    def test_bulk_unblock_matches_per_phase_edits(self, tmp_path):
+        """Test that unblocking 500 of 2000 phases matches per-phase regex edits."""
+        path = tmp_path / "large.md"
+        parts = ["# Roadmap\n\n## Batch 1\n\n"]
+        for n in range(2000):
+            status = "🔴 Blocked" if n % 4 == 0 else "⚪ Not Started"
+            parts.append(
+                f"### Phase 1.{n}: Phase {n}\n- **Status:** {status}\n"
+                "- **Effort:** M\n- **Tasks:**\n  - [ ] Do the thing\n\n"
+            )
+        original = "".join(parts)
+        path.write_text(original)
+        to_unblock = [f"1.{n}" for n in range(0, 2000, 4)]
+
+        content = original
+        for phase_id in to_unblock:
+            pattern = rf"(### Phase {re.escape(phase_id)}:.*?- \*\*Status:\*\*) 🔴 Blocked"
+            content = re.sub(pattern, r"\1 ⚪ Not Started", content, flags=re.DOTALL)
+
+        load_roadmap(path)
+        writer = RoadmapWriter(path)
+        for phase_id in to_unblock:
+            writer.set_status(phase_id, WorkStreamStatus.NOT_STARTED)
+        applied = writer.commit()
+
+        assert len(applied) == 500
+        assert path.read_text() == content
@@ -6,10 +6,13 @@ import pytest
 from src.orchestrator.work_stream import (
     WorkStream,
     WorkStreamStatus,
+    clear_roadmap_cache,
     get_available_work_streams,
     get_blocked_work_streams,
     get_bootstrap_phases,
     get_prioritized_work_streams,
+    get_work_stream,
+    load_roadmap,
     parse_roadmap,
 )
 
@@ -94,6 +97,28 @@ class TestWorkStream:
         assert "1.2" in str(ws)
         assert "Task Parser" in str(ws)
 
+    @pytest.mark.parametrize(
+        "depends_on, expected",
+        [
+            ("Phase 1.1", ["1.1"]),
+            ("Phase 1.1, Phase 1.2", ["1.1", "1.2"]),
+            ("Phase 1.1; Phase 1.2", ["1.1", "1.2"]),
+            ("Phase 1.1 ✅", ["1.1"]),
+            ("1.1, 1.2", ["1.1", "1.2"]),
+            ("", []),
+            (None, []),
+        ],
+    )
+    def test_get_dependency_ids(self, depends_on, expected):
+        """Test parsing the depends_on field into phase IDs."""
+        ws = WorkStream(
+            id="2.1",
+            name="Dependent",
+            status=WorkStreamStatus.NOT_STARTED,
+            depends_on=depends_on,
+        )
+        assert ws.get_dependency_ids() == expected
+
 
 class TestParseRoadmap:
     """Tests for roadmap parsing."""
@@ -306,3 +331,113 @@ class TestPriorityParsing:
 
         # Within normal: 1.2 should come before 3.1 (lower batch)
         assert ids.index("1.2") < ids.index("3.1")
+
+
+class TestRoadmapParseCache:
+    """Tests for the persistent, incremental roadmap parse cache."""
+
+    PHASE_TEMPLATE = """### Phase {batch}.{n}: Phase number {n}
+- **Status:** ⚪ Not Started
+- **Depends On:** Phase {batch}.{prev}
+- **Tasks:**
+  - [ ] First task of {n}
+  - [ ] Second task of {n}
+- **Effort:** M
+- **Done When:** Done
+
+"""
+
+    @pytest.fixture(autouse=True)
+    def cache_file(self, roadmap_cache_file):
+        """Start each test with an empty in-memory cache."""
+        clear_roadmap_cache()
+        yield roadmap_cache_file
+        clear_roadmap_cache()
+
+    def _write_roadmap(self, path, phases=20):
+        parts = ["# Roadmap\n\n## Batch 1\n\n"]
+        for n in range(1, phases + 1):
+            if n == phases // 2:
+                parts.append("## Batch 2\n\n")
+            batch = 1 if n < phases // 2 else 2
+            parts.append(self.PHASE_TEMPLATE.format(batch=batch, n=n, prev=max(n - 1, 1)))
+        path.write_text("".join(parts))
+        return path
+
+    def test_index_by_phase_id(self, tmp_path):
+        """Test per-phase dict lookups."""
+        roadmap = self._write_roadmap(tmp_path / "roadmap.md")
+
+        parsed = load_roadmap(roadmap)
+        assert parsed.get("1.3").name == "Phase number 3"
+        assert parsed.get("9.9") is None
+        assert get_work_stream("2.15", roadmap).tasks == [
+            "First task of 15", "Second task of 15",
+        ]
+
+    def test_disk_cache_survives_process_cache_clear(self, tmp_path, cache_file):
+        """Test that a fresh process reuses the on-disk parse."""
+        roadmap = self._write_roadmap(tmp_path / "roadmap.md")
+        first = load_roadmap(roadmap)
+        assert first.reparsed_blocks == 20
+        assert cache_file.exists()
+
+        clear_roadmap_cache()  # Simulate a new CLI invocation
+        second = load_roadmap(roadmap)
+        assert second.reparsed_blocks == 0
+        assert [ws.id for ws in second.streams] == [ws.id for ws in first.streams]
+
+    def test_only_changed_blocks_are_reparsed(self, tmp_path):
+        """Test incremental reparsing after a single-phase edit."""
+        roadmap = self._write_roadmap(tmp_path / "roadmap.md")
+        load_roadmap(roadmap)
+
+        content = roadmap.read_text()
+        roadmap.write_text(content.replace(
+            "### Phase 1.3: Phase number 3\n- **Status:** ⚪ Not Started",
+            "### Phase 1.3: Phase number 3\n- **Status:** ✅ Complete",
+        ))
+        parsed = load_roadmap(roadmap)
+
+        assert parsed.reparsed_blocks == 1
+        assert parsed.get("1.3").status == WorkStreamStatus.COMPLETE
+        assert parsed.get("1.4").status == WorkStreamStatus.NOT_STARTED
+
+    def test_batch_change_propagates_without_reparse(self, tmp_path):
+        """Test that moving a batch header updates later phases' batch."""
+        roadmap = self._write_roadmap(tmp_path / "roadmap.md")
+        assert load_roadmap(roadmap).get("2.10").batch == 2
+
+        roadmap.write_text(roadmap.read_text().replace("## Batch 2", "## Batch 5"))
+        parsed = load_roadmap(roadmap)
+
+        assert parsed.reparsed_blocks == 1  # Only the block containing the header
+        assert parsed.get("2.10").batch == 5
+        assert parsed.get("1.1").batch == 1
+
+    def test_status_span_offsets(self, tmp_path):
+        """Test that recorded offsets point at each phase's Status line."""
+        roadmap = self._write_roadmap(tmp_path / "roadmap.md")
+        parsed = load_roadmap(roadmap)
+        content = roadmap.read_text()
+
+        for phase_id, block in parsed.blocks.items():
+            assert content[block.start:].startswith(f"### Phase {phase_id}:")
+            start, end = block.status_span
+            assert content[start:end] == "- **Status:** ⚪ Not Started"
+
+    def test_matches_uncached_parse(self, tmp_path):
+        """Test that cached and uncached parses agree."""
+        roadmap = self._write_roadmap(tmp_path / "roadmap.md")
+        load_roadmap(roadmap)
+        roadmap.write_text(roadmap.read_text().replace("Second task of 7", "Renamed task"))
+
+        assert parse_roadmap(roadmap) == parse_roadmap(roadmap, use_cache=False)
+
+    def test_corrupt_disk_cache_is_ignored(self, tmp_path, cache_file):
+        """Test that an unreadable cache falls back to parsing."""
+        roadmap = self._write_roadmap(tmp_path / "roadmap.md")
+        cache_file.write_text("{not json")
+
+        assert len(parse_roadmap(roadmap)) == 20
+
@@ -225,6 +225,25 @@ class TestOrchestratorWrapperIntegration:
         assert result is not None
         assert result.success is not None
 
+    def test_decompositions_persist_across_wrappers(self, decomposition_cache_file):
+        """A second wrapper should reuse decompositions from the disk cache."""
+        request = (
+            "Build a user authentication system with OAuth2, "
+            "including login, registration, password reset, and admin dashboard"
+        )
+
+        first = OrchestratorWrapper(dry_run=True)
+        first_result = first.process_request(request)
+        assert decomposition_cache_file.exists()
+
+        second = OrchestratorWrapper(dry_run=True)
+        second_result = second.process_request(request)
+
+        assert [s.id for s in second_result.decomposition.subtasks] == [
+            s.id for s in first_result.decomposition.subtasks
+        ]
+        assert second.task_decomposer._disk_entries
+
 
 class TestExecutionResultDataclass:
     """Test ExecutionResult data structure."""
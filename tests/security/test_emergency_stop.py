@@ -236,6 +236,35 @@ async def test_nats_broadcast_on_stop():
         assert mock_bus.broadcast.called or result.success
 
 
+@pytest.mark.asyncio
+async def test_stop_reaches_agents_over_loopback():
+    """Test that a loopback:// stop broadcast reaches agents without a broker."""
+    from src.coordination.nats_bus import MessageType, NATSMessageBus
+
+    agent_bus = NATSMessageBus("loopback://")
+    await agent_bus.connect()
+    received = []
+
+    async def on_stop(msg):
+        received.append(msg)
+
+    await agent_bus.subscribe("orchestrator.broadcast.stop_task", on_stop)
+
+    stop = EmergencyStop(nats_url="loopback://")
+    await stop.connect_nats()
+    stop.trigger_stop(
+        mode=StopMode.IMMEDIATE,
+        reason=StopReason.USER_REQUESTED,
+        message="Halt",
+    )
+    await asyncio.sleep(0.01)
+    await stop.disconnect_nats()
+    await agent_bus.disconnect()
+
+    assert [m.message_type for m in received] == [MessageType.STOP_TASK]
+    assert received[0].content["mode"] == "immediate"
+
+
 def test_stop_with_target_agents():
     """Test stopping specific agents."""
     stop = EmergencyStop()
@@ -269,3 +269,20 @@ def test_multiple_refinements_independent():
     # Should be independent results
     assert refined1 != refined2
     assert refined1.original_task != refined2.original_task
+
+
+def test_coherence_passes_reuse_contradiction_scan():
+    """Repeated coherence passes report the same contradictions from one scan."""
+    task = ParsedTask(
+        goal="Build a simple distributed cache quickly",
+        task_type=TaskType.SOFTWARE,
+        raw_description="Build a simple distributed cache quickly. Make it thorough.",
+    )
+    refiner = RecurrentRefiner(max_passes=5, confidence_threshold=1.0)
+
+    initial = refiner._initial_scan(task)
+    first = refiner._coherence_check(task, [initial])
+    second = refiner._coherence_check(task, [initial, first])
+
+    assert first.findings["contradictions"] == second.findings["contradictions"]
+    assert len(first.findings["contradictions"]) == 2